@@ -0,0 +1,70 @@
+# =============================================================================
+# FICHIER: apps/core_app/renderers.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - Renderers & Parsers binaires
+Format MessagePack pour les terminaux mobiles (liaisons 2G/3G)
+
+Dépendance optionnelle : `msgpack`. Sans elle, seul JSON est négocié
+(les classes ne sont ajoutées à REST_FRAMEWORK que si l'import réussit).
+"""
+import datetime
+import decimal
+import uuid
+
+from django.utils.functional import Promise
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+
+
+def _encode_default(obj):
+    """Types non natifs MessagePack → représentation identique au JSON DRF"""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID, Promise)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, 'tolist'):  # numpy
+        return obj.tolist()
+    raise TypeError(f"Type non sérialisable en MessagePack: {type(obj).__name__}")
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Rendu MessagePack (Accept: application/msgpack ou ?format=msgpack)
+    """
+    media_type = MSGPACK_MEDIA_TYPE
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_encode_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    """
+    Lecture des corps MessagePack (Content-Type: application/msgpack)
+    """
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except Exception as exc:
+            raise ParseError(f"Corps MessagePack invalide: {exc}")
@@ -45,4 +45,19 @@ class BaseModelSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if request and hasattr(request, 'user'):
             validated_data['updated_by'] = request.user
-        return super().update(instance, validated_data)
\ No newline at end of file
+        return super().update(instance, validated_data)
+
+class FieldListSerializer(serializers.ListSerializer):
+    """
+    Liste compacte « field-list » pour la synchronisation mobile :
+    chaque ligne est un tableau de valeurs dans l'ordre de Meta.fields,
+    l'en-tête des champs n'étant transmis qu'une fois par réponse.
+    """
+
+    @property
+    def field_names(self):
+        return list(self.child.fields.keys())
+
+    def to_representation(self, data):
+        rows = super().to_representation(data)
+        return [list(row.values()) for row in rows]
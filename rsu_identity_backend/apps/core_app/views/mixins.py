@@ -0,0 +1,51 @@
+# =============================================================================
+# FICHIER: apps/core_app/views/mixins.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - ViewSet Mixins
+Profil de sérialisation compact pour la synchronisation des terminaux
+"""
+from rest_framework.response import Response
+
+
+class CompactSyncMixin:
+    """
+    Profil « compact » pour les endpoints de synchronisation mobile.
+
+    Activé par `?profile=compact` ou implicitement dès que le client
+    négocie MessagePack. En lecture, `compact_serializer_class` remplace
+    le serializer détaillé (pas de champs calculés ni d'objets imbriqués)
+    et les listes sont renvoyées sous forme {fields: [...], rows: [[...]]}.
+    """
+    compact_serializer_class = None
+    compact_actions = ('list', 'retrieve')
+
+    def is_compact_request(self):
+        request = getattr(self, 'request', None)
+        if request is None or self.compact_serializer_class is None:
+            return False
+        if request.query_params.get('profile') == 'compact':
+            return True
+        renderer = getattr(request, 'accepted_renderer', None)
+        return getattr(renderer, 'format', None) == 'msgpack'
+
+    def get_serializer_class(self):
+        if self.action in self.compact_actions and self.is_compact_request():
+            return self.compact_serializer_class
+        return super().get_serializer_class()
+
+    def list(self, request, *args, **kwargs):
+        if not self.is_compact_request():
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(
+            page if page is not None else queryset, many=True
+        )
+        payload = {'fields': serializer.field_names, 'rows': serializer.data}
+
+        if page is not None:
+            return self.get_paginated_response(payload)
+        return Response(payload)
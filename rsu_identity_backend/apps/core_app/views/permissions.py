@@ -20,6 +20,16 @@ class IsAdminOrSupervisor(permissions.BasePermission):
              request.user.user_type in ['ADMIN', 'SUPERVISOR'])
         )
 
+class IsAdmin(permissions.BasePermission):
+    """
+    Permission pour administrateurs uniquement
+    """
+    def has_permission(self, request, view):
+        return (
+            request.user.is_authenticated and
+            (request.user.is_staff or request.user.user_type == 'ADMIN')
+        )
+
 class IsOwnerOrAdmin(permissions.BasePermission):
     """
     Permission pour propriétaire de l'objet ou administrateur
@@ -0,0 +1,20 @@
+# ===================================================================
+# Management Command - Effectifs par tranche d'âge des ménages
+# ===================================================================
+
+from django.core.management.base import BaseCommand
+
+from apps.identity_app.services.household_demographics import refresh_household_age_bands
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcule members_under_15 / members_15_64 / members_over_64 des "
+        "ménages depuis les dates de naissance de leurs membres (une requête "
+        "groupée). À planifier (cron quotidien) pour suivre le vieillissement."
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write("👪 Recalcul des tranches d'âge des ménages...")
+        updated = refresh_household_age_bands()
+        self.stdout.write(self.style.SUCCESS(f"✅ {updated} ménage(s) mis à jour"))
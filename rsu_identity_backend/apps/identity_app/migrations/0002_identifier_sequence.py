@@ -0,0 +1,36 @@
+# Generated by Django 5.0.8 on 2026-10-19 01:28
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('identity_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdentifierSequence',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Créé le')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Modifié le')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Actif')),
+                ('name', models.CharField(choices=[('RSU_ID', 'RSU-ID Personne'), ('HOUSEHOLD_ID', 'ID Ménage')], max_length=30, unique=True, verbose_name='Séquence')),
+                ('next_value', models.BigIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)], verbose_name='Prochaine valeur')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='created_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('updated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='updated_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': "Séquence d'identifiants",
+                'verbose_name_plural': "Séquences d'identifiants",
+                'db_table': 'rsu_identifier_sequences',
+            },
+        ),
+    ]
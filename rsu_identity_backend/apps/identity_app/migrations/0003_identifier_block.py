@@ -0,0 +1,41 @@
+# Generated by Django 5.0.8 on 2026-10-19 01:31
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('identity_app', '0002_identifier_sequence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdentifierBlock',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Créé le')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Modifié le')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Actif')),
+                ('sequence_name', models.CharField(choices=[('RSU_ID', 'RSU-ID Personne'), ('HOUSEHOLD_ID', 'ID Ménage')], max_length=30, verbose_name='Séquence')),
+                ('device_id', models.CharField(db_index=True, max_length=100, verbose_name='Identifiant terminal')),
+                ('start_value', models.BigIntegerField(verbose_name='Début (inclus)')),
+                ('end_value', models.BigIntegerField(verbose_name='Fin (exclue)')),
+                ('excluded_identifiers', models.JSONField(blank=True, default=list, verbose_name='Identifiants déjà attribués (à ignorer)')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='created_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='identifier_blocks', to=settings.AUTH_USER_MODEL, verbose_name='Enquêteur propriétaire')),
+                ('updated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='updated_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': "Bloc d'identifiants",
+                'verbose_name_plural': "Blocs d'identifiants",
+                'db_table': 'rsu_identifier_blocks',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['sequence_name', 'start_value', 'end_value'], name='rsu_identif_sequenc_560158_idx'), models.Index(fields=['owner', 'device_id'], name='rsu_identif_owner_i_3becd1_idx')],
+            },
+        ),
+    ]
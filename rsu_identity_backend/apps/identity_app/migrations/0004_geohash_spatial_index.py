@@ -0,0 +1,44 @@
+# Generated by Django 5.0.8 on 2026-10-19 01:41
+
+from django.db import migrations, models
+
+from utils.geo import geohash_encode
+
+
+def backfill_geohash(apps, schema_editor):
+    """Calcule la cellule geohash des enregistrements géolocalisés existants"""
+    for model_name in ('PersonIdentity', 'Household'):
+        model = apps.get_model('identity_app', model_name)
+        batch = []
+        rows = model.objects.filter(
+            latitude__isnull=False, longitude__isnull=False
+        ).only('id', 'latitude', 'longitude').iterator(chunk_size=2000)
+        for obj in rows:
+            obj.geohash = geohash_encode(obj.latitude, obj.longitude)
+            batch.append(obj)
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, ['geohash'])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, ['geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('identity_app', '0003_identifier_block'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='household',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=12, null=True, verbose_name='Cellule geohash (index spatial)'),
+        ),
+        migrations.AddField(
+            model_name='personidentity',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=12, null=True, verbose_name='Cellule geohash (index spatial)'),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.0.8 on 2026-10-19 01:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('identity_app', '0004_geohash_spatial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='household',
+            name='distance_to_health_center',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Distance centre de santé (km)'),
+        ),
+        migrations.AddField(
+            model_name='household',
+            name='distance_to_market',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Distance marché (km)'),
+        ),
+        migrations.AddField(
+            model_name='household',
+            name='distance_to_road',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Distance route praticable (km)'),
+        ),
+        migrations.AddField(
+            model_name='household',
+            name='distance_to_school',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Distance école (km)'),
+        ),
+        migrations.AddField(
+            model_name='household',
+            name='facility_distances_computed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Date calcul distances services'),
+        ),
+        migrations.AddField(
+            model_name='personidentity',
+            name='distance_to_health_center',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Distance centre de santé (km)'),
+        ),
+        migrations.AddField(
+            model_name='personidentity',
+            name='distance_to_market',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Distance marché (km)'),
+        ),
+        migrations.AddField(
+            model_name='personidentity',
+            name='distance_to_road',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Distance route praticable (km)'),
+        ),
+        migrations.AddField(
+            model_name='personidentity',
+            name='distance_to_school',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Distance école (km)'),
+        ),
+        migrations.AddField(
+            model_name='personidentity',
+            name='facility_distances_computed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Date calcul distances services'),
+        ),
+    ]
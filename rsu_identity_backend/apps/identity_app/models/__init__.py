@@ -6,5 +6,6 @@ from .person import PersonIdentity
 from .household import Household, HouseholdMember
 from .geographic import GeographicData
 from .rbpp import RBPPSync
+from .sequence import IdentifierSequence, IdentifierBlock
 
-__all__ = ['PersonIdentity', 'Household', 'HouseholdMember', 'GeographicData', 'RBPPSync']
\ No newline at end of file
+__all__ = ['PersonIdentity', 'Household', 'HouseholdMember', 'GeographicData', 'RBPPSync', 'IdentifierSequence', 'IdentifierBlock']
\ No newline at end of file
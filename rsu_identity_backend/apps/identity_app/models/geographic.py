@@ -7,7 +7,7 @@
 🇬🇦 RSU Gabon - Modèle Données Géographiques
 Ciblage zones prioritaires et accessibilité services
 """
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
 from apps.core_app.models.base import BaseModel
 from utils.gabonese_data import PROVINCES
@@ -270,8 +270,23 @@ class GeographicData(BaseModel):
     
     def save(self, *args, **kwargs):
         """Auto-calcul scores avant sauvegarde"""
+        from apps.identity_app.services.accessibility_cache import (
+            invalidate_accessibility_aggregates
+        )
+        
         self.calculate_accessibility_score()
         super().save(*args, **kwargs)
+        # Agrégats province/commune à reconstruire une fois la transaction validée
+        transaction.on_commit(invalidate_accessibility_aggregates)
+    
+    def delete(self, *args, **kwargs):
+        from apps.identity_app.services.accessibility_cache import (
+            invalidate_accessibility_aggregates
+        )
+        
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(invalidate_accessibility_aggregates)
+        return result
     
     def __str__(self):
         return f"{self.location_name} - {self.get_province_display()}"
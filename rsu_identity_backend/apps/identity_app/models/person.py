@@ -13,6 +13,7 @@ from django.core.validators import RegexValidator
 from django.utils import timezone as django_timezone
 from apps.core_app.models.base import BaseModel
 from utils.gabonese_data import PROVINCES, generate_rsu_id  # Import correct
+from utils.geo import geohash_for_instance
 import uuid
 from django.core.exceptions import ValidationError
 import re
@@ -288,6 +289,46 @@ class PersonIdentity(BaseModel):
         blank=True,
         verbose_name="Précision GPS (mètres)"
     )
+    geohash = models.CharField(
+        max_length=12,
+        null=True,
+        blank=True,
+        db_index=True,
+        editable=False,
+        verbose_name="Cellule geohash (index spatial)"
+    )
+    
+    # === DISTANCES AUX SERVICES (calculées par FacilityDistanceService) ===
+    distance_to_health_center = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Distance centre de santé (km)"
+    )
+    distance_to_school = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Distance école (km)"
+    )
+    distance_to_market = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Distance marché (km)"
+    )
+    distance_to_road = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Distance route praticable (km)"
+    )
+    facility_distances_computed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Date calcul distances services"
+    )
     province = models.CharField(
         max_length=20,
         choices=PROVINCES_CHOICES,
@@ -441,6 +482,10 @@ class PersonIdentity(BaseModel):
         if not self.rsu_id:
             from utils.gabonese_data import generate_rsu_id
             self.rsu_id = generate_rsu_id()
+        # Index spatial : cellule geohash maintenue avec les coordonnées
+        self.geohash = geohash_for_instance(self)
+        if kwargs.get('update_fields') is not None and {'latitude', 'longitude'} & set(kwargs['update_fields']):
+            kwargs['update_fields'] = set(kwargs['update_fields']) | {'geohash'}
         super().save(*args, **kwargs)
     
     @property
@@ -0,0 +1,205 @@
+# =============================================================================
+# FICHIER: apps/identity_app/models/sequence.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - Séquences d'Identifiants
+Réservation de plages d'identifiants (RSU-ID, ID ménage) sans requête par ID
+"""
+import uuid
+
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django.core.validators import MinValueValidator
+from django.utils import timezone
+from apps.core_app.models.base import BaseModel
+
+
+class IdentifierSequence(BaseModel):
+    """
+    Compteur monotone par type d'identifiant.
+    Chaque réservation avance le compteur d'un bloc complet sous verrou :
+    les valeurs du bloc sont ensuite encodées localement (base36 + clé).
+    """
+    SEQUENCE_NAMES = [
+        ('RSU_ID', 'RSU-ID Personne'),
+        ('HOUSEHOLD_ID', 'ID Ménage'),
+    ]
+
+    name = models.CharField(
+        max_length=30,
+        unique=True,
+        choices=SEQUENCE_NAMES,
+        verbose_name="Séquence"
+    )
+    next_value = models.BigIntegerField(
+        default=1,
+        validators=[MinValueValidator(1)],
+        verbose_name="Prochaine valeur"
+    )
+
+    class Meta:
+        db_table = 'rsu_identifier_sequences'
+        verbose_name = "Séquence d'identifiants"
+        verbose_name_plural = "Séquences d'identifiants"
+
+    def __str__(self):
+        return f"{self.name} → {self.next_value}"
+
+    @classmethod
+    def reserve(cls, name, size):
+        """
+        Réserve `size` valeurs consécutives pour la séquence `name`.
+
+        Un seul aller-retour verrouillé par bloc, quel que soit `size`.
+
+        Returns:
+            range: valeurs réservées [début, début + size)
+        """
+        if size < 1:
+            raise ValueError("La taille du bloc doit être positive")
+
+        with transaction.atomic():
+            sequence, _ = cls.objects.select_for_update().get_or_create(name=name)
+            start = sequence.next_value
+            sequence.next_value = start + size
+            sequence.save(update_fields=['next_value', 'updated_at'])
+
+        return range(start, start + size)
+
+    @classmethod
+    def supports_committed_reserve(cls, using=DEFAULT_DB_ALIAS):
+        """
+        Réservation sur connexion autonome possible (PostgreSQL).
+        SQLite n'a qu'un écrivain : une seconde connexion attendrait le
+        verrou de la transaction appelante.
+        """
+        return connections[using].vendor == 'postgresql'
+
+    @classmethod
+    def reserve_committed(cls, name, size, using=DEFAULT_DB_ALIAS):
+        """
+        Réserve `size` valeurs sur une connexion autonome, validée aussitôt.
+
+        Appelée depuis une transaction en cours, la réservation ne dépend pas
+        de son issue et ne garde pas le verrou de la ligne jusqu'à sa fin :
+        les valeurs d'une transaction annulée sont perdues, jamais réattribuées.
+
+        Returns:
+            range: valeurs réservées [début, début + size)
+        """
+        if size < 1:
+            raise ValueError("La taille du bloc doit être positive")
+
+        connection = connections.create_connection(using)
+        table = connection.ops.quote_name(cls._meta.db_table)
+        pk = cls._meta.pk.get_db_prep_value(uuid.uuid4(), connection)
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {table} (id, name, next_value, is_active, created_at, updated_at) "
+                    f"VALUES (%s, %s, %s, TRUE, %s, %s) "
+                    f"ON CONFLICT (name) DO UPDATE SET "
+                    f"next_value = {table}.next_value + %s, updated_at = EXCLUDED.updated_at "
+                    f"RETURNING next_value",
+                    [pk, name, 1 + size, now, now, size]
+                )
+                end = cursor.fetchone()[0]
+        finally:
+            connection.close()
+
+        return range(end - size, end)
+
+
+class IdentifierBlock(BaseModel):
+    """
+    Bloc d'identifiants réservé pour un terminal d'enquête.
+    Le terminal attribue hors ligne les identifiants définitifs du bloc;
+    la synchronisation devient une simple insertion côté serveur.
+    """
+    sequence_name = models.CharField(
+        max_length=30,
+        choices=IdentifierSequence.SEQUENCE_NAMES,
+        verbose_name="Séquence"
+    )
+    device_id = models.CharField(
+        max_length=100,
+        db_index=True,
+        verbose_name="Identifiant terminal"
+    )
+    owner = models.ForeignKey(
+        'core_app.RSUUser',
+        on_delete=models.PROTECT,
+        related_name='identifier_blocks',
+        verbose_name="Enquêteur propriétaire"
+    )
+    start_value = models.BigIntegerField(verbose_name="Début (inclus)")
+    end_value = models.BigIntegerField(verbose_name="Fin (exclue)")
+    excluded_identifiers = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Identifiants déjà attribués (à ignorer)"
+    )
+
+    class Meta:
+        db_table = 'rsu_identifier_blocks'
+        verbose_name = "Bloc d'identifiants"
+        verbose_name_plural = "Blocs d'identifiants"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['sequence_name', 'start_value', 'end_value']),
+            models.Index(fields=['owner', 'device_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.sequence_name} [{self.start_value}-{self.end_value}) → {self.device_id}"
+
+    @property
+    def size(self):
+        return self.end_value - self.start_value
+
+    @classmethod
+    def reserve_for_device(cls, sequence_name, device_id, size, owner):
+        """Réserve un bloc dans la séquence et enregistre son propriétaire"""
+        from utils.gabonese_data import ID_ALLOCATORS
+
+        allocator = ID_ALLOCATORS[sequence_name]
+        with transaction.atomic():
+            values, available = allocator.reserve_range(size)
+            formatted = [allocator.formatter(value) for value in values]
+            available_set = set(available)
+            return cls.objects.create(
+                sequence_name=sequence_name,
+                device_id=device_id,
+                owner=owner,
+                start_value=values.start,
+                end_value=values.stop,
+                excluded_identifiers=[i for i in formatted if i not in available_set],
+                created_by=owner,
+            )
+
+    @classmethod
+    def find_owner_block(cls, sequence_name, identifier):
+        """Bloc contenant l'identifiant, ou None (clé de contrôle vérifiée)"""
+        from utils.gabonese_data import ID_ALLOCATORS, decode_identifier
+
+        try:
+            value = decode_identifier(identifier)
+        except ValueError:
+            return None
+        if ID_ALLOCATORS[sequence_name].formatter(value) != identifier:
+            return None  # préfixe d'une autre séquence
+        return cls.objects.filter(
+            sequence_name=sequence_name,
+            start_value__lte=value,
+            end_value__gt=value,
+        ).first()
+
+    def get_identifiers(self):
+        """Identifiants utilisables du bloc (hors exclusions)"""
+        from utils.gabonese_data import ID_ALLOCATORS
+
+        formatter = ID_ALLOCATORS[self.sequence_name].formatter
+        excluded = set(self.excluded_identifiers)
+        identifiers = (formatter(v) for v in range(self.start_value, self.end_value))
+        return [i for i in identifiers if i not in excluded]
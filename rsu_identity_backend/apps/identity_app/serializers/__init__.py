@@ -9,14 +9,20 @@ Sérialisation des modèles d'identité et géolocalisation
 """
 from .person_serializers import (
     PersonIdentitySerializer, PersonIdentityCreateSerializer,
-    PersonIdentityUpdateSerializer, PersonIdentityMinimalSerializer, PersonIdentitySearchSerializer
+    PersonIdentityUpdateSerializer, PersonIdentityMinimalSerializer, PersonIdentitySearchSerializer,
+    PersonIdentitySyncSerializer
 )
 from .household_serializers import (
     HouseholdSerializer, HouseholdCreateSerializer,
-    HouseholdMemberSerializer, HouseholdMemberCreateSerializer
+    HouseholdMemberSerializer, HouseholdMemberCreateSerializer, HouseholdSyncSerializer
 )
+from .person_fast_serializers import PersonIdentityFastListSerializer
 from .geographic_serializers import GeographicDataSerializer
 from .rbpp_serializers import RBPPSyncSerializer
+from .id_block_serializers import (
+    IdentifierBlockSerializer, IdentifierBlockDetailSerializer,
+    IdentifierBlockReservationSerializer
+)
 
 
 __all__ = [
@@ -24,6 +30,10 @@ __all__ = [
     'PersonIdentityUpdateSerializer', 'PersonIdentityMinimalSerializer',
     'HouseholdSerializer', 'HouseholdCreateSerializer',
     'HouseholdMemberSerializer', 'HouseholdMemberCreateSerializer',
-    'GeographicDataSerializer', 'RBPPSyncSerializer', 'PersonIdentitySearchSerializer'
+    'GeographicDataSerializer', 'RBPPSyncSerializer', 'PersonIdentitySearchSerializer',
+    'IdentifierBlockSerializer', 'IdentifierBlockDetailSerializer',
+    'IdentifierBlockReservationSerializer',
+    'PersonIdentitySyncSerializer', 'HouseholdSyncSerializer',
+    'PersonIdentityFastListSerializer'
 ]
 
@@ -8,9 +8,11 @@
 Sérialisation des ménages et membres
 """
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from apps.identity_app.models import Household, HouseholdMember
-from apps.core_app.serializers import BaseModelSerializer
+from apps.core_app.serializers import BaseModelSerializer, FieldListSerializer
 from .person_serializers import PersonIdentityMinimalSerializer
+from .id_block_serializers import validate_reserved_identifier
 
 class HouseholdMemberSerializer(BaseModelSerializer):
     """Serializer pour membres de ménage"""
@@ -128,16 +130,40 @@ class HouseholdSerializer(BaseModelSerializer):
             'level': 'HIGH' if len(indicators) >= 4 else 'MODERATE' if len(indicators) >= 2 else 'LOW'
         }
 
+class HouseholdSyncSerializer(serializers.ModelSerializer):
+    """
+    Profil compact pour synchronisation mobile
+    Champs stockés uniquement, sans membres imbriqués ni indicateurs calculés
+    """
+
+    class Meta:
+        model = Household
+        list_serializer_class = FieldListSerializer
+        fields = [
+            'id', 'household_id', 'head_of_household', 'household_type',
+            'household_size', 'members_under_15', 'members_15_64', 'members_over_64',
+            'housing_type', 'water_access', 'electricity_access', 'has_toilet',
+            'total_monthly_income', 'latitude', 'longitude', 'province',
+            'vulnerability_score', 'updated_at'
+        ]
+        read_only_fields = fields
+
 class HouseholdCreateSerializer(serializers.ModelSerializer):
     """
     Serializer pour création de ménage
     Essentiels pour enquêtes terrain
     """
+    # ID ménage optionnel : attribué hors ligne depuis un bloc réservé
+    household_id = serializers.CharField(
+        max_length=50,
+        required=False,
+        validators=[UniqueValidator(queryset=Household.objects.all())]
+    )
     
     class Meta:
         model = Household
         fields = [
-            'head_of_household', 'household_type', 'household_size',
+            'household_id', 'head_of_household', 'household_type', 'household_size',
             'housing_type', 'number_of_rooms',
             'water_access', 'electricity_access', 'has_toilet',
             'total_monthly_income', 'has_bank_account',
@@ -150,6 +176,10 @@ class HouseholdCreateSerializer(serializers.ModelSerializer):
             'household_size': {'required': True}
         }
     
+    def validate_household_id(self, value):
+        """ID ménage fourni par un terminal: doit provenir d'un bloc réservé"""
+        return validate_reserved_identifier('HOUSEHOLD_ID', value, self.context.get('request'))
+    
     def validate_household_size(self, value):
         """Validation taille ménage"""
         if value < 1:
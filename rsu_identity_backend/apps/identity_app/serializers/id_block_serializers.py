@@ -0,0 +1,75 @@
+# =============================================================================
+# FICHIER: apps/identity_app/serializers/id_block_serializers.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - ID Block Serializers
+Réservation de blocs d'identifiants pour enrôlement hors ligne
+"""
+from rest_framework import serializers
+from apps.identity_app.models import IdentifierBlock
+
+MAX_BLOCK_SIZE = 5000
+
+
+class IdentifierBlockSerializer(serializers.ModelSerializer):
+    """Bloc d'identifiants réservé par un terminal"""
+    size = serializers.IntegerField(read_only=True)
+    owner_username = serializers.CharField(source='owner.username', read_only=True)
+
+    class Meta:
+        model = IdentifierBlock
+        fields = [
+            'id', 'sequence_name', 'device_id', 'owner', 'owner_username',
+            'start_value', 'end_value', 'size', 'excluded_identifiers',
+            'created_at'
+        ]
+        read_only_fields = fields
+
+
+class IdentifierBlockDetailSerializer(IdentifierBlockSerializer):
+    """Bloc avec la liste explicite des identifiants attribuables"""
+    identifiers = serializers.ListField(source='get_identifiers', read_only=True)
+
+    class Meta(IdentifierBlockSerializer.Meta):
+        fields = IdentifierBlockSerializer.Meta.fields + ['identifiers']
+        read_only_fields = fields
+
+
+class IdentifierBlockReservationSerializer(serializers.Serializer):
+    """Demande de réservation de blocs RSU-ID / ID ménage"""
+    device_id = serializers.CharField(max_length=100)
+    rsu_id_count = serializers.IntegerField(
+        min_value=0, max_value=MAX_BLOCK_SIZE, default=500
+    )
+    household_id_count = serializers.IntegerField(
+        min_value=0, max_value=MAX_BLOCK_SIZE, default=100
+    )
+
+    def validate(self, attrs):
+        if not attrs['rsu_id_count'] and not attrs['household_id_count']:
+            raise serializers.ValidationError(
+                "Au moins un bloc (RSU-ID ou ménage) doit être demandé."
+            )
+        return attrs
+
+
+def validate_reserved_identifier(sequence_name, identifier, request=None):
+    """
+    Vérifie qu'un identifiant fourni par un terminal provient d'un bloc
+    réservé (et, si la requête est connue, réservé par cet enquêteur).
+    """
+    block = IdentifierBlock.find_owner_block(sequence_name, identifier)
+    if block is None:
+        raise serializers.ValidationError(
+            "Identifiant hors de tout bloc réservé ou clé de contrôle invalide."
+        )
+    if identifier in block.excluded_identifiers:
+        raise serializers.ValidationError("Identifiant exclu du bloc réservé.")
+
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated and block.owner_id != user.pk:
+        raise serializers.ValidationError(
+            "Identifiant réservé par un autre enquêteur."
+        )
+    return identifier
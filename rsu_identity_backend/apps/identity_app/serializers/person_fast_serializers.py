@@ -0,0 +1,203 @@
+# =============================================================================
+# FICHIER: apps/identity_app/serializers/person_fast_serializers.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - Sérialisation rapide des listes de personnes
+Lecture depuis values() : pas d'instanciation de modèle ni de
+SerializerMethodField par ligne, tables de libellés précalculées.
+Sortie identique à PersonIdentitySerializer.
+"""
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.identity_app.models import PersonIdentity
+from apps.core_app.serializers import RSUUserMinimalSerializer
+from utils.gabonese_data import PROVINCES
+from .person_serializers import PersonIdentitySerializer
+
+
+# Tables statiques précalculées une seule fois au chargement du module
+EMPLOYMENT_STATUS_LABELS = dict(PersonIdentity.EMPLOYMENT_STATUS_CHOICES)
+VULNERABLE_EMPLOYMENT = frozenset(['UNEMPLOYED', 'EMPLOYED_INFORMAL', 'UNABLE_TO_WORK'])
+STABLE_EMPLOYMENT = frozenset(['EMPLOYED_FORMAL', 'RETIRED'])
+ISOLATED_PROVINCES = frozenset(['NYANGA', 'OGOOUE_IVINDO', 'OGOOUE_LOLO'])
+
+USER_RELATIONS = {
+    'verified_by_details': 'verified_by',
+    'created_by_details': 'created_by',
+    'updated_by_details': 'updated_by',
+}
+USER_COLUMNS = ('id', 'username', 'first_name', 'last_name', 'user_type')
+
+# Colonnes values() nécessaires à chaque champ calculé
+COMPUTED_DEPENDENCIES = {
+    'age': ['birth_date'],
+    'full_name': ['first_name', 'last_name'],
+    'province_info': ['province'],
+    'employment_status_display': ['employment_status'],
+    'employment_info': ['employment_status', 'occupation', 'employer', 'monthly_income'],
+    'vulnerability_status': [
+        'birth_date', 'monthly_income', 'has_disability', 'province',
+        'is_household_head', 'gender'
+    ],
+    'data_completeness_percentage': ['data_completeness_score'],
+}
+for _name, _relation in USER_RELATIONS.items():
+    COMPUTED_DEPENDENCIES[_name] = [f'{_relation}__{column}' for column in USER_COLUMNS]
+
+# Types DRF dont la valeur values() est déjà la représentation finale
+PASSTHROUGH_FIELDS = (
+    serializers.CharField, serializers.BooleanField,
+    serializers.IntegerField, serializers.ChoiceField,
+)
+
+
+def _age(birth_date, today):
+    if not birth_date:
+        return None
+    return today.year - birth_date.year - (
+        (today.month, today.day) < (birth_date.month, birth_date.day)
+    )
+
+
+class PersonIdentityFastListSerializer:
+    """
+    Sérialiseur de liste à partir de dictionnaires values().
+
+    Usage:
+        fast = PersonIdentityFastListSerializer(fields=['rsu_id', 'full_name'])
+        data = fast.serialize(fast.values(queryset))
+    """
+    all_fields = PersonIdentitySerializer.Meta.fields
+
+    def __init__(self, fields=None):
+        if fields:
+            unknown = [name for name in fields if name not in self.all_fields]
+            if unknown:
+                raise serializers.ValidationError({
+                    'fields': f"Champs inconnus: {', '.join(unknown)}"
+                })
+            self.fields = [name for name in self.all_fields if name in set(fields)]
+        else:
+            self.fields = list(self.all_fields)
+
+        self._reference = PersonIdentitySerializer()
+        self._user_id = RSUUserMinimalSerializer().fields['id'].to_representation
+        self.columns = self._build_columns()
+        self._builders = [(name, self._builder_for(name)) for name in self.fields]
+
+    def _build_columns(self):
+        columns = []
+        for name in self.fields:
+            for column in COMPUTED_DEPENDENCIES.get(name, [name]):
+                if column not in columns:
+                    columns.append(column)
+        return columns
+
+    def values(self, queryset):
+        """Projection values() limitée aux colonnes des champs demandés"""
+        return queryset.select_related(None).prefetch_related(None).values(*self.columns)
+
+    def _builder_for(self, name):
+        """Fonction (row, today) → valeur, résolue une seule fois par champ"""
+        if name in USER_RELATIONS:
+            prefix = f'{USER_RELATIONS[name]}__'
+            return lambda row, today: self._user_details(row, prefix)
+
+        computed = getattr(self, f'_get_{name}', None)
+        if computed is not None:
+            return computed
+
+        field = self._reference.fields[name]
+        if isinstance(field, PASSTHROUGH_FIELDS) or isinstance(field, serializers.PrimaryKeyRelatedField):
+            return lambda row, today: row[name]
+
+        to_representation = field.to_representation
+        return lambda row, today: None if row[name] is None else to_representation(row[name])
+
+    def serialize(self, rows):
+        """Convertit des dictionnaires values() en représentations API"""
+        today = timezone.now().date()
+        builders = self._builders
+        return [
+            {name: build(row, today) for name, build in builders}
+            for row in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # Champs calculés (mêmes règles que PersonIdentitySerializer)
+    # ------------------------------------------------------------------
+    def _user_details(self, row, prefix):
+        user_id = row[f'{prefix}id']
+        if user_id is None:
+            return None
+        return {
+            'id': self._user_id(user_id),
+            'username': row[f'{prefix}username'],
+            'full_name': f"{row[f'{prefix}first_name']} {row[f'{prefix}last_name']}".strip(),
+            'user_type': row[f'{prefix}user_type'],
+        }
+
+    def _get_age(self, row, today):
+        return _age(row['birth_date'], today)
+
+    def _get_full_name(self, row, today):
+        return f"{row['first_name']} {row['last_name']}"
+
+    def _get_province_info(self, row, today):
+        province = row['province']
+        if not province:
+            return None
+        return PROVINCES.get(province, {})
+
+    def _get_employment_status_display(self, row, today):
+        status = row['employment_status']
+        return EMPLOYMENT_STATUS_LABELS.get(status, status) if status else None
+
+    def _get_employment_info(self, row, today):
+        status = row['employment_status']
+        if not status:
+            return None
+        income = row['monthly_income']
+        return {
+            'status': status,
+            'status_label': EMPLOYMENT_STATUS_LABELS.get(status, status),
+            'occupation': row['occupation'],
+            'employer': row['employer'],
+            'income': float(income) if income else None,
+            'is_vulnerable': status in VULNERABLE_EMPLOYMENT,
+            'is_stable': status in STABLE_EMPLOYMENT,
+        }
+
+    def _get_vulnerability_status(self, row, today):
+        indicators = []
+        age = _age(row['birth_date'], today)
+
+        if age is not None:
+            if age < 5:
+                indicators.append('ENFANT_JEUNE')
+            elif age > 65:
+                indicators.append('PERSONNE_AGEE')
+        if row['monthly_income'] and row['monthly_income'] < 150000:
+            indicators.append('PAUVRETE')
+        if row['has_disability']:
+            indicators.append('HANDICAP')
+        if row['province'] in ISOLATED_PROVINCES:
+            indicators.append('ZONE_ISOLEE')
+        if row['is_household_head'] and row['gender'] == 'F':
+            indicators.append('CHEF_MENAGE_FEMME')
+
+        if not indicators:
+            return {'status': 'NON_VULNERABLE', 'indicators': [], 'risk_level': 'LOW'}
+        return {
+            'status': 'VULNERABLE',
+            'indicators': indicators,
+            'risk_level': 'HIGH' if len(indicators) >= 3 else 'MEDIUM'
+        }
+
+    def _get_data_completeness_percentage(self, row, today):
+        value = row['data_completeness_score']
+        if value is None:
+            return None
+        return self._reference.fields['data_completeness_percentage'].to_representation(value)
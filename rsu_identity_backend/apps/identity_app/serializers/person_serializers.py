@@ -12,7 +12,11 @@ from django.utils import timezone
 from decimal import Decimal
 from datetime import date
 from apps.identity_app.models import PersonIdentity
-from apps.core_app.serializers import BaseModelSerializer, RSUUserMinimalSerializer
+from rest_framework.validators import UniqueValidator
+from apps.core_app.serializers import (
+    BaseModelSerializer, RSUUserMinimalSerializer, FieldListSerializer
+)
+from .id_block_serializers import validate_reserved_identifier
 
 
 class PersonIdentitySerializer(BaseModelSerializer):
@@ -168,8 +172,13 @@ class PersonIdentityCreateSerializer(serializers.ModelSerializer):
     ✅ CORRECTION: Inclut rsu_id en READ_ONLY pour le retourner après création
     """
     
-    # ✅ AJOUT: Déclarer rsu_id comme read_only pour le retourner
-    rsu_id = serializers.CharField(read_only=True)
+    # rsu_id retourné après création; un terminal hors ligne peut fournir
+    # un RSU-ID issu de son bloc réservé (synchronisation sans renumérotation)
+    rsu_id = serializers.CharField(
+        max_length=50,
+        required=False,
+        validators=[UniqueValidator(queryset=PersonIdentity.objects.all())]
+    )
     
     class Meta:
         model = PersonIdentity
@@ -201,6 +210,10 @@ class PersonIdentityCreateSerializer(serializers.ModelSerializer):
             'gender': {'required': True},
         }
     
+    def validate_rsu_id(self, value):
+        """RSU-ID fourni par un terminal: doit provenir d'un bloc réservé"""
+        return validate_reserved_identifier('RSU_ID', value, self.context.get('request'))
+
     def validate_birth_date(self, value):
         """Validation date naissance"""
         if value and value > date.today():
@@ -263,6 +276,7 @@ class PersonIdentityUpdateSerializer(PersonIdentityCreateSerializer):
     Serializer pour mise à jour PersonIdentity
     Tous les champs deviennent optionnels
     """
+    rsu_id = serializers.CharField(read_only=True)
     
     class Meta(PersonIdentityCreateSerializer.Meta):
         extra_kwargs = {
@@ -286,6 +300,27 @@ class PersonIdentityMinimalSerializer(serializers.ModelSerializer):
         ]
 
 
+class PersonIdentitySyncSerializer(serializers.ModelSerializer):
+    """
+    Profil compact pour synchronisation mobile
+    Champs stockés uniquement (aucun SerializerMethodField ni objet imbriqué)
+    """
+
+    class Meta:
+        model = PersonIdentity
+        list_serializer_class = FieldListSerializer
+        fields = [
+            'id', 'rsu_id', 'nip', 'first_name', 'last_name', 'birth_date',
+            'gender', 'marital_status', 'phone_number', 'education_level',
+            'employment_status', 'monthly_income',
+            'latitude', 'longitude', 'province', 'department', 'commune', 'district',
+            'has_disability', 'is_household_head',
+            'vulnerability_score', 'vulnerability_level', 'verification_status',
+            'updated_at'
+        ]
+        read_only_fields = fields
+
+
 class PersonIdentitySearchSerializer(serializers.Serializer):
     """Serializer pour recherche et déduplication"""
     first_name = serializers.CharField(required=False)
@@ -0,0 +1,83 @@
+# =============================================================================
+# FICHIER: apps/identity_app/services/accessibility_cache.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - Agrégats d'accessibilité par province et commune
+Moyennes de GeographicData.accessibility_score calculées en une seule
+requête groupée et conservées dans le cache Django.
+
+Le cache est invalidé à chaque sauvegarde/suppression d'une donnée
+géographique (recalcul du score) et reconstruit à la lecture suivante.
+"""
+from django.core.cache import cache
+from django.db.models import Count, Sum
+
+ACCESSIBILITY_CACHE_KEY = 'identity:accessibility_aggregates'
+ACCESSIBILITY_CACHE_TIMEOUT = 6 * 3600
+
+
+def build_accessibility_aggregates():
+    """
+    Agrège les scores par (province, commune)
+
+    Returns:
+        dict: {'provinces': {province: moyenne},
+               'communes': {province: {commune: moyenne}}}
+    """
+    from apps.identity_app.models import GeographicData
+
+    provinces, communes = {}, {}
+    rows = (
+        GeographicData.objects
+        .order_by()
+        .values('province', 'commune')
+        .annotate(total=Sum('accessibility_score'), count=Count('id'))
+    )
+    for row in rows:
+        total = float(row['total'] or 0)
+        province_stats = provinces.setdefault(row['province'], [0.0, 0])
+        province_stats[0] += total
+        province_stats[1] += row['count']
+        if row['commune']:
+            communes.setdefault(row['province'], {})[row['commune']] = round(
+                total / row['count'], 2
+            )
+
+    return {
+        'provinces': {
+            province: round(total / count, 2)
+            for province, (total, count) in provinces.items()
+        },
+        'communes': communes,
+    }
+
+
+def get_accessibility_aggregates():
+    """Agrégats depuis le cache (reconstruits si absents)"""
+    aggregates = cache.get(ACCESSIBILITY_CACHE_KEY)
+    if aggregates is None:
+        aggregates = refresh_accessibility_aggregates()
+    return aggregates
+
+
+def refresh_accessibility_aggregates():
+    """Recalcule et remet en cache les agrégats"""
+    aggregates = build_accessibility_aggregates()
+    cache.set(ACCESSIBILITY_CACHE_KEY, aggregates, ACCESSIBILITY_CACHE_TIMEOUT)
+    return aggregates
+
+
+def invalidate_accessibility_aggregates():
+    """Appelé par GeographicData.save/delete"""
+    cache.delete(ACCESSIBILITY_CACHE_KEY)
+
+
+def province_accessibility(province):
+    """Score moyen d'une province, None sans données géographiques"""
+    return get_accessibility_aggregates()['provinces'].get(province)
+
+
+def commune_accessibility(province, commune):
+    """Score moyen d'une commune, None sans données géographiques"""
+    return get_accessibility_aggregates()['communes'].get(province, {}).get(commune)
@@ -0,0 +1,114 @@
+# =============================================================================
+# FICHIER: apps/identity_app/services/household_demographics.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - Tranches d'âge des membres de ménage
+Effectifs < 15 ans, 15-64 ans et > 64 ans de nombreux ménages calculés
+en une seule requête groupée sur HouseholdMember (dates de naissance des
+personnes comparées à des dates seuils), sans parcourir les membres.
+
+Les champs Household.members_under_15 / members_15_64 / members_over_64
+sont tenus à jour depuis ces agrégats : à chaque ajout, modification ou
+suppression d'un membre (HouseholdMember.save/delete), et pour le
+vieillissement par la commande refresh_household_demographics. Lors du
+recalcul complet, les ménages sans membre enregistré conservent les
+effectifs déclarés ; un ménage désigné explicitement dont le dernier
+membre est parti est remis à zéro.
+"""
+from datetime import date
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+AGE_BAND_FIELDS = ('members_under_15', 'members_15_64', 'members_over_64')
+CHUNK_SIZE = 1000
+
+
+def birth_date_cutoff(today, years):
+    """Dernière date de naissance des personnes ayant au moins `years` ans"""
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:
+        # 29 février : anniversaire atteint le 28 les années non bissextiles
+        return date(today.year - years, 2, 28)
+
+
+def household_age_bands(household_ids=None, today=None):
+    """
+    Effectifs par tranche d'âge des membres actuels
+
+    Args:
+        household_ids: Ménages concernés (défaut: tous)
+        today: Date de référence des âges (défaut: aujourd'hui)
+
+    Returns:
+        dict: {household_id: {'members_under_15': n, 'members_15_64': n,
+               'members_over_64': n}} pour les ménages ayant des membres
+    """
+    from apps.identity_app.models import HouseholdMember
+
+    today = today or timezone.now().date()
+    age_15 = birth_date_cutoff(today, 15)
+    age_65 = birth_date_cutoff(today, 65)
+
+    members = HouseholdMember.objects.filter(is_current_member=True, is_active=True)
+    if household_ids is not None:
+        members = members.filter(household_id__in=list(household_ids))
+
+    rows = (
+        members
+        .order_by()
+        .values('household_id')
+        .annotate(
+            members_under_15=Count('pk', filter=Q(person__birth_date__gt=age_15)),
+            members_15_64=Count('pk', filter=Q(
+                person__birth_date__lte=age_15, person__birth_date__gt=age_65
+            )),
+            members_over_64=Count('pk', filter=Q(person__birth_date__lte=age_65)),
+        )
+    )
+    return {
+        row['household_id']: {field: row[field] for field in AGE_BAND_FIELDS}
+        for row in rows
+    }
+
+
+def refresh_household_age_bands(household_ids=None, today=None):
+    """
+    Reporte les agrégats sur les ménages dont les effectifs ont changé
+
+    Une requête d'agrégat, une lecture des effectifs enregistrés et un
+    bulk_update par bloc de CHUNK_SIZE ménages modifiés.
+
+    Args:
+        household_ids: Ménages à recalculer (défaut: tous ceux ayant des
+                       membres) ; ceux sans membre actuel sont remis à zéro
+
+    Returns:
+        int: Nombre de ménages mis à jour
+    """
+    from apps.identity_app.models import Household
+
+    if household_ids is not None:
+        household_ids = list(household_ids)
+    bands = household_age_bands(household_ids, today)
+    for household_id in household_ids or ():
+        bands.setdefault(household_id, dict.fromkeys(AGE_BAND_FIELDS, 0))
+
+    now = timezone.now()
+    changed = []
+    stored = Household.objects.filter(pk__in=list(bands)).only('pk', *AGE_BAND_FIELDS)
+    for household in stored.iterator(chunk_size=CHUNK_SIZE):
+        counts = bands[household.pk]
+        if all(getattr(household, field) == counts[field] for field in AGE_BAND_FIELDS):
+            continue
+        for field, value in counts.items():
+            setattr(household, field, value)
+        household.updated_at = now
+        changed.append(household)
+
+    Household.objects.bulk_update(
+        changed, [*AGE_BAND_FIELDS, 'updated_at'], batch_size=CHUNK_SIZE
+    )
+    return len(changed)
@@ -0,0 +1,82 @@
+# =============================================================================
+# FICHIER: apps/identity_app/services/spatial_index.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - Requêtes spatiales sur index geohash
+Rayon, boîte englobante et k plus proches voisins pour tout queryset
+possédant les champs `geohash`, `latitude` et `longitude`
+(PersonIdentity, Household) — sans PostGIS.
+
+Principe : la zone est couverte par quelques cellules geohash, chacune
+traduite en plage [préfixe, préfixe suivant) sur l'index du champ; le
+filtrage exact (boîte ou haversine) ne porte que sur ces candidats.
+"""
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+
+from utils.geo import (
+    bbox_around, geohash_cover, geohash_prefix_upper_bound, haversine_km
+)
+
+DEFAULT_KNN_START_RADIUS_KM = 1.0
+DEFAULT_KNN_MAX_RADIUS_KM = 1000.0
+
+
+def cell_q(cell, field='geohash'):
+    """Q d'une cellule : plage d'index [cellule, cellule suivante)"""
+    upper = geohash_prefix_upper_bound(cell)
+    if upper is None:
+        return Q(**{f'{field}__gte': cell})
+    return Q(**{f'{field}__gte': cell, f'{field}__lt': upper})
+
+
+def cells_q(cells, field='geohash'):
+    """Q couvrant plusieurs cellules"""
+    return reduce(or_, (cell_q(cell, field) for cell in cells))
+
+
+def within_bbox(queryset, min_lat, min_lon, max_lat, max_lon):
+    """Enregistrements situés dans la boîte englobante (filtre exact)"""
+    cells = geohash_cover(min_lat, min_lon, max_lat, max_lon)
+    return queryset.filter(cells_q(cells)).filter(
+        latitude__gte=min_lat, latitude__lte=max_lat,
+        longitude__gte=min_lon, longitude__lte=max_lon,
+    )
+
+
+def within_radius(queryset, latitude, longitude, radius_km):
+    """
+    Enregistrements à moins de `radius_km` du point.
+
+    Returns:
+        list: [(objet, distance_km)] triés par distance croissante
+    """
+    candidates = within_bbox(queryset, *bbox_around(latitude, longitude, radius_km))
+    results = []
+    for obj in candidates:
+        distance = haversine_km(latitude, longitude, obj.latitude, obj.longitude)
+        if distance <= radius_km:
+            results.append((obj, distance))
+    results.sort(key=lambda item: item[1])
+    return results
+
+
+def nearest(queryset, latitude, longitude, k,
+            start_radius_km=DEFAULT_KNN_START_RADIUS_KM,
+            max_radius_km=DEFAULT_KNN_MAX_RADIUS_KM):
+    """
+    k plus proches voisins par rayon croissant (doublé à chaque tour).
+    Exact : une recherche par rayon renvoie tous les points du disque.
+
+    Returns:
+        list: [(objet, distance_km)] — au plus k éléments
+    """
+    radius = start_radius_km
+    while True:
+        results = within_radius(queryset, latitude, longitude, radius)
+        if len(results) >= k or radius >= max_radius_km:
+            return results[:k]
+        radius = min(radius * 2, max_radius_km)
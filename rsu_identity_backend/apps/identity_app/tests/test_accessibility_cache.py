@@ -0,0 +1,68 @@
+# =============================================================================
+# FICHIER: apps/identity_app/tests/test_accessibility_cache.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - Tests agrégats d'accessibilité en cache
+"""
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.identity_app.models import GeographicData
+from apps.identity_app.services.accessibility_cache import (
+    commune_accessibility, get_accessibility_aggregates, province_accessibility
+)
+from apps.services_app.services import GeotargetingService
+
+
+class AccessibilityCacheTests(TestCase):
+    """Agrégats province/commune et invalidation à la sauvegarde"""
+
+    def setUp(self):
+        cache.clear()
+        self.sites = [
+            GeographicData.objects.create(
+                location_name=name, province='NYANGA', commune=commune,
+                accessibility_score=Decimal(score)
+            )
+            for name, commune, score in [
+                ('Site A', 'Tchibanga', '40'),
+                ('Site B', 'Tchibanga', '60'),
+                ('Site C', 'Mayumba', '20'),
+            ]
+        ]
+
+    def test_aggregates_single_query_then_cached(self):
+        with self.assertNumQueries(1):
+            aggregates = get_accessibility_aggregates()
+        self.assertEqual(aggregates['provinces'], {'NYANGA': 40.0})
+        self.assertEqual(aggregates['communes']['NYANGA'], {'Tchibanga': 50.0, 'Mayumba': 20.0})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(province_accessibility('NYANGA'), 40.0)
+            self.assertEqual(commune_accessibility('NYANGA', 'Mayumba'), 20.0)
+            self.assertIsNone(province_accessibility('ESTUAIRE'))
+
+    def test_save_and_delete_refresh_aggregates(self):
+        self.assertEqual(province_accessibility('NYANGA'), 40.0)
+
+        self.sites[2].accessibility_score = Decimal('80')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sites[2].save()
+            # Invalidation différée à la validation de la transaction
+            self.assertEqual(province_accessibility('NYANGA'), 40.0)
+        self.assertEqual(province_accessibility('NYANGA'), 60.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sites[2].delete()
+        self.assertEqual(province_accessibility('NYANGA'), 50.0)
+
+    def test_geotargeting_reads_cache(self):
+        service = GeotargetingService()
+        service.calculate_zone_accessibility_score('NYANGA')
+        with self.assertNumQueries(0):
+            self.assertEqual(service.calculate_zone_accessibility_score('NYANGA'), 40.0)
+            # Province sans données: estimation selon zone prioritaire
+            self.assertEqual(service.calculate_zone_accessibility_score('ESTUAIRE'), 85.0)
@@ -0,0 +1,78 @@
+# =============================================================================
+# FICHIER: apps/identity_app/tests/test_fast_list.py
+# =============================================================================
+
+"""
+Tests du chemin de liste rapide (values()) des personnes
+"""
+import json
+from decimal import Decimal
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.core_app.models import RSUUser
+from apps.identity_app.models import PersonIdentity
+from apps.identity_app.serializers import (
+    PersonIdentitySerializer, PersonIdentityFastListSerializer
+)
+from apps.identity_app.views.person_views import PersonIdentityViewSet
+
+
+def _as_json(data):
+    return json.loads(JSONRenderer().render(data))
+
+
+class PersonFastListTests(TestCase):
+    """Parité avec PersonIdentitySerializer et sélection ?fields="""
+
+    def setUp(self):
+        self.admin = RSUUser.objects.create_user(
+            username='fast_admin', email='fast@rsu.ga', password='test123',
+            user_type='ADMIN', employee_id='FAST-001',
+            first_name='Awa', last_name='Ndong'
+        )
+        PersonIdentity.objects.create(
+            first_name='Marie', last_name='Koumba', birth_date='1950-02-10',
+            gender='F', province='NYANGA', is_household_head=True,
+            employment_status='UNEMPLOYED', monthly_income=Decimal('45000.00'),
+            latitude=Decimal('-2.900000'), longitude=Decimal('10.980000'),
+            has_disability=True, created_by=self.admin, verified_by=self.admin
+        )
+        PersonIdentity.objects.create(
+            first_name='Jean', last_name='Ella', birth_date='1995-08-21',
+            gender='M', province='ESTUAIRE'
+        )
+        PersonIdentity.objects.create(
+            first_name='Sans', last_name='Province', birth_date='2022-01-01', gender='M'
+        )
+
+    def test_output_matches_full_serializer(self):
+        queryset = PersonIdentity.objects.order_by('last_name')
+        expected = _as_json(PersonIdentitySerializer(queryset, many=True).data)
+
+        fast = PersonIdentityFastListSerializer()
+        self.assertEqual(_as_json(fast.serialize(fast.values(queryset))), expected)
+
+    def test_sparse_fieldset_limits_columns(self):
+        fast = PersonIdentityFastListSerializer(fields=['rsu_id', 'full_name'])
+        self.assertEqual(fast.columns, ['rsu_id', 'first_name', 'last_name'])
+
+        rows = fast.serialize(fast.values(PersonIdentity.objects.all()))
+        self.assertEqual(set(rows[0]), {'rsu_id', 'full_name'})
+
+    def test_list_endpoint_fields_param(self):
+        request = APIRequestFactory().get('/persons/', {'fields': 'rsu_id,province_info'})
+        force_authenticate(request, user=self.admin)
+        response = PersonIdentityViewSet.as_view({'get': 'list'})(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(set(response.data['results'][0]), {'rsu_id', 'province_info'})
+
+    def test_unknown_field_rejected(self):
+        request = APIRequestFactory().get('/persons/', {'fields': 'rsu_id,password'})
+        force_authenticate(request, user=self.admin)
+        response = PersonIdentityViewSet.as_view({'get': 'list'})(request)
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,101 @@
+# =============================================================================
+# FICHIER: apps/identity_app/tests/test_household_demographics.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - Tests tranches d'âge des ménages agrégées en base
+"""
+from datetime import date
+
+from django.test import TestCase
+
+from apps.identity_app.models import Household, HouseholdMember, PersonIdentity
+from apps.identity_app.services.household_demographics import (
+    birth_date_cutoff, household_age_bands, refresh_household_age_bands
+)
+
+TODAY = date(2026, 6, 15)
+
+
+class HouseholdDemographicsTests(TestCase):
+    """Effectifs < 15 / 15-64 / > 64 ans en une requête groupée"""
+
+    def _person(self, birth_date, first_name='Membre'):
+        return PersonIdentity.objects.create(
+            first_name=first_name, last_name='Nzé', birth_date=birth_date, gender='F'
+        )
+
+    def _household(self, head, members):
+        household = Household.objects.create(
+            head_of_household=head, household_size=len(members) + 1, province='ESTUAIRE'
+        )
+        HouseholdMember.objects.bulk_create([
+            HouseholdMember(household=household, person=head, relationship_to_head='HEAD')
+        ] + [
+            HouseholdMember(household=household, person=self._person(birth_date), relationship_to_head='CHILD')
+            for birth_date in members
+        ])
+        return household
+
+    def setUp(self):
+        self.large = self._household(self._person(date(1980, 1, 1), 'Chef'), [
+            date(2015, 3, 1),    # 11 ans
+            date(2011, 6, 16),   # 14 ans (15 ans demain)
+            date(2011, 6, 15),   # 15 ans aujourd'hui
+            date(1961, 6, 16),   # 64 ans
+            date(1961, 6, 15),   # 65 ans aujourd'hui
+        ])
+        self.small = self._household(self._person(date(1950, 1, 1), 'Aïeule'), [])
+        # Membre parti : exclu des effectifs
+        HouseholdMember.objects.filter(household=self.large, person__birth_date=date(2015, 3, 1)).update(
+            is_current_member=False
+        )
+
+    def test_age_bands_single_query(self):
+        with self.assertNumQueries(1):
+            bands = household_age_bands(today=TODAY)
+
+        self.assertEqual(bands[self.large.pk], {
+            'members_under_15': 1, 'members_15_64': 3, 'members_over_64': 1,
+        })
+        self.assertEqual(bands[self.small.pk], {
+            'members_under_15': 0, 'members_15_64': 0, 'members_over_64': 1,
+        })
+
+    def test_refresh_updates_changed_households_only(self):
+        self.assertEqual(refresh_household_age_bands(today=TODAY), 2)
+        self.assertEqual(refresh_household_age_bands(today=TODAY), 0)
+
+        self.large.refresh_from_db()
+        self.assertEqual(self.large.calculate_dependency_ratio(), round(2 / 3 * 100, 2))
+
+    def test_member_changes_refresh_household(self):
+        child = self._person(date.today().replace(year=date.today().year - 3))
+        with self.captureOnCommitCallbacks(execute=True):
+            member = HouseholdMember.objects.create(
+                household=self.small, person=child, relationship_to_head='GRANDCHILD'
+            )
+        self.small.refresh_from_db()
+        self.assertEqual((self.small.members_under_15, self.small.members_over_64), (1, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            member.delete()
+        self.small.refresh_from_db()
+        self.assertEqual(self.small.members_under_15, 0)
+
+    def test_household_left_without_members_is_reset(self):
+        refresh_household_age_bands(today=TODAY)
+        HouseholdMember.objects.filter(household=self.small).update(is_current_member=False)
+
+        # Recalcul complet : ménage sans membre ignoré ; désigné : remis à zéro
+        self.assertEqual(refresh_household_age_bands(today=TODAY), 0)
+        self.assertEqual(refresh_household_age_bands([self.small.pk], today=TODAY), 1)
+        self.small.refresh_from_db()
+        self.assertEqual(
+            (self.small.members_under_15, self.small.members_15_64, self.small.members_over_64),
+            (0, 0, 0)
+        )
+
+    def test_leap_day_cutoff(self):
+        self.assertEqual(birth_date_cutoff(date(2028, 2, 29), 15), date(2013, 2, 28))
+        self.assertEqual(birth_date_cutoff(date(2028, 2, 29), 16), date(2012, 2, 29))
@@ -0,0 +1,182 @@
+# =============================================================================
+# FICHIER: apps/identity_app/tests/test_id_allocation.py
+# =============================================================================
+
+"""
+Tests de l'allocation d'identifiants RSU par blocs
+"""
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+from apps.core_app.models import RSUUser
+from apps.identity_app.models import (
+    PersonIdentity, Household, IdentifierSequence, IdentifierBlock
+)
+from apps.identity_app.serializers import PersonIdentityCreateSerializer
+from apps.identity_app.views.id_block_views import IdentifierBlockViewSet
+from utils.gabonese_data import (
+    IdentifierAllocator, allocate_rsu_ids, format_rsu_id, format_household_id,
+    has_valid_check_char, compute_check_char, encode_base36
+)
+
+
+class RSUIDEncodingTests(TestCase):
+    """Encodage base36 et clé de contrôle"""
+
+    def test_format_keeps_legacy_length(self):
+        rsu_id = format_rsu_id(1)
+        self.assertTrue(rsu_id.startswith('RSU-GA-'))
+        self.assertEqual(len(rsu_id), 15)
+        self.assertTrue(has_valid_check_char(rsu_id))
+
+    def test_check_char_detects_single_substitution(self):
+        payload = encode_base36(123456789)
+        check = compute_check_char(payload)
+        altered = payload[:3] + ('0' if payload[3] != '0' else '1') + payload[4:]
+        self.assertNotEqual(compute_check_char(altered), check)
+
+    def test_lexicographic_order_follows_sequence(self):
+        ids = [format_rsu_id(value) for value in (9, 10, 35, 36, 1295, 1296)]
+        self.assertEqual([i[:-1] for i in ids], sorted(i[:-1] for i in ids))
+
+
+class IdentifierAllocatorTests(TestCase):
+    """Réservation de blocs sans requête par identifiant"""
+
+    def test_bulk_allocation_is_unique_and_usable_with_bulk_create(self):
+        ids = allocate_rsu_ids(50)
+        self.assertEqual(len(set(ids)), 50)
+
+        PersonIdentity.objects.bulk_create([
+            PersonIdentity(rsu_id=rsu_id, first_name='Test', last_name=str(i),
+                           birth_date='1990-01-01', gender='M')
+            for i, rsu_id in enumerate(ids)
+        ])
+        self.assertEqual(PersonIdentity.objects.filter(rsu_id__in=ids).count(), 50)
+
+    def test_query_count_independent_of_block_size(self):
+        allocator = IdentifierAllocator(block_size=500)
+        allocator.reserve_block(1)  # création de la ligne de séquence
+        with CaptureQueriesContext(connection) as small:
+            allocator.reserve_block(10)
+        with CaptureQueriesContext(connection) as large:
+            allocator.reserve_block(1000)
+        self.assertEqual(len(small), len(large))
+
+    def test_existing_ids_in_range_are_skipped(self):
+        next_value = IdentifierSequence.reserve('RSU_ID', 1).stop
+        taken = format_rsu_id(next_value + 1)
+        PersonIdentity.objects.create(
+            rsu_id=taken, first_name='Ancien', last_name='ID',
+            birth_date='1980-01-01', gender='F'
+        )
+
+        ids = IdentifierAllocator().reserve_block(5)
+        self.assertNotIn(taken, ids)
+        self.assertEqual(len(ids), 4)
+
+
+class IdentifierAllocatorCacheTests(TransactionTestCase):
+    """Cache local alimenté uniquement par des réservations validées"""
+
+    def test_next_id_served_from_memory_within_block(self):
+        allocator = IdentifierAllocator(block_size=20)
+        allocator.next_id()
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(19):
+                allocator.next_id()
+        self.assertEqual(len(queries), 0)
+
+    def test_rolled_back_reservation_is_not_cached(self):
+        allocator = IdentifierAllocator(block_size=50)
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                allocator.next_id()
+                raise RuntimeError("Échec de la requête")
+
+        # L'avance annulée est réattribuée : aucune valeur ne doit rester en cache
+        reserved = {format_rsu_id(value) for value in IdentifierSequence.reserve('RSU_ID', 50)}
+        identifiers = [allocator.next_id() for _ in range(50)]
+        self.assertFalse(reserved & set(identifiers))
+        self.assertEqual(len(set(identifiers)), 50)
+
+    def test_committed_reserve_continues_sequence(self):
+        # Ligne créée par la connexion autonome, puis avancée par les deux chemins
+        self.assertEqual(list(IdentifierSequence.reserve_committed('HOUSEHOLD_ID', 3)), [1, 2, 3])
+        self.assertEqual(list(IdentifierSequence.reserve('HOUSEHOLD_ID', 2)), [4, 5])
+        self.assertEqual(list(IdentifierSequence.reserve_committed('HOUSEHOLD_ID', 2)), [6, 7])
+        self.assertEqual(IdentifierSequence.objects.get(name='HOUSEHOLD_ID').next_value, 8)
+
+
+class IdentifierBlockReservationTests(TestCase):
+    """Réservation de blocs par terminal et synchronisation hors ligne"""
+
+    def setUp(self):
+        self.surveyor = RSUUser.objects.create_user(
+            username='surveyor_blocks', email='blocks@rsu.ga', password='test123',
+            user_type='SURVEYOR', employee_id='BLK-001'
+        )
+        self.factory = APIRequestFactory()
+
+    def _reserve(self, user, **payload):
+        request = self.factory.post('/id-blocks/reserve/', payload, format='json')
+        force_authenticate(request, user=user)
+        return IdentifierBlockViewSet.as_view({'post': 'reserve'})(request)
+
+    def test_reserve_records_owner_and_returns_identifiers(self):
+        response = self._reserve(
+            self.surveyor, device_id='TAB-001', rsu_id_count=20, household_id_count=5
+        )
+        self.assertEqual(response.status_code, 201)
+
+        blocks = {b['sequence_name']: b for b in response.data['blocks']}
+        self.assertEqual(len(blocks['RSU_ID']['identifiers']), 20)
+        self.assertEqual(len(blocks['HOUSEHOLD_ID']['identifiers']), 5)
+        self.assertTrue(all(i.startswith('HH-GA-') for i in blocks['HOUSEHOLD_ID']['identifiers']))
+        self.assertEqual(
+            IdentifierBlock.objects.filter(owner=self.surveyor, device_id='TAB-001').count(), 2
+        )
+
+    def test_blocks_do_not_overlap(self):
+        first = IdentifierBlock.reserve_for_device('RSU_ID', 'TAB-A', 10, self.surveyor)
+        second = IdentifierBlock.reserve_for_device('RSU_ID', 'TAB-B', 10, self.surveyor)
+        self.assertFalse(set(first.get_identifiers()) & set(second.get_identifiers()))
+
+    def test_offline_rsu_id_accepted_only_from_owned_block(self):
+        block = IdentifierBlock.reserve_for_device('RSU_ID', 'TAB-001', 5, self.surveyor)
+        rsu_id = block.get_identifiers()[0]
+        request = self.factory.post('/persons/')
+        request.user = self.surveyor
+        data = {'first_name': 'Paul', 'last_name': 'Obame', 'birth_date': '1985-03-02',
+                'gender': 'M', 'rsu_id': rsu_id}
+
+        serializer = PersonIdentityCreateSerializer(data=data, context={'request': request})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.save().rsu_id, rsu_id)
+
+        other = RSUUser.objects.create_user(
+            username='other_surveyor', email='other@rsu.ga', password='test123',
+            user_type='SURVEYOR', employee_id='BLK-002'
+        )
+        request.user = other
+        data['rsu_id'] = block.get_identifiers()[1]
+        serializer = PersonIdentityCreateSerializer(data=data, context={'request': request})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('rsu_id', serializer.errors)
+
+    def test_unreserved_rsu_id_rejected(self):
+        data = {'first_name': 'Paul', 'last_name': 'Obame', 'birth_date': '1985-03-02',
+                'gender': 'M', 'rsu_id': format_rsu_id(10 ** 9)}
+        serializer = PersonIdentityCreateSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('rsu_id', serializer.errors)
+
+    def test_household_save_uses_sequence(self):
+        head = PersonIdentity.objects.create(
+            first_name='Chef', last_name='Ménage', birth_date='1970-01-01', gender='M'
+        )
+        household = Household.objects.create(head_of_household=head, household_size=3)
+        self.assertTrue(household.household_id.startswith('HH-GA-'))
+        self.assertEqual(len(household.household_id), 14)
+        self.assertTrue(has_valid_check_char(household.household_id))
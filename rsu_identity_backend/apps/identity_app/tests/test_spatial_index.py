@@ -0,0 +1,128 @@
+# =============================================================================
+# FICHIER: apps/identity_app/tests/test_spatial_index.py
+# =============================================================================
+
+"""
+Tests de l'index spatial geohash (rayon, boîte, k plus proches)
+"""
+from decimal import Decimal
+
+from django.test import TestCase, SimpleTestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.core_app.models import RSUUser
+from apps.identity_app.models import PersonIdentity, Household
+from apps.identity_app.services import spatial_index
+from apps.identity_app.views.household_views import HouseholdViewSet
+from utils.geo import (
+    geohash_encode, geohash_cover, geohash_prefix_upper_bound, haversine_km
+)
+
+LIBREVILLE = (0.4162, 9.4673)
+OWENDO = (0.2917, 9.5047)          # ≈ 14,5 km de Libreville
+NTOUM = (0.3906, 9.7611)           # ≈ 32,8 km de Libreville
+FRANCEVILLE = (-1.6333, 13.5833)   # ≈ 480 km de Libreville
+
+
+class GeohashUtilsTests(SimpleTestCase):
+    """Encodage et couverture de zone"""
+
+    def test_encode_reference_point(self):
+        # Valeur de référence : 57.64911, 10.40744 → u4pruydqq
+        self.assertEqual(geohash_encode(57.64911, 10.40744), 'u4pruydqq')
+
+    def test_prefix_upper_bound_carries(self):
+        self.assertEqual(geohash_prefix_upper_bound('s0n'), 's0p')
+        self.assertEqual(geohash_prefix_upper_bound('s0z'), 's1')
+        self.assertIsNone(geohash_prefix_upper_bound('zz'))
+
+    def test_cover_contains_points_of_box(self):
+        cells = geohash_cover(0.2, 9.3, 0.6, 9.8)
+        self.assertLessEqual(len(cells), 64)
+        for point in (LIBREVILLE, OWENDO, NTOUM):
+            self.assertTrue(any(geohash_encode(*point).startswith(c) for c in cells))
+
+    def test_haversine(self):
+        self.assertAlmostEqual(haversine_km(*LIBREVILLE, *OWENDO), 14.5, delta=0.5)
+
+
+class SpatialIndexTests(TestCase):
+    """Requêtes spatiales sur les ménages et les personnes"""
+
+    def setUp(self):
+        self.admin = RSUUser.objects.create_user(
+            username='geo_admin', email='geo@rsu.ga', password='test123',
+            user_type='ADMIN', employee_id='GEO-001'
+        )
+        self.households = {}
+        for name, (lat, lon) in {
+            'libreville': LIBREVILLE, 'owendo': OWENDO,
+            'ntoum': NTOUM, 'franceville': FRANCEVILLE,
+        }.items():
+            head = PersonIdentity.objects.create(
+                first_name='Chef', last_name=name.title(), birth_date='1980-01-01',
+                gender='M', latitude=Decimal(str(lat)), longitude=Decimal(str(lon)),
+                is_household_head=True, created_by=self.admin
+            )
+            self.households[name] = Household.objects.create(
+                head_of_household=head, household_size=3, province='ESTUAIRE',
+                latitude=Decimal(str(lat)), longitude=Decimal(str(lon)),
+                created_by=self.admin
+            )
+        Household.objects.create(
+            head_of_household=PersonIdentity.objects.create(
+                first_name='Sans', last_name='Gps', birth_date='1980-01-01', gender='F'
+            ),
+            household_size=1, province='ESTUAIRE'
+        )
+
+    def test_geohash_maintained_on_save(self):
+        household = self.households['libreville']
+        self.assertEqual(household.geohash, geohash_encode(*LIBREVILLE))
+
+        household.latitude, household.longitude = Decimal('-1.6333'), Decimal('13.5833')
+        household.save(update_fields=['latitude', 'longitude'])
+        household.refresh_from_db()
+        self.assertEqual(household.geohash, geohash_encode(*FRANCEVILLE))
+
+        self.assertIsNone(Household.objects.get(head_of_household__last_name='Gps').geohash)
+
+    def test_within_radius_sorted_by_distance(self):
+        results = spatial_index.within_radius(Household.objects.all(), *LIBREVILLE, 40)
+        names = [h.head_of_household.last_name for h, _ in results]
+        self.assertEqual(names, ['Libreville', 'Owendo', 'Ntoum'])
+        self.assertEqual(results[0][1], 0)
+
+        results = spatial_index.within_radius(Household.objects.all(), *LIBREVILLE, 20)
+        self.assertEqual(len(results), 2)
+
+    def test_within_bbox(self):
+        queryset = spatial_index.within_bbox(PersonIdentity.objects.all(), 0.0, 9.0, 1.0, 10.0)
+        self.assertEqual(
+            set(queryset.values_list('last_name', flat=True)),
+            {'Libreville', 'Owendo', 'Ntoum'}
+        )
+
+    def test_nearest_expands_radius(self):
+        results = spatial_index.nearest(Household.objects.all(), *FRANCEVILLE, k=2)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0][0], self.households['franceville'])
+        self.assertGreater(results[1][1], 400)
+
+    def test_nearby_action(self):
+        view = HouseholdViewSet.as_view({'get': 'nearby'})
+        request = APIRequestFactory().get(
+            '/households/nearby/', {'lat': LIBREVILLE[0], 'lng': LIBREVILLE[1], 'radius_km': 20}
+        )
+        force_authenticate(request, user=self.admin)
+        response = view(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(
+            response.data['results'][1]['household_id'],
+            self.households['owendo'].household_id
+        )
+
+        request = APIRequestFactory().get('/households/nearby/', {'lat': 'x', 'lng': 9})
+        force_authenticate(request, user=self.admin)
+        self.assertEqual(view(request).status_code, 400)
@@ -0,0 +1,74 @@
+# =============================================================================
+# FICHIER: apps/identity_app/tests/test_sync_format.py
+# =============================================================================
+
+"""
+Tests du format de synchronisation mobile (MessagePack + profil compact)
+"""
+import json
+
+import msgpack
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.core_app.models import RSUUser
+from apps.identity_app.models import PersonIdentity
+from apps.identity_app.serializers import PersonIdentitySyncSerializer
+from apps.identity_app.views.person_views import PersonIdentityViewSet
+
+
+class CompactSyncProfileTests(TestCase):
+    """Négociation MessagePack et profil field-list"""
+
+    def setUp(self):
+        self.admin = RSUUser.objects.create_user(
+            username='sync_admin', email='sync@rsu.ga', password='test123',
+            user_type='ADMIN', employee_id='SYNC-001'
+        )
+        for i in range(3):
+            PersonIdentity.objects.create(
+                first_name=f'Prénom{i}', last_name='Nzé', birth_date='1990-05-01',
+                gender='F', province='ESTUAIRE', created_by=self.admin
+            )
+        self.factory = APIRequestFactory()
+        self.list_view = PersonIdentityViewSet.as_view({'get': 'list'})
+
+    def _list(self, **extra):
+        request = self.factory.get('/persons/', **extra)
+        force_authenticate(request, user=self.admin)
+        response = self.list_view(request)
+        response.render()
+        return response
+
+    def test_compact_profile_returns_field_list_rows(self):
+        response = self._list(data={'profile': 'compact'})
+        results = json.loads(response.content)['results']
+
+        self.assertEqual(results['fields'], PersonIdentitySyncSerializer.Meta.fields)
+        self.assertEqual(len(results['rows']), 3)
+        self.assertNotIn('province_info', results['fields'])
+
+    def test_msgpack_negotiation_implies_compact_and_is_smaller(self):
+        full = self._list()
+        packed = self._list(HTTP_ACCEPT='application/msgpack')
+
+        self.assertEqual(packed['Content-Type'], 'application/msgpack')
+        payload = msgpack.unpackb(packed.content, raw=False)
+        self.assertEqual(len(payload['results']['rows']), 3)
+        self.assertLess(len(packed.content) * 3, len(full.content))
+
+    def test_msgpack_request_body_is_parsed(self):
+        body = msgpack.packb({
+            'first_name': 'Alain', 'last_name': 'Moussavou',
+            'birth_date': '1982-07-14', 'gender': 'M'
+        })
+        request = self.factory.post(
+            '/persons/', body, content_type='application/msgpack',
+            HTTP_ACCEPT='application/msgpack'
+        )
+        force_authenticate(request, user=self.admin)
+        response = PersonIdentityViewSet.as_view({'post': 'create'})(request)
+        response.render()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(msgpack.unpackb(response.content, raw=False)['rsu_id'].startswith('RSU-GA-'))
@@ -13,6 +13,7 @@ from rest_framework.routers import DefaultRouter
 # IMPORTS CORRECTS selon structure réelle des views
 from .views.person_views import PersonIdentityViewSet
 from .views.household_views import HouseholdViewSet, HouseholdMemberViewSet
+from .views.id_block_views import IdentifierBlockViewSet
 
 # Imports optionnels (commentés si non disponibles)
 try:
@@ -36,6 +37,7 @@ router = DefaultRouter()
 router.register(r'persons', PersonIdentityViewSet, basename='personidentity')
 router.register(r'households', HouseholdViewSet, basename='household')
 router.register(r'household-members', HouseholdMemberViewSet, basename='householdmember')
+router.register(r'id-blocks', IdentifierBlockViewSet, basename='identifierblock')
 
 # ViewSets OPTIONNELS (ajoutés seulement si disponibles)
 if GEOGRAPHIC_AVAILABLE:
@@ -75,5 +77,6 @@ urlpatterns = [
 # POST   /api/v1/identity/persons/{id}/search_duplicates/      → personidentity-search-duplicates  
 # GET    /api/v1/identity/persons/vulnerability_report/        → personidentity-vulnerability-report
 # GET    /api/v1/identity/households/{id}/add_member/          → household-add-member
+# POST   /api/v1/identity/id-blocks/reserve/                   → identifierblock-reserve
 # 
 # =============================================================================
\ No newline at end of file
@@ -17,17 +17,20 @@ from django.db.models import Count, Avg, Sum
 from apps.identity_app.models import Household, HouseholdMember
 from apps.identity_app.serializers import (
     HouseholdSerializer, HouseholdCreateSerializer,
-    HouseholdMemberSerializer, HouseholdMemberCreateSerializer
+    HouseholdMemberSerializer, HouseholdMemberCreateSerializer, HouseholdSyncSerializer
 )
 from apps.core_app.views.permissions import IsSurveyorOrSupervisor
+from apps.core_app.views.mixins import CompactSyncMixin
 from apps.core_app.models import AuditLog
+from apps.services_app.services import GeotargetingService
 
-class HouseholdViewSet(viewsets.ModelViewSet):
+class HouseholdViewSet(CompactSyncMixin, viewsets.ModelViewSet):
     """
     ViewSet pour gestion des ménages
     """
     queryset = Household.objects.all()
     serializer_class = HouseholdSerializer
+    compact_serializer_class = HouseholdSyncSerializer  # ?profile=compact / msgpack
     permission_classes = [IsAuthenticated, IsSurveyorOrSupervisor]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     
@@ -44,7 +47,7 @@ class HouseholdViewSet(viewsets.ModelViewSet):
     def get_serializer_class(self):
         if self.action == 'create':
             return HouseholdCreateSerializer
-        return HouseholdSerializer
+        return super().get_serializer_class()
     
     def get_queryset(self):
         """Filtrage géographique"""
@@ -79,6 +82,48 @@ class HouseholdViewSet(viewsets.ModelViewSet):
         
         return Response(stats)
 
+    @action(detail=False, methods=['get'])
+    def nearby(self, request):
+        """
+        Ménages proches d'un point GPS (index geohash)
+        ?lat=&lng=&radius_km=5  ou  ?lat=&lng=&k=10 (k plus proches)
+        """
+        try:
+            latitude = float(request.query_params['lat'])
+            longitude = float(request.query_params['lng'])
+            radius_km = float(request.query_params.get('radius_km', 5))
+            k = request.query_params.get('k')
+            k = int(k) if k else None
+        except (KeyError, ValueError):
+            return Response(
+                {'error': 'lat et lng numériques requis (radius_km et k optionnels)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180) or radius_km <= 0 \
+                or radius_km > 500 or (k is not None and not 1 <= k <= 500):
+            return Response(
+                {'error': 'Coordonnées, rayon (0-500 km) ou k (1-500) invalides'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        service = GeotargetingService()
+        queryset = self.get_queryset().select_related(None).prefetch_related(None)
+        if k:
+            results = service.find_nearest_households(latitude, longitude, k, queryset=queryset)
+        else:
+            results = service.find_households_within_radius(
+                latitude, longitude, radius_km, queryset=queryset
+            )
+
+        return Response({
+            'center': {'latitude': latitude, 'longitude': longitude},
+            'radius_km': None if k else radius_km,
+            'k': k,
+            'count': len(results),
+            'results': results,
+        })
+
 
 class HouseholdMemberViewSet(viewsets.ModelViewSet):
     """ViewSet pour membres de ménages"""
@@ -0,0 +1,98 @@
+# =============================================================================
+# FICHIER: apps/identity_app/views/id_block_views.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - ID Block ViewSet
+Réservation de blocs d'identifiants par terminal d'enquête (mode hors ligne)
+"""
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django.db import transaction
+
+from apps.identity_app.models import IdentifierBlock
+from apps.identity_app.serializers import (
+    IdentifierBlockSerializer, IdentifierBlockDetailSerializer,
+    IdentifierBlockReservationSerializer
+)
+from apps.core_app.views.permissions import IsSurveyorOrSupervisor
+from apps.core_app.models import AuditLog
+
+
+class IdentifierBlockViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Blocs d'identifiants réservés par les terminaux mobiles.
+
+    Le terminal attribue hors ligne les RSU-ID et ID ménage définitifs
+    de ses blocs : la synchronisation n'a plus de renumérotation.
+    """
+    serializer_class = IdentifierBlockSerializer
+    permission_classes = [IsAuthenticated, IsSurveyorOrSupervisor]
+
+    def get_queryset(self):
+        user = self.request.user
+        queryset = IdentifierBlock.objects.select_related('owner')
+
+        if not (user.is_staff or user.user_type == 'ADMIN'):
+            queryset = queryset.filter(owner=user)
+
+        device_id = self.request.query_params.get('device_id')
+        if device_id:
+            queryset = queryset.filter(device_id=device_id)
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'retrieve':
+            return IdentifierBlockDetailSerializer
+        return IdentifierBlockSerializer
+
+    @action(detail=False, methods=['post'])
+    def reserve(self, request):
+        """
+        Réserve un bloc RSU-ID et/ou un bloc ID ménage pour un terminal.
+
+        Body:
+        {
+            "device_id": "TAB-LBV-0042",
+            "rsu_id_count": 500,
+            "household_id_count": 100
+        }
+        """
+        serializer = IdentifierBlockReservationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        requested = [
+            ('RSU_ID', data['rsu_id_count']),
+            ('HOUSEHOLD_ID', data['household_id_count']),
+        ]
+
+        with transaction.atomic():
+            blocks = [
+                IdentifierBlock.reserve_for_device(
+                    sequence_name=sequence_name,
+                    device_id=data['device_id'],
+                    size=count,
+                    owner=request.user
+                )
+                for sequence_name, count in requested if count
+            ]
+
+        AuditLog.log_action(
+            user=request.user,
+            action='CREATE',
+            description=(
+                f"Réservation blocs d'identifiants pour terminal {data['device_id']}: "
+                + ', '.join(f"{b.sequence_name} [{b.start_value}-{b.end_value})" for b in blocks)
+            ),
+            ip_address=request.META.get('REMOTE_ADDR'),
+            user_agent=request.META.get('HTTP_USER_AGENT'),
+            severity='MEDIUM'
+        )
+
+        return Response({
+            'device_id': data['device_id'],
+            'blocks': IdentifierBlockDetailSerializer(blocks, many=True).data
+        }, status=status.HTTP_201_CREATED)
@@ -20,14 +20,17 @@ from apps.identity_app.models import PersonIdentity, RBPPSync
 from apps.identity_app.serializers import (
     PersonIdentitySerializer, PersonIdentityCreateSerializer,
     PersonIdentityUpdateSerializer, PersonIdentityMinimalSerializer,
-    PersonIdentitySearchSerializer
+    PersonIdentitySearchSerializer, PersonIdentitySyncSerializer,
+    PersonIdentityFastListSerializer
 )
 from apps.core_app.views.permissions import IsSurveyorOrSupervisor, CanAccessProvince
+from apps.core_app.views.mixins import CompactSyncMixin
 from apps.core_app.models import AuditLog
 
-class PersonIdentityViewSet(viewsets.ModelViewSet):
+class PersonIdentityViewSet(CompactSyncMixin, viewsets.ModelViewSet):
     queryset = PersonIdentity.objects.all()
     serializer_class = PersonIdentitySerializer
+    compact_serializer_class = PersonIdentitySyncSerializer  # ?profile=compact / msgpack
     
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     
@@ -119,6 +122,25 @@ class PersonIdentityViewSet(viewsets.ModelViewSet):
         })
 
     
+    def list(self, request, *args, **kwargs):
+        """
+        Liste rapide depuis values() (sortie identique au serializer complet)
+        GET /api/v1/identity/persons/?fields=rsu_id,full_name,province
+        """
+        if self.is_compact_request():
+            return super().list(request, *args, **kwargs)
+        
+        fields = request.query_params.get('fields')
+        fast = PersonIdentityFastListSerializer(
+            fields=[f.strip() for f in fields.split(',') if f.strip()] if fields else None
+        )
+        queryset = fast.values(self.filter_queryset(self.get_queryset()))
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(fast.serialize(page))
+        return Response(fast.serialize(queryset))
+    
     def get_serializer_class(self):
         """Serializer adapté selon l'action"""
         if self.action == 'create':
@@ -127,7 +149,7 @@ class PersonIdentityViewSet(viewsets.ModelViewSet):
             return PersonIdentityUpdateSerializer
         elif self.action in ['list_minimal', 'search_duplicates']:
             return PersonIdentitySearchSerializer
-        return PersonIdentitySerializer
+        return super().get_serializer_class()
     
     def get_queryset(self):
         """Filtrage selon les permissions géographiques"""
@@ -5,7 +5,10 @@ Fichier: apps/programs_app/admin.py
 
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import ProgramCategory, SocialProgram, ProgramEnrollment, Payment
+from .models import (
+    ProgramCategory, SocialProgram, ProgramCounters, ProgramEnrollment, ProgramWaitlistEntry,
+    Payment, PaymentRun
+)
 
 
 @admin.register(ProgramCategory)
@@ -96,6 +99,18 @@ class SocialProgramAdmin(admin.ModelAdmin):
     beneficiaries_progress.short_description = 'Bénéficiaires'
 
 
+@admin.register(ProgramCounters)
+class ProgramCountersAdmin(admin.ModelAdmin):
+    list_display = [
+        'program', 'enrollments_pending', 'enrollments_active',
+        'payments_pending', 'payments_failed', 'amount_paid', 'amount_pending', 'reconciled_at'
+    ]
+    readonly_fields = [field.name for field in ProgramCounters._meta.fields]
+    
+    def has_add_permission(self, request):
+        return False
+
+
 @admin.register(ProgramEnrollment)
 class ProgramEnrollmentAdmin(admin.ModelAdmin):
     list_display = [
@@ -142,15 +157,36 @@ class ProgramEnrollmentAdmin(admin.ModelAdmin):
     status_badge.short_description = 'Statut'
 
 
+@admin.register(ProgramWaitlistEntry)
+class ProgramWaitlistEntryAdmin(admin.ModelAdmin):
+    list_display = ['program', 'person', 'eligibility_score', 'vulnerability_score', 'created_at']
+    list_filter = ['program']
+    search_fields = ['person__rsu_id', 'person__first_name', 'person__last_name', 'program__code']
+    raw_id_fields = ['person']
+    ordering = ['program', '-eligibility_score', '-vulnerability_score', 'id']
+
+
+@admin.register(PaymentRun)
+class PaymentRunAdmin(admin.ModelAdmin):
+    list_display = [
+        'program', 'period', 'scheduled_date', 'payments_created',
+        'payments_skipped', 'total_amount', 'generated_by', 'created_at'
+    ]
+    list_filter = ['program', 'scheduled_date']
+    readonly_fields = [
+        'payments_created', 'payments_skipped', 'total_amount', 'created_at', 'updated_at'
+    ]
+
+
 @admin.register(Payment)
 class PaymentAdmin(admin.ModelAdmin):
     list_display = [
         'payment_reference', 'beneficiary_link', 'amount_display',
         'status_badge', 'payment_method', 'scheduled_date', 'processed_date'
     ]
-    list_filter = ['status', 'payment_method', 'scheduled_date']
+    list_filter = ['status', 'payment_method', 'scheduled_date', 'period']
     search_fields = [
-        'payment_reference', 'transaction_id',
+        'payment_reference', 'transaction_id', 'provider_reference',
         'beneficiary__first_name', 'beneficiary__last_name'
     ]
     readonly_fields = ['processed_date', 'created_at', 'updated_at']
@@ -0,0 +1,32 @@
+# ===================================================================
+# Management Command - Inscription automatique des bénéficiaires
+# ===================================================================
+
+from django.core.management.base import BaseCommand
+
+from apps.programs_app.services import AutoEnrollmentService
+
+
+class Command(BaseCommand):
+    help = (
+        "Inscrit les personnes HIGHLY_RECOMMENDED des programmes actifs, par "
+        "priorité puis score, jusqu'à épuisement des places ou du budget. "
+        "Plusieurs exécutions peuvent tourner en parallèle sur des programmes différents."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--program', action='append',
+                            help="Code programme (répétable, défaut: tous les programmes actifs)")
+
+    def handle(self, *args, **options):
+        results = AutoEnrollmentService().enroll_programs(options['program'])
+
+        for result in results:
+            self.stdout.write(
+                f"  {result['program_code']}: {result['enrolled_count']} inscription(s) "
+                f"(arrêt: {result['limited_by']})"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {sum(result['enrolled_count'] for result in results)} inscription(s) "
+            f"sur {len(results)} programme(s)"
+        ))
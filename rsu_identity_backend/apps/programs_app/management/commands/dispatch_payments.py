@@ -0,0 +1,56 @@
+# ===================================================================
+# Management Command - Envoi des paiements au fournisseur
+# ===================================================================
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.programs_app.models import Payment, PaymentRun
+from apps.programs_app.services import PaymentDispatchEngine, get_payment_provider
+
+
+class Command(BaseCommand):
+    help = (
+        "Envoie au fournisseur configuré (settings.PAYMENT_PROVIDER) les paiements "
+        "en attente d'un lot ou d'un programme, ou renvoie les paiements FAILED "
+        "dont la nouvelle tentative est due (--retry-failed, à planifier). "
+        "--recover-stuck renvoie, avec le même transaction_id, les paiements "
+        "restés PROCESSING au-delà du bail de réservation."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--run', type=int, help="Identifiant du lot de paiements")
+        parser.add_argument('--program', help="Code programme (paiements PENDING)")
+        parser.add_argument('--retry-failed', action='store_true',
+                            help="Renvoyer les paiements FAILED échus")
+        parser.add_argument('--recover-stuck', action='store_true',
+                            help="Renvoyer les paiements PROCESSING dont la réservation a expiré")
+        parser.add_argument('--workers', type=int, help="Envois simultanés maximum")
+
+    def handle(self, *args, **options):
+        provider = get_payment_provider()
+        if provider is None:
+            raise CommandError("Aucun fournisseur configuré (settings.PAYMENT_PROVIDER)")
+        engine = PaymentDispatchEngine(provider, max_workers=options['workers'])
+
+        if options['retry_failed']:
+            summary = engine.retry_failed()
+        elif options['recover_stuck']:
+            summary = engine.recover_stuck()
+        else:
+            queryset = Payment.objects.filter(status='PENDING')
+            if options['run']:
+                try:
+                    queryset = queryset.filter(payment_run=PaymentRun.objects.get(pk=options['run']))
+                except PaymentRun.DoesNotExist:
+                    raise CommandError(f"Lot {options['run']} introuvable")
+            elif options['program']:
+                queryset = queryset.filter(program__code=options['program'])
+            else:
+                raise CommandError("Préciser --run, --program, --retry-failed ou --recover-stuck")
+            summary = engine.dispatch(queryset.order_by('pk').values_list('id', flat=True))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {summary['sent']} envoyés: {summary['completed']} réglés, "
+            f"{summary['failed']} en échec ({summary['rescheduled']} replanifiés), "
+            f"{summary['amount_settled']:,.0f} FCFA"
+        ))
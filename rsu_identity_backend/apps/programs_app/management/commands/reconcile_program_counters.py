@@ -0,0 +1,48 @@
+# ===================================================================
+# Management Command - Recalcul des compteurs de programmes
+# ===================================================================
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.programs_app.models import SocialProgram
+from apps.programs_app.services import ProgramCounterService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcule depuis les inscriptions et paiements les compteurs dénormalisés "
+        "des programmes (ProgramCounters, current_beneficiaries). À planifier "
+        "quotidiennement pour corriger les écarts dus aux modifications hors workflow."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--program', action='append',
+                            help="Code programme (répétable, défaut: tous)")
+
+    def handle(self, *args, **options):
+        program_ids = None
+        if options['program']:
+            programs = dict(
+                SocialProgram.objects.filter(code__in=options['program'])
+                .values_list('code', 'pk')
+            )
+            unknown = set(options['program']) - set(programs)
+            if unknown:
+                raise CommandError(f"Programme(s) introuvable(s): {', '.join(sorted(unknown))}")
+            program_ids = list(programs.values())
+
+        with transaction.atomic():
+            result = ProgramCounterService().reconcile(program_ids)
+
+        if result['drifted']:
+            codes = SocialProgram.objects.filter(
+                pk__in=result['drifted']
+            ).values_list('code', flat=True)
+            self.stdout.write(self.style.WARNING(
+                f"⚠️  Compteurs corrigés: {', '.join(sorted(codes))}"
+            ))
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {result['reconciled']} programme(s) recalculé(s), "
+            f"{len(result['drifted'])} écart(s) corrigé(s)"
+        ))
@@ -0,0 +1,56 @@
+# Generated by Django 5.0.8 on 2026-10-19 02:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('identity_app', '0005_facility_distances'),
+        ('programs_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='period',
+            field=models.CharField(blank=True, help_text='Un seul paiement par inscription et par période', max_length=10, null=True, verbose_name='Période'),
+        ),
+        migrations.CreateModel(
+            name='PaymentRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(help_text='AAAA-MM (mensuel), AAAA-Tn (trimestriel), AAAA (annuel), UNIQUE (ponctuel)', max_length=10, verbose_name='Période')),
+                ('scheduled_date', models.DateField(verbose_name='Date prévue')),
+                ('payments_created', models.PositiveIntegerField(default=0, verbose_name='Paiements créés')),
+                ('payments_skipped', models.PositiveIntegerField(default=0, verbose_name='Paiements déjà existants')),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='Montant total (FCFA)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('generated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='generated_payment_runs', to=settings.AUTH_USER_MODEL, verbose_name='Généré par')),
+                ('program', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payment_runs', to='programs_app.socialprogram', verbose_name='Programme')),
+            ],
+            options={
+                'verbose_name': 'Lot de paiements',
+                'verbose_name_plural': 'Lots de paiements',
+                'db_table': 'payment_runs',
+                'ordering': ['-scheduled_date'],
+            },
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='payment_run',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payments', to='programs_app.paymentrun', verbose_name='Lot de paiements'),
+        ),
+        migrations.AddConstraint(
+            model_name='payment',
+            constraint=models.UniqueConstraint(condition=models.Q(('period__isnull', False)), fields=('enrollment', 'period'), name='unique_payment_per_enrollment_period'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='paymentrun',
+            unique_together={('program', 'period')},
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.8 on 2026-10-19 02:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('identity_app', '0005_facility_distances'),
+        ('programs_app', '0002_payment_runs'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='dispatch_attempts',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="Tentatives d'envoi"),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='next_retry_at',
+            field=models.DateTimeField(blank=True, help_text='Vide si aucune nouvelle tentative automatique', null=True, verbose_name='Prochaine tentative'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['status', 'next_retry_at'], name='payments_status_5274ab_idx'),
+        ),
+    ]
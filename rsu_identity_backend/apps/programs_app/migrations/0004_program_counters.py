@@ -0,0 +1,73 @@
+# Generated by Django 5.0.8 on 2026-10-19 02:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+
+def backfill_counters(apps, schema_editor):
+    """Compteurs initiaux des programmes existants"""
+    SocialProgram = apps.get_model('programs_app', 'SocialProgram')
+    ProgramEnrollment = apps.get_model('programs_app', 'ProgramEnrollment')
+    Payment = apps.get_model('programs_app', 'Payment')
+    ProgramCounters = apps.get_model('programs_app', 'ProgramCounters')
+
+    counters = {
+        pk: ProgramCounters(program_id=pk, reconciled_at=timezone.now())
+        for pk in SocialProgram.objects.values_list('pk', flat=True)
+    }
+    for program_id, status, count in (
+        ProgramEnrollment.objects.order_by().values('program_id', 'status')
+        .annotate(count=Count('id')).values_list('program_id', 'status', 'count')
+    ):
+        setattr(counters[program_id], f'enrollments_{status.lower()}', count)
+    for program_id, status, count, amount in (
+        Payment.objects.order_by().values('program_id', 'status')
+        .annotate(count=Count('id'), amount=Sum('amount'))
+        .values_list('program_id', 'status', 'count', 'amount')
+    ):
+        setattr(counters[program_id], f'payments_{status.lower()}', count)
+        if status == 'COMPLETED':
+            counters[program_id].amount_paid = amount or 0
+        elif status == 'PENDING':
+            counters[program_id].amount_pending = amount or 0
+
+    ProgramCounters.objects.bulk_create(counters.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs_app', '0003_payment_dispatch'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgramCounters',
+            fields=[
+                ('program', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='counters', serialize=False, to='programs_app.socialprogram', verbose_name='Programme')),
+                ('enrollments_pending', models.IntegerField(default=0, verbose_name='Inscriptions en attente')),
+                ('enrollments_approved', models.IntegerField(default=0, verbose_name='Inscriptions approuvées')),
+                ('enrollments_rejected', models.IntegerField(default=0, verbose_name='Inscriptions rejetées')),
+                ('enrollments_active', models.IntegerField(default=0, verbose_name='Inscriptions actives')),
+                ('enrollments_suspended', models.IntegerField(default=0, verbose_name='Inscriptions suspendues')),
+                ('enrollments_completed', models.IntegerField(default=0, verbose_name='Inscriptions terminées')),
+                ('payments_pending', models.IntegerField(default=0, verbose_name='Paiements en attente')),
+                ('payments_processing', models.IntegerField(default=0, verbose_name='Paiements en traitement')),
+                ('payments_completed', models.IntegerField(default=0, verbose_name='Paiements complétés')),
+                ('payments_failed', models.IntegerField(default=0, verbose_name='Paiements échoués')),
+                ('payments_cancelled', models.IntegerField(default=0, verbose_name='Paiements annulés')),
+                ('amount_paid', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='Montant versé (FCFA)')),
+                ('amount_pending', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='Montant en attente (FCFA)')),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True, verbose_name='Dernier recalcul')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Compteurs de Programme',
+                'verbose_name_plural': 'Compteurs de Programmes',
+                'db_table': 'program_counters',
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
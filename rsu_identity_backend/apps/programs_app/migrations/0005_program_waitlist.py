@@ -0,0 +1,34 @@
+# Generated by Django 5.0.8 on 2026-10-19 02:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('identity_app', '0005_facility_distances'),
+        ('programs_app', '0004_program_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgramWaitlistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('eligibility_score', models.DecimalField(decimal_places=2, max_digits=5, verbose_name="Score d'éligibilité")),
+                ('vulnerability_score', models.DecimalField(decimal_places=2, default=0, max_digits=5, verbose_name='Score de vulnérabilité')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='program_waitlists', to='identity_app.personidentity', verbose_name='Personne')),
+                ('program', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist', to='programs_app.socialprogram', verbose_name='Programme')),
+            ],
+            options={
+                'verbose_name': "Liste d'attente",
+                'verbose_name_plural': "Listes d'attente",
+                'db_table': 'program_waitlist',
+                'ordering': ['program', '-eligibility_score', '-vulnerability_score', 'id'],
+                'indexes': [models.Index(fields=['program', '-eligibility_score', '-vulnerability_score', 'id'], name='waitlist_rank_idx')],
+                'unique_together': {('program', 'person')},
+            },
+        ),
+    ]
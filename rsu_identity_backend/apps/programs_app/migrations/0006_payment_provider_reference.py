@@ -0,0 +1,18 @@
+# Generated by Django 5.0.8 on 2026-10-19 03:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs_app', '0005_program_waitlist'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='provider_reference',
+            field=models.CharField(blank=True, help_text="Référence renvoyée par le fournisseur à l'exécution du paiement", max_length=100, verbose_name='Référence fournisseur'),
+        ),
+    ]
@@ -230,6 +230,68 @@ class SocialProgram(models.Model):
         return self.current_beneficiaries >= self.max_beneficiaries
 
 
+class ProgramCounters(models.Model):
+    """
+    Compteurs dénormalisés d'un programme (tableaux de bord)
+    
+    Incrémentés par F() à chaque transition de statut (voir
+    services/program_counters.py), recalculés par reconcile_program_counters.
+    """
+    
+    program = models.OneToOneField(
+        SocialProgram,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='counters',
+        verbose_name="Programme"
+    )
+    
+    # Inscriptions par statut
+    enrollments_pending = models.IntegerField(default=0, verbose_name="Inscriptions en attente")
+    enrollments_approved = models.IntegerField(default=0, verbose_name="Inscriptions approuvées")
+    enrollments_rejected = models.IntegerField(default=0, verbose_name="Inscriptions rejetées")
+    enrollments_active = models.IntegerField(default=0, verbose_name="Inscriptions actives")
+    enrollments_suspended = models.IntegerField(default=0, verbose_name="Inscriptions suspendues")
+    enrollments_completed = models.IntegerField(default=0, verbose_name="Inscriptions terminées")
+    
+    # Paiements par statut
+    payments_pending = models.IntegerField(default=0, verbose_name="Paiements en attente")
+    payments_processing = models.IntegerField(default=0, verbose_name="Paiements en traitement")
+    payments_completed = models.IntegerField(default=0, verbose_name="Paiements complétés")
+    payments_failed = models.IntegerField(default=0, verbose_name="Paiements échoués")
+    payments_cancelled = models.IntegerField(default=0, verbose_name="Paiements annulés")
+    
+    # Montants
+    amount_paid = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=0,
+        verbose_name="Montant versé (FCFA)"
+    )
+    amount_pending = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=0,
+        verbose_name="Montant en attente (FCFA)"
+    )
+    
+    # Métadonnées
+    reconciled_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Dernier recalcul"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'program_counters'
+        verbose_name = 'Compteurs de Programme'
+        verbose_name_plural = 'Compteurs de Programmes'
+    
+    def __str__(self):
+        return f"Compteurs {self.program_id}"
+
+
 class ProgramEnrollment(models.Model):
     """Inscription d'un bénéficiaire à un programme"""
     
@@ -356,6 +418,118 @@ class ProgramEnrollment(models.Model):
         return f"{self.beneficiary.full_name} → {self.program.code}"
 
 
+class ProgramWaitlistEntry(models.Model):
+    """
+    Candidat en liste d'attente d'un programme complet
+    
+    Rang: score d'éligibilité puis vulnérabilité décroissants, ancienneté.
+    L'index composite suit exactement cet ordre : insertion et lecture de
+    la tête de liste sont logarithmiques, sans reclassement.
+    """
+    
+    program = models.ForeignKey(
+        SocialProgram,
+        on_delete=models.CASCADE,
+        related_name='waitlist',
+        verbose_name="Programme"
+    )
+    person = models.ForeignKey(
+        PersonIdentity,
+        on_delete=models.CASCADE,
+        related_name='program_waitlists',
+        verbose_name="Personne"
+    )
+    eligibility_score = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        verbose_name="Score d'éligibilité"
+    )
+    vulnerability_score = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        default=0,
+        verbose_name="Score de vulnérabilité"
+    )
+    
+    # Métadonnées
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'program_waitlist'
+        verbose_name = "Liste d'attente"
+        verbose_name_plural = "Listes d'attente"
+        ordering = ['program', '-eligibility_score', '-vulnerability_score', 'id']
+        unique_together = [['program', 'person']]
+        indexes = [
+            models.Index(
+                fields=['program', '-eligibility_score', '-vulnerability_score', 'id'],
+                name='waitlist_rank_idx'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.program.code} ← {self.person.full_name} ({self.eligibility_score})"
+
+
+class PaymentRun(models.Model):
+    """Lot de paiements d'un programme pour une période (paie mensuelle, etc.)"""
+    
+    program = models.ForeignKey(
+        SocialProgram,
+        on_delete=models.CASCADE,
+        related_name='payment_runs',
+        verbose_name="Programme"
+    )
+    period = models.CharField(
+        max_length=10,
+        verbose_name="Période",
+        help_text="AAAA-MM (mensuel), AAAA-Tn (trimestriel), AAAA (annuel), UNIQUE (ponctuel)"
+    )
+    scheduled_date = models.DateField(
+        verbose_name="Date prévue"
+    )
+    
+    # Résumé
+    payments_created = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Paiements créés"
+    )
+    payments_skipped = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Paiements déjà existants"
+    )
+    total_amount = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=0,
+        verbose_name="Montant total (FCFA)"
+    )
+    
+    # Gestion
+    generated_by = models.ForeignKey(
+        RSUUser,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='generated_payment_runs',
+        verbose_name="Généré par"
+    )
+    
+    # Métadonnées
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'payment_runs'
+        verbose_name = 'Lot de paiements'
+        verbose_name_plural = 'Lots de paiements'
+        ordering = ['-scheduled_date']
+        unique_together = [['program', 'period']]
+    
+    def __str__(self):
+        return f"{self.program.code} - {self.period}"
+
+
 class Payment(models.Model):
     """Paiement/Transfert monétaire"""
     
@@ -393,6 +567,21 @@ class Payment(models.Model):
         related_name='payments',
         verbose_name="Programme"
     )
+    payment_run = models.ForeignKey(
+        PaymentRun,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='payments',
+        verbose_name="Lot de paiements"
+    )
+    period = models.CharField(
+        max_length=10,
+        null=True,
+        blank=True,
+        verbose_name="Période",
+        help_text="Un seul paiement par inscription et par période"
+    )
     
     # Montant
     amount = models.DecimalField(
@@ -448,6 +637,24 @@ class Payment(models.Model):
         verbose_name="Motif d'échec"
     )
     
+    # Envoi au fournisseur (Mobile Money, banque)
+    dispatch_attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Tentatives d'envoi"
+    )
+    next_retry_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Prochaine tentative",
+        help_text="Vide si aucune nouvelle tentative automatique"
+    )
+    provider_reference = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name="Référence fournisseur",
+        help_text="Référence renvoyée par le fournisseur à l'exécution du paiement"
+    )
+    
     # Gestion
     processed_by = models.ForeignKey(
         RSUUser,
@@ -471,6 +678,14 @@ class Payment(models.Model):
             models.Index(fields=['status', 'scheduled_date']),
             models.Index(fields=['payment_reference']),
             models.Index(fields=['beneficiary', 'status']),
+            models.Index(fields=['status', 'next_retry_at']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['enrollment', 'period'],
+                condition=models.Q(period__isnull=False),
+                name='unique_payment_per_enrollment_period'
+            ),
         ]
     
     def __str__(self):
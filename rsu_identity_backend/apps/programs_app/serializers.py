@@ -256,7 +256,8 @@ class PaymentSerializer(serializers.ModelSerializer):
         model = Payment
         fields = '__all__'
         read_only_fields = [
-            'processed_date', 'created_at', 'updated_at'
+            'processed_date', 'payment_run', 'period', 'provider_reference',
+            'created_at', 'updated_at'
         ]
     
     def validate(self, data):
@@ -294,4 +295,40 @@ class EligibilityCheckSerializer(serializers.Serializer):
     def validate_program_id(self, value):
         if not SocialProgram.objects.filter(id=value).exists():
             raise serializers.ValidationError("Programme introuvable")
-        return value
\ No newline at end of file
+        return value
+
+class BulkEnrollmentSelectionSerializer(serializers.Serializer):
+    """Sélection des inscriptions d'un traitement groupé"""
+    
+    enrollment_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False
+    )
+    program = serializers.PrimaryKeyRelatedField(
+        queryset=SocialProgram.objects.all(), required=False
+    )
+    min_eligibility_score = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=0, max_value=100,
+        required=False, allow_null=True
+    )
+    
+    def validate(self, data):
+        if 'enrollment_ids' not in data and 'program' not in data:
+            raise serializers.ValidationError("enrollment_ids ou program requis")
+        return data
+
+
+class PaymentBatchSelectionSerializer(serializers.Serializer):
+    """Sélection des paiements d'un règlement groupé"""
+    
+    payment_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False
+    )
+    program = serializers.PrimaryKeyRelatedField(
+        queryset=SocialProgram.objects.all(), required=False
+    )
+    scheduled_before = serializers.DateField(required=False, allow_null=True)
+    
+    def validate(self, data):
+        if 'payment_ids' not in data and 'program' not in data:
+            raise serializers.ValidationError("payment_ids ou program requis")
+        return data
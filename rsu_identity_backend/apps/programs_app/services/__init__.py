@@ -0,0 +1,29 @@
+"""
+🇬🇦 RSU Gabon - Services Programs App
+Fichier: apps/programs_app/services/__init__.py
+"""
+from .program_counters import ProgramCounterService
+from .enrollment_workflow import EnrollmentWorkflowService
+from .payment_settlement import PaymentSettlementService
+from .payment_run import PaymentRunService, period_key
+from .program_statistics import ProgramStatisticsService
+from .waitlist import WaitlistService
+from .auto_enrollment import AutoEnrollmentService
+from .payment_dispatch import (
+    PaymentDispatchEngine, PaymentProvider, FakeMobileMoneyProvider, get_payment_provider
+)
+
+__all__ = [
+    'ProgramCounterService',
+    'EnrollmentWorkflowService',
+    'PaymentSettlementService',
+    'PaymentRunService',
+    'period_key',
+    'PaymentDispatchEngine',
+    'PaymentProvider',
+    'FakeMobileMoneyProvider',
+    'get_payment_provider',
+    'ProgramStatisticsService',
+    'WaitlistService',
+    'AutoEnrollmentService',
+]
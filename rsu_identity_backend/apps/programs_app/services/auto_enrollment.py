@@ -0,0 +1,186 @@
+"""
+🇬🇦 RSU Gabon - Inscription automatique des bénéficiaires
+Fichier: apps/programs_app/services/auto_enrollment.py
+
+Les évaluations HIGHLY_RECOMMENDED (services_app.SocialProgramEligibility)
+d'un programme sont consommées par ordre de priorité de traitement puis de
+score, jusqu'à épuisement des places (max_beneficiaries) ou du budget. Les
+inscriptions sont créées en masse, directement approuvées.
+
+Chaque programme est traité dans sa propre transaction, sous verrou de sa
+ligne SocialProgram : deux exécutions sur le même programme se suivent,
+des exécutions sur des programmes différents s'exécutent en parallèle.
+Les personnes déjà inscrites au programme sont exclues, ce qui rend une
+nouvelle exécution sans effet tant qu'aucune place ne se libère. Les
+candidats restants d'un programme complet rejoignent sa liste d'attente.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Exists, F, IntegerField, OuterRef, Value, When
+from django.utils import timezone
+
+from apps.services_app.models import SocialProgramEligibility
+from apps.services_app.services.base_service import BaseService
+from apps.services_app.services.budget_optimizer import program_budget_slots
+from ..models import ProgramEnrollment, SocialProgram
+from .program_counters import ProgramCounterService
+from .waitlist import WaitlistService
+
+# Rang de traitement (les codes numériques sont ceux des évaluations
+# enregistrées avant la normalisation de processing_priority)
+PRIORITY_RANKS = {
+    'URGENT': 0,
+    'HIGH': 1, '1': 1,
+    'MEDIUM': 2, '2': 2,
+    'LOW': 3, '5': 3, '99': 3,
+}
+
+
+class AutoEnrollmentService(BaseService):
+    """
+    Inscription en masse depuis les résultats d'éligibilité
+
+    Usage:
+        AutoEnrollmentService().enroll_program(program, enrolled_by=request.user)
+        AutoEnrollmentService().enroll_programs()    # tous les programmes actifs
+    """
+
+    RECOMMENDATION_LEVEL = 'HIGHLY_RECOMMENDED'
+    BATCH_SIZE = 1000
+    NOTE = "Inscription automatique (éligibilité fortement recommandée)"
+
+    def __init__(self):
+        super().__init__()
+        self.counters = ProgramCounterService()
+
+    def enroll_program(
+        self,
+        program: SocialProgram,
+        enrolled_by=None,
+        person_ids: Optional[Iterable] = None,
+        limit: Optional[int] = None
+    ) -> Dict:
+        """
+        Inscrit les meilleurs candidats dans la limite des places et du budget
+
+        Args:
+            program: Programme (statut ACTIVE, dans ses dates)
+            enrolled_by: Utilisateur enregistré comme approbateur
+            person_ids: Restreindre aux personnes indiquées
+            limit: Nombre maximum d'inscriptions
+
+        Raises:
+            ValueError: Programme inactif
+        """
+        for attempt in range(2):
+            try:
+                with transaction.atomic():
+                    return self._enroll(program.pk, enrolled_by, person_ids, limit)
+            except IntegrityError:
+                # Inscription manuelle concurrente d'un candidat : nouvelle sélection
+                if attempt:
+                    raise
+
+    def enroll_programs(self, program_codes: Optional[List[str]] = None, enrolled_by=None) -> List[Dict]:
+        """Un lot par programme actif (transactions indépendantes)"""
+        programs = SocialProgram.objects.filter(status='ACTIVE')
+        if program_codes:
+            programs = programs.filter(code__in=program_codes)
+
+        results = []
+        for program in programs.order_by('code'):
+            if not program.is_active:
+                continue
+            results.append(self.enroll_program(program, enrolled_by=enrolled_by))
+        return results
+
+    def _enroll(self, program_id, enrolled_by, person_ids, limit) -> Dict:
+        program = SocialProgram.objects.select_for_update().get(pk=program_id)
+        if not program.is_active:
+            raise ValueError(f"Programme {program.code} non actif")
+
+        capacity_slots = program.capacity_remaining
+        budget_slots = program_budget_slots(program)
+        bounds = {
+            name: max(value, 0)
+            for name, value in (('capacity', capacity_slots), ('budget', budget_slots), ('limit', limit))
+            if value is not None
+        }
+        slots = min(bounds.values()) if bounds else None
+
+        queryset = self._candidates(program, person_ids)
+        candidates = list(queryset[:slots] if slots is not None else queryset)
+
+        now = timezone.now()
+        for start in range(0, len(candidates), self.BATCH_SIZE):
+            ProgramEnrollment.objects.bulk_create([
+                ProgramEnrollment(
+                    program=program,
+                    beneficiary_id=person_id,
+                    household_id=household_id,
+                    status='APPROVED',
+                    approval_date=now.date(),
+                    approved_by=enrolled_by,
+                    eligibility_score=score,
+                    notes=self.NOTE,
+                )
+                for person_id, household_id, score in candidates[start:start + self.BATCH_SIZE]
+            ])
+
+        enrolled = len(candidates)
+        if enrolled:
+            SocialProgram.objects.filter(pk=program.pk).update(
+                current_beneficiaries=F('current_beneficiaries') + enrolled,
+                updated_at=now
+            )
+            self.counters.enrollment_transition(program.pk, None, 'APPROVED', count=enrolled)
+            WaitlistService().discard(program.pk, [person_id for person_id, _, _ in candidates])
+
+        # Première borne atteinte, sinon plus aucun candidat
+        limited_by = 'candidates'
+        if slots is not None and enrolled == slots:
+            limited_by = min(bounds, key=bounds.get)
+
+        waitlisted = 0
+        if limited_by == 'capacity':
+            # Les personnes inscrites ci-dessus sont déjà exclues (Exists) : pas de décalage
+            waitlisted = WaitlistService().add_many(program, (
+                queryset.values_list(
+                    'person_id', 'eligibility_score', 'person__vulnerability_score'
+                ).iterator(chunk_size=self.BATCH_SIZE)
+            ))
+
+        result = {
+            'program_code': program.code,
+            'enrolled_count': enrolled,
+            'capacity_remaining': None if capacity_slots is None else capacity_slots - enrolled,
+            'budget_slots_remaining': None if budget_slots is None else budget_slots - enrolled,
+            'limited_by': limited_by,
+            'waitlisted_count': waitlisted,
+        }
+        self.log_operation('auto_enrollment_completed', result)
+        return result
+
+    def _candidates(self, program: SocialProgram, person_ids=None):
+        """Évaluations non encore inscrites, par priorité puis score"""
+        already_enrolled = ProgramEnrollment.objects.filter(
+            program=program, beneficiary_id=OuterRef('person_id')
+        )
+        queryset = (
+            SocialProgramEligibility.objects
+            .filter(program_code=program.code, recommendation_level=self.RECOMMENDATION_LEVEL)
+            .exclude(Exists(already_enrolled))
+            .annotate(priority_rank=Case(
+                *[When(processing_priority=code, then=Value(rank))
+                  for code, rank in PRIORITY_RANKS.items()],
+                default=Value(max(PRIORITY_RANKS.values()) + 1),
+                output_field=IntegerField()
+            ))
+        )
+        if person_ids is not None:
+            queryset = queryset.filter(person_id__in=list(person_ids))
+        return queryset.order_by(
+            'priority_rank', '-eligibility_score', 'assessment_date'
+        ).values_list('person_id', 'person__headed_household', 'eligibility_score')
@@ -0,0 +1,287 @@
+"""
+🇬🇦 RSU Gabon - Workflow des inscriptions
+Fichier: apps/programs_app/services/enrollment_workflow.py
+
+Approbation, rejet et activation par UPDATE conditionnels sur le statut :
+deux requêtes concurrentes ne peuvent pas appliquer la même transition,
+et la place réservée dans le programme (current_beneficiaries) est
+vérifiée et incrémentée en base. Une place libérée (fin d'inscription,
+approbation révoquée) est aussitôt attribuée à la liste d'attente. Les
+compteurs du programme sont mis à jour dans la même transaction.
+
+Les traitements groupés verrouillent les inscriptions une seule fois,
+contrôlent la capacité de tous les programmes concernés en une requête,
+appliquent un UPDATE par statut et produisent une seule entrée d'audit.
+"""
+
+from collections import defaultdict
+from typing import Dict, Optional
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.core_app.models import AuditLog
+from apps.services_app.services.base_service import BaseService
+from ..models import ProgramEnrollment, SocialProgram
+from .program_counters import ProgramCounterService
+from .waitlist import WaitlistService
+
+
+class EnrollmentWorkflowService(BaseService):
+    """
+    Transitions de statut des inscriptions
+
+    Les méthodes lèvent ValueError si la transition est impossible.
+
+    Usage:
+        workflow = EnrollmentWorkflowService()
+        workflow.approve(enrollment, approved_by=request.user)
+        workflow.activate(enrollment)
+        workflow.bulk_approve(ProgramEnrollment.objects.filter(program=program), user)
+    """
+
+    # Taille des listes d'identifiants par requête
+    CHUNK_SIZE = 2000
+
+    def __init__(self):
+        super().__init__()
+        self.counters = ProgramCounterService()
+
+    @transaction.atomic
+    def approve(self, enrollment: ProgramEnrollment, approved_by=None) -> ProgramEnrollment:
+        """PENDING → APPROVED, dans la limite de capacité du programme"""
+        now = timezone.now()
+        self._transition(
+            enrollment, 'PENDING', 'APPROVED',
+            "Seules les inscriptions en attente peuvent être approuvées",
+            approval_date=now.date(), approved_by=approved_by
+        )
+
+        reserved = SocialProgram.objects.filter(
+            Q(max_beneficiaries__isnull=True) |
+            Q(current_beneficiaries__lt=F('max_beneficiaries')),
+            pk=enrollment.program_id
+        ).update(current_beneficiaries=F('current_beneficiaries') + 1, updated_at=now)
+        if not reserved:
+            # Annule aussi le changement de statut (transaction)
+            raise ValueError("Le programme a atteint sa capacité maximale")
+
+        self.counters.enrollment_transition(enrollment.program_id, 'PENDING', 'APPROVED')
+        enrollment.program.current_beneficiaries += 1
+        return enrollment
+
+    @transaction.atomic
+    def reject(self, enrollment: ProgramEnrollment, reason: str = '', rejected_by=None) -> ProgramEnrollment:
+        """PENDING → REJECTED, ou révocation d'une approbation (APPROVED → REJECTED)"""
+        error = "Seules les inscriptions en attente ou approuvées peuvent être rejetées"
+        fields = {'rejection_reason': reason, 'approved_by': rejected_by}
+        try:
+            self._transition(enrollment, 'PENDING', 'REJECTED', error, **fields)
+            from_status = 'PENDING'
+        except ValueError:
+            self._transition(enrollment, 'APPROVED', 'REJECTED', error, **fields)
+            from_status = 'APPROVED'
+
+        self.counters.enrollment_transition(enrollment.program_id, from_status, 'REJECTED')
+        if from_status == 'APPROVED':
+            self._release_place(enrollment.program_id)
+        return enrollment
+
+    @transaction.atomic
+    def activate(self, enrollment: ProgramEnrollment) -> ProgramEnrollment:
+        """APPROVED → ACTIVE (début des versements)"""
+        self._transition(
+            enrollment, 'APPROVED', 'ACTIVE',
+            "Seules les inscriptions approuvées peuvent être activées",
+            start_date=timezone.now().date()
+        )
+        self.counters.enrollment_transition(enrollment.program_id, 'APPROVED', 'ACTIVE')
+        return enrollment
+
+    @transaction.atomic
+    def complete(self, enrollment: ProgramEnrollment) -> ProgramEnrollment:
+        """ACTIVE → COMPLETED ; la place libérée revient à la liste d'attente"""
+        self._transition(
+            enrollment, 'ACTIVE', 'COMPLETED',
+            "Seules les inscriptions actives peuvent être terminées",
+            end_date=timezone.now().date()
+        )
+        self.counters.enrollment_transition(enrollment.program_id, 'ACTIVE', 'COMPLETED')
+        self._release_place(enrollment.program_id)
+        return enrollment
+
+    def _release_place(self, program_id: int, count: int = 1):
+        """Libère des places et inscrit aussitôt la tête de liste d'attente"""
+        SocialProgram.objects.filter(
+            pk=program_id, current_beneficiaries__gte=count
+        ).update(
+            current_beneficiaries=F('current_beneficiaries') - count,
+            updated_at=timezone.now()
+        )
+        WaitlistService().promote(program_id)
+
+    def _transition(self, enrollment, from_status, to_status, error, **fields):
+        """UPDATE conditionnel sur le statut attendu, reporté sur l'instance"""
+        updated = ProgramEnrollment.objects.filter(
+            pk=enrollment.pk, status=from_status
+        ).update(status=to_status, updated_at=timezone.now(), **fields)
+        if not updated:
+            raise ValueError(error)
+
+        enrollment.status = to_status
+        for field, value in fields.items():
+            setattr(enrollment, field, value)
+        self.log_operation('enrollment_transition', {
+            'enrollment_id': enrollment.pk,
+            'from': from_status,
+            'to': to_status,
+        })
+
+    # =========================================================================
+    # TRAITEMENTS GROUPÉS
+    # =========================================================================
+
+    @transaction.atomic
+    def bulk_approve(self, queryset, approved_by=None) -> Dict:
+        """
+        Approuve les inscriptions PENDING du queryset dans la limite de capacité
+
+        Par programme, les meilleurs scores d'éligibilité passent en premier ;
+        les inscriptions au-delà de la capacité restent en attente.
+        """
+        rows = self._lock(queryset, 'PENDING', ordering=(
+            F('eligibility_score').desc(nulls_last=True), 'enrollment_date', 'pk'
+        ))
+        by_program = self._group(rows)
+
+        capacity = {
+            pk: (None if max_beneficiaries is None else max(max_beneficiaries - current, 0))
+            for pk, max_beneficiaries, current in (
+                SocialProgram.objects.select_for_update()
+                .filter(pk__in=list(by_program))
+                .values_list('pk', 'max_beneficiaries', 'current_beneficiaries')
+            )
+        }
+
+        approved, over_capacity = {}, 0
+        for program_id, enrollment_ids in by_program.items():
+            remaining = capacity[program_id]
+            if remaining is not None and len(enrollment_ids) > remaining:
+                over_capacity += len(enrollment_ids) - remaining
+                enrollment_ids = enrollment_ids[:remaining]
+            if enrollment_ids:
+                approved[program_id] = enrollment_ids
+
+        now = timezone.now()
+        self._update_status(
+            [pk for enrollment_ids in approved.values() for pk in enrollment_ids],
+            status='APPROVED', approval_date=now.date(), approved_by=approved_by, updated_at=now
+        )
+        for program_id, enrollment_ids in approved.items():
+            SocialProgram.objects.filter(pk=program_id).update(
+                current_beneficiaries=F('current_beneficiaries') + len(enrollment_ids),
+                updated_at=now
+            )
+
+        return self._finish_batch(
+            'PENDING', 'APPROVED', approved, approved_by,
+            skipped={'capacity': over_capacity}
+        )
+
+    @transaction.atomic
+    def bulk_reject(self, queryset, reason: str = '', rejected_by=None) -> Dict:
+        """Rejette les inscriptions PENDING du queryset"""
+        rejected = self._group(self._lock(queryset, 'PENDING'))
+        self._update_status(
+            [pk for enrollment_ids in rejected.values() for pk in enrollment_ids],
+            status='REJECTED', rejection_reason=reason, approved_by=rejected_by,
+            updated_at=timezone.now()
+        )
+        return self._finish_batch(
+            'PENDING', 'REJECTED', rejected, rejected_by, extra={'reason': reason}
+        )
+
+    @transaction.atomic
+    def bulk_activate(self, queryset, activated_by=None) -> Dict:
+        """Active les inscriptions APPROVED du queryset"""
+        activated = self._group(self._lock(queryset, 'APPROVED'))
+        now = timezone.now()
+        self._update_status(
+            [pk for enrollment_ids in activated.values() for pk in enrollment_ids],
+            status='ACTIVE', start_date=now.date(), updated_at=now
+        )
+        return self._finish_batch('APPROVED', 'ACTIVE', activated, activated_by)
+
+    def _lock(self, queryset, from_status: str, ordering=('pk',)):
+        """Verrouille (une requête) les inscriptions au statut attendu"""
+        return list(
+            queryset.select_for_update()
+            .filter(status=from_status)
+            .order_by(*ordering)
+            .values_list('pk', 'program_id')
+        )
+
+    @staticmethod
+    def _group(rows) -> Dict[int, list]:
+        grouped = defaultdict(list)
+        for pk, program_id in rows:
+            grouped[program_id].append(pk)
+        return grouped
+
+    def _update_status(self, enrollment_ids, **fields):
+        """Un UPDATE par statut (découpé au-delà de CHUNK_SIZE identifiants)"""
+        for start in range(0, len(enrollment_ids), self.CHUNK_SIZE):
+            ProgramEnrollment.objects.filter(
+                pk__in=enrollment_ids[start:start + self.CHUNK_SIZE]
+            ).update(**fields)
+
+    def _finish_batch(
+        self,
+        from_status: str,
+        to_status: str,
+        changed: Dict[int, list],
+        user=None,
+        skipped: Optional[Dict] = None,
+        extra: Optional[Dict] = None
+    ) -> Dict:
+        """Compteurs par programme et entrée d'audit unique pour le lot"""
+        for program_id, enrollment_ids in changed.items():
+            self.counters.enrollment_transition(
+                program_id, from_status, to_status, count=len(enrollment_ids)
+            )
+
+        processed = sum(map(len, changed.values()))
+        result = {
+            'transition': f'{from_status}->{to_status}',
+            'processed_count': processed,
+            'skipped': skipped or {},
+            'programs': {
+                str(program_id): len(enrollment_ids) for program_id, enrollment_ids in changed.items()
+            },
+        }
+
+        if user is not None and (processed or any(result['skipped'].values())):
+            audit = AuditLog.log_action(
+                user=user,
+                action='UPDATE',
+                description=(
+                    f"Traitement groupé des inscriptions {from_status} → {to_status}: "
+                    f"{processed} inscription(s)"
+                ),
+                changes={
+                    **result,
+                    **(extra or {}),
+                    'enrollment_ids': [
+                        pk for enrollment_ids in changed.values() for pk in enrollment_ids
+                    ],
+                },
+                severity='MEDIUM'
+            )
+            result['audit_id'] = str(audit.pk)
+
+        self.log_operation('enrollments_bulk_transition', {
+            'transition': result['transition'],
+            'processed_count': processed,
+        })
+        return result
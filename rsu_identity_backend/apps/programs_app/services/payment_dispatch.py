@@ -0,0 +1,420 @@
+"""
+🇬🇦 RSU Gabon - Envoi des paiements aux fournisseurs (Mobile Money, banque)
+Fichier: apps/programs_app/services/payment_dispatch.py
+
+Les paiements sont réservés (PROCESSING) par tranches, envoyés en parallèle
+au fournisseur par un pool de threads borné et cadencé selon sa limite de
+débit, puis enregistrés en masse : les succès passent par le règlement
+atomique (PaymentSettlementService), les échecs sont planifiés pour une
+nouvelle tentative avec délai exponentiel.
+
+Chaque paiement porte un transaction_id stable (dérivé de sa référence) :
+renvoyer le même paiement après une coupure ne peut pas payer deux fois
+chez un fournisseur qui déduplique sur cet identifiant. Une réservation
+vaut bail de CLAIM_TIMEOUT : un paiement resté PROCESSING au-delà (worker
+interrompu entre l'envoi et l'enregistrement) est de nouveau réservable
+et renvoyé avec le même transaction_id (recover_stuck).
+"""
+
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.services_app.services.base_service import BaseService
+from ..models import Payment
+from .payment_settlement import PaymentSettlementService
+from .program_counters import ProgramCounterService
+
+TRANSACTION_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, 'payments.rsu.ga')
+
+
+def transaction_id_for(payment_reference: str) -> str:
+    """Identifiant d'idempotence d'un paiement (identique à chaque envoi)"""
+    return f"RSU-{uuid.uuid5(TRANSACTION_NAMESPACE, payment_reference).hex}"
+
+
+# =============================================================================
+# INTERFACE FOURNISSEUR
+# =============================================================================
+
+@dataclass(frozen=True)
+class PaymentInstruction:
+    """Ordre de paiement transmis au fournisseur"""
+    payment_id: int
+    transaction_id: str
+    payment_reference: str
+    amount: Decimal
+    payment_method: str
+    phone_number: str
+    beneficiary_name: str
+    attempt: int = 1
+    program_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ProviderResult:
+    """Réponse du fournisseur"""
+    status: str
+    provider_reference: str = ''
+    message: str = ''
+
+
+SUCCESS = 'SUCCESS'
+REJECTED = 'REJECTED'      # Refus définitif (compte invalide, plafond...)
+RETRYABLE = 'RETRYABLE'    # Erreur transitoire (timeout, indisponibilité)
+
+
+class PaymentProvider:
+    """
+    Fournisseur de paiement
+
+    Les implémentations doivent dédupliquer sur instruction.transaction_id
+    et être utilisables depuis plusieurs threads.
+    """
+
+    name = 'base'
+    max_concurrency = 8
+    rate_limit_per_second: Optional[float] = None
+
+    def send(self, instruction: PaymentInstruction) -> ProviderResult:
+        raise NotImplementedError
+
+
+class FakeMobileMoneyProvider(PaymentProvider):
+    """
+    Fournisseur local (tests, développement)
+
+    Args:
+        rejected: Références refusées définitivement
+        transient_failures: {référence: nombre d'échecs transitoires avant succès}
+        latency: Latence simulée par appel (secondes)
+    """
+
+    name = 'fake_mobile_money'
+
+    def __init__(self, rejected=(), transient_failures=None, latency=0.0, max_concurrency=8):
+        self.rejected = set(rejected)
+        self.transient_failures = dict(transient_failures or {})
+        self.latency = latency
+        self.max_concurrency = max_concurrency
+        self.calls = 0
+        self._processed = {}
+        self._lock = threading.Lock()
+
+    def send(self, instruction: PaymentInstruction) -> ProviderResult:
+        with self._lock:
+            self.calls += 1
+            if instruction.transaction_id in self._processed:
+                return self._processed[instruction.transaction_id]
+            if self.transient_failures.get(instruction.payment_reference):
+                self.transient_failures[instruction.payment_reference] -= 1
+                return ProviderResult(RETRYABLE, message='Service temporairement indisponible')
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if instruction.payment_reference in self.rejected:
+            result = ProviderResult(REJECTED, message='Compte Mobile Money invalide')
+        else:
+            result = ProviderResult(SUCCESS, provider_reference=f'FAKE-{instruction.transaction_id[-12:]}')
+
+        with self._lock:
+            self._processed[instruction.transaction_id] = result
+        return result
+
+    @property
+    def paid_transactions(self):
+        return [tid for tid, result in self._processed.items() if result.status == SUCCESS]
+
+
+def get_payment_provider() -> Optional[PaymentProvider]:
+    """Fournisseur configuré (settings.PAYMENT_PROVIDER), None si règlement manuel"""
+    path = getattr(settings, 'PAYMENT_PROVIDER', '')
+    return import_string(path)() if path else None
+
+
+class RateLimiter:
+    """Espacement minimal entre deux appels, partagé par les threads"""
+
+    def __init__(self, per_second: Optional[float], sleep=time.sleep):
+        self.interval = 1.0 / per_second if per_second else 0.0
+        self.sleep = sleep
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            self.sleep(slot - now)
+
+
+# =============================================================================
+# MOTEUR D'ENVOI
+# =============================================================================
+
+class PaymentDispatchEngine(BaseService):
+    """
+    Envoi par lots avec concurrence bornée et nouvelles tentatives
+
+    Usage:
+        engine = PaymentDispatchEngine(get_payment_provider())
+        engine.dispatch(run.payments.values_list('id', flat=True))
+        engine.retry_failed()            # tâche planifiée
+        engine.recover_stuck()           # réservations expirées
+    """
+
+    CHUNK_SIZE = 1000
+
+    # Nouvelles tentatives immédiates sur erreur transitoire (dans l'envoi)
+    MAX_TRANSIENT_RETRIES = 3
+    RETRY_BASE_DELAY = 0.5
+
+    # Nouvelles tentatives différées des paiements FAILED : 15, 30, 60, 120 min
+    MAX_DISPATCH_ATTEMPTS = 5
+    FAILED_RETRY_BASE = timedelta(minutes=15)
+
+    # Bail d'une réservation PROCESSING (au-delà : worker présumé interrompu)
+    CLAIM_TIMEOUT = timedelta(minutes=30)
+
+    def __init__(self, provider: PaymentProvider, max_workers: int = None, sleep=time.sleep):
+        super().__init__()
+        if provider is None:
+            raise ValueError("Aucun fournisseur de paiement configuré")
+        self.provider = provider
+        self.max_workers = max_workers or provider.max_concurrency
+        self.sleep = sleep
+        self.rate_limiter = RateLimiter(provider.rate_limit_per_second, sleep=sleep)
+        self.counters = ProgramCounterService()
+
+    def dispatch(
+        self,
+        payment_ids: Iterable,
+        processed_by=None,
+        respect_backoff: bool = True
+    ) -> Dict:
+        """
+        Envoie les paiements PENDING (et FAILED dont la tentative est due)
+
+        Args:
+            payment_ids: Paiements à envoyer
+            processed_by: Utilisateur
+            respect_backoff: False pour renvoyer immédiatement un paiement FAILED
+                             (traitement manuel)
+
+        Returns:
+            Dict: Compteurs par issue et montant réglé
+        """
+        payment_ids = list(payment_ids)
+        summary = {'sent': 0, 'completed': 0, 'failed': 0, 'rescheduled': 0,
+                   'skipped': 0, 'amount_settled': 0.0}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for start in range(0, len(payment_ids), self.CHUNK_SIZE):
+                chunk = payment_ids[start:start + self.CHUNK_SIZE]
+                instructions = self._claim(chunk, respect_backoff)
+                summary['skipped'] += len(chunk) - len(instructions)
+                if not instructions:
+                    continue
+
+                results = list(pool.map(self._send, instructions))
+                self._record(instructions, results, processed_by, summary)
+                summary['sent'] += len(instructions)
+
+        self.log_operation('payments_dispatched', {'provider': self.provider.name, **summary})
+        return summary
+
+    def retry_failed(self, program=None, processed_by=None) -> Dict:
+        """Renvoie les paiements FAILED dont la prochaine tentative est échue"""
+        queryset = Payment.objects.filter(
+            status='FAILED',
+            next_retry_at__lte=timezone.now(),
+            dispatch_attempts__lt=self.MAX_DISPATCH_ATTEMPTS
+        )
+        if program is not None:
+            queryset = queryset.filter(program=program)
+        return self.dispatch(queryset.values_list('id', flat=True), processed_by)
+
+    def recover_stuck(self, program=None, processed_by=None) -> Dict:
+        """
+        Renvoie les paiements PROCESSING dont la réservation a expiré
+
+        Le transaction_id inchangé garantit qu'un paiement déjà exécuté
+        chez le fournisseur n'est pas payé une seconde fois.
+        """
+        queryset = Payment.objects.filter(
+            status='PROCESSING', updated_at__lt=timezone.now() - self.CLAIM_TIMEOUT
+        )
+        if program is not None:
+            queryset = queryset.filter(program=program)
+        return self.dispatch(queryset.values_list('id', flat=True), processed_by)
+
+    def _claim(self, chunk: List, respect_backoff: bool) -> List[PaymentInstruction]:
+        """Réserve les paiements (PROCESSING) et prépare les ordres"""
+        now = timezone.now()
+        retry_due = Q(status='FAILED')
+        if respect_backoff:
+            retry_due &= Q(
+                next_retry_at__lte=now,
+                dispatch_attempts__lt=self.MAX_DISPATCH_ATTEMPTS
+            )
+        claim_expired = Q(status='PROCESSING', updated_at__lt=now - self.CLAIM_TIMEOUT)
+
+        with transaction.atomic():
+            rows = list(
+                Payment.objects.select_for_update()
+                .filter(Q(pk__in=chunk) & (Q(status='PENDING') | retry_due | claim_expired))
+                .values_list(
+                    'pk', 'payment_reference', 'transaction_id', 'amount', 'payment_method',
+                    'dispatch_attempts', 'beneficiary__phone_number', 'beneficiary__first_name',
+                    'beneficiary__last_name', 'program_id', 'status'
+                )
+            )
+            if not rows:
+                return []
+
+            Payment.objects.filter(pk__in=[row[0] for row in rows]).update(
+                status='PROCESSING',
+                dispatch_attempts=F('dispatch_attempts') + 1,
+                next_retry_at=None,
+                updated_at=now
+            )
+            missing_ids = [
+                Payment(pk=row[0], transaction_id=transaction_id_for(row[1]))
+                for row in rows if not row[2]
+            ]
+            Payment.objects.bulk_update(missing_ids, ['transaction_id'], batch_size=self.CHUNK_SIZE)
+
+            transitions = defaultdict(lambda: [Decimal('0'), 0])
+            for row in rows:
+                if row[10] == 'PROCESSING':
+                    continue  # Réservation expirée reprise : compteurs inchangés
+                transitions[(row[9], row[10])][0] += row[3]
+                transitions[(row[9], row[10])][1] += 1
+            for (program_id, previous_status), (amount, count) in transitions.items():
+                self.counters.payment_transition(
+                    program_id, previous_status, 'PROCESSING', count=count, amount=amount
+                )
+
+        return [
+            PaymentInstruction(
+                payment_id=pk,
+                transaction_id=transaction_id or transaction_id_for(reference),
+                payment_reference=reference,
+                amount=amount,
+                payment_method=method,
+                phone_number=phone or '',
+                beneficiary_name=f'{first_name} {last_name}'.strip(),
+                attempt=previous_attempts + 1,
+                program_id=program_id,
+            )
+            for (pk, reference, transaction_id, amount, method, previous_attempts,
+                 phone, first_name, last_name, program_id, _) in rows
+        ]
+
+    def _send(self, instruction: PaymentInstruction) -> ProviderResult:
+        """Envoi d'un ordre avec reprises exponentielles sur erreur transitoire"""
+        for attempt in range(self.MAX_TRANSIENT_RETRIES + 1):
+            self.rate_limiter.acquire()
+            try:
+                result = self.provider.send(instruction)
+            except Exception as e:
+                result = ProviderResult(RETRYABLE, message=str(e))
+
+            if result.status != RETRYABLE or attempt == self.MAX_TRANSIENT_RETRIES:
+                return result
+
+            delay = self.RETRY_BASE_DELAY * 2 ** attempt
+            self.sleep(delay + random.uniform(0, self.RETRY_BASE_DELAY))
+        return result
+
+    def _record(self, instructions, results, processed_by, summary: Dict):
+        """Enregistre les issues : règlement groupé des succès, échecs planifiés"""
+        now = timezone.now()
+        references = {}
+        failures = {}
+
+        for instruction, result in zip(instructions, results):
+            if result.status == SUCCESS:
+                references[instruction.payment_id] = result.provider_reference
+                continue
+
+            retry_at = None
+            if result.status == RETRYABLE and instruction.attempt < self.MAX_DISPATCH_ATTEMPTS:
+                retry_at = now + self.FAILED_RETRY_BASE * 2 ** (instruction.attempt - 1)
+            failures[instruction.payment_id] = (
+                instruction.attempt, retry_at, f'[{self.provider.name}] {result.message}'.strip()
+            )
+
+        if references:
+            settlement = PaymentSettlementService().settle_payments(
+                list(references), processed_by, statuses=['PROCESSING'],
+                provider_references=references
+            )
+            summary['completed'] += settlement['settled_count']
+            summary['amount_settled'] += settlement['total_amount']
+
+        if failures:
+            self._record_failures(failures, processed_by, now, summary)
+
+    def _record_failures(self, failures: Dict, processed_by, now, summary: Dict):
+        """
+        Échecs appliqués aux seuls paiements encore réservés par cet envoi
+
+        Un paiement réglé entre-temps ou repris par un autre worker (bail
+        expiré, tentative suivante) n'est pas modifié.
+        """
+        groups = defaultdict(list)
+        failed_totals = defaultdict(lambda: [Decimal('0'), 0])
+
+        with transaction.atomic():
+            rows = (
+                Payment.objects.select_for_update()
+                .filter(pk__in=list(failures), status='PROCESSING')
+                .values_list('pk', 'dispatch_attempts', 'program_id', 'amount')
+            )
+            for pk, attempts, program_id, amount in rows:
+                attempt, retry_at, reason = failures[pk]
+                if attempts != attempt:
+                    continue
+                groups[(attempt, retry_at, reason)].append(pk)
+                failed_totals[program_id][0] += amount
+                failed_totals[program_id][1] += 1
+
+            failed = rescheduled = 0
+            for (attempt, retry_at, reason), payment_ids in groups.items():
+                updated = Payment.objects.filter(
+                    pk__in=payment_ids, status='PROCESSING', dispatch_attempts=attempt
+                ).update(
+                    status='FAILED', failure_reason=reason, next_retry_at=retry_at,
+                    processed_by=processed_by, updated_at=now
+                )
+                failed += updated
+                if retry_at is not None:
+                    rescheduled += updated
+
+            for program_id, (amount, count) in failed_totals.items():
+                self.counters.payment_transition(
+                    program_id, 'PROCESSING', 'FAILED', count=count, amount=amount
+                )
+
+        summary['failed'] += failed
+        summary['rescheduled'] += rescheduled
+        summary['skipped'] += len(failures) - failed
@@ -0,0 +1,186 @@
+"""
+🇬🇦 RSU Gabon - Génération des lots de paiements
+Fichier: apps/programs_app/services/payment_run.py
+
+Pour un programme et une période, crée en masse un paiement par
+inscription ACTIVE (montant = benefit_amount, versé selon la fréquence du
+programme). La génération est idempotente : la contrainte unique
+(inscription, période) et la référence déterministe empêchent tout
+doublon, y compris entre deux exécutions concurrentes.
+
+Le contrôle budgétaire déduit du budget restant les paiements déjà émis et
+non réglés (toutes périodes) : budget_spent n'évolue qu'au règlement.
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Optional
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from apps.services_app.services.base_service import BaseService
+from ..models import Payment, PaymentRun, ProgramEnrollment, SocialProgram
+from .program_counters import ProgramCounterService
+
+
+def period_key(frequency: str, on_date: date) -> str:
+    """Clé de période d'un versement selon la fréquence du programme"""
+    if frequency == 'MONTHLY':
+        return f'{on_date.year}-{on_date.month:02d}'
+    if frequency == 'QUARTERLY':
+        return f'{on_date.year}-T{(on_date.month - 1) // 3 + 1}'
+    if frequency == 'ANNUAL':
+        return str(on_date.year)
+    return 'UNIQUE'
+
+
+class PaymentRunService(BaseService):
+    """
+    Génération et résumé des lots de paiements
+
+    Usage:
+        run = PaymentRunService().generate_run(program, date(2025, 3, 1))
+        PaymentRunService().summarize(run)
+    """
+
+    CHUNK_SIZE = 2000
+    DEFAULT_PAYMENT_METHOD = 'MOBILE_MONEY'
+
+    # Paiements émis, non encore réglés (engagent le budget)
+    OUTSTANDING = Q(status__in=['PENDING', 'PROCESSING']) | Q(status='FAILED', next_retry_at__isnull=False)
+
+    def generate_run(
+        self,
+        program: SocialProgram,
+        period_date: Optional[date] = None,
+        scheduled_date: Optional[date] = None,
+        generated_by=None,
+        payment_method: str = None
+    ) -> PaymentRun:
+        """
+        Crée les paiements manquants de la période
+
+        Args:
+            program: Programme (statut ACTIVE)
+            period_date: Date dans la période (défaut: aujourd'hui)
+            scheduled_date: Date de versement prévue (défaut: period_date)
+            generated_by: Utilisateur
+            payment_method: Méthode (défaut: Mobile Money)
+
+        Raises:
+            ValueError: Programme inactif ou budget restant insuffisant
+        """
+        if program.status != 'ACTIVE':
+            raise ValueError(f"Programme {program.code} non actif")
+
+        period_date = period_date or timezone.now().date()
+        scheduled_date = scheduled_date or period_date
+        period = period_key(program.frequency, period_date)
+        amount = program.benefit_amount
+
+        with transaction.atomic():
+            # Lots d'un même programme sérialisés : contrôle budgétaire sur données fraîches
+            program = SocialProgram.objects.select_for_update().get(pk=program.pk)
+            run, _ = PaymentRun.objects.select_for_update().get_or_create(
+                program=program,
+                period=period,
+                defaults={'scheduled_date': scheduled_date, 'generated_by': generated_by}
+            )
+
+            already_paid = dict(
+                Payment.objects.filter(program=program, period=period)
+                .values_list('enrollment_id', 'payment_run_id')
+            )
+            enrollments = (
+                ProgramEnrollment.objects
+                .filter(program=program, status='ACTIVE')
+                .filter(Q(start_date__isnull=True) | Q(start_date__lte=scheduled_date))
+                .filter(Q(end_date__isnull=True) | Q(end_date__gte=scheduled_date))
+                .order_by('pk')
+                .values_list('pk', 'beneficiary_id')
+            )
+            to_create = [
+                (enrollment_id, beneficiary_id)
+                for enrollment_id, beneficiary_id in enrollments.iterator(chunk_size=self.CHUNK_SIZE)
+                if enrollment_id not in already_paid
+            ]
+
+            # Contrôle budgétaire avant toute écriture
+            outstanding = Payment.objects.filter(self.OUTSTANDING, program=program).aggregate(
+                total=Sum('amount')
+            )['total'] or Decimal('0')
+            available = program.budget_remaining - outstanding
+            required = amount * len(to_create)
+            if required > available:
+                raise ValueError(
+                    f"Budget insuffisant: {required} FCFA requis, {available} FCFA disponibles "
+                    f"({program.budget_remaining} FCFA restants dont {outstanding} FCFA non réglés)"
+                )
+
+            method = payment_method or self.DEFAULT_PAYMENT_METHOD
+            for start in range(0, len(to_create), self.CHUNK_SIZE):
+                Payment.objects.bulk_create(
+                    [
+                        Payment(
+                            enrollment_id=enrollment_id,
+                            beneficiary_id=beneficiary_id,
+                            program=program,
+                            payment_run=run,
+                            period=period,
+                            amount=amount,
+                            payment_method=method,
+                            payment_reference=f'{program.code}-{period}-{enrollment_id}',
+                            scheduled_date=scheduled_date,
+                        )
+                        for enrollment_id, beneficiary_id in to_create[start:start + self.CHUNK_SIZE]
+                    ],
+                    ignore_conflicts=True
+                )
+
+            totals = Payment.objects.filter(payment_run=run).aggregate(
+                count=Count('id'), total=Sum('amount')
+            )
+            # Paiements créés par cette exécution (PENDING)
+            created_now = totals['count'] - run.payments_created
+            ProgramCounterService().payment_transition(
+                program.pk, None, 'PENDING',
+                count=created_now,
+                amount=(totals['total'] or Decimal('0')) - run.total_amount
+            )
+            # Cumul du lot ; paiements de la période existant hors du lot
+            run.payments_created = totals['count']
+            run.payments_skipped = sum(1 for run_id in already_paid.values() if run_id != run.pk)
+            run.total_amount = totals['total'] or Decimal('0')
+            run.save(update_fields=['payments_created', 'payments_skipped', 'total_amount', 'updated_at'])
+
+        self.log_operation('payment_run_generated', {
+            'program_code': program.code,
+            'period': period,
+            'payments_created': run.payments_created,
+            'payments_skipped': run.payments_skipped,
+            'created_this_execution': created_now,
+        })
+        return run
+
+    def summarize(self, run: PaymentRun) -> Dict:
+        """Résumé d'un lot : volumes, montants et avancement par statut"""
+        by_status = {
+            row['status']: {'count': row['count'], 'amount': float(row['amount'] or 0)}
+            for row in (
+                run.payments.order_by().values('status')
+                .annotate(count=Count('id'), amount=Sum('amount'))
+            )
+        }
+        return {
+            'run_id': run.pk,
+            'program_code': run.program.code,
+            'period': run.period,
+            'scheduled_date': run.scheduled_date.isoformat(),
+            'payments_created': run.payments_created,
+            'payments_skipped': run.payments_skipped,
+            'total_amount': float(run.total_amount),
+            'by_status': by_status,
+            'generated_at': run.created_at.isoformat(),
+        }
@@ -0,0 +1,212 @@
+"""
+🇬🇦 RSU Gabon - Règlement des paiements
+Fichier: apps/programs_app/services/payment_settlement.py
+
+Les compteurs (ProgramEnrollment.total_received / payments_count,
+SocialProgram.budget_spent) ne sont jamais lus puis réécrits en Python :
+ils sont incrémentés en base par des UPDATE avec expressions F(), ce qui
+évite les mises à jour perdues entre lots concurrents.
+
+Un lot complet est appliqué en quelques UPDATE agrégés : un par tranche
+de paiements pour le statut, un par programme pour le budget et un par
+groupe d'inscriptions recevant le même montant (en pratique un seul par
+programme pour un versement mensuel).
+
+Les compteurs de statut du programme (ProgramCounters) suivent chaque
+transition, regroupés par (programme, statut d'origine).
+
+Le règlement manuel ne porte que sur les paiements PENDING ou FAILED : un
+paiement PROCESSING est réservé par le moteur d'envoi, qui le règle
+lui-même ou le reprend après expiration (PaymentDispatchEngine.recover_stuck).
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.services_app.services.base_service import BaseService
+from ..models import Payment, ProgramEnrollment, SocialProgram
+from .program_counters import ProgramCounterService
+
+
+class PaymentSettlementService(BaseService):
+    """
+    Règlement unitaire ou par lot des paiements
+
+    Usage:
+        service = PaymentSettlementService()
+        service.settle_payment(payment, processed_by=request.user)
+        service.settle_payments(payment_ids, processed_by=request.user)
+    """
+
+    SETTLEABLE_STATUSES = ['PENDING', 'FAILED']
+    FAILABLE_STATUSES = ['PENDING', 'PROCESSING']
+    CHUNK_SIZE = 500
+
+    def __init__(self):
+        super().__init__()
+        self.counters = ProgramCounterService()
+
+    @transaction.atomic
+    def settle_payment(self, payment: Payment, processed_by=None) -> bool:
+        """
+        Règle un paiement et incrémente les compteurs associés
+
+        Returns:
+            bool: False si le paiement a déjà été réglé (requête concurrente)
+        """
+        now = timezone.now()
+        previous_status = Payment.objects.select_for_update().filter(
+            pk=payment.pk, status__in=self.SETTLEABLE_STATUSES
+        ).values_list('status', flat=True).first()
+        if previous_status is None:
+            return False
+
+        Payment.objects.filter(pk=payment.pk).update(
+            status='COMPLETED', processed_date=now, processed_by=processed_by, updated_at=now
+        )
+
+        ProgramEnrollment.objects.filter(pk=payment.enrollment_id).update(
+            total_received=F('total_received') + payment.amount,
+            payments_count=F('payments_count') + 1,
+            updated_at=now
+        )
+        SocialProgram.objects.filter(pk=payment.program_id).update(
+            budget_spent=F('budget_spent') + payment.amount,
+            updated_at=now
+        )
+        self.counters.payment_transition(
+            payment.program_id, previous_status, 'COMPLETED', amount=payment.amount
+        )
+
+        payment.status, payment.processed_date, payment.processed_by = 'COMPLETED', now, processed_by
+        self.log_operation('payment_settled', {
+            'payment_reference': payment.payment_reference,
+            'amount': float(payment.amount),
+        })
+        return True
+
+    @transaction.atomic
+    def settle_payments(self, payment_ids: Iterable, processed_by=None, statuses=None,
+                        provider_references: Dict = None) -> Dict:
+        """
+        Règle un lot de paiements (run mensuel) en UPDATE agrégés
+
+        Seuls les paiements dans `statuses` (défaut: SETTLEABLE_STATUSES)
+        sont réglés ; les autres (déjà réglés, annulés, réservés) sont ignorés.
+        `provider_references` ({payment_id: référence}) est enregistré sur
+        les paiements effectivement réglés.
+
+        Returns:
+            Dict: Nombre de paiements réglés, montant total et détail par programme
+        """
+        now = timezone.now()
+        payment_ids = list(payment_ids)
+        statuses = statuses or self.SETTLEABLE_STATUSES
+        provider_references = provider_references or {}
+
+        enrollment_totals = defaultdict(lambda: [Decimal('0'), 0])
+        program_totals = defaultdict(lambda: [Decimal('0'), 0])
+        transitions = defaultdict(lambda: [Decimal('0'), 0])
+        settled = 0
+
+        for start in range(0, len(payment_ids), self.CHUNK_SIZE):
+            chunk = payment_ids[start:start + self.CHUNK_SIZE]
+            rows = list(
+                Payment.objects.select_for_update()
+                .filter(pk__in=chunk, status__in=statuses)
+                .values_list('pk', 'enrollment_id', 'program_id', 'amount', 'status')
+            )
+            if not rows:
+                continue
+
+            Payment.objects.filter(pk__in=[row[0] for row in rows]).update(
+                status='COMPLETED', processed_date=now, processed_by=processed_by, updated_at=now
+            )
+            referenced = [
+                Payment(pk=row[0], provider_reference=provider_references[row[0]])
+                for row in rows if provider_references.get(row[0])
+            ]
+            Payment.objects.bulk_update(referenced, ['provider_reference'])
+            for _, enrollment_id, program_id, amount, previous_status in rows:
+                enrollment_totals[enrollment_id][0] += amount
+                enrollment_totals[enrollment_id][1] += 1
+                program_totals[program_id][0] += amount
+                program_totals[program_id][1] += 1
+                transitions[(program_id, previous_status)][0] += amount
+                transitions[(program_id, previous_status)][1] += 1
+            settled += len(rows)
+
+        # Inscriptions regroupées par (montant, nombre de paiements) reçus
+        enrollment_groups = defaultdict(list)
+        for enrollment_id, (amount, count) in enrollment_totals.items():
+            enrollment_groups[(amount, count)].append(enrollment_id)
+
+        for (amount, count), enrollment_ids in enrollment_groups.items():
+            for start in range(0, len(enrollment_ids), self.CHUNK_SIZE):
+                ProgramEnrollment.objects.filter(
+                    pk__in=enrollment_ids[start:start + self.CHUNK_SIZE]
+                ).update(
+                    total_received=F('total_received') + amount,
+                    payments_count=F('payments_count') + count,
+                    updated_at=now
+                )
+
+        for program_id, (amount, _) in program_totals.items():
+            SocialProgram.objects.filter(pk=program_id).update(
+                budget_spent=F('budget_spent') + amount,
+                updated_at=now
+            )
+
+        for (program_id, previous_status), (amount, count) in transitions.items():
+            self.counters.payment_transition(
+                program_id, previous_status, 'COMPLETED', count=count, amount=amount
+            )
+
+        result = {
+            'settled_count': settled,
+            'skipped_count': len(payment_ids) - settled,
+            'total_amount': float(sum(amount for amount, _ in program_totals.values())),
+            'programs': {
+                str(program_id): {'payments': count, 'amount': float(amount)}
+                for program_id, (amount, count) in program_totals.items()
+            },
+        }
+        self.log_operation('payments_batch_settled', {
+            'settled_count': result['settled_count'],
+            'total_amount': result['total_amount'],
+        })
+        return result
+
+    @transaction.atomic
+    def mark_failed(self, payment: Payment, reason: str = '', processed_by=None) -> bool:
+        """
+        Marque un paiement en attente ou en traitement comme échoué
+
+        Returns:
+            bool: False si le paiement n'est plus en attente (réglé, annulé...)
+        """
+        previous_status = Payment.objects.select_for_update().filter(
+            pk=payment.pk, status__in=self.FAILABLE_STATUSES
+        ).values_list('status', flat=True).first()
+        if previous_status is None:
+            return False
+
+        Payment.objects.filter(pk=payment.pk).update(
+            status='FAILED', failure_reason=reason, processed_by=processed_by,
+            updated_at=timezone.now()
+        )
+        self.counters.payment_transition(
+            payment.program_id, previous_status, 'FAILED', amount=payment.amount
+        )
+
+        payment.status, payment.failure_reason, payment.processed_by = 'FAILED', reason, processed_by
+        self.log_operation('payment_failed', {
+            'payment_reference': payment.payment_reference,
+            'reason': reason,
+        })
+        return True
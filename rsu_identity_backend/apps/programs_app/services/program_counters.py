@@ -0,0 +1,212 @@
+"""
+🇬🇦 RSU Gabon - Compteurs dénormalisés des programmes
+Fichier: apps/programs_app/services/program_counters.py
+
+Chaque transition de statut (approbation, rejet, activation, règlement,
+échec...) applique des incréments F() sur la ligne ProgramCounters du
+programme, dans la transaction qui écrit le statut. Les tableaux de bord
+lisent ces compteurs au lieu de parcourir Payment et ProgramEnrollment.
+
+Les modifications hors workflow (admin, PATCH du statut, suppressions) ne
+sont pas suivies : reconcile() recalcule les compteurs depuis les tables
+(commande reconcile_program_counters, à planifier quotidiennement).
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from apps.services_app.services.base_service import BaseService
+from ..models import Payment, ProgramCounters, ProgramEnrollment, SocialProgram
+
+ENROLLMENT_COUNTERS = {
+    status: f'enrollments_{status.lower()}' for status, _ in ProgramEnrollment.STATUS_CHOICES
+}
+PAYMENT_COUNTERS = {
+    status: f'payments_{status.lower()}' for status, _ in Payment.STATUS_CHOICES
+}
+PAYMENT_AMOUNTS = {'PENDING': 'amount_pending', 'COMPLETED': 'amount_paid'}
+
+# Inscriptions comptées dans SocialProgram.current_beneficiaries
+BENEFICIARY_STATUSES = ('APPROVED', 'ACTIVE')
+
+
+class ProgramCounterService(BaseService):
+    """
+    Mise à jour et recalcul des compteurs par programme
+
+    Les transitions doivent être appliquées après l'écriture du statut,
+    dans la même transaction.
+
+    Usage:
+        counters = ProgramCounterService()
+        counters.enrollment_transition(program_id, 'PENDING', 'APPROVED')
+        counters.payment_transition(program_id, 'PENDING', 'COMPLETED', amount=Decimal('20000'))
+        counters.reconcile()
+    """
+
+    def enrollment_transition(
+        self,
+        program_id: int,
+        from_status: Optional[str],
+        to_status: Optional[str],
+        count: int = 1
+    ):
+        """Inscriptions passées de from_status à to_status (None: création/suppression)"""
+        deltas = defaultdict(int)
+        if from_status:
+            deltas[ENROLLMENT_COUNTERS[from_status]] -= count
+        if to_status:
+            deltas[ENROLLMENT_COUNTERS[to_status]] += count
+        self.apply(program_id, deltas)
+
+    def payment_transition(
+        self,
+        program_id: int,
+        from_status: Optional[str],
+        to_status: Optional[str],
+        count: int = 1,
+        amount: Decimal = Decimal('0')
+    ):
+        """Paiements (montant cumulé amount) passés de from_status à to_status"""
+        deltas = defaultdict(int)
+        for payment_status, sign in ((from_status, -1), (to_status, 1)):
+            if not payment_status:
+                continue
+            deltas[PAYMENT_COUNTERS[payment_status]] += sign * count
+            if payment_status in PAYMENT_AMOUNTS:
+                deltas[PAYMENT_AMOUNTS[payment_status]] += sign * amount
+        self.apply(program_id, deltas)
+
+    def apply(self, program_id: int, deltas: Dict[str, int]):
+        """Incréments atomiques ; premier passage : compteurs calculés en base"""
+        changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+        if not changes:
+            return
+
+        updated = ProgramCounters.objects.filter(program_id=program_id).update(
+            **changes, updated_at=timezone.now()
+        )
+        if not updated:
+            # Statut déjà écrit : le recalcul inclut la transition
+            self.reconcile([program_id])
+
+    def reconcile(self, program_ids: Iterable = None) -> Dict:
+        """
+        Recalcule les compteurs (et current_beneficiaries) depuis les tables
+
+        Args:
+            program_ids: Programmes à recalculer (défaut: tous)
+
+        Returns:
+            Dict: Programmes recalculés et programmes dont les compteurs divergeaient
+        """
+        programs = SocialProgram.objects.all()
+        enrollments = ProgramEnrollment.objects.all()
+        payments = Payment.objects.all()
+        if program_ids is not None:
+            program_ids = list(program_ids)
+            programs = programs.filter(pk__in=program_ids)
+            enrollments = enrollments.filter(program_id__in=program_ids)
+            payments = payments.filter(program_id__in=program_ids)
+
+        values = defaultdict(self._empty_counters)
+        for program_id, enrollment_status, count in (
+            enrollments.order_by().values('program_id', 'status')
+            .annotate(count=Count('id')).values_list('program_id', 'status', 'count')
+        ):
+            values[program_id][ENROLLMENT_COUNTERS[enrollment_status]] = count
+
+        for program_id, payment_status, count, amount in (
+            payments.order_by().values('program_id', 'status')
+            .annotate(count=Count('id'), amount=Sum('amount'))
+            .values_list('program_id', 'status', 'count', 'amount')
+        ):
+            values[program_id][PAYMENT_COUNTERS[payment_status]] = count
+            if payment_status in PAYMENT_AMOUNTS:
+                values[program_id][PAYMENT_AMOUNTS[payment_status]] = amount or Decimal('0')
+
+        existing = {
+            counters.program_id: counters
+            for counters in ProgramCounters.objects.filter(program__in=programs)
+        }
+        program_rows = list(programs.values_list('pk', 'current_beneficiaries'))
+        now = timezone.now()
+        drifted = []
+
+        for program_id, current_beneficiaries in program_rows:
+            computed = values[program_id]
+            beneficiaries = sum(
+                computed[ENROLLMENT_COUNTERS[beneficiary_status]]
+                for beneficiary_status in BENEFICIARY_STATUSES
+            )
+            counters = existing.get(program_id)
+            if counters is None or beneficiaries != current_beneficiaries or any(
+                getattr(counters, field) != value for field, value in computed.items()
+            ):
+                drifted.append(program_id)
+
+            ProgramCounters.objects.update_or_create(
+                program_id=program_id, defaults={**computed, 'reconciled_at': now}
+            )
+            if beneficiaries != current_beneficiaries:
+                SocialProgram.objects.filter(pk=program_id).update(
+                    current_beneficiaries=beneficiaries
+                )
+
+        result = {'reconciled': len(program_rows), 'drifted': drifted}
+        self.log_operation('program_counters_reconciled', result)
+        return result
+
+    def get_counters(self, program: SocialProgram) -> Dict:
+        """Compteurs d'un programme au format des statistiques"""
+        counters = ProgramCounters.objects.filter(program=program).first()
+        if counters is None:
+            self.reconcile([program.pk])
+            counters = ProgramCounters.objects.get(program=program)
+        return self.serialize(counters)
+
+    def totals(self, program_ids: Iterable = None) -> Dict:
+        """Somme des compteurs de tous les programmes (1 requête)"""
+        queryset = ProgramCounters.objects.all()
+        if program_ids is not None:
+            queryset = queryset.filter(program_id__in=program_ids)
+        fields = self._counter_fields()
+        totals = queryset.aggregate(**{field: Sum(field) for field in fields})
+        return self.serialize({field: totals[field] or 0 for field in fields})
+
+    def serialize(self, counters) -> Dict:
+        """{'enrollments': {...}, 'payments': {...}, 'amounts': {...}}"""
+        read = counters.get if isinstance(counters, dict) else lambda field: getattr(counters, field)
+        enrollments = {
+            status.lower(): read(field) for status, field in ENROLLMENT_COUNTERS.items()
+        }
+        payments = {
+            status.lower(): read(field) for status, field in PAYMENT_COUNTERS.items()
+        }
+        return {
+            'enrollments': {'total': sum(enrollments.values()), **enrollments},
+            'payments': {'total': sum(payments.values()), **payments},
+            'amounts': {
+                'paid': float(read('amount_paid')),
+                'pending': float(read('amount_pending')),
+            },
+        }
+
+    @staticmethod
+    def _counter_fields():
+        return [
+            *ENROLLMENT_COUNTERS.values(),
+            *PAYMENT_COUNTERS.values(),
+            *PAYMENT_AMOUNTS.values(),
+        ]
+
+    @classmethod
+    def _empty_counters(cls) -> Dict:
+        return {
+            field: Decimal('0') if field in PAYMENT_AMOUNTS.values() else 0
+            for field in cls._counter_fields()
+        }
@@ -0,0 +1,127 @@
+"""
+🇬🇦 RSU Gabon - Statistiques d'un programme
+Fichier: apps/programs_app/services/program_statistics.py
+
+Le tableau de bord d'un programme lit les compteurs dénormalisés
+(inscriptions et paiements par statut, voir program_counters) et calcule la
+démographie en une requête groupée, puis est mis en cache brièvement. La clé inclut updated_at : toute modification du
+programme, y compris les compteurs budgétaires, produit une nouvelle clé.
+"""
+
+from typing import Dict
+
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+
+from apps.identity_app.models import PersonIdentity
+from apps.services_app.services.base_service import BaseService
+from ..models import SocialProgram
+from .program_counters import ProgramCounterService
+
+
+class ProgramStatisticsService(BaseService):
+    """
+    Statistiques détaillées d'un programme
+
+    Usage:
+        stats = ProgramStatisticsService().get_statistics(program)
+    """
+
+    CACHE_TIMEOUT = 60
+
+    ENROLLMENT_STATUSES = ['PENDING', 'APPROVED', 'ACTIVE', 'REJECTED', 'COMPLETED']
+    PAYMENT_STATUSES = ['COMPLETED', 'PENDING', 'FAILED']
+    DEMOGRAPHIC_STATUSES = ['APPROVED', 'ACTIVE']
+
+    # Clé de réponse → code genre PersonIdentity
+    GENDERS = {'M': 'M', 'F': 'F', 'OTHER': 'O'}
+
+    def cache_key(self, program: SocialProgram) -> str:
+        return f'program_statistics:{program.pk}:{program.updated_at.timestamp()}'
+
+    def get_statistics(self, program: SocialProgram) -> Dict:
+        """Statistiques en cache (recalculées au plus toutes les CACHE_TIMEOUT s)"""
+        key = self.cache_key(program)
+        stats = cache.get(key)
+        if stats is None:
+            stats = self.compute_statistics(program)
+            cache.set(key, stats, self.CACHE_TIMEOUT)
+        return stats
+
+    def compute_statistics(self, program: SocialProgram) -> Dict:
+        counters = ProgramCounterService().get_counters(program)
+        return {
+            'program_info': {
+                'code': program.code,
+                'name': program.name,
+                'status': program.status,
+                'is_active': program.is_active,
+            },
+            'budget': {
+                'total': float(program.total_budget),
+                'spent': float(program.budget_spent),
+                'remaining': float(program.budget_remaining),
+                'percentage_used': round(
+                    (program.budget_spent / program.total_budget * 100), 2
+                ) if program.total_budget > 0 else 0
+            },
+            'beneficiaries': {
+                'current': program.current_beneficiaries,
+                'max': program.max_beneficiaries,
+                'remaining': program.capacity_remaining,
+                'is_full': program.is_full
+            },
+            'enrollments': {
+                'total': counters['enrollments']['total'],
+                **{
+                    status.lower(): counters['enrollments'][status.lower()]
+                    for status in self.ENROLLMENT_STATUSES
+                },
+            },
+            'payments': {
+                'total_count': counters['payments']['total'],
+                **{
+                    status.lower(): counters['payments'][status.lower()]
+                    for status in self.PAYMENT_STATUSES
+                },
+                'total_amount': counters['amounts']['paid'],
+            },
+            'demographics': self._demographics(program),
+        }
+
+    def _demographics(self, program: SocialProgram) -> Dict:
+        """Genre, province et score moyen des bénéficiaires (1 requête groupée)"""
+        rows = (
+            PersonIdentity.objects
+            .filter(
+                program_enrollments__program=program,
+                program_enrollments__status__in=self.DEMOGRAPHIC_STATUSES
+            )
+            .order_by()
+            .values('province')
+            .annotate(
+                count=Count('id'),
+                scored=Count('vulnerability_score'),
+                score_sum=Sum('vulnerability_score'),
+                **{
+                    f'gender_{key}': Count('id', filter=Q(gender=code))
+                    for key, code in self.GENDERS.items()
+                }
+            )
+        )
+
+        by_gender = dict.fromkeys(self.GENDERS, 0)
+        by_province = []
+        scored, score_sum = 0, 0
+        for row in sorted(rows, key=lambda r: -r['count']):
+            by_province.append({'province': row['province'], 'count': row['count']})
+            for key in self.GENDERS:
+                by_gender[key] += row[f'gender_{key}']
+            scored += row['scored']
+            score_sum += row['score_sum'] or 0
+
+        return {
+            'by_gender': by_gender,
+            'by_province': by_province,
+            'avg_vulnerability_score': round(float(score_sum) / scored, 2) if scored else 0,
+        }
@@ -0,0 +1,172 @@
+"""
+🇬🇦 RSU Gabon - Liste d'attente des programmes complets
+Fichier: apps/programs_app/services/waitlist.py
+
+Les candidats éligibles d'un programme complet sont conservés dans une
+table indexée sur (programme, score d'éligibilité, vulnérabilité, id) :
+une insertion ne reclasse personne et la tête de liste se lit par un
+parcours d'index limité. Lorsqu'une place se libère (inscription terminée
+ou approbation révoquée), les premiers candidats sont dépilés et inscrits
+dans la même transaction, si le programme est actif et dans la limite des
+places et du budget non engagé.
+"""
+
+from decimal import Decimal
+from typing import Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from apps.services_app.services.base_service import BaseService
+from apps.services_app.services.budget_optimizer import program_budget_slots
+from ..models import ProgramEnrollment, ProgramWaitlistEntry, SocialProgram
+from .program_counters import ProgramCounterService
+
+
+class WaitlistService(BaseService):
+    """
+    File d'attente classée par programme
+
+    Usage:
+        waitlist = WaitlistService()
+        waitlist.add(program, person, eligibility_score=Decimal('82.5'))
+        waitlist.promote(program.pk, approved_by=request.user)
+    """
+
+    BATCH_SIZE = 1000
+    NOTE = "Inscription depuis la liste d'attente"
+
+    def add(self, program: SocialProgram, person, eligibility_score) -> ProgramWaitlistEntry:
+        """Inscrit (ou reclasse) une personne en liste d'attente"""
+        entry, _ = ProgramWaitlistEntry.objects.update_or_create(
+            program=program,
+            person=person,
+            defaults={
+                'eligibility_score': eligibility_score,
+                'vulnerability_score': person.vulnerability_score or Decimal('0'),
+            }
+        )
+        return entry
+
+    def add_many(self, program: SocialProgram, candidates: Iterable[Tuple]) -> int:
+        """
+        Ajout en masse, sans effet sur les personnes déjà en attente
+
+        Args:
+            candidates: (person_id, eligibility_score, vulnerability_score)
+
+        Returns:
+            int: Entrées réellement ajoutées (hors personnes déjà en attente)
+        """
+        waiting = ProgramWaitlistEntry.objects.filter(program=program)
+        before = waiting.count()
+        entries = [
+            ProgramWaitlistEntry(
+                program=program,
+                person_id=person_id,
+                eligibility_score=eligibility_score,
+                vulnerability_score=vulnerability_score or Decimal('0'),
+            )
+            for person_id, eligibility_score, vulnerability_score in candidates
+        ]
+        ProgramWaitlistEntry.objects.bulk_create(
+            entries, batch_size=self.BATCH_SIZE, ignore_conflicts=True
+        )
+        return waiting.count() - before
+
+    def discard(self, program_id: int, person_ids: Iterable) -> int:
+        """Retire des personnes inscrites par ailleurs"""
+        deleted, _ = ProgramWaitlistEntry.objects.filter(
+            program_id=program_id, person_id__in=list(person_ids)
+        ).delete()
+        return deleted
+
+    def ranked(self, program: SocialProgram):
+        """Liste classée (parcours de l'index waitlist_rank_idx)"""
+        return ProgramWaitlistEntry.objects.filter(program=program).order_by(
+            '-eligibility_score', '-vulnerability_score', 'id'
+        )
+
+    def position(self, program: SocialProgram, person) -> Optional[int]:
+        """Rang (1 = prochain candidat) d'une personne, None si absente"""
+        entry = ProgramWaitlistEntry.objects.filter(program=program, person=person).first()
+        if entry is None:
+            return None
+        score, vulnerability = entry.eligibility_score, entry.vulnerability_score
+        ahead = ProgramWaitlistEntry.objects.filter(program=program).filter(
+            Q(eligibility_score__gt=score) |
+            Q(eligibility_score=score, vulnerability_score__gt=vulnerability) |
+            Q(eligibility_score=score, vulnerability_score=vulnerability, id__lt=entry.id)
+        ).count()
+        return ahead + 1
+
+    @transaction.atomic
+    def promote(self, program_id: int, max_count: Optional[int] = None, approved_by=None) -> List[int]:
+        """
+        Inscrit les premiers candidats dans les places disponibles
+
+        Returns:
+            List[int]: Personnes inscrites
+        """
+        program = SocialProgram.objects.select_for_update().get(pk=program_id)
+        if not program.is_active:
+            return []
+
+        # Première borne atteinte : places, budget, nombre demandé
+        bounds = [
+            value for value in (program.capacity_remaining, program_budget_slots(program), max_count)
+            if value is not None
+        ]
+        slots = max(min(bounds), 0) if bounds else None
+        if slots == 0:
+            return []
+
+        already_enrolled = ProgramEnrollment.objects.filter(
+            program_id=program_id, beneficiary_id=OuterRef('person_id')
+        )
+        head = self.ranked(program).select_for_update().annotate(
+            enrolled=Exists(already_enrolled)
+        ).values_list('id', 'person_id', 'person__headed_household', 'eligibility_score', 'enrolled')
+
+        # Dépile la tête de liste ; les personnes inscrites entre-temps sont écartées
+        promoted = []
+        while slots is None or len(promoted) < slots:
+            size = self.BATCH_SIZE if slots is None else min(self.BATCH_SIZE, slots - len(promoted))
+            batch = list(head[:size])
+            if not batch:
+                break
+            ProgramWaitlistEntry.objects.filter(pk__in=[row[0] for row in batch]).delete()
+            promoted.extend(
+                (person_id, household_id, score)
+                for _, person_id, household_id, score, enrolled in batch if not enrolled
+            )
+
+        now = timezone.now()
+        ProgramEnrollment.objects.bulk_create([
+            ProgramEnrollment(
+                program=program,
+                beneficiary_id=person_id,
+                household_id=household_id,
+                status='APPROVED',
+                approval_date=now.date(),
+                approved_by=approved_by,
+                eligibility_score=score,
+                notes=self.NOTE,
+            )
+            for person_id, household_id, score in promoted
+        ], batch_size=self.BATCH_SIZE)
+
+        if promoted:
+            SocialProgram.objects.filter(pk=program_id).update(
+                current_beneficiaries=F('current_beneficiaries') + len(promoted),
+                updated_at=now
+            )
+            ProgramCounterService().enrollment_transition(
+                program_id, None, 'APPROVED', count=len(promoted)
+            )
+            self.log_operation('waitlist_promoted', {
+                'program_code': program.code,
+                'promoted_count': len(promoted),
+            })
+        return [person_id for person_id, _, _ in promoted]
@@ -3,12 +3,28 @@
 Fichier: apps/programs_app/tests.py
 """
 
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
-from rest_framework.test import APITestCase, APIClient
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase, APIClient, APIRequestFactory, force_authenticate
 from rest_framework import status
-from apps.core_app.models import RSUUser
-from apps.identity_app.models import PersonIdentity
-from .models import ProgramCategory, SocialProgram, ProgramEnrollment
+from apps.core_app.models import AuditLog, RSUUser
+from apps.identity_app.models import Household, PersonIdentity
+from .models import (
+    ProgramCategory, SocialProgram, ProgramEnrollment, ProgramWaitlistEntry, Payment
+)
+from apps.services_app.models import SocialProgramEligibility
+from apps.services_app.services.budget_optimizer import program_benefit_cost
+from .services import (
+    AutoEnrollmentService, EnrollmentWorkflowService, FakeMobileMoneyProvider, PaymentDispatchEngine,
+    PaymentRunService, PaymentSettlementService, ProgramCounterService,
+    ProgramStatisticsService, WaitlistService, period_key
+)
+from .services.payment_dispatch import RETRYABLE, ProviderResult
+from .views import PaymentViewSet, ProgramEnrollmentViewSet, SocialProgramViewSet
+from datetime import date, timedelta
 from decimal import Decimal
 
 
@@ -69,4 +85,769 @@ class ProgramsAPITest(APITestCase):
         response = self.client.get('/api/v1/programs/programs/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('results', response.data)
\ No newline at end of file
+        self.assertIn('results', response.data)
+
+
+class ProgramTestCase(TestCase):
+    """
+    Catégorie, programme et administrateur communs (setUpTestData)
+    
+    PROGRAM : champs propres au programme de la classe
+    USER : (username, employee_id) de l'administrateur, None si inutile
+    """
+    
+    PROGRAM = {}
+    USER = None
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = ProgramCategory.objects.create(name='Transferts', description='Cash')
+        cls.program = SocialProgram.objects.create(
+            category=cls.category, description='Test', start_date=date(2025, 1, 1), **cls.PROGRAM
+        )
+        if cls.USER:
+            username, employee_id = cls.USER
+            cls.user = RSUUser.objects.create_user(
+                username=username, email=f'{username}@programs.ga', password='TestPass123!',
+                user_type='ADMIN', employee_id=employee_id
+            )
+
+
+class PaymentSettlementTest(ProgramTestCase):
+    """Règlement des paiements avec compteurs atomiques"""
+    
+    PROGRAM = {
+        'code': 'PAY-2025', 'name': 'Versements',
+        'total_budget': Decimal('10000000'), 'benefit_amount': Decimal('20000'),
+    }
+    USER = ('settlement', 'PROG-002')
+    
+    def setUp(self):
+        self.enrollments = []
+        self.payments = []
+        for index in range(3):
+            person = PersonIdentity.objects.create(
+                first_name='Test', last_name=f'Pay{index}', birth_date='1980-01-01', gender='F'
+            )
+            enrollment = ProgramEnrollment.objects.create(
+                program=self.program, beneficiary=person, status='ACTIVE'
+            )
+            self.enrollments.append(enrollment)
+            self.payments.append(Payment.objects.create(
+                enrollment=enrollment, beneficiary=person, program=self.program,
+                amount=Decimal('20000') if index else Decimal('35000'),
+                payment_method='MOBILE_MONEY', payment_reference=f'PAY-{index}',
+                scheduled_date=date(2025, 2, 1)
+            ))
+    
+    def test_settle_payment_increments_counters_once(self):
+        service = PaymentSettlementService()
+        self.assertTrue(service.settle_payment(self.payments[1], processed_by=self.user))
+        # Deuxième traitement concurrent du même paiement : ignoré
+        self.assertFalse(service.settle_payment(self.payments[1], processed_by=self.user))
+        
+        self.enrollments[1].refresh_from_db()
+        self.program.refresh_from_db()
+        self.assertEqual(self.enrollments[1].total_received, Decimal('20000'))
+        self.assertEqual(self.enrollments[1].payments_count, 1)
+        self.assertEqual(self.program.budget_spent, Decimal('20000'))
+    
+    def test_settle_batch_with_aggregate_updates(self):
+        # Un paiement déjà réglé hors lot ne doit pas être compté deux fois
+        PaymentSettlementService().settle_payment(self.payments[2])
+        ids = [payment.pk for payment in self.payments]
+        
+        # 1 SELECT + 1 UPDATE statut + 2 groupes de montants + 1 programme
+        # + 1 compteurs (+ savepoint)
+        with self.assertNumQueries(8):
+            result = PaymentSettlementService().settle_payments(ids, processed_by=self.user)
+        
+        self.assertEqual(result['settled_count'], 2)
+        self.assertEqual(result['skipped_count'], 1)
+        self.assertEqual(result['total_amount'], 55000.0)
+        self.program.refresh_from_db()
+        self.assertEqual(self.program.budget_spent, Decimal('75000'))
+        self.assertEqual(
+            sorted(ProgramEnrollment.objects.values_list('total_received', flat=True)),
+            [Decimal('20000'), Decimal('20000'), Decimal('35000')]
+        )
+        self.assertFalse(Payment.objects.exclude(status='COMPLETED').exists())
+    
+    def test_process_batch_endpoint(self):
+        view = PaymentViewSet.as_view({'post': 'process_batch'})
+        request = APIRequestFactory().post(
+            '/payments/process_batch/', {'program': self.program.pk}, format='json'
+        )
+        force_authenticate(request, user=self.user)
+        response = view(request)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['settled_count'], 3)
+        
+        for body in [{'payment_ids': [1, 'x']}, {'program': self.program.pk, 'scheduled_before': '2025-13-01'}]:
+            request = APIRequestFactory().post('/payments/process_batch/', body, format='json')
+            force_authenticate(request, user=self.user)
+            self.assertEqual(view(request).status_code, status.HTTP_400_BAD_REQUEST, body)
+    
+    def test_manual_settlement_skips_dispatched_payments(self):
+        Payment.objects.filter(pk=self.payments[0].pk).update(status='PROCESSING')
+        ids = [payment.pk for payment in self.payments]
+        
+        result = PaymentSettlementService().settle_payments(ids, processed_by=self.user)
+        self.assertEqual((result['settled_count'], result['skipped_count']), (2, 1))
+        self.assertFalse(PaymentSettlementService().settle_payment(self.payments[0]))
+        self.assertEqual(Payment.objects.get(pk=self.payments[0].pk).status, 'PROCESSING')
+
+
+class PaymentRunTest(ProgramTestCase):
+    """Génération idempotente des lots de paiements"""
+    
+    PROGRAM = {
+        'code': 'RUN-2025', 'name': 'Paie mensuelle', 'status': 'ACTIVE',
+        'total_budget': Decimal('100000'), 'benefit_amount': Decimal('20000'), 'frequency': 'MONTHLY',
+    }
+    USER = ('payrun', 'PROG-003')
+    
+    def setUp(self):
+        for index, enrollment_status in enumerate(['ACTIVE', 'ACTIVE', 'ACTIVE', 'SUSPENDED']):
+            person = PersonIdentity.objects.create(
+                first_name='Test', last_name=f'Run{index}', birth_date='1980-01-01', gender='F'
+            )
+            ProgramEnrollment.objects.create(
+                program=self.program, beneficiary=person, status=enrollment_status
+            )
+    
+    def test_period_keys(self):
+        self.assertEqual(period_key('MONTHLY', date(2025, 3, 15)), '2025-03')
+        self.assertEqual(period_key('QUARTERLY', date(2025, 5, 1)), '2025-T2')
+        self.assertEqual(period_key('ANNUAL', date(2025, 5, 1)), '2025')
+    
+    def test_generate_run_is_idempotent(self):
+        service = PaymentRunService()
+        run = service.generate_run(self.program, date(2025, 3, 10), generated_by=self.user)
+        self.assertEqual(run.payments_created, 3)
+        self.assertEqual(run.total_amount, Decimal('60000'))
+        
+        # Nouvelle inscription puis relance : seul le paiement manquant est créé
+        person = PersonIdentity.objects.create(
+            first_name='Test', last_name='Late', birth_date='1980-01-01', gender='F'
+        )
+        ProgramEnrollment.objects.create(program=self.program, beneficiary=person, status='ACTIVE')
+        run = service.generate_run(self.program, date(2025, 3, 25))
+        
+        # Cumul du lot : les paiements de la première exécution ne sont pas « existants »
+        self.assertEqual(run.payments_created, 4)
+        self.assertEqual(run.payments_skipped, 0)
+        self.assertEqual(run.total_amount, Decimal('80000'))
+        self.assertEqual(Payment.objects.filter(period='2025-03').count(), 4)
+        summary = service.summarize(run)
+        self.assertEqual(summary['by_status']['PENDING']['count'], 4)
+    
+    def test_generate_run_checks_budget(self):
+        self.program.budget_spent = Decimal('50000')
+        self.program.save()
+        with self.assertRaises(ValueError):
+            PaymentRunService().generate_run(self.program, date(2025, 3, 10))
+        self.assertFalse(Payment.objects.exists())
+    
+    def test_budget_check_counts_unsettled_periods(self):
+        service = PaymentRunService()
+        # 60 000 engagés en mars, non réglés : avril (60 000) dépasserait 100 000
+        service.generate_run(self.program, date(2025, 3, 10))
+        with self.assertRaises(ValueError):
+            service.generate_run(self.program, date(2025, 4, 10))
+        self.assertEqual(Payment.objects.count(), 3)
+        
+        # Paiements de mars rejetés définitivement : le budget est libéré
+        Payment.objects.update(status='FAILED', next_retry_at=None)
+        self.assertEqual(service.generate_run(self.program, date(2025, 4, 10)).payments_created, 3)
+
+
+class PaymentDispatchTest(ProgramTestCase):
+    """Envoi au fournisseur : concurrence, idempotence et reprises"""
+    
+    PROGRAM = {
+        'code': 'MM-2025', 'name': 'Mobile Money', 'status': 'ACTIVE',
+        'total_budget': Decimal('10000000'), 'benefit_amount': Decimal('20000'),
+    }
+    
+    def setUp(self):
+        for index in range(6):
+            person = PersonIdentity.objects.create(
+                first_name='Test', last_name=f'Mm{index}', birth_date='1980-01-01', gender='F'
+            )
+            ProgramEnrollment.objects.create(program=self.program, beneficiary=person, status='ACTIVE')
+        self.run = PaymentRunService().generate_run(self.program, date(2025, 3, 1))
+        self.references = list(self.run.payments.order_by('pk').values_list('payment_reference', flat=True))
+        self.delays = []
+    
+    def _engine(self, provider):
+        engine = PaymentDispatchEngine(provider, max_workers=4, sleep=self.delays.append)
+        engine.RETRY_BASE_DELAY = 0.01
+        return engine
+    
+    def test_dispatch_settles_and_schedules_retries(self):
+        provider = FakeMobileMoneyProvider(
+            rejected=[self.references[0]],
+            transient_failures={self.references[1]: 1, self.references[2]: 10}
+        )
+        summary = self._engine(provider).dispatch(self.run.payments.values_list('id', flat=True))
+        
+        self.assertEqual(summary['sent'], 6)
+        self.assertEqual(summary['completed'], 4)
+        self.assertEqual(summary['failed'], 2)
+        self.assertEqual(summary['rescheduled'], 1)
+        # Reprises exponentielles sur erreur transitoire
+        self.assertEqual(len(self.delays), 4)
+        
+        self.program.refresh_from_db()
+        self.assertEqual(self.program.budget_spent, Decimal('80000'))
+        rejected = Payment.objects.get(payment_reference=self.references[0])
+        self.assertEqual(rejected.status, 'FAILED')
+        self.assertIsNone(rejected.next_retry_at)
+        transient = Payment.objects.get(payment_reference=self.references[2])
+        self.assertEqual(transient.status, 'FAILED')
+        self.assertIsNotNone(transient.next_retry_at)
+        self.assertTrue(transient.transaction_id.startswith('RSU-'))
+        self.assertEqual(transient.provider_reference, '')
+        settled = Payment.objects.get(payment_reference=self.references[1])
+        self.assertEqual(settled.provider_reference, f'FAKE-{settled.transaction_id[-12:]}')
+    
+    def test_retry_failed_respects_backoff_and_is_idempotent(self):
+        provider = FakeMobileMoneyProvider(transient_failures={self.references[0]: 4})
+        engine = self._engine(provider)
+        engine.dispatch(self.run.payments.values_list('id', flat=True))
+        
+        # Tentative différée pas encore échue
+        self.assertEqual(engine.retry_failed()['sent'], 0)
+        Payment.objects.filter(status='FAILED').update(next_retry_at=timezone.now())
+        self.assertEqual(engine.retry_failed()['completed'], 1)
+        
+        # Renvoyer des paiements déjà réglés ne les repaie pas
+        self.assertEqual(engine.dispatch(self.run.payments.values_list('id', flat=True))['sent'], 0)
+        self.assertEqual(len(provider.paid_transactions), 6)
+        self.assertEqual(
+            ProgramEnrollment.objects.filter(payments_count=1).count(), 6
+        )
+    
+    def test_recover_stuck_resends_expired_claims_once(self):
+        provider = FakeMobileMoneyProvider()
+        engine = self._engine(provider)
+        payment_ids = list(self.run.payments.values_list('id', flat=True))
+        
+        # Worker interrompu après l'envoi de deux paiements, avant l'enregistrement
+        instructions = engine._claim(payment_ids, respect_backoff=True)
+        for instruction in instructions[:2]:
+            provider.send(instruction)
+        
+        # Réservation encore valide : ni renvoi, ni nouvelle réservation
+        self.assertEqual(engine.recover_stuck()['sent'], 0)
+        self.assertEqual(engine.dispatch(payment_ids)['sent'], 0)
+        
+        Payment.objects.filter(status='PROCESSING').update(
+            updated_at=timezone.now() - engine.CLAIM_TIMEOUT - timedelta(minutes=1)
+        )
+        summary = engine.recover_stuck()
+        self.assertEqual(summary['completed'], 6)
+        # Même transaction_id : les deux paiements déjà exécutés ne sont pas repayés
+        self.assertEqual(len(provider.paid_transactions), 6)
+        self.assertEqual(set(self.run.payments.values_list('dispatch_attempts', flat=True)), {2})
+        self.assertEqual(ProgramCounterService().reconcile()['drifted'], [])
+
+    def test_late_failure_ignored_after_reclaim(self):
+        engine = self._engine(FakeMobileMoneyProvider())
+        payment_ids = list(self.run.payments.order_by('pk').values_list('id', flat=True))
+        expired = timezone.now() - engine.CLAIM_TIMEOUT - timedelta(minutes=1)
+
+        # Premier envoi bloqué, réservation reprise par un autre worker
+        stale = engine._claim(payment_ids, respect_backoff=True)
+        Payment.objects.filter(status='PROCESSING').update(updated_at=expired)
+        engine._claim(payment_ids[:3], respect_backoff=True)
+        engine.dispatch(payment_ids[3:])
+
+        summary = {'failed': 0, 'rescheduled': 0, 'skipped': 0, 'completed': 0}
+        engine._record(stale, [ProviderResult(RETRYABLE, message='Timeout')] * len(stale), None, summary)
+
+        self.assertEqual((summary['failed'], summary['skipped']), (0, 6))
+        self.assertEqual(
+            list(self.run.payments.order_by('pk').values_list('status', flat=True)),
+            ['PROCESSING'] * 3 + ['COMPLETED'] * 3
+        )
+        self.assertEqual(ProgramCounterService().reconcile()['drifted'], [])
+
+
+
+class ProgramStatisticsTest(ProgramTestCase):
+    """Statistiques du programme en agrégats conditionnels"""
+    
+    PROGRAM = {
+        'code': 'STAT-2025', 'name': 'Statistiques', 'status': 'ACTIVE',
+        'total_budget': Decimal('100000'), 'benefit_amount': Decimal('10000'),
+    }
+    
+    def setUp(self):
+        cache.clear()
+        people = [
+            ('F', 'NYANGA', 80, 'ACTIVE'),
+            ('F', 'NYANGA', 60, 'APPROVED'),
+            ('M', 'ESTUAIRE', None, 'ACTIVE'),
+            ('O', 'ESTUAIRE', 40, 'PENDING'),
+        ]
+        for index, (gender, province, score, enrollment_status) in enumerate(people):
+            person = PersonIdentity.objects.create(
+                first_name='Test', last_name=f'Stat{index}', birth_date='1980-01-01',
+                gender=gender, province=province, vulnerability_score=score
+            )
+            enrollment = ProgramEnrollment.objects.create(
+                program=self.program, beneficiary=person, status=enrollment_status
+            )
+            Payment.objects.create(
+                enrollment=enrollment, program=self.program, beneficiary=person,
+                amount=Decimal('10000'), payment_method='MOBILE_MONEY',
+                status='COMPLETED' if index < 2 else 'PENDING',
+                payment_reference=f'STAT-{index}', scheduled_date=date(2025, 2, 1)
+            )
+        ProgramCounterService().reconcile()
+    
+    def test_statistics_from_counters(self):
+        service = ProgramStatisticsService()
+        with self.assertNumQueries(2):
+            stats = service.get_statistics(self.program)
+        
+        self.assertEqual(stats['enrollments']['total'], 4)
+        self.assertEqual(stats['enrollments']['active'], 2)
+        self.assertEqual(stats['enrollments']['pending'], 1)
+        self.assertEqual(stats['payments']['completed'], 2)
+        self.assertEqual(stats['payments']['total_amount'], 20000.0)
+        demographics = stats['demographics']
+        self.assertEqual(demographics['by_gender'], {'M': 1, 'F': 2, 'OTHER': 0})
+        self.assertEqual(demographics['by_province'][0], {'province': 'NYANGA', 'count': 2})
+        # Moyenne des scores renseignés (80, 60), pas leur somme
+        self.assertEqual(demographics['avg_vulnerability_score'], 70.0)
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(service.get_statistics(self.program), stats)
+    
+    def test_program_update_changes_cache_key(self):
+        service = ProgramStatisticsService()
+        service.get_statistics(self.program)
+        self.program.status = 'SUSPENDED'
+        self.program.save()
+        
+        stats = service.get_statistics(self.program)
+        self.assertEqual(stats['program_info']['status'], 'SUSPENDED')
+
+
+
+class ProgramCountersTest(ProgramTestCase):
+    """Compteurs dénormalisés tenus à jour par les transitions"""
+    
+    PROGRAM = {
+        'code': 'CNT-2025', 'name': 'Compteurs', 'status': 'ACTIVE',
+        'total_budget': Decimal('1000000'), 'benefit_amount': Decimal('10000'), 'max_beneficiaries': 3,
+    }
+    USER = ('counters', 'PROG-005')
+    
+    def setUp(self):
+        self.enrollments = []
+        for index in range(4):
+            person = PersonIdentity.objects.create(
+                first_name='Test', last_name=f'Cnt{index}', birth_date='1980-01-01', gender='F'
+            )
+            self.enrollments.append(ProgramEnrollment.objects.create(
+                program=self.program, beneficiary=person
+            ))
+        ProgramCounterService().reconcile()
+    
+    def _counters(self):
+        return ProgramCounterService().get_counters(self.program)
+    
+    def test_transitions_match_reconcile(self):
+        workflow = EnrollmentWorkflowService()
+        for enrollment in self.enrollments[:3]:
+            workflow.approve(enrollment, approved_by=self.user)
+            workflow.activate(enrollment)
+        workflow.reject(self.enrollments[3], 'Hors critères', rejected_by=self.user)
+        
+        run = PaymentRunService().generate_run(self.program)
+        payments = list(run.payments.order_by('pk'))
+        PaymentSettlementService().settle_payment(payments[0], processed_by=self.user)
+        PaymentSettlementService().mark_failed(payments[1], 'Numéro invalide')
+        
+        counters = self._counters()
+        self.assertEqual(counters['enrollments']['active'], 3)
+        self.assertEqual(counters['enrollments']['rejected'], 1)
+        self.assertEqual(counters['enrollments']['pending'], 0)
+        self.assertEqual(counters['payments']['completed'], 1)
+        self.assertEqual(counters['payments']['failed'], 1)
+        self.assertEqual(counters['payments']['pending'], 1)
+        self.assertEqual(counters['amounts'], {'paid': 10000.0, 'pending': 10000.0})
+        
+        self.program.refresh_from_db()
+        self.assertEqual(self.program.current_beneficiaries, 3)
+        self.assertEqual(ProgramCounterService().reconcile()['drifted'], [])
+    
+    def test_approve_checks_capacity_in_database(self):
+        workflow = EnrollmentWorkflowService()
+        for enrollment in self.enrollments[:3]:
+            workflow.approve(enrollment)
+        
+        with self.assertRaises(ValueError):
+            workflow.approve(self.enrollments[3])
+        self.enrollments[3].refresh_from_db()
+        self.assertEqual(self.enrollments[3].status, 'PENDING')
+        self.assertEqual(self._counters()['enrollments']['approved'], 3)
+    
+    def test_dispatch_and_batch_settlement_counters(self):
+        workflow = EnrollmentWorkflowService()
+        for enrollment in self.enrollments[:3]:
+            workflow.approve(enrollment)
+            workflow.activate(enrollment)
+        run = PaymentRunService().generate_run(self.program)
+        rejected = run.payments.order_by('pk').first().payment_reference
+        
+        engine = PaymentDispatchEngine(
+            FakeMobileMoneyProvider(rejected=[rejected]), sleep=lambda seconds: None
+        )
+        engine.dispatch(run.payments.values_list('id', flat=True))
+        
+        counters = self._counters()
+        self.assertEqual(counters['payments']['completed'], 2)
+        self.assertEqual(counters['payments']['failed'], 1)
+        self.assertEqual(counters['payments']['processing'], 0)
+        self.assertEqual(counters['amounts']['paid'], 20000.0)
+        self.assertEqual(ProgramCounterService().reconcile()['drifted'], [])
+    
+    def test_program_edits_leave_counters_alone(self):
+        factory = APIRequestFactory()
+        for action, method, body in [
+            ('partial_update', 'patch', {'name': 'Compteurs (révisé)'}),
+            ('pause', 'post', {}),
+            ('close', 'post', {}),
+        ]:
+            view = SocialProgramViewSet.as_view({method: action})
+            request = getattr(factory, method)('/programs/', body, format='json')
+            force_authenticate(request, user=self.user)
+            with CaptureQueriesContext(connection) as queries:
+                response = view(request, pk=self.program.pk)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, action)
+            updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+            self.assertEqual(len(updates), 1, action)
+            self.assertNotIn('current_beneficiaries', updates[0])
+            self.assertNotIn('budget_spent', updates[0])
+        
+        self.program.refresh_from_db()
+        self.assertEqual((self.program.name, self.program.status), ('Compteurs (révisé)', 'CLOSED'))
+    
+    def test_reconcile_fixes_drift(self):
+        ProgramEnrollment.objects.filter(pk=self.enrollments[0].pk).update(status='ACTIVE')
+        
+        result = ProgramCounterService().reconcile()
+        self.assertEqual(result['drifted'], [self.program.pk])
+        self.assertEqual(self._counters()['enrollments']['active'], 1)
+        self.program.refresh_from_db()
+        self.assertEqual(self.program.current_beneficiaries, 1)
+
+
+
+class BulkEnrollmentWorkflowTest(ProgramTestCase):
+    """Approbation, rejet et activation groupés"""
+    
+    PROGRAM = {
+        'code': 'BULK-2025', 'name': 'Lots', 'status': 'ACTIVE',
+        'total_budget': Decimal('1000000'), 'benefit_amount': Decimal('10000'), 'max_beneficiaries': 3,
+    }
+    USER = ('bulk', 'PROG-006')
+    
+    def setUp(self):
+        self.enrollments = []
+        for index, score in enumerate([40, 90, 70, 80, 60]):
+            person = PersonIdentity.objects.create(
+                first_name='Test', last_name=f'Bulk{index}', birth_date='1980-01-01', gender='F'
+            )
+            self.enrollments.append(ProgramEnrollment.objects.create(
+                program=self.program, beneficiary=person, eligibility_score=Decimal(score)
+            ))
+        ProgramCounterService().reconcile()
+    
+    def test_bulk_approve_respects_capacity(self):
+        workflow = EnrollmentWorkflowService()
+        queryset = ProgramEnrollment.objects.filter(program=self.program)
+        
+        # Verrou, capacité, UPDATE statut, programme, compteurs, audit (+ savepoint)
+        with self.assertNumQueries(8):
+            result = workflow.bulk_approve(queryset, approved_by=self.user)
+        
+        self.assertEqual(result['processed_count'], 3)
+        self.assertEqual(result['skipped'], {'capacity': 2})
+        approved = set(
+            ProgramEnrollment.objects.filter(status='APPROVED')
+            .values_list('eligibility_score', flat=True)
+        )
+        self.assertEqual(approved, {Decimal('90'), Decimal('80'), Decimal('70')})
+        self.program.refresh_from_db()
+        self.assertEqual(self.program.current_beneficiaries, 3)
+        
+        audit = AuditLog.objects.get(pk=result['audit_id'])
+        self.assertEqual(len(audit.changes['enrollment_ids']), 3)
+        self.assertEqual(ProgramCounterService().reconcile()['drifted'], [])
+    
+    def test_bulk_reject_and_activate(self):
+        workflow = EnrollmentWorkflowService()
+        ids = [enrollment.pk for enrollment in self.enrollments]
+        workflow.bulk_approve(ProgramEnrollment.objects.filter(pk__in=ids[1:3]))
+        
+        result = workflow.bulk_activate(ProgramEnrollment.objects.filter(pk__in=ids))
+        self.assertEqual(result['processed_count'], 2)
+        result = workflow.bulk_reject(
+            ProgramEnrollment.objects.filter(pk__in=ids), 'Hors critères', rejected_by=self.user
+        )
+        self.assertEqual(result['processed_count'], 3)
+        
+        counters = ProgramCounterService().get_counters(self.program)
+        self.assertEqual(counters['enrollments']['active'], 2)
+        self.assertEqual(counters['enrollments']['rejected'], 3)
+        self.assertEqual(ProgramCounterService().reconcile()['drifted'], [])
+    
+    def test_bulk_endpoint_requires_selection(self):
+        view = ProgramEnrollmentViewSet.as_view({'post': 'bulk_approve'})
+        factory = APIRequestFactory()
+        
+        for body in [
+            {},
+            {'enrollment_ids': 'tous'},
+            {'enrollment_ids': [1, 'x']},
+            {'program': 999999},
+            {'program': self.program.pk, 'min_eligibility_score': 'élevé'},
+        ]:
+            request = factory.post('/enrollments/bulk_approve/', body, format='json')
+            force_authenticate(request, user=self.user)
+            self.assertEqual(view(request).status_code, status.HTTP_400_BAD_REQUEST, body)
+        
+        request = factory.post(
+            '/enrollments/bulk_approve/',
+            {'program': self.program.pk, 'min_eligibility_score': 75}, format='json'
+        )
+        force_authenticate(request, user=self.user)
+        response = view(request)
+        self.assertEqual(response.data['processed_count'], 2)
+    
+    def test_eligibility_score_without_household(self):
+        person = self.enrollments[0].beneficiary
+        score = ProgramEnrollmentViewSet()._calculate_eligibility_score(person, self.program)
+        # Vulnérabilité + province + genre ; ni critère d'âge ni ménage
+        self.assertEqual(score, 70.0)
+
+
+
+class AutoEnrollmentTest(ProgramTestCase):
+    """Inscription en masse depuis les évaluations d'éligibilité"""
+    
+    # Versement unique de 10 000 FCFA par bénéficiaire
+    PROGRAM = {
+        'code': 'AUTO-2025', 'name': 'Auto', 'status': 'ACTIVE', 'end_date': date(2099, 7, 1),
+        'total_budget': Decimal('240000'), 'benefit_amount': Decimal('10000'),
+        'frequency': 'ONE_TIME', 'max_beneficiaries': 3,
+    }
+    
+    def setUp(self):
+        self.people = {}
+        candidates = [
+            ('low', 'LOW', 99, 'HIGHLY_RECOMMENDED'),
+            ('urgent', 'URGENT', 81, 'HIGHLY_RECOMMENDED'),
+            ('high_a', 'HIGH', 85, 'HIGHLY_RECOMMENDED'),
+            ('high_b', 'HIGH', 95, 'HIGHLY_RECOMMENDED'),
+            ('recommended', 'URGENT', 99, 'RECOMMENDED'),
+        ]
+        for name, priority, score, level in candidates:
+            person = PersonIdentity.objects.create(
+                first_name='Test', last_name=name, birth_date='1980-01-01', gender='F'
+            )
+            self.people[name] = person
+            SocialProgramEligibility.objects.create(
+                person=person, program_code='AUTO-2025', eligibility_score=Decimal(score),
+                recommendation_level=level, processing_priority=priority
+            )
+    
+    def _enrolled(self):
+        return set(
+            ProgramEnrollment.objects.filter(program=self.program)
+            .values_list('beneficiary__last_name', flat=True)
+        )
+    
+    def test_priority_order_until_capacity(self):
+        result = AutoEnrollmentService().enroll_program(self.program)
+        
+        self.assertEqual(result['enrolled_count'], 3)
+        self.assertEqual(result['limited_by'], 'capacity')
+        self.assertEqual(self._enrolled(), {'urgent', 'high_b', 'high_a'})
+        self.program.refresh_from_db()
+        self.assertEqual(self.program.current_beneficiaries, 3)
+        self.assertEqual(ProgramCounterService().reconcile()['drifted'], [])
+        
+        # Programme complet : nouvelle exécution sans effet
+        self.assertEqual(AutoEnrollmentService().enroll_program(self.program)['enrolled_count'], 0)
+    
+    def test_budget_limits_enrollment(self):
+        SocialProgram.objects.filter(pk=self.program.pk).update(
+            max_beneficiaries=None, total_budget=Decimal('20000')
+        )
+        self.program.refresh_from_db()
+        
+        result = AutoEnrollmentService().enroll_program(self.program)
+        self.assertEqual(result['enrolled_count'], 2)
+        self.assertEqual(result['limited_by'], 'budget')
+        self.assertEqual(self._enrolled(), {'urgent', 'high_b'})
+    
+    def test_skips_existing_enrollments_and_inactive_programs(self):
+        ProgramEnrollment.objects.create(program=self.program, beneficiary=self.people['urgent'])
+        SocialProgram.objects.filter(pk=self.program.pk).update(max_beneficiaries=None)
+        self.program.refresh_from_db()
+        
+        result = AutoEnrollmentService().enroll_program(self.program)
+        self.assertEqual(result['enrolled_count'], 3)
+        self.assertEqual(result['limited_by'], 'candidates')
+        
+        self.program.status = 'PAUSED'
+        self.program.save()
+        with self.assertRaises(ValueError):
+            AutoEnrollmentService().enroll_program(self.program)
+    
+    def test_endpoint_validates_limit(self):
+        user = RSUUser.objects.create_user(
+            username='autoenroll', email='auto@programs.ga', password='TestPass123!',
+            user_type='ADMIN', employee_id='PROG-007'
+        )
+        view = SocialProgramViewSet.as_view({'post': 'auto_enroll'})
+        factory = APIRequestFactory()
+        
+        for limit in ('beaucoup', -1, 0, [2]):
+            request = factory.post('/programs/auto_enroll/', {'limit': limit}, format='json')
+            force_authenticate(request, user=user)
+            response = view(request, pk=self.program.pk)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, limit)
+        self.assertEqual(self._enrolled(), set())
+        
+        request = factory.post('/programs/auto_enroll/', {'limit': '1'}, format='json')
+        force_authenticate(request, user=user)
+        response = view(request, pk=self.program.pk)
+        self.assertEqual(response.data['enrolled_count'], 1)
+        self.assertEqual(response.data['limited_by'], 'limit')
+
+
+class WaitlistTest(ProgramTestCase):
+    """Liste d'attente classée et promotion sur libération de place"""
+    
+    PROGRAM = {
+        'code': 'WAIT-2025', 'name': 'Attente', 'status': 'ACTIVE',
+        'total_budget': Decimal('1000000'), 'benefit_amount': Decimal('10000'), 'max_beneficiaries': 1,
+    }
+    
+    def setUp(self):
+        self.waitlist = WaitlistService()
+        self.people = {}
+        for name, vulnerability in [('holder', 50), ('a', 40), ('b', 90), ('c', 10)]:
+            self.people[name] = PersonIdentity.objects.create(
+                first_name='Test', last_name=name, birth_date='1980-01-01', gender='F',
+                vulnerability_score=Decimal(vulnerability)
+            )
+        self.holder = ProgramEnrollment.objects.create(
+            program=self.program, beneficiary=self.people['holder'], status='PENDING'
+        )
+        EnrollmentWorkflowService().approve(self.holder)
+        
+        # Même score pour a et b : la vulnérabilité départage
+        self.waitlist.add(self.program, self.people['a'], Decimal('80'))
+        self.waitlist.add(self.program, self.people['b'], Decimal('80'))
+        self.waitlist.add(self.program, self.people['c'], Decimal('95'))
+    
+    def _ranked_names(self):
+        return [entry.person.last_name for entry in self.waitlist.ranked(self.program)]
+    
+    def test_ranking_and_position(self):
+        self.assertEqual(self._ranked_names(), ['c', 'b', 'a'])
+        self.assertEqual(self.waitlist.position(self.program, self.people['a']), 3)
+        self.assertIsNone(self.waitlist.position(self.program, self.people['holder']))
+        
+        # Programme complet : aucune promotion
+        self.assertEqual(self.waitlist.promote(self.program.pk), [])
+    
+    def test_complete_promotes_next_candidate(self):
+        workflow = EnrollmentWorkflowService()
+        workflow.activate(self.holder)
+        workflow.complete(self.holder)
+        
+        promoted = ProgramEnrollment.objects.get(program=self.program, status='APPROVED')
+        self.assertEqual(promoted.beneficiary, self.people['c'])
+        self.assertEqual(self._ranked_names(), ['b', 'a'])
+        self.program.refresh_from_db()
+        self.assertEqual(self.program.current_beneficiaries, 1)
+        self.assertEqual(ProgramCounterService().reconcile()['drifted'], [])
+    
+    def test_revoked_approval_promotes_and_skips_enrolled(self):
+        ProgramEnrollment.objects.create(
+            program=self.program, beneficiary=self.people['c'], status='REJECTED'
+        )
+        ProgramCounterService().reconcile()
+        EnrollmentWorkflowService().reject(self.holder, 'Révocation')
+        
+        # c, déjà inscrit (rejeté), est retiré de la liste sans prendre la place
+        promoted = ProgramEnrollment.objects.get(program=self.program, status='APPROVED')
+        self.assertEqual(promoted.beneficiary, self.people['b'])
+        self.assertEqual(self._ranked_names(), ['a'])
+        self.assertEqual(ProgramCounterService().reconcile()['drifted'], [])
+    
+    def test_promote_checks_status_budget_and_household(self):
+        household = Household.objects.create(
+            head_of_household=self.people['c'], household_size=1, province='ESTUAIRE'
+        )
+        # Places illimitées, budget pour un seul bénéficiaire de plus
+        self.program.refresh_from_db()
+        SocialProgram.objects.filter(pk=self.program.pk).update(
+            max_beneficiaries=None, total_budget=Decimal(2 * program_benefit_cost(self.program))
+        )
+        
+        SocialProgram.objects.filter(pk=self.program.pk).update(status='PAUSED')
+        self.assertEqual(self.waitlist.promote(self.program.pk), [])
+        
+        SocialProgram.objects.filter(pk=self.program.pk).update(status='ACTIVE')
+        self.assertEqual(self.waitlist.promote(self.program.pk), [self.people['c'].pk])
+        promoted = ProgramEnrollment.objects.get(program=self.program, beneficiary=self.people['c'])
+        self.assertEqual(promoted.household, household)
+        self.assertEqual(self._ranked_names(), ['b', 'a'])
+    
+    def test_auto_enrollment_waitlists_overflow(self):
+        for name in ('a', 'b'):
+            SocialProgramEligibility.objects.create(
+                person=self.people[name], program_code='WAIT-2025',
+                eligibility_score=Decimal('85'), recommendation_level='HIGHLY_RECOMMENDED',
+                processing_priority='HIGH'
+            )
+        ProgramWaitlistEntry.objects.filter(program=self.program).delete()
+        
+        result = AutoEnrollmentService().enroll_program(self.program)
+        self.assertEqual(result['limited_by'], 'capacity')
+        self.assertEqual(result['waitlisted_count'], 2)
+        self.assertEqual(self._ranked_names(), ['b', 'a'])
+    
+    def test_auto_enrollment_waitlists_all_remaining_candidates(self):
+        # Une place libre, plus de candidats que de places
+        ProgramWaitlistEntry.objects.filter(program=self.program).delete()
+        EnrollmentWorkflowService().reject(self.holder, 'Révocation')
+        for name, score in [('c', 99), ('b', 90), ('a', 80)]:
+            SocialProgramEligibility.objects.create(
+                person=self.people[name], program_code='WAIT-2025',
+                eligibility_score=Decimal(score), recommendation_level='HIGHLY_RECOMMENDED',
+                processing_priority='HIGH'
+            )
+        self.waitlist.add(self.program, self.people['a'], Decimal('80'))
+        
+        result = AutoEnrollmentService().enroll_program(self.program)
+        self.assertEqual(result['enrolled_count'], 1)
+        self.assertEqual(result['limited_by'], 'capacity')
+        self.assertTrue(ProgramEnrollment.objects.filter(
+            program=self.program, beneficiary=self.people['c'], status='APPROVED'
+        ).exists())
+        # b n'est pas perdu ; a, déjà en attente, n'est pas recompté
+        self.assertEqual(self._ranked_names(), ['b', 'a'])
+        self.assertEqual(result['waitlisted_count'], 1)
@@ -10,7 +10,9 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from django.db.models import Q, Sum, Count
+from django.db import transaction
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 
 from .models import ProgramCategory, SocialProgram, ProgramEnrollment, Payment
 from .serializers import (
@@ -20,9 +22,16 @@ from .serializers import (
     ProgramEnrollmentListSerializer,
     ProgramEnrollmentDetailSerializer,
     PaymentSerializer,
-    EligibilityCheckSerializer
+    EligibilityCheckSerializer,
+    BulkEnrollmentSelectionSerializer,
+    PaymentBatchSelectionSerializer
+)
+from apps.identity_app.models import Household, PersonIdentity
+from .services import (
+    AutoEnrollmentService, EnrollmentWorkflowService, PaymentDispatchEngine, PaymentRunService,
+    PaymentSettlementService, ProgramCounterService, ProgramStatisticsService,
+    WaitlistService, get_payment_provider
 )
-from apps.identity_app.models import PersonIdentity
 
 
 class ProgramCategoryViewSet(viewsets.ModelViewSet):
@@ -58,6 +67,14 @@ class SocialProgramViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
     
+    def perform_update(self, serializer):
+        # Seuls les champs modifiés sont écrits : current_beneficiaries et
+        # budget_spent, incrémentés en base par F(), ne sont pas écrasés
+        program = serializer.instance
+        for field, value in serializer.validated_data.items():
+            setattr(program, field, value)
+        program.save(update_fields=[*serializer.validated_data, 'updated_at'])
+    
     @action(detail=False, methods=['get'])
     def active(self, request):
         """Liste programmes actifs seulement"""
@@ -76,75 +93,9 @@ class SocialProgramViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['get'])
     def statistics(self, request, pk=None):
-        """Statistiques détaillées du programme"""
+        """Statistiques détaillées du programme (3 requêtes, cache court)"""
         program = self.get_object()
-        
-        enrollments = program.enrollments.all()
-        payments = program.payments.all()
-        
-        stats = {
-            'program_info': {
-                'code': program.code,
-                'name': program.name,
-                'status': program.status,
-                'is_active': program.is_active,
-            },
-            'budget': {
-                'total': float(program.total_budget),
-                'spent': float(program.budget_spent),
-                'remaining': float(program.budget_remaining),
-                'percentage_used': round((program.budget_spent / program.total_budget * 100), 2) if program.total_budget > 0 else 0
-            },
-            'beneficiaries': {
-                'current': program.current_beneficiaries,
-                'max': program.max_beneficiaries,
-                'remaining': program.capacity_remaining,
-                'is_full': program.is_full
-            },
-            'enrollments': {
-                'total': enrollments.count(),
-                'pending': enrollments.filter(status='PENDING').count(),
-                'approved': enrollments.filter(status='APPROVED').count(),
-                'active': enrollments.filter(status='ACTIVE').count(),
-                'rejected': enrollments.filter(status='REJECTED').count(),
-                'completed': enrollments.filter(status='COMPLETED').count(),
-            },
-            'payments': {
-                'total_count': payments.count(),
-                'completed': payments.filter(status='COMPLETED').count(),
-                'pending': payments.filter(status='PENDING').count(),
-                'failed': payments.filter(status='FAILED').count(),
-                'total_amount': float(payments.filter(status='COMPLETED').aggregate(
-                    total=Sum('amount')
-                )['total'] or 0),
-            },
-            'demographics': self._get_demographics(program),
-        }
-        
-        return Response(stats)
-    
-    def _get_demographics(self, program):
-        """Démographie des bénéficiaires"""
-        enrollments = program.enrollments.filter(status__in=['APPROVED', 'ACTIVE'])
-        beneficiaries = PersonIdentity.objects.filter(
-            program_enrollments__in=enrollments
-        )
-        
-        return {
-            'by_gender': {
-                'M': beneficiaries.filter(gender='M').count(),
-                'F': beneficiaries.filter(gender='F').count(),
-                'OTHER': beneficiaries.filter(gender='OTHER').count(),
-            },
-            'by_province': list(
-                beneficiaries.values('province').annotate(
-                    count=Count('id')
-                ).order_by('-count')
-            ),
-            'avg_vulnerability_score': beneficiaries.aggregate(
-                avg=Sum('vulnerability_score')
-            )['avg'] or 0,
-        }
+        return Response(ProgramStatisticsService().get_statistics(program))
     
     @action(detail=True, methods=['post'])
     def activate(self, request, pk=None):
@@ -158,7 +109,7 @@ class SocialProgramViewSet(viewsets.ModelViewSet):
             )
         
         program.status = 'ACTIVE'
-        program.save()
+        program.save(update_fields=['status', 'updated_at'])
         
         return Response({
             'detail': 'Programme activé avec succès',
@@ -171,7 +122,7 @@ class SocialProgramViewSet(viewsets.ModelViewSet):
         program = self.get_object()
         
         program.status = 'PAUSED'
-        program.save()
+        program.save(update_fields=['status', 'updated_at'])
         
         return Response({
             'detail': 'Programme suspendu',
@@ -185,12 +136,101 @@ class SocialProgramViewSet(viewsets.ModelViewSet):
         
         program.status = 'CLOSED'
         program.end_date = timezone.now().date()
-        program.save()
+        program.save(update_fields=['status', 'end_date', 'updated_at'])
         
         return Response({
             'detail': 'Programme clôturé',
             'program': self.get_serializer(program).data
         })
+    
+    @action(detail=True, methods=['post'])
+    def generate_payments(self, request, pk=None):
+        """
+        Générer le lot de paiements d'une période (idempotent)
+        
+        Body: {"period_date": "AAAA-MM-JJ", "scheduled_date": "AAAA-MM-JJ"} (optionnels)
+        """
+        program = self.get_object()
+        
+        dates = {}
+        for field in ('period_date', 'scheduled_date'):
+            value = request.data.get(field)
+            if value:
+                dates[field] = parse_date(value)
+                if dates[field] is None:
+                    return Response(
+                        {'detail': f'{field} invalide (format AAAA-MM-JJ)'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+        
+        service = PaymentRunService()
+        try:
+            run = service.generate_run(program, generated_by=request.user, **dates)
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response(service.summarize(run))
+    
+    @action(detail=True, methods=['post'])
+    def auto_enroll(self, request, pk=None):
+        """
+        Inscrire les personnes fortement recommandées (places et budget disponibles)
+        
+        Body: {"limit": 500} (optionnel)
+        """
+        program = self.get_object()
+        limit = request.data.get('limit')
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                limit = 0
+            if limit < 1:
+                return Response(
+                    {'detail': 'limit doit être un entier positif'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        try:
+            result = AutoEnrollmentService().enroll_program(
+                program, enrolled_by=request.user, limit=limit
+            )
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response(result)
+    
+    @action(detail=True, methods=['get'])
+    def waitlist(self, request, pk=None):
+        """
+        Tête de la liste d'attente du programme
+        
+        Query params: limit (défaut 50)
+        """
+        program = self.get_object()
+        try:
+            limit = min(int(request.query_params.get('limit', 50)), 500)
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            return Response({'detail': 'limit invalide'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        entries = WaitlistService().ranked(program).select_related('person')[:limit]
+        return Response({
+            'program_code': program.code,
+            'waitlist_count': program.waitlist.count(),
+            'entries': [
+                {
+                    'position': position,
+                    'person_id': entry.person_id,
+                    'rsu_id': entry.person.rsu_id,
+                    'eligibility_score': float(entry.eligibility_score),
+                    'vulnerability_score': float(entry.vulnerability_score),
+                    'created_at': entry.created_at,
+                }
+                for position, entry in enumerate(entries, start=1)
+            ],
+        })
 
 
 class ProgramEnrollmentViewSet(viewsets.ModelViewSet):
@@ -210,6 +250,7 @@ class ProgramEnrollmentViewSet(viewsets.ModelViewSet):
             return ProgramEnrollmentListSerializer
         return ProgramEnrollmentDetailSerializer
     
+    @transaction.atomic
     def perform_create(self, serializer):
         """Création avec calcul score éligibilité"""
         enrollment = serializer.save()
@@ -217,12 +258,17 @@ class ProgramEnrollmentViewSet(viewsets.ModelViewSet):
         # Calculer score d'éligibilité
         score = self._calculate_eligibility_score(
             enrollment.beneficiary,
-            enrollment.program
+            enrollment.program,
+            household=enrollment.household
         )
         enrollment.eligibility_score = score
         enrollment.save()
+        
+        ProgramCounterService().enrollment_transition(
+            enrollment.program_id, None, enrollment.status
+        )
     
-    def _calculate_eligibility_score(self, beneficiary, program):
+    def _calculate_eligibility_score(self, beneficiary, program, household=None):
         """Calcule score de matching avec critères du programme"""
         criteria = program.eligibility_criteria
         score = 0
@@ -231,7 +277,7 @@ class ProgramEnrollmentViewSet(viewsets.ModelViewSet):
         # Score vulnérabilité (40 points)
         max_score += 40
         vuln_min = criteria.get('vulnerability_min', 0)
-        if beneficiary.vulnerability_score >= vuln_min:
+        if (beneficiary.vulnerability_score or 0) >= vuln_min:
             score += 40
         
         # Âge (20 points)
@@ -262,40 +308,86 @@ class ProgramEnrollmentViewSet(viewsets.ModelViewSet):
         # Taille ménage (10 points)
         max_score += 10
         household_size_min = criteria.get('household_size_min')
-        if beneficiary.household:
-            if not household_size_min or beneficiary.household.size >= household_size_min:
+        household_size = self._household_size(beneficiary, household)
+        if household_size is not None:
+            if not household_size_min or household_size >= household_size_min:
                 score += 10
         
         # Calculer pourcentage
         return round((score / max_score * 100), 2) if max_score > 0 else 0
     
+    def _household_size(self, beneficiary, household=None):
+        """Taille du ménage de l'inscription, sinon du ménage dirigé ou actuel"""
+        if household is not None:
+            return household.household_size
+        return Household.objects.filter(
+            Q(head_of_household=beneficiary) |
+            Q(members__person=beneficiary, members__is_current_member=True)
+        ).values_list('household_size', flat=True).first()
+    
+    def _bulk_queryset(self, request):
+        """
+        Inscriptions visées par un traitement groupé
+        
+        Body: {"enrollment_ids": [...]} ou {"program": <id>, "min_eligibility_score": 60}
+        """
+        serializer = BulkEnrollmentSelectionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        selection = serializer.validated_data
+        
+        if 'enrollment_ids' in selection:
+            return ProgramEnrollment.objects.filter(pk__in=selection['enrollment_ids'])
+        
+        queryset = ProgramEnrollment.objects.filter(program=selection['program'])
+        if selection.get('min_eligibility_score') is not None:
+            queryset = queryset.filter(
+                eligibility_score__gte=selection['min_eligibility_score']
+            )
+        return queryset
+    
+    def _bulk_response(self, request, transition):
+        queryset = self._bulk_queryset(request)
+        result = transition(queryset)
+        return Response({
+            'detail': f"{result['processed_count']} inscription(s) traitée(s)",
+            **result
+        })
+    
+    @action(detail=False, methods=['post'])
+    def bulk_approve(self, request):
+        """Approuver un lot d'inscriptions en attente (dans la limite de capacité)"""
+        workflow = EnrollmentWorkflowService()
+        return self._bulk_response(
+            request, lambda queryset: workflow.bulk_approve(queryset, approved_by=request.user)
+        )
+    
+    @action(detail=False, methods=['post'])
+    def bulk_reject(self, request):
+        """Rejeter un lot d'inscriptions en attente (Body: ..., "reason": "...")"""
+        workflow = EnrollmentWorkflowService()
+        reason = request.data.get('reason', '')
+        return self._bulk_response(
+            request, lambda queryset: workflow.bulk_reject(queryset, reason, rejected_by=request.user)
+        )
+    
+    @action(detail=False, methods=['post'])
+    def bulk_activate(self, request):
+        """Activer un lot d'inscriptions approuvées"""
+        workflow = EnrollmentWorkflowService()
+        return self._bulk_response(
+            request, lambda queryset: workflow.bulk_activate(queryset, activated_by=request.user)
+        )
+    
     @action(detail=True, methods=['post'])
     def approve(self, request, pk=None):
         """Approuver une inscription"""
         enrollment = self.get_object()
         
-        if enrollment.status != 'PENDING':
-            return Response(
-                {'detail': 'Seules les inscriptions en attente peuvent être approuvées'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # Vérifier capacité programme
-        if enrollment.program.is_full:
-            return Response(
-                {'detail': 'Le programme a atteint sa capacité maximale'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        enrollment.status = 'APPROVED'
-        enrollment.approval_date = timezone.now().date()
-        enrollment.approved_by = request.user
-        enrollment.save()
-        
-        # Incrémenter compteur bénéficiaires
-        program = enrollment.program
-        program.current_beneficiaries += 1
-        program.save()
+        # Statut et capacité vérifiés en base, compteurs incrémentés
+        try:
+            EnrollmentWorkflowService().approve(enrollment, approved_by=request.user)
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'detail': 'Inscription approuvée',
@@ -308,16 +400,10 @@ class ProgramEnrollmentViewSet(viewsets.ModelViewSet):
         enrollment = self.get_object()
         reason = request.data.get('reason', '')
         
-        if enrollment.status != 'PENDING':
-            return Response(
-                {'detail': 'Seules les inscriptions en attente peuvent être rejetées'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        enrollment.status = 'REJECTED'
-        enrollment.rejection_reason = reason
-        enrollment.approved_by = request.user
-        enrollment.save()
+        try:
+            EnrollmentWorkflowService().reject(enrollment, reason, rejected_by=request.user)
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'detail': 'Inscription rejetée',
@@ -329,21 +415,31 @@ class ProgramEnrollmentViewSet(viewsets.ModelViewSet):
         """Activer une inscription approuvée"""
         enrollment = self.get_object()
         
-        if enrollment.status != 'APPROVED':
-            return Response(
-                {'detail': 'Seules les inscriptions approuvées peuvent être activées'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        enrollment.status = 'ACTIVE'
-        enrollment.start_date = timezone.now().date()
-        enrollment.save()
+        try:
+            EnrollmentWorkflowService().activate(enrollment)
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'detail': 'Inscription activée',
             'enrollment': self.get_serializer(enrollment).data
         })
     
+    @action(detail=True, methods=['post'])
+    def complete(self, request, pk=None):
+        """Terminer une inscription active (place attribuée à la liste d'attente)"""
+        enrollment = self.get_object()
+        
+        try:
+            EnrollmentWorkflowService().complete(enrollment)
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({
+            'detail': 'Inscription terminée',
+            'enrollment': self.get_serializer(enrollment).data
+        })
+    
     @action(detail=False, methods=['post'])
     def check_eligibility(self, request):
         """Vérifier éligibilité bénéficiaire pour programme"""
@@ -397,6 +493,14 @@ class PaymentViewSet(viewsets.ModelViewSet):
     ordering_fields = ['scheduled_date', 'processed_date', 'amount']
     ordering = ['-scheduled_date']
     
+    @transaction.atomic
+    def perform_create(self, serializer):
+        """Création manuelle (hors lots) suivie dans les compteurs du programme"""
+        payment = serializer.save()
+        ProgramCounterService().payment_transition(
+            payment.program_id, None, payment.status, amount=payment.amount
+        )
+    
     @action(detail=True, methods=['post'])
     def process(self, request, pk=None):
         """Traiter un paiement"""
@@ -408,31 +512,66 @@ class PaymentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        payment.status = 'PROCESSING'
-        payment.save()
+        # Envoi au fournisseur configuré (Mobile Money, banque)
+        provider = get_payment_provider()
+        if provider is not None:
+            PaymentDispatchEngine(provider).dispatch(
+                [payment.pk], processed_by=request.user, respect_backoff=False
+            )
+            payment.refresh_from_db()
+            if payment.status != 'COMPLETED':
+                return Response(
+                    {
+                        'detail': 'Échec du paiement chez le fournisseur',
+                        'payment': self.get_serializer(payment).data
+                    },
+                    status=status.HTTP_502_BAD_GATEWAY
+                )
+            return Response({
+                'detail': 'Paiement traité avec succès',
+                'payment': self.get_serializer(payment).data
+            })
+        
+        # Sans fournisseur : règlement manuel
+        # Statut et compteurs (inscription, budget programme) mis à jour en base
+        if not PaymentSettlementService().settle_payment(payment, processed_by=request.user):
+            return Response(
+                {'detail': 'Ce paiement a déjà été traité'},
+                status=status.HTTP_409_CONFLICT
+            )
+        
+        return Response({
+            'detail': 'Paiement traité avec succès',
+            'payment': self.get_serializer(payment).data
+        })
+    
+    @action(detail=False, methods=['post'])
+    def process_batch(self, request):
+        """
+        Traiter un lot de paiements (versement mensuel)
         
-        # Simulation traitement (à remplacer par vraie intégration)
-        # En production: appel API Mobile Money, Banque, etc.
+        Body: {"payment_ids": [...]} ou {"program": <id>, "scheduled_before": "AAAA-MM-JJ"}
         
-        payment.status = 'COMPLETED'
-        payment.processed_date = timezone.now()
-        payment.processed_by = request.user
-        payment.save()
+        Les paiements réservés par le moteur d'envoi (PROCESSING) sont ignorés.
+        """
+        serializer = PaymentBatchSelectionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        selection = serializer.validated_data
         
-        # Mettre à jour enrollment
-        enrollment = payment.enrollment
-        enrollment.total_received += payment.amount
-        enrollment.payments_count += 1
-        enrollment.save()
+        payment_ids = selection.get('payment_ids')
+        if payment_ids is None:
+            queryset = Payment.objects.filter(program=selection['program'], status='PENDING')
+            if selection.get('scheduled_before'):
+                queryset = queryset.filter(scheduled_date__lte=selection['scheduled_before'])
+            payment_ids = queryset.values_list('id', flat=True)
         
-        # Mettre à jour programme
-        program = payment.program
-        program.budget_spent += payment.amount
-        program.save()
+        result = PaymentSettlementService().settle_payments(
+            payment_ids, processed_by=request.user
+        )
         
         return Response({
-            'detail': 'Paiement traité avec succès',
-            'payment': self.get_serializer(payment).data
+            'detail': f"{result['settled_count']} paiement(s) traité(s)",
+            **result
         })
     
     @action(detail=True, methods=['post'])
@@ -441,10 +580,11 @@ class PaymentViewSet(viewsets.ModelViewSet):
         payment = self.get_object()
         reason = request.data.get('reason', '')
         
-        payment.status = 'FAILED'
-        payment.failure_reason = reason
-        payment.processed_by = request.user
-        payment.save()
+        if not PaymentSettlementService().mark_failed(payment, reason, processed_by=request.user):
+            return Response(
+                {'detail': 'Seuls les paiements en attente ou en traitement peuvent échouer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         return Response({
             'detail': 'Paiement marqué comme échoué',
@@ -466,25 +606,17 @@ class PaymentViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def statistics(self, request):
-        """Statistiques globales paiements"""
+        """Statistiques globales paiements (compteurs dénormalisés des programmes)"""
         queryset = self.get_queryset()
+        counters = ProgramCounterService().totals()
+        by_status = dict(counters['payments'])
         
         stats = {
-            'total_count': queryset.count(),
-            'by_status': {
-                'pending': queryset.filter(status='PENDING').count(),
-                'processing': queryset.filter(status='PROCESSING').count(),
-                'completed': queryset.filter(status='COMPLETED').count(),
-                'failed': queryset.filter(status='FAILED').count(),
-                'cancelled': queryset.filter(status='CANCELLED').count(),
-            },
+            'total_count': by_status.pop('total'),
+            'by_status': by_status,
             'amounts': {
-                'total_processed': float(queryset.filter(
-                    status='COMPLETED'
-                ).aggregate(total=Sum('amount'))['total'] or 0),
-                'total_pending': float(queryset.filter(
-                    status='PENDING'
-                ).aggregate(total=Sum('amount'))['total'] or 0),
+                'total_processed': counters['amounts']['paid'],
+                'total_pending': counters['amounts']['pending'],
             },
             'by_method': list(
                 queryset.filter(status='COMPLETED').values('payment_method').annotate(
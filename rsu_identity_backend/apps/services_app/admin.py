@@ -11,8 +11,10 @@ from .models import (
     SocialProgramEligibility, 
     VulnerabilityAssessment,
     ProgramBudgetChange,
-    GeographicInterventionCost  # ✅ Ajouter
+    GeographicInterventionCost,  # ✅ Ajouter
+    ScoringModel
 )
+from .services.scoring_models import get_scoring_registry
 from .models import GeographicInterventionCost
 
 
@@ -58,14 +60,14 @@ class VulnerabilityAssessmentAdmin(admin.ModelAdmin):
     
     list_display = [
         'person', 'vulnerability_score', 'risk_level',
-        'assessment_date', 'is_active'
+        'scoring_model', 'assessment_date', 'is_active'
     ]
-    list_filter = ['risk_level', 'assessment_date', 'is_active']
+    list_filter = ['risk_level', 'scoring_model', 'assessment_date', 'is_active']
     search_fields = ['person__full_name', 'person__rsu_id']
     readonly_fields = [
         'vulnerability_score', 'risk_level', 'vulnerability_factors',
         'household_composition_score', 'economic_vulnerability_score',
-        'social_vulnerability_score', 'assessment_date'
+        'social_vulnerability_score', 'assessment_date', 'scoring_model'
     ]
     
     fieldsets = (
@@ -74,7 +76,7 @@ class VulnerabilityAssessmentAdmin(admin.ModelAdmin):
         }),
         ('Scores Calculés', {
             'fields': (
-                'vulnerability_score', 'risk_level',
+                'vulnerability_score', 'risk_level', 'scoring_model',
                 'household_composition_score', 'economic_vulnerability_score',
                 'social_vulnerability_score'
             ),
@@ -89,6 +91,41 @@ class VulnerabilityAssessmentAdmin(admin.ModelAdmin):
         })
     )
 
+@admin.register(ScoringModel)
+class ScoringModelAdmin(admin.ModelAdmin):
+    """
+    Versions des pondérations et seuils de vulnérabilité
+    Une version déjà utilisée par des évaluations n'est plus modifiable
+    """
+    list_display = ['version', 'name', 'is_current', 'activated_at', 'created_by', 'created_at']
+    list_filter = ['is_current']
+    readonly_fields = ['version', 'is_current', 'activated_at', 'created_by', 'created_at', 'updated_at']
+    actions = ['make_current']
+    
+    def get_readonly_fields(self, request, obj=None):
+        readonly = list(super().get_readonly_fields(request, obj))
+        if obj is not None and obj.assessments.exists():
+            readonly += ['dimension_weights', 'risk_thresholds']
+        return readonly
+    
+    def save_model(self, request, obj, form, change):
+        """Nouvelle version : numéro suivant, non mise en vigueur"""
+        obj.updated_by = request.user
+        if change:
+            super().save_model(request, obj, form, change)
+            return
+        obj.created_by = request.user
+        get_scoring_registry().save_new_version(obj)
+    
+    @admin.action(description="Mettre en vigueur la version sélectionnée")
+    def make_current(self, request, queryset):
+        if queryset.count() != 1:
+            self.message_user(request, "Sélectionner une seule version", level='error')
+            return
+        scoring_model = get_scoring_registry().activate(queryset.get().version, activated_by=request.user)
+        self.message_user(request, f"Version {scoring_model.version} en vigueur")
+
+
 @admin.register(ProgramBudgetChange)
 class ProgramBudgetChangeAdmin(admin.ModelAdmin):
     """Administration des modifications budgétaires"""
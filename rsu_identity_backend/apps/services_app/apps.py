@@ -0,0 +1,14 @@
+"""
+🇬🇦 RSU Gabon - Services App Config
+Fichier: apps/services_app/apps.py
+"""
+
+from django.apps import AppConfig
+
+
+class ServicesAppConfig(AppConfig):
+    name = 'apps.services_app'
+    verbose_name = 'Services Métier'
+
+    def ready(self):
+        from . import signals  # noqa: F401
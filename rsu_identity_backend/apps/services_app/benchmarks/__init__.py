@@ -0,0 +1,12 @@
+"""
+🇬🇦 RSU Gabon - Benchmarks de performance
+Données synthétiques reproductibles, scénarios mesurés et comparaison
+à une référence JSON (détection des régressions).
+"""
+from .synthetic import DATASET_SIZES, generate_population
+from .runner import BenchmarkRunner, compare_results, SCENARIOS
+
+__all__ = [
+    'DATASET_SIZES', 'generate_population',
+    'BenchmarkRunner', 'compare_results', 'SCENARIOS'
+]
@@ -0,0 +1,244 @@
+"""
+🇬🇦 RSU Gabon - Exécution des scénarios de benchmark
+Mesures par scénario : nombre de requêtes SQL, latence p50/p95 et pic
+mémoire Python (tracemalloc). Chaque itération est exécutée dans une
+transaction annulée : les scénarios qui écrivent restent reproductibles.
+"""
+import logging
+import math
+import time
+import tracemalloc
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+logger = logging.getLogger(__name__)
+
+SCENARIOS = {}
+
+DEFAULT_TOLERANCES = {
+    'p50_ms': 0.20,
+    'p95_ms': 0.20,
+    'peak_memory_kb': 0.25,
+    'queries': 0.0,
+}
+
+
+def scenario(name):
+    """Enregistre une fabrique de scénario: (contexte) → callable mesuré"""
+    def register(factory):
+        SCENARIOS[name] = factory
+        return factory
+    return register
+
+
+class _Rollback(Exception):
+    """Annule la transaction d'une itération"""
+
+
+def _percentile(values, fraction):
+    """Percentile par rang le plus proche"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _call_view(view, request_user, path, params=None, **kwargs):
+    request = APIRequestFactory().get(path, params or {})
+    force_authenticate(request, user=request_user)
+    response = view(request, **kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    return response
+
+
+# =============================================================================
+# SCÉNARIOS
+# =============================================================================
+
+@scenario('person_list')
+def _person_list(ctx):
+    from apps.identity_app.views.person_views import PersonIdentityViewSet
+    view = PersonIdentityViewSet.as_view({'get': 'list'})
+    return lambda: _call_view(view, ctx['user'], '/persons/')
+
+
+@scenario('person_detail')
+def _person_detail(ctx):
+    from apps.identity_app.views.person_views import PersonIdentityViewSet
+    view = PersonIdentityViewSet.as_view({'get': 'retrieve'})
+    person_id = ctx['sample_person_ids'][0]
+    return lambda: _call_view(view, ctx['user'], f'/persons/{person_id}/', pk=person_id)
+
+
+@scenario('search_duplicates')
+def _search_duplicates(ctx):
+    from apps.identity_app.models import PersonIdentity
+    from apps.identity_app.views.person_views import PersonIdentityViewSet
+    view = PersonIdentityViewSet.as_view({'get': 'search_duplicates'})
+    person = PersonIdentity.objects.get(pk=ctx['sample_person_ids'][0])
+    params = {
+        'first_name': person.first_name,
+        'last_name': person.last_name,
+        'birth_date': str(person.birth_date),
+    }
+    return lambda: _call_view(view, ctx['user'], '/persons/search_duplicates/', params)
+
+
+@scenario('vulnerability_bulk')
+def _vulnerability_bulk(ctx):
+    from apps.services_app.services import VulnerabilityService
+    service = VulnerabilityService()
+    person_ids = ctx['sample_person_ids'][:100]
+    return lambda: service.bulk_calculate_assessments(person_ids)
+
+
+@scenario('eligibility_matrix')
+def _eligibility_matrix(ctx):
+    from apps.services_app.services import EligibilityService
+    service = EligibilityService()
+    person_ids = ctx['sample_person_ids'][:20]
+    return lambda: [service.calculate_eligibility_for_all_programs(pid) for pid in person_ids]
+
+
+@scenario('geotargeting_analysis')
+def _geotargeting_analysis(ctx):
+    from apps.services_app.services import GeotargetingService
+    # Nouvelle instance par itération : l'instantané provincial est par requête
+    return lambda: GeotargetingService().analyze_geographic_vulnerability()
+
+
+@scenario('dashboard')
+def _dashboard(ctx):
+    from apps.services_app.views.analytics_views import AnalyticsViewSet
+    view = AnalyticsViewSet.as_view({'get': 'dashboard'})
+    return lambda: _call_view(view, ctx['user'], '/analytics/dashboard/')
+
+
+# =============================================================================
+# EXÉCUTION
+# =============================================================================
+
+class BenchmarkRunner:
+    """
+    Exécute les scénarios et produit un rapport sérialisable en JSON.
+    """
+
+    def __init__(self, user, iterations=10, sample_size=100, scenarios=None):
+        from apps.identity_app.models import PersonIdentity
+
+        self.iterations = iterations
+        self.scenario_names = list(scenarios or SCENARIOS.keys())
+        unknown = [name for name in self.scenario_names if name not in SCENARIOS]
+        if unknown:
+            raise ValueError(f"Scénarios inconnus: {', '.join(unknown)}")
+
+        self.context = {
+            'user': user,
+            'sample_person_ids': list(
+                PersonIdentity.objects.order_by('rsu_id')
+                .values_list('id', flat=True)[:sample_size]
+            ),
+        }
+
+    def _run_once(self, func):
+        """Une itération dans une transaction annulée"""
+        try:
+            with transaction.atomic():
+                func()
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def measure(self, func):
+        """Mesure une fonction: latences, requêtes et pic mémoire"""
+        self._run_once(func)  # échauffement (caches, imports)
+
+        latencies = []
+        query_counts = []
+        for _ in range(self.iterations):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                self._run_once(func)
+                latencies.append((time.perf_counter() - start) * 1000)
+            query_counts.append(len(queries))
+
+        # Pic mémoire mesuré à part : tracemalloc fausse les latences
+        tracemalloc.start()
+        try:
+            self._run_once(func)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'iterations': self.iterations,
+            'queries': max(query_counts),
+            'p50_ms': round(_percentile(latencies, 0.50), 3),
+            'p95_ms': round(_percentile(latencies, 0.95), 3),
+            'peak_memory_kb': round(peak / 1024, 1),
+        }
+
+    def run(self, stdout=None):
+        """Exécute tous les scénarios demandés"""
+        results = {}
+        for name in self.scenario_names:
+            try:
+                with transaction.atomic():  # savepoint : un échec n'invalide pas la suite
+                    func = SCENARIOS[name](self.context)
+                results[name] = self.measure(func)
+            except Exception as e:
+                logger.warning(f"Benchmark {name} en échec: {e}")
+                results[name] = {'error': f"{type(e).__name__}: {e}"}
+            if stdout:
+                stdout.write(f"   {name}: {results[name]}")
+        return {
+            'meta': {
+                'generated_at': timezone.now().isoformat(),
+                'database': connection.vendor,
+                'iterations': self.iterations,
+            },
+            'scenarios': results,
+        }
+
+
+def compare_results(baseline, current, tolerances=None):
+    """
+    Compare un rapport à la référence.
+
+    Une métrique régresse si elle dépasse la référence de plus que sa
+    tolérance relative (les requêtes SQL sont comparées strictement).
+
+    Returns:
+        list: régressions [{scenario, metric, baseline, current, change_pct}]
+    """
+    tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+    regressions = []
+
+    for name, reference in baseline.get('scenarios', {}).items():
+        measured = current.get('scenarios', {}).get(name)
+        if measured is None or 'error' in reference:
+            continue
+        if 'error' in measured:
+            regressions.append({
+                'scenario': name, 'metric': 'error',
+                'baseline': None, 'current': measured['error'], 'change_pct': None
+            })
+            continue
+
+        for metric, tolerance in tolerances.items():
+            before, after = reference.get(metric), measured.get(metric)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + tolerance) and after - before > 0:
+                regressions.append({
+                    'scenario': name,
+                    'metric': metric,
+                    'baseline': before,
+                    'current': after,
+                    'change_pct': round((after - before) / before * 100, 1) if before else None,
+                })
+
+    return regressions
@@ -0,0 +1,201 @@
+"""
+🇬🇦 RSU Gabon - Population synthétique pour benchmarks
+Mêmes générateurs que create_realistic_gabon_data.py (utils.synthetic_population :
+noms, provinces, revenus, vulnérabilité) mais en bulk_create et avec graine fixe : deux exécutions
+de même taille produisent la même population.
+"""
+import random
+from decimal import Decimal
+
+from django.db import transaction
+
+from apps.identity_app.models import PersonIdentity, Household, HouseholdMember
+from utils import synthetic_population as realistic
+from utils.gabonese_data import allocate_rsu_ids, allocate_household_ids
+from utils.geo import geohash_encode
+
+
+DATASET_SIZES = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+
+BATCH_SIZE = 2000
+
+CHIEF_OCCUPATIONS = [
+    'Fonctionnaire', 'Enseignant', 'Commerçant', 'Agriculteur',
+    'Chauffeur', 'Artisan', 'Sans emploi', 'Retraité'
+]
+HOUSEHOLD_SIZES = [2, 3, 4, 5, 6, 7, 8]
+HOUSEHOLD_SIZE_WEIGHTS = [20, 25, 25, 15, 10, 3, 2]
+
+
+def _chief_income(occupation):
+    """Revenu du chef selon l'occupation (règles du script réaliste)"""
+    if occupation == 'Sans emploi':
+        return 0, None
+    if occupation == 'Retraité':
+        return random.randint(80000, 200000), None
+    if occupation == 'Fonctionnaire':
+        return random.randint(200000, 600000), 'État Gabonais'
+    employer = None if occupation in ['Commerçant', 'Agriculteur', 'Artisan'] else 'Employeur privé'
+    return random.randint(100000, 400000), employer
+
+
+def _person(rsu_id, first_name, last_name, birth_date, gender, occupation,
+            employer, income, province, commune, lat, lon, geohash, is_head, created_by):
+    age = realistic.calculate_age(birth_date)
+    has_disability = random.random() < (0.05 if is_head else 0.03)
+    score = realistic.calculate_vulnerability_score(
+        income, age, has_disability, is_head, gender
+    )
+    return PersonIdentity(
+        rsu_id=rsu_id,
+        first_name=first_name,
+        last_name=last_name,
+        birth_date=birth_date,
+        birth_place=commune,
+        gender=gender,
+        marital_status='MARRIED' if is_head else 'SINGLE',
+        phone_number=realistic.gen_phone() if age >= 16 else None,
+        education_level=random.choice(['PRIMARY', 'SECONDARY', 'HIGH_SCHOOL', 'UNIVERSITY']),
+        occupation=occupation,
+        employer=employer,
+        employment_status=realistic.get_employment_status(age, occupation),
+        monthly_income=Decimal(income),
+        latitude=Decimal(str(lat)),
+        longitude=Decimal(str(lon)),
+        geohash=geohash,
+        province=province,
+        commune=commune,
+        has_disability=has_disability,
+        is_household_head=is_head,
+        vulnerability_score=Decimal(score),
+        vulnerability_level=realistic.get_vulnerability_level(score),
+        data_completeness_score=Decimal('85.00' if is_head else '75.00'),
+        created_by=created_by,
+    )
+
+
+def _build_household(rsu_ids, household_id, created_by):
+    """Construit (personnes, ménage, membres) sans aucune requête"""
+    province = random.choice(list(realistic.PROVINCES.keys()))
+    commune = random.choice(realistic.PROVINCES[province]['communes'])
+    lat, lon = realistic.gen_gps_coords(*realistic.PROVINCES[province]['gps'])
+    geohash = geohash_encode(lat, lon)  # bulk_create ne passe pas par save()
+    family_name = random.choice(realistic.NOMS)
+    size = len(rsu_ids)
+
+    chief_gender = random.choice(['M', 'F'])
+    chief_occupation = random.choice(CHIEF_OCCUPATIONS)
+    chief_income, chief_employer = _chief_income(chief_occupation)
+    chief = _person(
+        rsu_ids[0],
+        random.choice(realistic.PRENOMS_HOMMES if chief_gender == 'M' else realistic.PRENOMS_FEMMES),
+        family_name, realistic.gen_birth_date(25, 70), chief_gender,
+        chief_occupation, chief_employer, chief_income,
+        province, commune, lat, lon, geohash, True, created_by
+    )
+    persons = [chief]
+    bands = {'under_15': 0, '15_64': 1, 'over_64': 0}
+
+    for idx, rsu_id in enumerate(rsu_ids[1:], start=1):
+        gender = random.choice(['M', 'F'])
+        birth_date = realistic.gen_birth_date(0, 25) if idx > 1 else realistic.gen_birth_date(20, 60)
+        age = realistic.calculate_age(birth_date)
+        if age < 16:
+            occupation, income, employer = ('Étudiant' if age >= 6 else None), 0, None
+        else:
+            occupation = random.choice(['Commerçant', 'Enseignant', 'Sans emploi', 'Fonctionnaire'])
+            income = 0 if occupation == 'Sans emploi' else random.randint(50000, 300000)
+            employer = None if occupation in ['Sans emploi', 'Commerçant'] else 'Employeur privé'
+        persons.append(_person(
+            rsu_id,
+            random.choice(realistic.PRENOMS_HOMMES if gender == 'M' else realistic.PRENOMS_FEMMES),
+            family_name, birth_date, gender, occupation, employer, income,
+            province, commune, lat, lon, geohash, False, created_by
+        ))
+        bands['under_15' if age < 15 else '15_64' if age <= 64 else 'over_64'] += 1
+
+    household = Household(
+        household_id=household_id,
+        head_of_household=chief,
+        head_person=chief,
+        household_type='NUCLEAR' if size <= 5 else 'EXTENDED',
+        household_size=size,
+        members_under_15=bands['under_15'],
+        members_15_64=bands['15_64'],
+        members_over_64=bands['over_64'],
+        housing_type=random.choice(['OWNED', 'RENTED', 'FREE']),
+        water_access=random.choice(['PIPED', 'WELL', 'BOREHOLE']),
+        electricity_access=random.choice(['GRID', 'GENERATOR', 'NONE']),
+        has_toilet=random.random() < 0.7,
+        total_monthly_income=sum(p.monthly_income for p in persons),
+        has_bank_account=random.random() < 0.4,
+        has_disabled_members=any(p.has_disability for p in persons),
+        has_elderly_members=bands['over_64'] > 0,
+        latitude=chief.latitude,
+        longitude=chief.longitude,
+        geohash=geohash,
+        province=province,
+        vulnerability_score=float(chief.vulnerability_score),
+        created_by=created_by,
+    )
+    members = [
+        HouseholdMember(
+            household=household,
+            person=person,
+            relationship_to_head='HEAD' if idx == 0 else 'SPOUSE' if idx == 1 else 'CHILD',
+            created_by=created_by,
+        )
+        for idx, person in enumerate(persons)
+    ]
+    return persons, household, members
+
+
+def generate_population(total_persons, seed=42, created_by=None, stdout=None):
+    """
+    Génère `total_persons` personnes (≈ 4 par ménage) en bulk_create.
+
+    Les identifiants sont pré-alloués par blocs (aucune requête par ID).
+
+    Returns:
+        dict: {'persons': int, 'households': int}
+    """
+    random.seed(seed)
+    created = {'persons': 0, 'households': 0}
+
+    while created['persons'] < total_persons:
+        # Tailles de ménage du lot, tronquées pour atteindre exactement la cible
+        sizes = []
+        remaining = min(BATCH_SIZE, total_persons - created['persons'])
+        while remaining > 0:
+            size = min(random.choices(HOUSEHOLD_SIZES, weights=HOUSEHOLD_SIZE_WEIGHTS)[0], remaining)
+            sizes.append(size)
+            remaining -= size
+
+        rsu_ids = allocate_rsu_ids(sum(sizes))
+        household_ids = allocate_household_ids(len(sizes))
+        persons, households, members = [], [], []
+        offset = 0
+        for size, household_id in zip(sizes, household_ids):
+            h_persons, household, h_members = _build_household(
+                rsu_ids[offset:offset + size], household_id, created_by
+            )
+            offset += size
+            persons.extend(h_persons)
+            households.append(household)
+            members.extend(h_members)
+
+        with transaction.atomic():
+            PersonIdentity.objects.bulk_create(persons, batch_size=BATCH_SIZE)
+            Household.objects.bulk_create(households, batch_size=BATCH_SIZE)
+            HouseholdMember.objects.bulk_create(members, batch_size=BATCH_SIZE)
+
+        created['persons'] += len(persons)
+        created['households'] += len(households)
+        if stdout:
+            stdout.write(f"   {created['persons']}/{total_persons} personnes générées")
+
+    return created
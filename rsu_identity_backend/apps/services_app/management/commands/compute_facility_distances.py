@@ -0,0 +1,48 @@
+# ===================================================================
+# Management Command - Précalcul distances aux services
+# ===================================================================
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.services_app.services import FacilityDistanceService
+
+
+class Command(BaseCommand):
+    help = (
+        "Calcule la distance au plus proche centre de santé, école, marché et "
+        "route pour chaque personne, ménage et localité géolocalisés, à partir "
+        "d'un fichier d'infrastructures (CSV: type,latitude,longitude ou GeoJSON)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('facilities', help="Fichier d'infrastructures (.csv, .json, .geojson)")
+        parser.add_argument('--chunk-size', type=int,
+                            default=FacilityDistanceService.DEFAULT_CHUNK_SIZE)
+        parser.add_argument('--skip-persons', action='store_true')
+        parser.add_argument('--skip-households', action='store_true')
+        parser.add_argument('--skip-geographic', action='store_true')
+
+    def handle(self, *args, **options):
+        path = Path(options['facilities'])
+        if not path.exists():
+            raise CommandError(f"Fichier introuvable: {path}")
+
+        try:
+            service = FacilityDistanceService.from_file(path, chunk_size=options['chunk_size'])
+        except (ValueError, KeyError) as e:
+            raise CommandError(f"Fichier d'infrastructures invalide: {e}")
+
+        if not service.trees:
+            raise CommandError("Aucune infrastructure dans le fichier")
+
+        self.stdout.write(f"📍 Types indexés: {', '.join(sorted(service.trees))}")
+        stats = service.update_all(
+            persons=not options['skip_persons'],
+            households=not options['skip_households'],
+            geographic=not options['skip_geographic'],
+        )
+        for model_name, count in stats.items():
+            self.stdout.write(f"   {model_name}: {count} mis à jour")
+        self.stdout.write(self.style.SUCCESS("✅ Distances aux services recalculées"))
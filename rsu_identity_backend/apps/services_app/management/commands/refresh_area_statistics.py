@@ -0,0 +1,29 @@
+# ===================================================================
+# Management Command - Statistiques de ciblage commune / district
+# ===================================================================
+
+from django.core.management.base import BaseCommand
+
+from apps.services_app.services import GeotargetingService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcule la table des statistiques de ciblage par commune et "
+        "district (vulnérabilité, éligibles par programme, accessibilité). "
+        "À planifier (cron) après les recalculs de vulnérabilité."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--level',
+            action='append',
+            choices=list(GeotargetingService.AREA_LEVEL_FIELDS),
+            help="Niveau à recalculer (répétable, défaut: tous)"
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("📊 Recalcul des statistiques de ciblage infra-provincial...")
+        stats = GeotargetingService().refresh_area_statistics(options['level'])
+        for level, count in stats.items():
+            self.stdout.write(self.style.SUCCESS(f"✅ {level}: {count} zones"))
@@ -0,0 +1,23 @@
+# ===================================================================
+# Management Command - Régénération tuiles carte de chaleur
+# ===================================================================
+
+from django.core.management.base import BaseCommand
+
+from apps.services_app.services import HeatmapTileService
+
+
+class Command(BaseCommand):
+    help = (
+        "Agrège les évaluations de vulnérabilité actives par cellule geohash "
+        "(zooms 1 à 4) et régénère les tuiles de carte de chaleur. "
+        "À planifier (cron) après les recalculs de vulnérabilité."
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🗺️  Régénération des tuiles de carte de chaleur...")
+        stats = HeatmapTileService().refresh_tiles()
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Tuiles: {stats['created']} créées, {stats['updated']} mises à jour, "
+            f"{stats['unchanged']} inchangées, {stats['deleted']} supprimées"
+        ))
@@ -0,0 +1,122 @@
+# ===================================================================
+# Management Command - Benchmarks de performance
+# ===================================================================
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.core_app.models import RSUUser
+from apps.identity_app.models import PersonIdentity
+from apps.services_app.benchmarks import (
+    DATASET_SIZES, generate_population, BenchmarkRunner, compare_results, SCENARIOS
+)
+
+
+class _DiscardData(Exception):
+    """Annule la population synthétique en fin de benchmark"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmarks API/services sur population synthétique (10k/100k/1m). '
+        'Enregistre requêtes SQL, latences p50/p95 et pic mémoire en JSON; '
+        '--compare signale les régressions par rapport à une référence.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', default='10k',
+                            help=f"Taille population: {', '.join(DATASET_SIZES)} ou entier")
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--iterations', type=int, default=10)
+        parser.add_argument('--scenarios', default='',
+                            help=f"Liste séparée par virgules ({', '.join(SCENARIOS)})")
+        parser.add_argument('--output', default='benchmarks/results.json',
+                            help='Fichier JSON de résultats')
+        parser.add_argument('--compare', default=None,
+                            help='Référence JSON à comparer (échec si régression)')
+        parser.add_argument('--tolerance', type=float, default=None,
+                            help='Tolérance relative latences/mémoire (défaut 0.20 / 0.25)')
+        parser.add_argument('--use-existing-data', action='store_true',
+                            help='Ne pas générer de population (base déjà peuplée)')
+        parser.add_argument('--keep-data', action='store_true',
+                            help='Conserver la population générée (annulée par défaut)')
+
+    def handle(self, *args, **options):
+        size = options['size'].lower()
+        total_persons = DATASET_SIZES.get(size) or (int(size) if size.isdigit() else None)
+        if not total_persons:
+            raise CommandError(f"Taille invalide: {options['size']}")
+
+        if not options['use_existing_data'] and PersonIdentity.objects.exists():
+            raise CommandError(
+                "La base contient déjà des personnes : utiliser une base de benchmark vide "
+                "ou --use-existing-data."
+            )
+
+        scenarios = [s.strip() for s in options['scenarios'].split(',') if s.strip()] or None
+
+        try:
+            with transaction.atomic():
+                report = self._run(total_persons, scenarios, options)
+                if not options['keep_data']:
+                    raise _DiscardData
+        except _DiscardData:
+            self.stdout.write("🧹 Population synthétique annulée")
+
+        output = Path(options['output'])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        self.stdout.write(self.style.SUCCESS(f"✅ Résultats écrits dans {output}"))
+
+        if options['compare']:
+            self._compare(report, options)
+
+    def _run(self, total_persons, scenarios, options):
+        user, _ = RSUUser.objects.get_or_create(
+            username='benchmark_admin',
+            defaults={'user_type': 'ADMIN', 'is_staff': True, 'employee_id': 'BENCH-001'}
+        )
+
+        if not options['use_existing_data']:
+            self.stdout.write(f"📥 Génération de {total_persons} personnes (graine {options['seed']})...")
+            generate_population(total_persons, seed=options['seed'], created_by=user, stdout=self.stdout)
+
+        self.stdout.write("⏱️  Exécution des scénarios...")
+        runner = BenchmarkRunner(user, iterations=options['iterations'], scenarios=scenarios)
+        report = runner.run(stdout=self.stdout)
+        report['meta'].update({
+            'size': options['size'],
+            'persons': PersonIdentity.objects.count(),
+            'seed': options['seed'],
+        })
+        return report
+
+    def _compare(self, report, options):
+        baseline_path = Path(options['compare'])
+        if not baseline_path.exists():
+            raise CommandError(f"Référence introuvable: {baseline_path}")
+        baseline = json.loads(baseline_path.read_text())
+
+        if baseline.get('meta', {}).get('persons') != report['meta']['persons']:
+            self.stdout.write(self.style.WARNING(
+                "⚠️  Tailles de population différentes : comparaison indicative"
+            ))
+
+        tolerances = None
+        if options['tolerance'] is not None:
+            tolerances = {metric: options['tolerance'] for metric in ('p50_ms', 'p95_ms', 'peak_memory_kb')}
+
+        regressions = compare_results(baseline, report, tolerances)
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS("✅ Aucune régression détectée"))
+            return
+
+        for r in regressions:
+            change = f" ({r['change_pct']:+.1f}%)" if r['change_pct'] is not None else ''
+            self.stdout.write(self.style.ERROR(
+                f"❌ {r['scenario']}.{r['metric']}: {r['baseline']} → {r['current']}{change}"
+            ))
+        raise CommandError(f"{len(regressions)} régression(s) de performance")
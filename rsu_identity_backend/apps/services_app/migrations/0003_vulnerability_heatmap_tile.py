@@ -0,0 +1,43 @@
+# Generated by Django 5.0.8 on 2026-10-19 01:47
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services_app', '0002_alter_programbudgetchange_program_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VulnerabilityHeatmapTile',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Créé le')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Modifié le')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Actif')),
+                ('zoom', models.PositiveSmallIntegerField(verbose_name='Niveau de zoom')),
+                ('tile_key', models.CharField(max_length=12, verbose_name='Préfixe geohash de la tuile')),
+                ('payload', models.JSONField(default=dict, verbose_name='Contenu compact (fields + rows)')),
+                ('etag', models.CharField(max_length=64, verbose_name='ETag')),
+                ('cell_count', models.PositiveIntegerField(default=0, verbose_name='Nombre de cellules')),
+                ('person_count', models.PositiveIntegerField(default=0, verbose_name='Nombre de personnes')),
+                ('generated_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date de génération')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='created_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('updated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='updated_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'Tuile carte de chaleur',
+                'verbose_name_plural': 'Tuiles carte de chaleur',
+                'db_table': 'services_vulnerability_heatmap_tiles',
+                'ordering': ['zoom', 'tile_key'],
+                'unique_together': {('zoom', 'tile_key')},
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.0.8 on 2026-10-19 01:53
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services_app', '0003_vulnerability_heatmap_tile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AreaTargetingStats',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Créé le')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Modifié le')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Actif')),
+                ('level', models.CharField(choices=[('COMMUNE', 'Commune'), ('DISTRICT', 'District/Arrondissement')], max_length=10, verbose_name='Niveau géographique')),
+                ('province', models.CharField(max_length=50, verbose_name='Province')),
+                ('area_name', models.CharField(max_length=100, verbose_name='Commune / district')),
+                ('priority_zone', models.CharField(max_length=20, verbose_name='Zone prioritaire')),
+                ('total_assessed', models.PositiveIntegerField(default=0, verbose_name='Personnes évaluées')),
+                ('critical_count', models.PositiveIntegerField(default=0, verbose_name='Vulnérabilité critique')),
+                ('high_count', models.PositiveIntegerField(default=0, verbose_name='Vulnérabilité élevée')),
+                ('vulnerable_count', models.PositiveIntegerField(default=0, verbose_name='Population vulnérable (critique + élevée)')),
+                ('vulnerability_rate', models.DecimalField(decimal_places=2, default=0, max_digits=5, verbose_name='Taux vulnérabilité (%)')),
+                ('avg_vulnerability_score', models.DecimalField(decimal_places=2, default=0, max_digits=5, verbose_name='Score vulnérabilité moyen')),
+                ('accessibility_score', models.DecimalField(decimal_places=2, default=0, max_digits=5, verbose_name='Score accessibilité')),
+                ('priority_score', models.DecimalField(decimal_places=2, default=0, max_digits=7, verbose_name='Score priorité composite')),
+                ('eligible_by_program', models.JSONField(default=dict, verbose_name='Éligibles recommandés par programme')),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date de calcul')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='created_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('updated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='updated_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'Statistiques ciblage commune/district',
+                'verbose_name_plural': 'Statistiques ciblage communes/districts',
+                'db_table': 'services_area_targeting_stats',
+                'ordering': ['level', '-priority_score'],
+                'indexes': [models.Index(fields=['level', 'priority_score'], name='services_ar_level_7083b7_idx'), models.Index(fields=['level', 'province'], name='services_ar_level_9d30eb_idx'), models.Index(fields=['level', 'vulnerability_rate'], name='services_ar_level_b4cd33_idx')],
+                'unique_together': {('level', 'province', 'area_name')},
+            },
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.0.8 on 2026-10-19 02:26
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def create_initial_scoring_model(apps, schema_editor):
+    """Version 1 : pondérations et seuils jusque-là codés dans VulnerabilityService"""
+    ScoringModel = apps.get_model('services_app', 'ScoringModel')
+    ScoringModel.objects.get_or_create(
+        version=1,
+        defaults={
+            'name': 'Politique initiale',
+            'dimension_weights': {
+                'economic': 0.30,
+                'social': 0.25,
+                'geographic': 0.20,
+                'health': 0.15,
+                'education': 0.10,
+            },
+            'risk_thresholds': {'CRITICAL': 80, 'HIGH': 60, 'MODERATE': 40},
+            'is_current': True,
+            'activated_at': timezone.now(),
+        }
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services_app', '0004_area_targeting_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoringModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Créé le')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Modifié le')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Actif')),
+                ('version', models.PositiveIntegerField(unique=True, verbose_name='Version')),
+                ('name', models.CharField(max_length=100, verbose_name='Nom')),
+                ('dimension_weights', models.JSONField(verbose_name='Pondérations par dimension')),
+                ('risk_thresholds', models.JSONField(verbose_name='Seuils par niveau de risque')),
+                ('is_current', models.BooleanField(default=False, verbose_name='Version en vigueur')),
+                ('activated_at', models.DateTimeField(blank=True, null=True, verbose_name='Mise en vigueur le')),
+                ('notes', models.TextField(blank=True, verbose_name='Notes')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='created_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('updated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='updated_%(class)s_set', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'Modèle de scoring',
+                'verbose_name_plural': 'Modèles de scoring',
+                'db_table': 'services_scoring_models',
+                'ordering': ['-version'],
+            },
+        ),
+        migrations.AddField(
+            model_name='vulnerabilityassessment',
+            name='scoring_model',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='assessments', to='services_app.scoringmodel', verbose_name='Modèle de scoring'),
+        ),
+        migrations.AddConstraint(
+            model_name='scoringmodel',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('is_current',), name='single_current_scoring_model'),
+        ),
+        migrations.RunPython(create_initial_scoring_model, migrations.RunPython.noop),
+    ]
@@ -136,6 +136,78 @@ class SocialProgramEligibility(BaseModel):
         return f"{self.person.full_name} - {self.program_code}"
 
 
+# ===================================================================
+# MODÈLES DE SCORING VERSIONNÉS
+# ===================================================================
+
+class ScoringModel(BaseModel):
+    """
+    Version des pondérations et seuils du score de vulnérabilité
+    
+    Une seule version est en vigueur (is_current) ; les versions
+    précédentes restent consultables pour comparer ou rescorer.
+    """
+    
+    version = models.PositiveIntegerField(
+        unique=True,
+        verbose_name="Version"
+    )
+    
+    name = models.CharField(
+        max_length=100,
+        verbose_name="Nom"
+    )
+    
+    dimension_weights = JSONField(
+        verbose_name="Pondérations par dimension"
+    )
+    
+    risk_thresholds = JSONField(
+        verbose_name="Seuils par niveau de risque"
+    )
+    
+    is_current = models.BooleanField(
+        default=False,
+        verbose_name="Version en vigueur"
+    )
+    
+    activated_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Mise en vigueur le"
+    )
+    
+    notes = models.TextField(
+        blank=True,
+        verbose_name="Notes"
+    )
+    
+    class Meta:
+        db_table = 'services_scoring_models'
+        verbose_name = "Modèle de scoring"
+        verbose_name_plural = "Modèles de scoring"
+        ordering = ['-version']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['is_current'],
+                condition=models.Q(is_current=True),
+                name='single_current_scoring_model'
+            )
+        ]
+    
+    def clean(self):
+        from django.core.exceptions import ValidationError
+        from .services.scoring_models import compile_scoring_model
+        
+        try:
+            compile_scoring_model(self)
+        except (ValueError, TypeError) as e:
+            raise ValidationError(str(e))
+    
+    def __str__(self):
+        return f"v{self.version} - {self.name}"
+
+
 # ===================================================================
 # ÉVALUATION VULNÉRABILITÉ
 # ===================================================================
@@ -230,6 +302,15 @@ class VulnerabilityAssessment(BaseModel):
         verbose_name="Notes d'évaluation"
     )
     
+    scoring_model = models.ForeignKey(
+        ScoringModel,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='assessments',
+        verbose_name="Modèle de scoring"
+    )
+    
     class Meta:
         db_table = 'services_vulnerability_assessments'
         verbose_name = "Évaluation vulnérabilité"
@@ -377,4 +458,171 @@ class GeographicInterventionCost(BaseModel):
         ordering = ['zone_key']
     
     def __str__(self):
-        return f"{self.get_zone_key_display()} - {self.cost_per_person:,.0f} FCFA"
\ No newline at end of file
+        return f"{self.get_zone_key_display()} - {self.cost_per_person:,.0f} FCFA"
+
+# ===================================================================
+# TUILES CARTE DE CHALEUR VULNÉRABILITÉ (précalculées)
+# ===================================================================
+
+class VulnerabilityHeatmapTile(BaseModel):
+    """
+    Tuile précalculée de carte de chaleur : agrégats de vulnérabilité par
+    cellule geohash, sans aucune coordonnée individuelle.
+    Régénérée par la commande refresh_heatmap_tiles.
+    """
+    
+    zoom = models.PositiveSmallIntegerField(
+        verbose_name="Niveau de zoom"
+    )
+    
+    tile_key = models.CharField(
+        max_length=12,
+        verbose_name="Préfixe geohash de la tuile"
+    )
+    
+    payload = JSONField(
+        default=dict,
+        verbose_name="Contenu compact (fields + rows)"
+    )
+    
+    etag = models.CharField(
+        max_length=64,
+        verbose_name="ETag"
+    )
+    
+    cell_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Nombre de cellules"
+    )
+    
+    person_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Nombre de personnes"
+    )
+    
+    generated_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Date de génération"
+    )
+    
+    class Meta:
+        db_table = 'services_vulnerability_heatmap_tiles'
+        verbose_name = "Tuile carte de chaleur"
+        verbose_name_plural = "Tuiles carte de chaleur"
+        ordering = ['zoom', 'tile_key']
+        unique_together = [['zoom', 'tile_key']]
+    
+    def __str__(self):
+        return f"Tuile z{self.zoom}/{self.tile_key} ({self.cell_count} cellules)"
+
+
+# ===================================================================
+# STATISTIQUES CIBLAGE INFRA-PROVINCIAL (commune / district)
+# ===================================================================
+
+class AreaTargetingStats(BaseModel):
+    """
+    Agrégats de vulnérabilité par commune ou district, précalculés par
+    GeotargetingService.refresh_area_statistics() : le classement de
+    milliers de communes est une simple requête indexée.
+    """
+    
+    LEVEL_CHOICES = [
+        ('COMMUNE', 'Commune'),
+        ('DISTRICT', 'District/Arrondissement'),
+    ]
+    
+    level = models.CharField(
+        max_length=10,
+        choices=LEVEL_CHOICES,
+        verbose_name="Niveau géographique"
+    )
+    
+    province = models.CharField(
+        max_length=50,
+        verbose_name="Province"
+    )
+    
+    area_name = models.CharField(
+        max_length=100,
+        verbose_name="Commune / district"
+    )
+    
+    priority_zone = models.CharField(
+        max_length=20,
+        verbose_name="Zone prioritaire"
+    )
+    
+    # Agrégats évaluations actives
+    total_assessed = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Personnes évaluées"
+    )
+    
+    critical_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Vulnérabilité critique"
+    )
+    
+    high_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Vulnérabilité élevée"
+    )
+    
+    vulnerable_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Population vulnérable (critique + élevée)"
+    )
+    
+    vulnerability_rate = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        default=0,
+        verbose_name="Taux vulnérabilité (%)"
+    )
+    
+    avg_vulnerability_score = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        default=0,
+        verbose_name="Score vulnérabilité moyen"
+    )
+    
+    accessibility_score = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        default=0,
+        verbose_name="Score accessibilité"
+    )
+    
+    priority_score = models.DecimalField(
+        max_digits=7,
+        decimal_places=2,
+        default=0,
+        verbose_name="Score priorité composite"
+    )
+    
+    eligible_by_program = JSONField(
+        default=dict,
+        verbose_name="Éligibles recommandés par programme"
+    )
+    
+    refreshed_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Date de calcul"
+    )
+    
+    class Meta:
+        db_table = 'services_area_targeting_stats'
+        verbose_name = "Statistiques ciblage commune/district"
+        verbose_name_plural = "Statistiques ciblage communes/districts"
+        ordering = ['level', '-priority_score']
+        unique_together = [['level', 'province', 'area_name']]
+        indexes = [
+            models.Index(fields=['level', 'priority_score']),
+            models.Index(fields=['level', 'province']),
+            models.Index(fields=['level', 'vulnerability_rate']),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_level_display()} {self.area_name} ({self.province})"
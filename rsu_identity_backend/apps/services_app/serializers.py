@@ -258,6 +258,17 @@ class VulnerabilityAssessmentCreateSerializer(serializers.ModelSerializer):
         return value
 
 
+class ScoringRescoreSerializer(serializers.Serializer):
+    """
+    Demande de recalcul des évaluations d'une version de scoring
+    """
+    
+    version = serializers.IntegerField(
+        min_value=1, allow_null=True,
+        help_text="Version à remplacer (null : évaluations non versionnées)"
+    )
+
+
 # ============================================================================
 # STATISTICS & REPORTS SERIALIZERS (EXISTANT - CONSERVÉ)
 # ============================================================================
@@ -308,6 +319,7 @@ __all__ = [
     # Vulnerability
     'VulnerabilityAssessmentSerializer',
     'VulnerabilityAssessmentCreateSerializer',
+    'ScoringRescoreSerializer',
     
     # Statistics
     'ProgramStatisticsSerializer',
@@ -10,11 +10,15 @@ from .base_service import BaseService, ServiceHelper
 from .vulnerability_service import VulnerabilityService
 from .eligibility_service import EligibilityService
 from .geotargeting_service import GeotargetingService
+from .facility_distance_service import FacilityDistanceService
+from .heatmap_service import HeatmapTileService
 
 __all__ = [
     'BaseService',
     'ServiceHelper',
     'VulnerabilityService',
     'EligibilityService',
-    'GeotargetingService'
+    'GeotargetingService',
+    'FacilityDistanceService',
+    'HeatmapTileService'
 ]
\ No newline at end of file
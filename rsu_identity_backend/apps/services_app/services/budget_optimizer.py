@@ -0,0 +1,358 @@
+# ===================================================================
+# RSU GABON - OPTIMISEUR ALLOCATION BUDGÉTAIRE
+# Sac à dos borné / programme linéaire en nombres entiers
+# ===================================================================
+
+"""
+Allocation d'un budget entre provinces × programmes.
+
+La matrice (bénéficiaires éligibles, coût par bénéficiaire, poids de
+priorité) est chargée une seule fois en deux requêtes, puis réutilisée pour
+autant de scénarios que nécessaire : comparer des scénarios ne coûte plus
+aucune requête.
+
+Problème résolu pour chaque scénario :
+    max  Σ poids[p,k] · x[p,k]
+    s.c. Σ coût[p,k] · x[p,k] ≤ budget
+         Σ_p x[p,k] ≤ capacité restante du programme k
+         Σ_p coût[p,k] · x[p,k] ≤ plafond budgétaire du programme k
+         ⌈couverture_min · éligibles[p,k]⌉ ≤ x[p,k] ≤ éligibles[p,k], entier
+
+Résolution par scipy.optimize.milp si SciPy est installé, sinon par un
+glouton au ratio poids/coût (optimum de la relaxation linéaire, arrondi).
+"""
+
+import logging
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ELIGIBLE_RECOMMENDATIONS = ['HIGHLY_RECOMMENDED', 'RECOMMENDED']
+
+# Nombre de versements par an selon la fréquence du programme
+PAYMENTS_PER_YEAR = {
+    'MONTHLY': 12,
+    'QUARTERLY': 4,
+    'ANNUAL': 1,
+}
+DEFAULT_DURATION_MONTHS = 12
+
+
+def _load_milp():
+    """scipy.optimize.milp si disponible (import différé : module lourd)"""
+    try:
+        from scipy.optimize import milp, LinearConstraint, Bounds
+    except ImportError:
+        return None
+    return milp, LinearConstraint, Bounds
+
+
+def program_duration_months(program) -> int:
+    """Durée du programme en mois (12 par défaut si sans date de fin)"""
+    if not program.end_date:
+        return DEFAULT_DURATION_MONTHS
+    months = (
+        (program.end_date.year - program.start_date.year) * 12
+        + program.end_date.month - program.start_date.month
+    )
+    return max(months, 1)
+
+
+def program_benefit_cost(program) -> float:
+    """Total des prestations versées à un bénéficiaire sur la durée du programme"""
+    benefit = float(program.benefit_amount)
+    if program.frequency == 'ONE_TIME':
+        return benefit
+    payments = math.ceil(
+        program_duration_months(program) * PAYMENTS_PER_YEAR.get(program.frequency, 12) / 12
+    )
+    return benefit * max(payments, 1)
+
+
+def program_budget_slots(program) -> Optional[int]:
+    """
+    Bénéficiaires supplémentaires finançables (None si coût nul)
+
+    Chaque bénéficiaire inscrit engage les prestations de toute la durée
+    du programme ; le budget non engagé est divisé par ce coût.
+    """
+    cost = program_benefit_cost(program)
+    if cost <= 0:
+        return None
+    committed = program.current_beneficiaries * cost
+    return max(math.floor((float(program.total_budget) - committed) / cost), 0)
+
+
+class AllocationMatrix:
+    """
+    Matrice provinces × programmes partagée entre scénarios
+
+    Attributes:
+        provinces: Lignes
+        program_codes: Colonnes
+        eligible: Bénéficiaires éligibles (P×K, entiers)
+        cost: Coût total par bénéficiaire (P×K, FCFA)
+        weight: Poids de priorité par bénéficiaire (P×K)
+        capacity: Places restantes par programme (K, inf si illimité)
+        programs: {code: SocialProgram} si chargée depuis la base
+    """
+
+    def __init__(self, provinces, program_codes, eligible, cost, weight,
+                 capacity=None, zones=None, programs=None):
+        self.provinces = list(provinces)
+        self.program_codes = list(program_codes)
+        self.eligible = np.asarray(eligible, dtype=float).reshape(len(self.provinces), len(self.program_codes))
+        self.cost = np.asarray(cost, dtype=float).reshape(self.eligible.shape)
+        self.weight = np.asarray(weight, dtype=float).reshape(self.eligible.shape)
+        self.capacity = (
+            np.full(len(self.program_codes), np.inf) if capacity is None
+            else np.asarray(capacity, dtype=float)
+        )
+        self.zones = zones or {}
+        self.programs = programs or {}
+
+    @classmethod
+    def load(cls, geotargeting_service, program_codes: List[str], provinces: List[str] = None):
+        """
+        Charge la matrice en deux requêtes (programmes + comptages groupés
+        de l'instantané provincial, réutilisés s'il est déjà chargé)
+
+        Args:
+            geotargeting_service: Fournit zones, coûts d'intervention et multiplicateurs
+            program_codes: Programmes à considérer
+            provinces: Provinces (défaut: toutes)
+        """
+        from apps.programs_app.models import SocialProgram
+
+        programs = {p.code: p for p in SocialProgram.objects.filter(code__in=program_codes)}
+        missing = [code for code in program_codes if code not in programs]
+        if missing:
+            raise ValueError(f"Programme(s) introuvable(s): {', '.join(missing)}")
+
+        # Comptages groupés et coûts partagés avec les autres méthodes du service
+        snapshot = geotargeting_service.get_snapshot()
+        provinces = list(provinces or geotargeting_service._get_all_provinces())
+        eligible = np.array([
+            [snapshot.eligible_count(code, province) for code in program_codes]
+            for province in provinces
+        ], dtype=float).reshape(len(provinces), len(program_codes))
+
+        zones = {p: geotargeting_service._get_zone_from_province(p) for p in provinces}
+        intervention_cost = np.array(
+            [snapshot.costs[zones[p]] for p in provinces], dtype=float
+        )
+        multiplier = np.array([
+            geotargeting_service.ZONE_PRIORITY_MAPPING[zones[p]]['intervention_multiplier']
+            for p in provinces
+        ])
+        benefit_cost = np.array([program_benefit_cost(programs[code]) for code in program_codes])
+        capacity = np.array([
+            np.inf if programs[code].capacity_remaining is None
+            else max(programs[code].capacity_remaining, 0)
+            for code in program_codes
+        ], dtype=float)
+
+        return cls(
+            provinces=provinces,
+            program_codes=program_codes,
+            eligible=eligible,
+            cost=intervention_cost[:, None] + benefit_cost[None, :],
+            weight=np.repeat(multiplier[:, None], len(program_codes), axis=1),
+            capacity=capacity,
+            zones=zones,
+            programs=programs,
+        )
+
+    def total_eligible(self, provinces=None, program_codes=None) -> int:
+        rows, cols = self._selection(provinces, program_codes)
+        return int(self.eligible[np.ix_(rows, cols)].sum())
+
+    def _selection(self, provinces=None, program_codes=None):
+        rows = [i for i, p in enumerate(self.provinces) if not provinces or p in provinces]
+        cols = [j for j, c in enumerate(self.program_codes) if not program_codes or c in program_codes]
+        return rows, cols
+
+
+class BudgetOptimizer:
+    """
+    Résolution de scénarios d'allocation sur une matrice partagée
+
+    Usage:
+        matrix = AllocationMatrix.load(service, ['TMC-2025'])
+        optimizer = BudgetOptimizer(matrix)
+        plans = optimizer.solve_scenarios([{'name': 'A', 'budget': 5e8}, ...])
+    """
+
+    def __init__(self, matrix: AllocationMatrix, use_scipy: bool = True):
+        self.matrix = matrix
+        self._milp = _load_milp() if use_scipy else None
+
+    def solve(
+        self,
+        budget: float,
+        provinces: Optional[List[str]] = None,
+        program_codes: Optional[List[str]] = None,
+        min_coverage_rate: float = 0.0,
+        program_budgets: Optional[Dict[str, float]] = None
+    ) -> Dict:
+        """
+        Allocation optimale pour un scénario
+
+        Args:
+            budget: Budget disponible (FCFA)
+            provinces: Restreindre aux provinces (défaut: toutes)
+            program_codes: Restreindre aux programmes (défaut: tous)
+            min_coverage_rate: Couverture minimale par cellule (0-1, équité)
+            program_budgets: Plafonds budgétaires par programme
+
+        Returns:
+            Dict: Plan (provinces, programmes, totaux, solveur)
+        """
+        m = self.matrix
+        rows, cols = m._selection(provinces, program_codes)
+        eligible = m.eligible[np.ix_(rows, cols)]
+        cost = m.cost[np.ix_(rows, cols)]
+        weight = m.weight[np.ix_(rows, cols)]
+        capacity = m.capacity[cols]
+        caps = np.array([
+            (program_budgets or {}).get(m.program_codes[j], np.inf) for j in cols
+        ], dtype=float)
+        lower = np.ceil(eligible * min_coverage_rate)
+
+        floor_cost = float((lower * cost).sum())
+        if floor_cost > budget or np.any(lower.sum(axis=0) > capacity) \
+                or np.any((lower * cost).sum(axis=0) > caps):
+            raise ValueError("Couverture minimale impossible avec ce budget ou ces capacités")
+
+        if eligible.size == 0 or not eligible.any():
+            allocation, solver = np.zeros_like(eligible), 'none'
+        elif self._milp is not None:
+            allocation, solver = self._solve_milp(eligible, cost, weight, capacity, caps, lower, budget)
+        else:
+            allocation, solver = self._solve_greedy(eligible, cost, weight, capacity, caps, lower, budget)
+
+        return self._format_plan(rows, cols, allocation, eligible, cost, weight, budget, solver)
+
+    def solve_scenarios(self, scenarios: List[Dict]) -> List[Dict]:
+        """
+        Résout plusieurs scénarios sur la même matrice (aucune requête)
+
+        Args:
+            scenarios: [{'name', 'budget', 'provinces'?, 'programs'?,
+                         'min_coverage_rate'?, 'program_budgets'?}]
+        """
+        results = []
+        for scenario in scenarios:
+            plan = self.solve(
+                float(scenario['budget']),
+                provinces=scenario.get('provinces'),
+                program_codes=scenario.get('programs'),
+                min_coverage_rate=scenario.get('min_coverage_rate', 0.0),
+                program_budgets=scenario.get('program_budgets'),
+            )
+            plan['scenario_name'] = scenario.get('name')
+            results.append(plan)
+        return results
+
+    # ------------------------------------------------------------------
+    # Solveurs
+    # ------------------------------------------------------------------
+    def _solve_milp(self, eligible, cost, weight, capacity, caps, lower, budget):
+        milp, LinearConstraint, Bounds = self._milp
+        n_rows, n_cols = eligible.shape
+        size = n_rows * n_cols
+
+        matrices, upper_bounds = [cost.ravel()], [budget]
+        for j in range(n_cols):
+            column = np.zeros((n_rows, n_cols))
+            column[:, j] = 1
+            if np.isfinite(capacity[j]):
+                matrices.append(column.ravel())
+                upper_bounds.append(capacity[j])
+            if np.isfinite(caps[j]):
+                matrices.append((column * cost).ravel())
+                upper_bounds.append(caps[j])
+
+        result = milp(
+            c=-weight.ravel(),
+            constraints=LinearConstraint(np.vstack(matrices), -np.inf, np.array(upper_bounds)),
+            integrality=np.ones(size),
+            bounds=Bounds(lower.ravel(), eligible.ravel()),
+        )
+        if not result.success:
+            logger.warning(f"MILP non résolu ({result.message}), repli glouton")
+            return self._solve_greedy(eligible, cost, weight, capacity, caps, lower, budget)
+        return np.round(result.x).reshape(n_rows, n_cols), 'milp'
+
+    def _solve_greedy(self, eligible, cost, weight, capacity, caps, lower, budget):
+        """
+        Planchers d'abord, puis cellules par ratio poids/coût décroissant en
+        prenant le maximum abordable : optimum de la relaxation linéaire
+        (contrainte budgétaire unique), arrondi à l'entier inférieur. Les
+        cellules de coût nul passent en premier, sans limite budgétaire.
+        """
+        allocation = lower.copy()
+        remaining = budget - float((lower * cost).sum())
+        remaining_capacity = capacity - lower.sum(axis=0)
+        remaining_caps = caps - (lower * cost).sum(axis=0)
+
+        cells = sorted(
+            ((i, j) for i in range(eligible.shape[0]) for j in range(eligible.shape[1])),
+            key=lambda cell: (-weight[cell] / cost[cell] if cost[cell] > 0 else -np.inf, cell)
+        )
+        for i, j in cells:
+            unit = cost[i, j]
+            affordable = min(remaining, remaining_caps[j]) // unit if unit > 0 else np.inf
+            count = min(eligible[i, j] - allocation[i, j], affordable, remaining_capacity[j])
+            if count <= 0:
+                continue
+            allocation[i, j] += count
+            remaining -= count * unit
+            remaining_caps[j] -= count * unit
+            remaining_capacity[j] -= count
+        return allocation, 'greedy'
+
+    # ------------------------------------------------------------------
+    def _format_plan(self, rows, cols, allocation, eligible, cost, weight, budget, solver):
+        m = self.matrix
+        provinces, programs = {}, {}
+
+        for a, i in enumerate(rows):
+            covered = int(allocation[a].sum())
+            if covered == 0:
+                continue
+            total = int(eligible[a].sum())
+            province = m.provinces[i]
+            provinces[province] = {
+                'beneficiaries_covered': covered,
+                'total_eligible': total,
+                'coverage_rate': round(covered / total * 100, 2) if total else 0,
+                'allocated_budget': float((allocation[a] * cost[a]).sum()),
+                'priority_zone': m.zones.get(province),
+                'by_program': {
+                    m.program_codes[j]: int(allocation[a, b])
+                    for b, j in enumerate(cols) if allocation[a, b] > 0
+                },
+            }
+
+        for b, j in enumerate(cols):
+            programs[m.program_codes[j]] = {
+                'beneficiaries_covered': int(allocation[:, b].sum()),
+                'allocated_budget': float((allocation[:, b] * cost[:, b]).sum()),
+            }
+
+        allocated = float((allocation * cost).sum())
+        return {
+            'provinces': provinces,
+            'programs': programs,
+            'total_beneficiaries_covered': int(allocation.sum()),
+            'total_eligible': int(eligible.sum()),
+            'total_budget_allocated': allocated,
+            'budget_remaining': budget - allocated,
+            'provinces_covered': len(provinces),
+            'weighted_impact': round(float((allocation * weight).sum()), 2),
+            'solver': solver,
+        }
@@ -23,6 +23,7 @@ from apps.programs_app.models import SocialProgram  # ← Source unique
 from ..admin import SocialProgramEligibility # ← Source unique
 
 from .base_service import BaseService
+from .budget_optimizer import ELIGIBLE_RECOMMENDATIONS
 
 logger = logging.getLogger(__name__)
 
@@ -65,15 +66,17 @@ class EligibilityService(BaseService):
     def refresh_programs_cache(self):
         """Actualise le cache des programmes actifs et de leurs critères."""
         programs_info = {}
-        for program in SocialProgram.objects.filter(is_active=True).all():
+        for program in SocialProgram.objects.filter(status='ACTIVE'):
+            criteria = program.eligibility_criteria or {}
             programs_info[program.code] = {
                 'program_name': program.name,
                 'max_beneficiaries': program.max_beneficiaries,
-                'can_accept_new': program.is_active, # Simplification
+                'can_accept_new': program.is_active,
                 'budget_available': True, # Simplification
                 'target_provinces': program.target_provinces or [],
-                'eligibility_criteria': program.eligibility_criteria or {},
-                'program_type': program.program_type
+                'eligibility_criteria': criteria,
+                'program_type': criteria.get('program_type'),
+                'automated_enrollment': criteria.get('automated_enrollment', False),
             }
         self.active_programs = programs_info
         self.log_operation('programs_cache_refreshed', {'active_programs_count': len(programs_info)})
@@ -133,6 +136,9 @@ class EligibilityService(BaseService):
             if (criteria.get('automated_enrollment') and 
                 eligibility.recommendation_level == 'HIGHLY_RECOMMENDED'):
                 self._auto_enroll_beneficiary(person, program, eligibility)
+            elif program.is_full and eligibility.recommendation_level in ELIGIBLE_RECOMMENDATIONS:
+                # Programme complet : la personne attend la prochaine place libérée
+                self._add_to_waitlist(person, program, eligibility)
             
             self.log_operation(
                 'eligibility_calculated', 
@@ -338,19 +344,19 @@ class EligibilityService(BaseService):
         # Logique d'ajustement ici si nécessaire (ex: multiplier par taille du ménage)
         return amount
         
-    def _determine_recommendation(self, score: float, criteria: Dict, blocking_factors: List[str]) -> Tuple[str, int]:
+    def _determine_recommendation(self, score: float, criteria: Dict, blocking_factors: List[str]) -> Tuple[str, str]:
         """Détermine le niveau de recommandation et la priorité."""
         
         # Si un facteur bloquant non contournable existe, la recommandation est bloquée
         if blocking_factors and 'Profil non adapté aux critères primaires' in blocking_factors:
-             return 'NOT_ELIGIBLE', 99 # Priorité basse pour un profil non conforme
+             return 'NOT_ELIGIBLE', 'LOW' # Priorité basse pour un profil non conforme
 
         if score >= 80:
-            return 'HIGHLY_RECOMMENDED', 1 # Priorité haute
+            return 'HIGHLY_RECOMMENDED', 'HIGH'
         elif score >= 50:
-            return 'RECOMMENDED', 2
+            return 'RECOMMENDED', 'MEDIUM'
         else:
-            return 'NOT_ELIGIBLE', 5
+            return 'NOT_ELIGIBLE', 'LOW'
             
     def _create_program_full_eligibility(self, person: PersonIdentity, program_code: str) -> SocialProgramEligibility:
         """Crée un enregistrement d'éligibilité pour un programme fermé."""
@@ -359,16 +365,33 @@ class EligibilityService(BaseService):
             program_code=program_code,
             eligibility_score=Decimal('0.00'),
             recommendation_level='NOT_ELIGIBLE',
-            processing_priority=99,
+            processing_priority='LOW',
             blocking_factors=["Programme fermé aux nouvelles inscriptions"],
             assessment_date=timezone.now()
         )
         
     def _auto_enroll_beneficiary(self, person, program, eligibility):
-        """Logique d'auto-inscription simplifiée."""
-        logger.info(f"Auto-enrollment triggered for {person.rsu_id} into {program.code}")
-        # Ici, vous inséreriez la logique métier pour créer une inscription effective.
+        """Inscription immédiate (places et budget vérifiés sous verrou du programme)."""
+        from apps.programs_app.services import AutoEnrollmentService
+
+        try:
+            result = AutoEnrollmentService().enroll_program(program, person_ids=[person.pk])
+        except ValueError as e:
+            logger.warning(f"Auto-inscription {person.rsu_id} → {program.code} impossible: {e}")
+            return
+        if not result['enrolled_count']:
+            logger.info(
+                f"Auto-inscription {person.rsu_id} → {program.code} différée "
+                f"({result['limited_by']})"
+            )
         
+    def _add_to_waitlist(self, person, program, eligibility):
+        """Inscription en liste d'attente d'un programme complet."""
+        from apps.programs_app.services import WaitlistService
+
+        WaitlistService().add(program, person, eligibility.eligibility_score)
+        logger.info(f"{person.rsu_id} en liste d'attente du programme complet {program.code}")
+
     # ===================================================================
     # 4. MÉTHODES D'INTERROGATION (API)
     # ===================================================================
@@ -0,0 +1,242 @@
+# ===================================================================
+# RSU GABON - SERVICE DISTANCES AUX SERVICES (PRÉCALCUL)
+# Plus proche centre de santé / école / marché / route par BallTree
+# ===================================================================
+
+"""
+Précalcul des distances aux infrastructures pour personnes, ménages et
+localités (GeographicData).
+
+Les infrastructures sont chargées depuis un fichier local (CSV ou GeoJSON),
+indexées dans un BallTree haversine par type, puis les coordonnées sont
+traitées par blocs vectorisés. Les distances sont stockées sur les modèles :
+les services de scoring les lisent sans aucun calcul par requête.
+"""
+
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from django.utils import timezone
+
+from apps.identity_app.models import PersonIdentity, Household, GeographicData
+from utils.geo import EARTH_RADIUS_KM
+from .base_service import BaseService
+
+logger = logging.getLogger(__name__)
+
+
+class FacilityDistanceService(BaseService):
+    """
+    Moteur batch de distances au plus proche service
+
+    Usage:
+        service = FacilityDistanceService.from_file('data/facilities.csv')
+        stats = service.update_all()
+    """
+
+    # Type d'infrastructure → champ PersonIdentity / Household
+    FACILITY_FIELDS = {
+        'HEALTH_CENTER': 'distance_to_health_center',
+        'SCHOOL': 'distance_to_school',
+        'MARKET': 'distance_to_market',
+        'ROAD': 'distance_to_road',
+    }
+
+    # Type d'infrastructure → champ GeographicData (km entiers)
+    GEOGRAPHIC_FIELDS = {
+        'HEALTH_CENTER': 'distance_to_hospital',
+        'SCHOOL': 'distance_to_school',
+        'MARKET': 'distance_to_market',
+        'ROAD': 'distance_to_road',
+    }
+
+    # Libellés acceptés dans les fichiers sources
+    TYPE_ALIASES = {
+        'HOSPITAL': 'HEALTH_CENTER',
+        'HEALTH': 'HEALTH_CENTER',
+        'CLINIC': 'HEALTH_CENTER',
+        'DISPENSARY': 'HEALTH_CENTER',
+        'PRIMARY_SCHOOL': 'SCHOOL',
+        'ROAD_POINT': 'ROAD',
+    }
+
+    DEFAULT_CHUNK_SIZE = 5000
+
+    def __init__(self, facilities: Dict[str, List], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            facilities: {type: [(latitude, longitude), ...]}
+            chunk_size: Nombre d'enregistrements traités par bloc
+        """
+        from sklearn.neighbors import BallTree  # import lourd : différé au premier usage
+
+        super().__init__()
+        self.chunk_size = chunk_size
+        self.trees = {}
+        for facility_type, points in facilities.items():
+            if facility_type not in self.FACILITY_FIELDS:
+                raise ValueError(f"Type d'infrastructure inconnu: {facility_type}")
+            if len(points):
+                self.trees[facility_type] = BallTree(
+                    np.radians(np.asarray(points, dtype=float)), metric='haversine'
+                )
+
+    # ===================================================================
+    # CHARGEMENT INFRASTRUCTURES
+    # ===================================================================
+
+    @classmethod
+    def from_file(cls, path, **kwargs) -> 'FacilityDistanceService':
+        """Construit le moteur depuis un fichier CSV ou GeoJSON"""
+        return cls(cls.load_facilities(path), **kwargs)
+
+    @classmethod
+    def normalize_type(cls, raw_type: str) -> str:
+        facility_type = (raw_type or '').strip().upper()
+        facility_type = cls.TYPE_ALIASES.get(facility_type, facility_type)
+        if facility_type not in cls.FACILITY_FIELDS:
+            raise ValueError(f"Type d'infrastructure inconnu: {raw_type}")
+        return facility_type
+
+    @classmethod
+    def load_facilities(cls, path) -> Dict[str, List]:
+        """
+        Charge les infrastructures d'un fichier local.
+
+        Formats:
+            - CSV : colonnes type, latitude, longitude (name optionnel)
+            - GeoJSON : FeatureCollection de Point, propriété `type`
+
+        Returns:
+            Dict: {type: [(latitude, longitude), ...]}
+        """
+        path = Path(path)
+        facilities = {facility_type: [] for facility_type in cls.FACILITY_FIELDS}
+
+        if path.suffix.lower() in ('.json', '.geojson'):
+            with path.open(encoding='utf-8') as handle:
+                collection = json.load(handle)
+            for feature in collection.get('features', []):
+                geometry = feature.get('geometry') or {}
+                if geometry.get('type') != 'Point':
+                    continue
+                longitude, latitude = geometry['coordinates'][:2]
+                facility_type = cls.normalize_type((feature.get('properties') or {}).get('type'))
+                facilities[facility_type].append((float(latitude), float(longitude)))
+        else:
+            with path.open(encoding='utf-8', newline='') as handle:
+                for row in csv.DictReader(handle):
+                    facility_type = cls.normalize_type(row.get('type'))
+                    facilities[facility_type].append(
+                        (float(row['latitude']), float(row['longitude']))
+                    )
+
+        logger.info(
+            f"Infrastructures chargées depuis {path}: "
+            + ", ".join(f"{t}={len(p)}" for t, p in facilities.items())
+        )
+        return facilities
+
+    # ===================================================================
+    # CALCUL VECTORISÉ
+    # ===================================================================
+
+    def nearest_distances(self, coordinates) -> Dict[str, np.ndarray]:
+        """
+        Distance haversine (km) au plus proche service de chaque type
+
+        Args:
+            coordinates: Tableau (n, 2) de (latitude, longitude) en degrés
+
+        Returns:
+            Dict: {type: tableau (n,) des distances en km}
+        """
+        points = np.radians(np.asarray(coordinates, dtype=float).reshape(-1, 2))
+        return {
+            facility_type: tree.query(points, k=1, return_distance=True)[0][:, 0] * EARTH_RADIUS_KM
+            for facility_type, tree in self.trees.items()
+        }
+
+    def update_model(self, queryset, field_map: Dict[str, str], integer_km: bool = False) -> int:
+        """
+        Met à jour les distances d'un queryset par blocs (pagination par clé)
+
+        Args:
+            queryset: Enregistrements possédant latitude/longitude
+            field_map: {type: champ de destination}
+            integer_km: Arrondir au km (champs PositiveIntegerField)
+
+        Returns:
+            int: Nombre d'enregistrements mis à jour
+        """
+        if not self.trees:
+            return 0
+
+        model = queryset.model
+        fields = [field_map[t] for t in self.trees]
+        if 'facility_distances_computed_at' in {f.name for f in model._meta.fields}:
+            fields.append('facility_distances_computed_at')
+
+        base = queryset.filter(
+            latitude__isnull=False, longitude__isnull=False
+        ).order_by('pk')
+        computed_at = timezone.now()
+        updated = 0
+        last_pk = None
+
+        while True:
+            chunk = base if last_pk is None else base.filter(pk__gt=last_pk)
+            rows = list(chunk.values_list('pk', 'latitude', 'longitude')[:self.chunk_size])
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+
+            distances = self.nearest_distances([(lat, lon) for _, lat, lon in rows])
+            objects = []
+            for index, (pk, _, _) in enumerate(rows):
+                obj = model(pk=pk)
+                for facility_type, values in distances.items():
+                    value = float(values[index])
+                    setattr(
+                        obj, field_map[facility_type],
+                        int(round(value)) if integer_km else round(value, 3)
+                    )
+                if 'facility_distances_computed_at' in fields:
+                    obj.facility_distances_computed_at = computed_at
+                objects.append(obj)
+
+            model.objects.bulk_update(objects, fields, batch_size=1000)
+            updated += len(objects)
+
+        return updated
+
+    def update_all(self, persons=True, households=True, geographic=True) -> Dict[str, int]:
+        """
+        Recalcule les distances de toutes les entités géolocalisées
+
+        Returns:
+            Dict: Nombre d'enregistrements mis à jour par modèle
+        """
+        stats = {}
+        if persons:
+            stats['persons'] = self.update_model(
+                PersonIdentity.objects.all(), self.FACILITY_FIELDS
+            )
+        if households:
+            stats['households'] = self.update_model(
+                Household.objects.all(), self.FACILITY_FIELDS
+            )
+        if geographic:
+            stats['geographic_data'] = self.update_model(
+                GeographicData.objects.all(), self.GEOGRAPHIC_FIELDS, integer_km=True
+            )
+
+        self.log_operation('facility_distances_update', {
+            'facility_types': sorted(self.trees),
+            **stats
+        })
+        return stats
@@ -11,9 +11,15 @@ from django.db.models import Count, Avg, Q, F, Sum
 from django.utils import timezone
 
 from apps.identity_app.models import PersonIdentity, GeographicData
+from apps.identity_app.services.accessibility_cache import get_accessibility_aggregates
 from ..models import VulnerabilityAssessment
 from apps.programs_app.models import SocialProgram  
 from .base_service import BaseService
+from .province_snapshot import ProvinceSnapshot
+from .intervention_cost_registry import get_cost_registry
+from .budget_optimizer import (
+    AllocationMatrix, BudgetOptimizer, program_benefit_cost, program_duration_months
+)
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +72,17 @@ class GeotargetingService(BaseService):
         super().__init__()
         # Charger coûts configurables depuis base de données
         self.intervention_costs = self._load_intervention_costs()
+        self._snapshot = None
+
+    def get_snapshot(self) -> ProvinceSnapshot:
+        """Agrégats par province, chargés une fois par instance (= par requête)"""
+        if self._snapshot is None:
+            self._snapshot = ProvinceSnapshot(self)
+        return self._snapshot
+
+    def invalidate_snapshot(self):
+        """À appeler après une écriture modifiant les agrégats"""
+        self._snapshot = None
 
     def analyze_geographic_vulnerability(
         self, 
@@ -81,10 +98,7 @@ class GeotargetingService(BaseService):
             Dict: Analyse complète vulnérabilité géographique
         """
         try:
-            queryset = VulnerabilityAssessment.objects.filter(is_active=True)
-            
-            if province:
-                queryset = queryset.filter(person__province=province)
+            snapshot = self.get_snapshot()
             
             # Analyse par province
             province_analysis = {}
@@ -95,43 +109,21 @@ class GeotargetingService(BaseService):
                         continue
                     
                     # Statistiques province
-                    prov_assessments = queryset.filter(person__province=prov)
-                    total_persons = prov_assessments.count()
+                    stats = snapshot.assessment_stats(prov)
                     
-                    if total_persons == 0:
+                    if not stats:
                         continue
                     
-                    # Distribution niveaux vulnérabilité
-                    critical_count = prov_assessments.filter(risk_level='CRITICAL').count()
-                    high_count = prov_assessments.filter(
-                        risk_level='HIGH'
-                    ).count()
-                    
-                    # Score moyen
-                    # Score moyen
-                    avg_vuln = prov_assessments.aggregate(
-                        avg_score=Avg('vulnerability_score')
-                    )['avg_score'] or 0
-
-                    
-                    # Score accessibilité (si données géographiques disponibles)
-                    accessibility_score = self._calculate_province_accessibility(prov)
-                    
                     province_analysis[prov] = {
                         'priority_zone': zone_key,
                         'zone_name': zone_data['name'],
-                        'total_population': total_persons,
-                        'critical_vulnerable': critical_count,
-                        'high_vulnerable': high_count,
-                        'vulnerability_rate': round(
-                            (critical_count + high_count) / total_persons * 100, 2
-                        ) if total_persons > 0 else 0,
-                        'avg_vulnerability_score': round(float(avg_vuln), 2),
-                        'accessibility_score': accessibility_score,
-                        'intervention_cost_per_person': self.intervention_costs.get(
-                            zone_key,
-                            self.DEFAULT_INTERVENTION_COSTS[zone_key]
-                        ),
+                        'total_population': stats['total'],
+                        'critical_vulnerable': stats['critical'],
+                        'high_vulnerable': stats['high'],
+                        'vulnerability_rate': round(stats['vulnerability_rate'], 2),
+                        'avg_vulnerability_score': round(stats['avg_score'], 2),
+                        'accessibility_score': snapshot.province_accessibility(prov),
+                        'intervention_cost_per_person': snapshot.costs[zone_key],
                         'characteristics': zone_data['characteristics']
                     }
             
@@ -187,11 +179,14 @@ class GeotargetingService(BaseService):
             float: Score accessibilité 0-100 (100 = très accessible)
         """
         try:
-            # Récupérer données géographiques
-            geo_queryset = GeographicData.objects.filter(province=province)
+            if not location_name:
+                # Moyenne province depuis l'instantané
+                return self.get_snapshot().province_accessibility(province)
             
-            if location_name:
-                geo_queryset = geo_queryset.filter(location_name=location_name)
+            # Récupérer données géographiques
+            geo_queryset = GeographicData.objects.filter(
+                province=province, location_name=location_name
+            )
             
             if not geo_queryset.exists():
                 # Pas de données = score estimé selon zone
@@ -211,7 +206,10 @@ class GeotargetingService(BaseService):
     def identify_priority_zones(
         self,
         min_vulnerable_population: int = 100,
-        min_vulnerability_rate: float = 40.0
+        min_vulnerability_rate: float = 40.0,
+        level: str = 'PROVINCE',
+        province: str = None,
+        limit: int = None
     ) -> List[Dict]:
         """
         Identifie zones prioritaires pour interventions
@@ -219,284 +217,33 @@ class GeotargetingService(BaseService):
         Args:
             min_vulnerable_population: Population vulnérable minimum
             min_vulnerability_rate: Taux vulnérabilité minimum (%)
+            level: 'PROVINCE', 'COMMUNE' ou 'DISTRICT'
+            province: Restreindre à une province (niveaux commune/district)
+            limit: Nombre maximum de zones retournées
             
         Returns:
             List[Dict]: Zones prioritaires classées
         """
-        try:
-            priority_zones = []
-            
-            # Analyse par province
-            for province_code in self._get_all_provinces():
-                assessments = VulnerabilityAssessment.objects.filter(
-                    person__province=province_code,
-                    is_active=True
-                )
-                
-                total_pop = assessments.count()
-                if total_pop < min_vulnerable_population:
-                    continue
-                
-                # Comptage vulnérables
-                vulnerable_count = assessments.filter(
-                    risk_level__in=['CRITICAL', 'HIGH']
-                ).count()
-                
-                vulnerability_rate = (vulnerable_count / total_pop * 100) if total_pop > 0 else 0
-                
-                if vulnerability_rate < min_vulnerability_rate:
-                    continue
-                
-                # Zone prioritaire identifiée
-                zone_key = self._get_zone_from_province(province_code)
-                zone_data = self.ZONE_PRIORITY_MAPPING[zone_key]
-                
-                # Score accessibilité
-                accessibility = self.calculate_zone_accessibility_score(province_code)
-                
-                # Score priorité composite
-                priority_score = self._calculate_composite_priority_score(
-                    vulnerability_rate,
-                    vulnerable_count,
-                    accessibility,
-                    zone_key
-                )
-                
-                # Coût intervention pour cette zone
-                intervention_cost = self.intervention_costs.get(
-                    zone_key,
-                    self.DEFAULT_INTERVENTION_COSTS[zone_key]
-                )
-                
-                priority_zones.append({
-                    'province': province_code,
-                    'priority_zone': zone_key,
-                    'zone_classification': zone_data['name'],
-                    'total_population': total_pop,
-                    'vulnerable_population': vulnerable_count,
-                    'vulnerability_rate': round(vulnerability_rate, 2),
-                    'accessibility_score': accessibility,
-                    'priority_score': priority_score,
-                    'estimated_intervention_cost': vulnerable_count * intervention_cost,
-                    'cost_per_person': intervention_cost,
-                    'recommended_programs': self._recommend_programs_for_zone(
-                        province_code,
-                        vulnerability_rate
-                    )
-                })
-            
-            # Trier par score priorité décroissant
-            priority_zones.sort(key=lambda x: x['priority_score'], reverse=True)
-            
-            self.log_operation(
-                'priority_zones_identified',
-                {
-                    'zones_count': len(priority_zones),
-                    'min_vulnerable_pop': min_vulnerable_population,
-                    'min_vulnerability_rate': min_vulnerability_rate
-                }
-            )
-            
-            return priority_zones
-            
-        except Exception as e:
-            logger.error(f"Erreur identification zones prioritaires: {str(e)}")
-            raise
-
-    def optimize_program_deployment(
-        self,
-        program_code: str,
-        available_budget: Decimal,
-        target_provinces: List[str] = None
-    ) -> Dict:
-        """
-        Optimise déploiement programme selon budget et zones
-        
-        Args:
-            program_code: Code du programme
-            available_budget: Budget disponible (FCFA)
-            target_provinces: Provinces ciblées (optionnel)
-            
-        Returns:
-            Dict: Plan déploiement optimisé
-        """
-        try:
-            # Récupérer programme
-            program = SocialProgram.objects.get(code=program_code)
-            
-            # Identifier bénéficiaires potentiels par province
-            potential_beneficiaries = {}
-            
-            provinces_to_analyze = target_provinces or self._get_all_provinces()
-            
-            for province in provinces_to_analyze:
-                # Bénéficiaires éligibles dans la province
-                eligible_count = self._count_eligible_beneficiaries(
-                    program_code,
-                    province
-                )
-                
-                if eligible_count == 0:
-                    continue
-                
-                zone_key = self._get_zone_from_province(province)
-                cost_per_person = self.intervention_costs.get(
-                    zone_key,
-                    self.DEFAULT_INTERVENTION_COSTS[zone_key]
-                )
-                
-                # Coût bénéfice mensuel
-                monthly_benefit = float(program.benefit_amount_fcfa)
-                total_cost_per_beneficiary = cost_per_person + (
-                    monthly_benefit * program.duration_months
-                )
-                
-                potential_beneficiaries[province] = {
-                    'eligible_count': eligible_count,
-                    'cost_per_beneficiary': total_cost_per_beneficiary,
-                    'total_cost': eligible_count * total_cost_per_beneficiary,
-                    'priority_zone': zone_key,
-                    'intervention_multiplier': self.ZONE_PRIORITY_MAPPING[zone_key]['intervention_multiplier']
-                }
-            
-            # Optimisation allocation budget
-            deployment_plan = self._optimize_budget_allocation(
-                potential_beneficiaries,
-                float(available_budget)
-            )
-            
-            self.log_operation(
-                'program_deployment_optimized',
-                {
-                    'program_code': program_code,
-                    'budget': float(available_budget),
-                    'provinces_analyzed': len(potential_beneficiaries)
-                }
-            )
-            
-            return {
-                'program_code': program_code,
-                'program_name': program.name,
-                'available_budget': float(available_budget),
-                'deployment_plan': deployment_plan,
-                'optimization_date': timezone.now().isoformat()
-            }
-            
-        except SocialProgram.DoesNotExist:
-            logger.error(f"Programme {program_code} introuvable")
-            raise ValueError(f"Programme {program_code} introuvable")
-        except Exception as e:
-            logger.error(f"Erreur optimisation déploiement: {str(e)}")
-            raise
-            
-            # Classement provinces par priorité
-            sorted_provinces = sorted(
-                province_analysis.items(),
-                key=lambda x: (
-                    -x[1]['vulnerability_rate'],
-                    -x[1]['critical_vulnerable']
-                )
+        if level != 'PROVINCE':
+            return self._identify_priority_areas(
+                level, min_vulnerable_population, min_vulnerability_rate, province, limit
             )
-            
-            # Recommandations stratégiques
-            recommendations = self._generate_geographic_recommendations(
-                province_analysis
-            )
-            
-            result = {
-                'analysis_date': timezone.now().isoformat(),
-                'provinces_analyzed': len(province_analysis),
-                'province_details': dict(sorted_provinces),
-                'strategic_recommendations': recommendations,
-                'filters_applied': {'province': province}
-            }
-            
-            self.log_operation(
-                'geographic_vulnerability_analyzed',
-                {
-                    'provinces_count': len(province_analysis),
-                    'province_filter': province
-                }
-            )
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Erreur analyse géographique: {str(e)}")
-            raise
-
-    def calculate_zone_accessibility_score(
-        self, 
-        province: str,
-        location_name: str = None
-    ) -> float:
-        """
-        Calcule score accessibilité zone (0-100)
         
-        Args:
-            province: Province
-            location_name: Localité spécifique (optionnel)
-            
-        Returns:
-            float: Score accessibilité 0-100 (100 = très accessible)
-        """
-        try:
-            # Récupérer données géographiques
-            geo_queryset = GeographicData.objects.filter(province=province)
-            
-            if location_name:
-                geo_queryset = geo_queryset.filter(location_name=location_name)
-            
-            if not geo_queryset.exists():
-                # Pas de données = score estimé selon zone
-                return self._estimate_accessibility_from_zone(province)
-            
-            # Score moyen accessibilité
-            avg_accessibility = geo_queryset.aggregate(
-                avg_score=Avg('accessibility_score')
-            )['avg_score']
-            
-            return round(float(avg_accessibility or 50.0), 2)
-            
-        except Exception as e:
-            logger.error(f"Erreur calcul accessibilité: {str(e)}")
-            return 50.0
-
-    def identify_priority_zones(
-        self,
-        min_vulnerable_population: int = 100,
-        min_vulnerability_rate: float = 40.0
-    ) -> List[Dict]:
-        """
-        Identifie zones prioritaires pour interventions
-        
-        Args:
-            min_vulnerable_population: Population vulnérable minimum
-            min_vulnerability_rate: Taux vulnérabilité minimum (%)
-            
-        Returns:
-            List[Dict]: Zones prioritaires classées
-        """
         try:
             priority_zones = []
             
+            snapshot = self.get_snapshot()
+            
             # Analyse par province
             for province_code in self._get_all_provinces():
-                assessments = VulnerabilityAssessment.objects.filter(
-                    person__province=province_code,
-                    is_active=True
-                )
-                
-                total_pop = assessments.count()
-                if total_pop < min_vulnerable_population:
+                stats = snapshot.assessment_stats(province_code)
+                total_pop = stats['total'] if stats else 0
+                if not stats or total_pop < min_vulnerable_population:
                     continue
                 
                 # Comptage vulnérables
-                vulnerable_count = assessments.filter(
-                    risk_level__in=['CRITICAL', 'HIGH']
-                ).count()
-                
-                vulnerability_rate = (vulnerable_count / total_pop * 100) if total_pop > 0 else 0
+                vulnerable_count = stats['vulnerable']
+                vulnerability_rate = stats['vulnerability_rate']
                 
                 if vulnerability_rate < min_vulnerability_rate:
                     continue
@@ -506,7 +253,7 @@ class GeotargetingService(BaseService):
                 zone_data = self.ZONE_PRIORITY_MAPPING[zone_key]
                 
                 # Score accessibilité
-                accessibility = self.calculate_zone_accessibility_score(province_code)
+                accessibility = snapshot.province_accessibility(province_code)
                 
                 # Score priorité composite
                 priority_score = self._calculate_composite_priority_score(
@@ -525,7 +272,7 @@ class GeotargetingService(BaseService):
                     'vulnerability_rate': round(vulnerability_rate, 2),
                     'accessibility_score': accessibility,
                     'priority_score': priority_score,
-                    'estimated_intervention_cost': vulnerable_count * self.INTERVENTION_COSTS[zone_key],
+                    'estimated_intervention_cost': vulnerable_count * snapshot.costs[zone_key],
                     'recommended_programs': self._recommend_programs_for_zone(
                         province_code,
                         vulnerability_rate
@@ -534,6 +281,8 @@ class GeotargetingService(BaseService):
             
             # Trier par score priorité décroissant
             priority_zones.sort(key=lambda x: x['priority_score'], reverse=True)
+            if limit:
+                priority_zones = priority_zones[:limit]
             
             self.log_operation(
                 'priority_zones_identified',
@@ -554,7 +303,8 @@ class GeotargetingService(BaseService):
         self,
         program_code: str,
         available_budget: Decimal,
-        target_provinces: List[str] = None
+        target_provinces: List[str] = None,
+        min_coverage_rate: float = 0.0
     ) -> Dict:
         """
         Optimise déploiement programme selon budget et zones
@@ -563,50 +313,16 @@ class GeotargetingService(BaseService):
             program_code: Code du programme
             available_budget: Budget disponible (FCFA)
             target_provinces: Provinces ciblées (optionnel)
+            min_coverage_rate: Couverture minimale par province (0-1)
             
         Returns:
             Dict: Plan déploiement optimisé
         """
         try:
-            # Récupérer programme
-            program = SocialProgram.objects.get(code=program_code)
-            
-            # Identifier bénéficiaires potentiels par province
-            potential_beneficiaries = {}
-            
-            provinces_to_analyze = target_provinces or self._get_all_provinces()
-            
-            for province in provinces_to_analyze:
-                # Bénéficiaires éligibles dans la province
-                eligible_count = self._count_eligible_beneficiaries(
-                    program_code,
-                    province
-                )
-                
-                if eligible_count == 0:
-                    continue
-                
-                zone_key = self._get_zone_from_province(province)
-                cost_per_person = self.INTERVENTION_COSTS[zone_key]
-                
-                # Coût bénéfice mensuel
-                monthly_benefit = float(program.benefit_amount_fcfa)
-                total_cost_per_beneficiary = cost_per_person + (
-                    monthly_benefit * program.duration_months
-                )
-                
-                potential_beneficiaries[province] = {
-                    'eligible_count': eligible_count,
-                    'cost_per_beneficiary': total_cost_per_beneficiary,
-                    'total_cost': eligible_count * total_cost_per_beneficiary,
-                    'priority_zone': zone_key,
-                    'intervention_multiplier': self.ZONE_PRIORITY_MAPPING[zone_key]['intervention_multiplier']
-                }
-            
-            # Optimisation allocation budget
-            deployment_plan = self._optimize_budget_allocation(
-                potential_beneficiaries,
-                float(available_budget)
+            matrix = AllocationMatrix.load(self, [program_code], target_provinces)
+            deployment_plan = BudgetOptimizer(matrix).solve(
+                float(available_budget),
+                min_coverage_rate=min_coverage_rate
             )
             
             self.log_operation(
@@ -614,56 +330,30 @@ class GeotargetingService(BaseService):
                 {
                     'program_code': program_code,
                     'budget': float(available_budget),
-                    'provinces_analyzed': len(potential_beneficiaries)
+                    'provinces_analyzed': len(matrix.provinces),
+                    'solver': deployment_plan['solver']
                 }
             )
             
             return {
                 'program_code': program_code,
-                'program_name': program.name,
+                'program_name': matrix.programs[program_code].name,
                 'available_budget': float(available_budget),
                 'deployment_plan': deployment_plan,
                 'optimization_date': timezone.now().isoformat()
             }
             
-        except SocialProgram.DoesNotExist:
-            logger.error(f"Programme {program_code} introuvable")
-            raise ValueError(f"Programme {program_code} introuvable")
         except Exception as e:
             logger.error(f"Erreur optimisation déploiement: {str(e)}")
             raise
 
     def _load_intervention_costs(self) -> Dict[str, float]:
         """
-        Charge coûts intervention depuis base de données
+        Charge coûts intervention depuis le registre partagé
+        (cache commun à tous les workers, rechargement unique)
         """
         try:
-            from django.core.cache import cache
-            from ..models import GeographicInterventionCost  # ✅ Import modèle
-            
-            # Vérifier cache
-            cached_costs = cache.get('intervention_costs')
-            if cached_costs:
-                return cached_costs
-            
-            # Charger depuis DB
-            costs = {}
-            cost_objects = GeographicInterventionCost.objects.filter(is_active=True)
-            
-            for cost_obj in cost_objects:
-                costs[cost_obj.zone_key] = float(cost_obj.cost_per_person)
-            
-            # Si aucune config en DB, utiliser défauts
-            if not costs:
-                self.logger.warning("Aucun coût en DB, utilisation valeurs par défaut")
-                costs = self.DEFAULT_INTERVENTION_COSTS.copy()
-            
-            # Mettre en cache 1 heure
-            cache.set('intervention_costs', costs, 3600)
-            
-            self.logger.info(f"Coûts intervention chargés: {costs}")
-            
-            return costs
+            return get_cost_registry().get_costs()
             
         except Exception as e:
             self.logger.warning(f"Erreur chargement coûts: {str(e)}")
@@ -693,13 +383,11 @@ class GeotargetingService(BaseService):
             if new_cost < 0:
                 raise ValueError("Coût doit être positif")
             
-            # TODO: Sauvegarder dans modèle GeographicInterventionCost
-            # Pour l'instant, mettre à jour en mémoire et cache
+            # Persistance en base ; le signal recharge le registre après commit
+            get_cost_registry().set_cost(zone_key, new_cost, updated_by)
             
             self.intervention_costs[zone_key] = new_cost
-            
-            from django.core.cache import cache
-            cache.set('intervention_costs', self.intervention_costs, 3600)
+            self.invalidate_snapshot()
             
             self.log_operation(
                 'intervention_cost_updated',
@@ -739,46 +427,14 @@ class GeotargetingService(BaseService):
             Dict: Détail coûts intervention
         """
         try:
-            zone_key = self._get_zone_from_province(province)
-            
-            # Coût opérationnel (logistique, déploiement, suivi)
-            # Utilise coût personnalisé si fourni, sinon coût configuré/défaut
-            operational_cost_per_person = (
-                custom_operational_cost if custom_operational_cost is not None
-                else self.intervention_costs.get(zone_key, self.DEFAULT_INTERVENTION_COSTS[zone_key])
+            result = self._build_intervention_cost_analysis(
+                province,
+                beneficiary_count,
+                program_duration_months,
+                monthly_benefit,
+                custom_operational_cost
             )
-            
-            # Coût total bénéfices (transferts directs)
-            total_benefits = beneficiary_count * monthly_benefit * program_duration_months
-            
-            # Coût total opérationnel
-            total_operational = beneficiary_count * operational_cost_per_person
-            
-            # Coût total programme
-            total_cost = total_benefits + total_operational
-            
-            # Coût par bénéficiaire
-            cost_per_beneficiary = total_cost / beneficiary_count if beneficiary_count > 0 else 0
-            
-            # Ratio efficacité (% du budget qui va directement aux bénéficiaires)
-            efficiency_ratio = (total_benefits / total_cost * 100) if total_cost > 0 else 0
-            
-            result = {
-                'province': province,
-                'priority_zone': zone_key,
-                'beneficiary_count': beneficiary_count,
-                'program_duration_months': program_duration_months,
-                'monthly_benefit_fcfa': monthly_benefit,
-                'costs': {
-                    'operational_cost_per_person': operational_cost_per_person,
-                    'total_operational': total_operational,
-                    'total_benefits': total_benefits,
-                    'total_program_cost': total_cost,
-                    'cost_per_beneficiary': cost_per_beneficiary
-                },
-                'efficiency_ratio': round(efficiency_ratio, 2),
-                'cost_customized': custom_operational_cost is not None
-            }
+            total_cost = result['costs']['total_program_cost']
             
             self.log_operation(
                 'intervention_cost_calculated',
@@ -799,7 +455,8 @@ class GeotargetingService(BaseService):
         self,
         program_code: str,
         available_budget: float,
-        max_provinces: int = 5
+        max_provinces: int = 5,
+        level: str = 'PROVINCE'
     ) -> List[Dict]:
         """
         Génère recommandations déploiement optimisées
@@ -807,47 +464,40 @@ class GeotargetingService(BaseService):
         Args:
             program_code: Code du programme
             available_budget: Budget disponible (FCFA)
-            max_provinces: Nombre maximum de provinces à cibler
+            max_provinces: Nombre maximum de zones à cibler
+            level: 'PROVINCE', 'COMMUNE' ou 'DISTRICT' (statistiques précalculées)
             
         Returns:
-            List[Dict]: Recommandations par province classées
+            List[Dict]: Recommandations par zone classées
         """
         try:
             # Récupérer programme
             program = SocialProgram.objects.get(code=program_code)
+            duration_months = program_duration_months(program)
+            monthly_benefit = program_benefit_cost(program) / duration_months
             
             recommendations = []
             
-            # Analyser toutes les provinces
-            for province in self._get_all_provinces():
-                # Nombre bénéficiaires éligibles
-                eligible_count = self._count_eligible_beneficiaries(
-                    program_code,
-                    province
-                )
-                
-                if eligible_count == 0:
-                    continue
-                
+            for area in self._deployment_candidates(program_code, level):
                 # Calcul coûts
-                cost_analysis = self.calculate_intervention_cost(
-                    province=province,
-                    beneficiary_count=eligible_count,
-                    program_duration_months=program.duration_months,
-                    monthly_benefit=float(program.benefit_amount_fcfa)
+                cost_analysis = self._build_intervention_cost_analysis(
+                    province=area['province'],
+                    beneficiary_count=area['eligible_count'],
+                    program_duration_months=duration_months,
+                    monthly_benefit=monthly_benefit
                 )
                 
                 # Score impact (vulnérabilité × population)
-                vulnerability_rate = self._get_province_vulnerability_rate(province)
-                impact_score = vulnerability_rate * eligible_count / 100
+                vulnerability_rate = area['vulnerability_rate']
+                impact_score = vulnerability_rate * area['eligible_count'] / 100
                 
                 # ROI social (impact par FCFA dépensé)
                 social_roi = impact_score / cost_analysis['costs']['total_program_cost'] * 1000000
                 
-                recommendations.append({
-                    'province': province,
+                recommendation = {
+                    'province': area['province'],
                     'priority_zone': cost_analysis['priority_zone'],
-                    'eligible_beneficiaries': eligible_count,
+                    'eligible_beneficiaries': area['eligible_count'],
                     'total_cost': cost_analysis['costs']['total_program_cost'],
                     'cost_per_beneficiary': cost_analysis['costs']['cost_per_beneficiary'],
                     'vulnerability_rate': vulnerability_rate,
@@ -855,12 +505,15 @@ class GeotargetingService(BaseService):
                     'social_roi': round(social_roi, 4),
                     'efficiency_ratio': cost_analysis['efficiency_ratio'],
                     'recommendation': self._generate_province_recommendation(
-                        province,
+                        area['province'],
                         cost_analysis,
                         vulnerability_rate,
                         available_budget
                     )
-                })
+                }
+                if level != 'PROVINCE':
+                    recommendation.update(level=level, area_name=area['area_name'])
+                recommendations.append(recommendation)
             
             # Trier par ROI social décroissant
             recommendations.sort(key=lambda x: x['social_roi'], reverse=True)
@@ -876,6 +529,7 @@ class GeotargetingService(BaseService):
                 'deployment_recommendations_generated',
                 {
                     'program_code': program_code,
+                    'level': level,
                     'provinces_recommended': len(top_recommendations),
                     'budget_coverage': budget_coverage
                 }
@@ -884,6 +538,7 @@ class GeotargetingService(BaseService):
             return {
                 'program_code': program_code,
                 'program_name': program.name,
+                'level': level,
                 'available_budget': available_budget,
                 'recommendations': top_recommendations,
                 'summary': {
@@ -903,25 +558,289 @@ class GeotargetingService(BaseService):
             raise
 
     # ===================================================================
-    # MÉTHODES PRIVÉES - UTILITAIRES
+    # CIBLAGE INFRA-PROVINCIAL (COMMUNE / DISTRICT)
     # ===================================================================
 
-    def _calculate_province_accessibility(self, province: str) -> float:
-        """Calcule score accessibilité moyen d'une province"""
-        try:
-            geo_data = GeographicData.objects.filter(province=province)
+    AREA_LEVEL_FIELDS = {
+        'COMMUNE': 'commune',
+        'DISTRICT': 'district',
+    }
+
+    def refresh_area_statistics(self, levels: List[str] = None) -> Dict[str, int]:
+        """
+        Recalcule la table AreaTargetingStats (requêtes agrégées groupées,
+        trois par niveau quel que soit le nombre de communes)
+        
+        Args:
+            levels: Niveaux à recalculer (défaut: COMMUNE et DISTRICT)
             
-            if geo_data.exists():
-                avg_score = geo_data.aggregate(
-                    avg=Avg('accessibility_score')
-                )['avg']
-                return round(float(avg_score or 50.0), 2)
+        Returns:
+            Dict: Nombre de zones par niveau
+        """
+        from ..models import SocialProgramEligibility, AreaTargetingStats
+        from .budget_optimizer import ELIGIBLE_RECOMMENDATIONS
+        
+        stats = {}
+        now = timezone.now()
+        
+        for level in levels or list(self.AREA_LEVEL_FIELDS):
+            field = self.AREA_LEVEL_FIELDS[level]
+            person_field = f'person__{field}'
+            areas = {}
+            
+            # 1. Agrégats vulnérabilité (évaluations actives)
+            assessment_rows = (
+                VulnerabilityAssessment.objects
+                .filter(is_active=True, person__province__isnull=False)
+                .exclude(**{f'{person_field}__isnull': True})
+                .exclude(**{person_field: ''})
+                .order_by()
+                .values('person__province', person_field)
+                .annotate(
+                    total=Count('id'),
+                    critical=Count('id', filter=Q(risk_level='CRITICAL')),
+                    high=Count('id', filter=Q(risk_level='HIGH')),
+                    avg_score=Avg('vulnerability_score')
+                )
+            )
+            for row in assessment_rows:
+                areas[(row['person__province'], row[person_field])] = {
+                    'total': row['total'],
+                    'critical': row['critical'],
+                    'high': row['high'],
+                    'avg_score': float(row['avg_score'] or 0),
+                    'eligible': {}
+                }
             
-            return self._estimate_accessibility_from_zone(province)
+            # 2. Éligibles recommandés par programme
+            eligibility_rows = (
+                SocialProgramEligibility.objects
+                .filter(
+                    recommendation_level__in=ELIGIBLE_RECOMMENDATIONS,
+                    person__province__isnull=False
+                )
+                .exclude(**{f'{person_field}__isnull': True})
+                .exclude(**{person_field: ''})
+                .order_by()
+                .values('person__province', person_field, 'program_code')
+                .annotate(count=Count('id'))
+            )
+            for row in eligibility_rows:
+                area = areas.setdefault(
+                    (row['person__province'], row[person_field]),
+                    {'total': 0, 'critical': 0, 'high': 0, 'avg_score': 0.0, 'eligible': {}}
+                )
+                area['eligible'][row['program_code']] = row['count']
+            
+            # 3. Accessibilité moyenne (données géographiques)
+            if level == 'COMMUNE':
+                accessibility = {
+                    (province, commune): score
+                    for province, communes in get_accessibility_aggregates()['communes'].items()
+                    for commune, score in communes.items()
+                }
+            else:
+                accessibility = {
+                    (row['province'], row[field]): float(row['avg'])
+                    for row in (
+                        GeographicData.objects
+                        .exclude(**{f'{field}__isnull': True})
+                        .order_by()
+                        .values('province', field)
+                        .annotate(avg=Avg('accessibility_score'))
+                    )
+                    if row['avg'] is not None
+                }
             
-        except Exception as e:
-            logger.error(f"Erreur calcul accessibilité province: {str(e)}")
-            return 50.0
+            objects = []
+            for (province, area_name), data in areas.items():
+                zone_key = self._get_zone_from_province(province)
+                vulnerable = data['critical'] + data['high']
+                rate = vulnerable / data['total'] * 100 if data['total'] else 0.0
+                access = accessibility.get(
+                    (province, area_name),
+                    self._estimate_accessibility_from_zone(province)
+                )
+                objects.append(AreaTargetingStats(
+                    level=level,
+                    province=province,
+                    area_name=area_name,
+                    priority_zone=zone_key,
+                    total_assessed=data['total'],
+                    critical_count=data['critical'],
+                    high_count=data['high'],
+                    vulnerable_count=vulnerable,
+                    vulnerability_rate=Decimal(str(round(rate, 2))),
+                    avg_vulnerability_score=Decimal(str(round(data['avg_score'], 2))),
+                    accessibility_score=Decimal(str(round(access, 2))),
+                    priority_score=Decimal(str(self._calculate_composite_priority_score(
+                        rate, vulnerable, access, zone_key
+                    ))),
+                    eligible_by_program=data['eligible'],
+                    refreshed_at=now
+                ))
+            
+            with transaction.atomic():
+                AreaTargetingStats.objects.filter(level=level).delete()
+                AreaTargetingStats.objects.bulk_create(objects, batch_size=1000)
+            stats[level] = len(objects)
+        
+        self.log_operation('area_statistics_refreshed', stats)
+        return stats
+
+    def _identify_priority_areas(
+        self,
+        level: str,
+        min_vulnerable_population: int,
+        min_vulnerability_rate: float,
+        province: str = None,
+        limit: int = None
+    ) -> List[Dict]:
+        """Classement communes/districts depuis la table précalculée (requête indexée)"""
+        from ..models import AreaTargetingStats
+        
+        if level not in self.AREA_LEVEL_FIELDS:
+            raise ValueError(f"Niveau {level} invalide")
+        
+        queryset = AreaTargetingStats.objects.filter(
+            level=level,
+            total_assessed__gte=min_vulnerable_population,
+            vulnerability_rate__gte=min_vulnerability_rate
+        ).order_by('-priority_score', 'province', 'area_name')
+        if province:
+            queryset = queryset.filter(province=province)
+        if limit:
+            queryset = queryset[:limit]
+        
+        priority_areas = []
+        for area in queryset:
+            rate = float(area.vulnerability_rate)
+            priority_areas.append({
+                'level': level,
+                'area_name': area.area_name,
+                'province': area.province,
+                'priority_zone': area.priority_zone,
+                'zone_classification': self.ZONE_PRIORITY_MAPPING[area.priority_zone]['name'],
+                'total_population': area.total_assessed,
+                'vulnerable_population': area.vulnerable_count,
+                'vulnerability_rate': rate,
+                'accessibility_score': float(area.accessibility_score),
+                'priority_score': float(area.priority_score),
+                'estimated_intervention_cost': (
+                    area.vulnerable_count * self._get_intervention_cost(area.priority_zone)
+                ),
+                'recommended_programs': self._recommend_programs_for_zone(area.province, rate),
+                'stats_refreshed_at': area.refreshed_at.isoformat()
+            })
+        
+        self.log_operation(
+            'priority_zones_identified',
+            {
+                'level': level,
+                'zones_count': len(priority_areas),
+                'min_vulnerable_pop': min_vulnerable_population,
+                'min_vulnerability_rate': min_vulnerability_rate
+            }
+        )
+        
+        return priority_areas
+
+    def _deployment_candidates(self, program_code: str, level: str):
+        """
+        Zones candidates d'un programme: province, nom de zone, éligibles
+        et taux de vulnérabilité (lecture unique de la table pour commune/district)
+        """
+        from ..models import AreaTargetingStats
+        
+        if level == 'PROVINCE':
+            for province in self._get_all_provinces():
+                eligible_count = self._count_eligible_beneficiaries(program_code, province)
+                if eligible_count:
+                    yield {
+                        'province': province,
+                        'area_name': province,
+                        'eligible_count': eligible_count,
+                        'vulnerability_rate': self._get_province_vulnerability_rate(province)
+                    }
+            return
+        
+        if level not in self.AREA_LEVEL_FIELDS:
+            raise ValueError(f"Niveau {level} invalide")
+        
+        rows = AreaTargetingStats.objects.filter(level=level).values_list(
+            'province', 'area_name', 'vulnerability_rate', 'eligible_by_program'
+        )
+        for province, area_name, rate, eligible_by_program in rows:
+            eligible_count = eligible_by_program.get(program_code, 0)
+            if eligible_count:
+                yield {
+                    'province': province,
+                    'area_name': area_name,
+                    'eligible_count': eligible_count,
+                    'vulnerability_rate': float(rate)
+                }
+
+    # ===================================================================
+    # MÉTHODES PRIVÉES - UTILITAIRES
+    # ===================================================================
+
+    def _build_intervention_cost_analysis(
+        self,
+        province: str,
+        beneficiary_count: int,
+        program_duration_months: int,
+        monthly_benefit: float,
+        custom_operational_cost: float = None
+    ) -> Dict:
+        """Détail coûts intervention (calcul pur, sans journalisation)"""
+        zone_key = self._get_zone_from_province(province)
+        
+        # Coût opérationnel (logistique, déploiement, suivi)
+        # Utilise coût personnalisé si fourni, sinon coût configuré/défaut
+        operational_cost_per_person = (
+            custom_operational_cost if custom_operational_cost is not None
+            else self.intervention_costs.get(zone_key, self.DEFAULT_INTERVENTION_COSTS[zone_key])
+        )
+        
+        # Coût total bénéfices (transferts directs)
+        total_benefits = beneficiary_count * monthly_benefit * program_duration_months
+        
+        # Coût total opérationnel
+        total_operational = beneficiary_count * operational_cost_per_person
+        
+        # Coût total programme
+        total_cost = total_benefits + total_operational
+        
+        # Coût par bénéficiaire
+        cost_per_beneficiary = total_cost / beneficiary_count if beneficiary_count > 0 else 0
+        
+        # Ratio efficacité (% du budget qui va directement aux bénéficiaires)
+        efficiency_ratio = (total_benefits / total_cost * 100) if total_cost > 0 else 0
+        
+        return {
+            'province': province,
+            'priority_zone': zone_key,
+            'beneficiary_count': beneficiary_count,
+            'program_duration_months': program_duration_months,
+            'monthly_benefit_fcfa': monthly_benefit,
+            'costs': {
+                'operational_cost_per_person': operational_cost_per_person,
+                'total_operational': total_operational,
+                'total_benefits': total_benefits,
+                'total_program_cost': total_cost,
+                'cost_per_beneficiary': cost_per_beneficiary
+            },
+            'efficiency_ratio': round(efficiency_ratio, 2),
+            'cost_customized': custom_operational_cost is not None
+        }
+
+    def _get_intervention_cost(self, zone_key: str) -> float:
+        """Coût d'intervention par personne d'une zone (configuré ou défaut)"""
+        return self.intervention_costs.get(zone_key, self.DEFAULT_INTERVENTION_COSTS[zone_key])
+
+    def _calculate_province_accessibility(self, province: str) -> float:
+        """Score accessibilité moyen d'une province"""
+        return self.get_snapshot().province_accessibility(province)
 
     def _estimate_accessibility_from_zone(self, province: str) -> float:
         """Estime accessibilité selon zone prioritaire"""
@@ -1028,42 +947,11 @@ class GeotargetingService(BaseService):
         province: str
     ) -> int:
         """Compte bénéficiaires éligibles dans une province"""
-        try:
-            from ..models import SocialProgramEligibility
-            
-            count = SocialProgramEligibility.objects.filter(
-                program_code=program_code,
-                person__province=province,
-                recommendation_level__in=['HIGHLY_RECOMMENDED', 'RECOMMENDED']
-            ).count()
-            
-            return count
-            
-        except Exception as e:
-            logger.error(f"Erreur comptage bénéficiaires: {str(e)}")
-            return 0
+        return self.get_snapshot().eligible_count(program_code, province)
 
     def _get_province_vulnerability_rate(self, province: str) -> float:
         """Retourne taux vulnérabilité d'une province"""
-        try:
-            assessments = VulnerabilityAssessment.objects.filter(
-                person__province=province,
-                is_active=True
-            )
-            
-            total = assessments.count()
-            if total == 0:
-                return 0.0
-            
-            vulnerable = assessments.filter(
-                risk_level__in=['CRITICAL', 'HIGH']
-            ).count()
-            
-            return round(vulnerable / total * 100, 2)
-            
-        except Exception as e:
-            logger.error(f"Erreur calcul taux vulnérabilité: {str(e)}")
-            return 0.0
+        return self.get_snapshot().vulnerability_rate(province)
 
     def _optimize_budget_allocation(
         self,
@@ -1071,46 +959,23 @@ class GeotargetingService(BaseService):
         available_budget: float
     ) -> Dict:
         """
-        Optimise allocation budget entre provinces
-        Algorithme glouton basé sur ROI social
+        Optimise allocation budget entre provinces (sac à dos borné)
+        à partir de données déjà agrégées par province
         """
-        allocated = {}
-        remaining_budget = available_budget
-        
-        # Trier provinces par ROI (coût/impact)
-        sorted_provinces = sorted(
-            beneficiaries_by_province.items(),
-            key=lambda x: x[1]['cost_per_beneficiary'] / x[1]['intervention_multiplier']
+        provinces = list(beneficiaries_by_province)
+        matrix = AllocationMatrix(
+            provinces=provinces,
+            program_codes=['_'],
+            eligible=[beneficiaries_by_province[p]['eligible_count'] for p in provinces],
+            cost=[beneficiaries_by_province[p]['cost_per_beneficiary'] for p in provinces],
+            weight=[beneficiaries_by_province[p]['intervention_multiplier'] for p in provinces],
+            zones={p: beneficiaries_by_province[p]['priority_zone'] for p in provinces},
         )
-        
-        for province, data in sorted_provinces:
-            if remaining_budget <= 0:
-                break
-            
-            # Calculer combien de bénéficiaires peuvent être couverts
-            affordable_count = int(remaining_budget / data['cost_per_beneficiary'])
-            actual_count = min(affordable_count, data['eligible_count'])
-            
-            if actual_count > 0:
-                allocated_cost = actual_count * data['cost_per_beneficiary']
-                
-                allocated[province] = {
-                    'beneficiaries_covered': actual_count,
-                    'total_eligible': data['eligible_count'],
-                    'coverage_rate': round(actual_count / data['eligible_count'] * 100, 2),
-                    'allocated_budget': allocated_cost,
-                    'priority_zone': data['priority_zone']
-                }
-                
-                remaining_budget -= allocated_cost
-        
-        return {
-            'provinces': allocated,
-            'total_beneficiaries_covered': sum(p['beneficiaries_covered'] for p in allocated.values()),
-            'total_budget_allocated': available_budget - remaining_budget,
-            'budget_remaining': remaining_budget,
-            'provinces_covered': len(allocated)
-        }
+        plan = BudgetOptimizer(matrix).solve(available_budget)
+        plan.pop('programs')
+        for data in plan['provinces'].values():
+            data.pop('by_program')
+        return plan
 
     def _generate_geographic_recommendations(
         self,
@@ -1190,20 +1055,14 @@ class GeotargetingService(BaseService):
             Dict: Statistiques déploiement
         """
         try:
-            from ..models import SocialProgramEligibility
-            
-            queryset = SocialProgramEligibility.objects.filter(
-                recommendation_level__in=['HIGHLY_RECOMMENDED', 'RECOMMENDED']
-            )
-            
-            if program_code:
-                queryset = queryset.filter(program_code=program_code)
+            snapshot = self.get_snapshot()
+            eligible_by_province = snapshot.eligible_by_province(program_code)
             
             # Statistiques par province
             province_stats = {}
             
             for province in self._get_all_provinces():
-                count = queryset.filter(person__province=province).count()
+                count = eligible_by_province.get(province, 0)
                 
                 if count == 0:
                     continue
@@ -1214,10 +1073,7 @@ class GeotargetingService(BaseService):
                     'eligible_count': count,
                     'priority_zone': zone_key,
                     'zone_name': self.ZONE_PRIORITY_MAPPING[zone_key]['name'],
-                    'intervention_cost_per_person': self.intervention_costs.get(
-                        zone_key,
-                        self.DEFAULT_INTERVENTION_COSTS[zone_key]
-                    )
+                    'intervention_cost_per_person': snapshot.costs[zone_key]
                 }
             
             # Statistiques par zone
@@ -1238,10 +1094,7 @@ class GeotargetingService(BaseService):
                         'zone_name': self.ZONE_PRIORITY_MAPPING[zone_key]['name'],
                         'provinces': provinces_in_zone,
                         'total_eligible': total_eligible,
-                        'avg_cost_per_person': self.intervention_costs.get(
-                            zone_key,
-                            self.DEFAULT_INTERVENTION_COSTS[zone_key]
-                        )
+                        'avg_cost_per_person': snapshot.costs[zone_key]
                     }
             
             result = {
@@ -1275,50 +1128,45 @@ class GeotargetingService(BaseService):
         """
         Compare différents scénarios de déploiement
         
+        La matrice éligibles × coûts est chargée une seule fois puis
+        partagée par tous les scénarios (aucune requête par scénario).
+        
         Args:
             program_code: Code du programme
             scenarios: Liste scénarios avec budget et provinces
                       Exemple: [
                           {'name': 'Scenario A', 'budget': 100000000, 'provinces': ['NYANGA']},
-                          {'name': 'Scenario B', 'budget': 150000000, 'provinces': ['NYANGA', 'OGOOUE_LOLO']}
+                          {'name': 'Scenario B', 'budget': 150000000, 'provinces': ['NYANGA', 'OGOOUE_LOLO'],
+                           'min_coverage_rate': 0.2}
                       ]
             
         Returns:
             Dict: Comparaison détaillée scénarios
         """
         try:
-            program = SocialProgram.objects.get(code=program_code)
+            matrix = AllocationMatrix.load(self, [program_code])
+            optimizer = BudgetOptimizer(matrix)
+            total_eligible = matrix.total_eligible()
             
             scenario_results = []
             
-            for scenario in scenarios:
-                # Optimiser déploiement pour ce scénario
-                deployment = self.optimize_program_deployment(
-                    program_code=program_code,
-                    available_budget=Decimal(str(scenario['budget'])),
-                    target_provinces=scenario.get('provinces')
-                )
-                
-                # Calculer métriques clés
-                plan = deployment['deployment_plan']
-                
+            for scenario, plan in zip(scenarios, optimizer.solve_scenarios(scenarios)):
                 scenario_results.append({
                     'scenario_name': scenario['name'],
                     'budget': scenario['budget'],
-                    'target_provinces': scenario.get('provinces', 'Toutes'),
+                    'target_provinces': scenario.get('provinces') or 'Toutes',
                     'beneficiaries_covered': plan['total_beneficiaries_covered'],
                     'budget_allocated': plan['total_budget_allocated'],
                     'budget_remaining': plan['budget_remaining'],
                     'provinces_covered': plan['provinces_covered'],
+                    'weighted_impact': plan['weighted_impact'],
                     'coverage_rate': round(
-                        plan['total_beneficiaries_covered'] / 
-                        sum(self._count_eligible_beneficiaries(program_code, p) 
-                            for p in self._get_all_provinces()) * 100, 2
-                    ) if sum(self._count_eligible_beneficiaries(program_code, p) 
-                            for p in self._get_all_provinces()) > 0 else 0,
+                        plan['total_beneficiaries_covered'] / total_eligible * 100, 2
+                    ) if total_eligible > 0 else 0,
                     'cost_per_beneficiary': round(
                         plan['total_budget_allocated'] / plan['total_beneficiaries_covered'], 2
-                    ) if plan['total_beneficiaries_covered'] > 0 else 0
+                    ) if plan['total_beneficiaries_covered'] > 0 else 0,
+                    'deployment_plan': plan
                 })
             
             # Identifier meilleur scénario (ROI)
@@ -1329,7 +1177,7 @@ class GeotargetingService(BaseService):
             
             result = {
                 'program_code': program_code,
-                'program_name': program.name,
+                'program_name': matrix.programs[program_code].name,
                 'scenarios': scenario_results,
                 'best_scenario': best_scenario['scenario_name'],
                 'comparison_date': timezone.now().isoformat()
@@ -1345,9 +1193,6 @@ class GeotargetingService(BaseService):
             
             return result
             
-        except SocialProgram.DoesNotExist:
-            logger.error(f"Programme {program_code} introuvable")
-            raise ValueError(f"Programme {program_code} introuvable")
         except Exception as e:
             logger.error(f"Erreur comparaison scénarios: {str(e)}")
             raise
@@ -1389,4 +1234,74 @@ class GeotargetingService(BaseService):
             
         except Exception as e:
             logger.error(f"Erreur récupération coûts: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+    # ===================================================================
+    # RECHERCHE SPATIALE (index geohash, sans PostGIS)
+    # ===================================================================
+
+    def find_households_within_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        queryset=None
+    ) -> List[Dict]:
+        """
+        Ménages situés à moins de `radius_km` d'un point
+
+        Args:
+            latitude, longitude: Centre de recherche
+            radius_km: Rayon en kilomètres
+            queryset: Ménages à considérer (défaut: tous les ménages actifs)
+
+        Returns:
+            List[Dict]: Ménages triés par distance croissante
+        """
+        from apps.identity_app.services import spatial_index
+
+        results = spatial_index.within_radius(
+            self._spatial_household_queryset(queryset), latitude, longitude, radius_km
+        )
+        return [self._format_spatial_household(h, d) for h, d in results]
+
+    def find_nearest_households(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 10,
+        queryset=None
+    ) -> List[Dict]:
+        """
+        k ménages les plus proches d'un point
+
+        Returns:
+            List[Dict]: Au plus k ménages triés par distance croissante
+        """
+        from apps.identity_app.services import spatial_index
+
+        results = spatial_index.nearest(
+            self._spatial_household_queryset(queryset), latitude, longitude, k
+        )
+        return [self._format_spatial_household(h, d) for h, d in results]
+
+    def _spatial_household_queryset(self, queryset=None):
+        from apps.identity_app.models import Household
+
+        if queryset is None:
+            queryset = Household.objects.filter(is_active=True)
+        return queryset.only(
+            'id', 'household_id', 'province', 'latitude', 'longitude',
+            'geohash', 'household_size', 'vulnerability_score'
+        )
+
+    def _format_spatial_household(self, household, distance_km: float) -> Dict:
+        return {
+            'id': str(household.id),
+            'household_id': household.household_id,
+            'province': household.province,
+            'latitude': float(household.latitude),
+            'longitude': float(household.longitude),
+            'household_size': household.household_size,
+            'vulnerability_score': household.vulnerability_score,
+            'distance_km': round(distance_km, 3),
+        }
@@ -0,0 +1,185 @@
+# ===================================================================
+# RSU GABON - SERVICE TUILES CARTE DE CHALEUR VULNÉRABILITÉ
+# Agrégation par cellule geohash, plusieurs niveaux de zoom
+# ===================================================================
+
+"""
+Carte de chaleur nationale de la vulnérabilité.
+
+Les évaluations actives (la plus récente par personne) sont agrégées par
+cellule geohash à plusieurs précisions, puis regroupées en tuiles stockées
+(VulnerabilityHeatmapTile) avec leur ETag. Le dashboard lit les tuiles
+sans jamais recevoir de coordonnées individuelles.
+"""
+
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from utils.geo import geohash_bounds
+from ..models import VulnerabilityAssessment, VulnerabilityHeatmapTile
+from .base_service import BaseService
+
+logger = logging.getLogger(__name__)
+
+
+class HeatmapTileService(BaseService):
+    """
+    Précalcul et lecture des tuiles de carte de chaleur
+
+    Usage:
+        HeatmapTileService().refresh_tiles()        # tâche planifiée
+        tile = HeatmapTileService().get_tile(2, 's0')
+    """
+
+    # Zoom → (précision des cellules, précision du préfixe de tuile)
+    # Précision 3 ≈ 156 km, 4 ≈ 39 km, 5 ≈ 4,9 km, 6 ≈ 1,2 km
+    ZOOM_LEVELS = {
+        1: (3, 1),
+        2: (4, 2),
+        3: (5, 3),
+        4: (6, 4),
+    }
+
+    # Cellules sous ce seuil non publiées (protection des données individuelles)
+    MIN_CELL_COUNT = 3
+
+    CELL_FIELDS = ['cell', 'count', 'avg_score', 'max_score', 'critical', 'high']
+
+    def _latest_scores(self):
+        """
+        Dernière évaluation active de chaque personne géolocalisée
+
+        Yields:
+            tuple: (geohash, score, risk_level)
+        """
+        rows = (
+            VulnerabilityAssessment.objects
+            .filter(is_active=True, person__geohash__isnull=False)
+            .order_by('person_id', '-assessment_date')
+            .values_list('person_id', 'person__geohash', 'vulnerability_score', 'risk_level')
+        )
+        previous = None
+        for person_id, geohash, score, risk_level in rows.iterator(chunk_size=5000):
+            if person_id == previous:
+                continue
+            previous = person_id
+            yield geohash, float(score), risk_level
+
+    def build_tiles(self) -> Dict:
+        """
+        Agrège toutes les évaluations en tuiles (aucune écriture)
+
+        Returns:
+            Dict: {(zoom, tile_key): payload}
+        """
+        # cellules[zoom][cellule] = [count, somme, max, critical, high]
+        cells = {zoom: defaultdict(lambda: [0, 0.0, 0.0, 0, 0]) for zoom in self.ZOOM_LEVELS}
+
+        for geohash, score, risk_level in self._latest_scores():
+            for zoom, (cell_precision, _) in self.ZOOM_LEVELS.items():
+                stats = cells[zoom][geohash[:cell_precision]]
+                stats[0] += 1
+                stats[1] += score
+                stats[2] = max(stats[2], score)
+                stats[3] += risk_level == 'CRITICAL'
+                stats[4] += risk_level == 'HIGH'
+
+        tiles = {}
+        for zoom, (_, tile_precision) in self.ZOOM_LEVELS.items():
+            grouped = defaultdict(list)
+            for cell, (count, total, maximum, critical, high) in sorted(cells[zoom].items()):
+                if count < self.MIN_CELL_COUNT:
+                    continue
+                grouped[cell[:tile_precision]].append(
+                    [cell, count, round(total / count, 2), round(maximum, 2), critical, high]
+                )
+            for tile_key, rows in grouped.items():
+                tiles[(zoom, tile_key)] = {
+                    'zoom': zoom,
+                    'tile': tile_key,
+                    'bbox': geohash_bounds(tile_key),
+                    'fields': self.CELL_FIELDS,
+                    'rows': rows,
+                }
+        return tiles
+
+    @staticmethod
+    def compute_etag(payload: Dict) -> str:
+        content = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    @transaction.atomic
+    def refresh_tiles(self) -> Dict[str, int]:
+        """
+        Régénère les tuiles stockées; les tuiles inchangées gardent leur ETag
+
+        Returns:
+            Dict: {'created', 'updated', 'unchanged', 'deleted'}
+        """
+        tiles = self.build_tiles()
+        existing = {
+            (tile.zoom, tile.tile_key): tile
+            for tile in VulnerabilityHeatmapTile.objects.all()
+        }
+        now = timezone.now()
+        stats = {'created': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+        to_create, to_update = [], []
+
+        for key, payload in tiles.items():
+            etag = self.compute_etag(payload)
+            counts = {
+                'cell_count': len(payload['rows']),
+                'person_count': sum(row[1] for row in payload['rows']),
+            }
+            tile = existing.pop(key, None)
+            if tile is None:
+                to_create.append(VulnerabilityHeatmapTile(
+                    zoom=key[0], tile_key=key[1], payload=payload,
+                    etag=etag, generated_at=now, **counts
+                ))
+            elif tile.etag != etag:
+                tile.payload, tile.etag, tile.generated_at = payload, etag, now
+                tile.cell_count, tile.person_count = counts['cell_count'], counts['person_count']
+                to_update.append(tile)
+            else:
+                stats['unchanged'] += 1
+
+        VulnerabilityHeatmapTile.objects.bulk_create(to_create, batch_size=500)
+        VulnerabilityHeatmapTile.objects.bulk_update(
+            to_update,
+            ['payload', 'etag', 'generated_at', 'cell_count', 'person_count'],
+            batch_size=500
+        )
+        if existing:
+            VulnerabilityHeatmapTile.objects.filter(
+                pk__in=[tile.pk for tile in existing.values()]
+            ).delete()
+
+        stats.update(created=len(to_create), updated=len(to_update), deleted=len(existing))
+        self.log_operation('heatmap_tiles_refreshed', stats)
+        return stats
+
+    def list_tiles(self, zoom: int) -> List[Dict]:
+        """Index des tuiles d'un niveau (sans contenu)"""
+        return [
+            {
+                'tile': tile['tile_key'],
+                'bbox': geohash_bounds(tile['tile_key']),
+                'etag': tile['etag'],
+                'cell_count': tile['cell_count'],
+                'person_count': tile['person_count'],
+                'generated_at': tile['generated_at'].isoformat(),
+            }
+            for tile in VulnerabilityHeatmapTile.objects.filter(zoom=zoom).values(
+                'tile_key', 'etag', 'cell_count', 'person_count', 'generated_at'
+            )
+        ]
+
+    def get_tile(self, zoom: int, tile_key: str) -> Optional[VulnerabilityHeatmapTile]:
+        return VulnerabilityHeatmapTile.objects.filter(zoom=zoom, tile_key=tile_key).first()
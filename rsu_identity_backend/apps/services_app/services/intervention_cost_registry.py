@@ -0,0 +1,148 @@
+# ===================================================================
+# RSU GABON - REGISTRE DES COÛTS D'INTERVENTION
+# Cache partagé, rafraîchissement unique (single-flight) et anticipé
+# ===================================================================
+
+"""
+Coûts d'intervention par zone (GeographicInterventionCost).
+
+Tous les workers lisent la même entrée du cache Django. L'entrée porte une
+date de rafraîchissement anticipé (80 % de sa durée de vie) : le premier
+worker qui la dépasse prend un verrou (cache.add, atomique) et recharge la
+table pendant que les autres continuent de servir la valeur encore valide.
+Sur cache vide, un seul worker interroge la base ; les autres attendent
+brièvement son résultat au lieu de recharger en parallèle.
+
+Les écritures passent par la table ; les signaux post_save / post_delete
+rechargent le registre après commit (voir ..signals).
+"""
+
+import logging
+import time
+import uuid
+from typing import Dict, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
+class InterventionCostRegistry:
+    """
+    Accès aux coûts d'intervention configurés
+
+    Usage:
+        costs = get_cost_registry().get_costs()
+        get_cost_registry().set_cost('ZONE_1', 175000, updated_by=user)
+    """
+
+    CACHE_KEY = 'intervention_costs'
+    LOCK_KEY = 'intervention_costs:refresh_lock'
+
+    TTL = 3600
+    EARLY_REFRESH_RATIO = 0.8
+    LOCK_TIMEOUT = 30
+
+    # Attente du worker qui recharge (cache vide uniquement)
+    WAIT_ATTEMPTS = 20
+    WAIT_INTERVAL = 0.05
+
+    def __init__(self, defaults: Dict[str, float]):
+        self.defaults = dict(defaults)
+
+    def get_costs(self) -> Dict[str, float]:
+        """Coûts par zone (défauts complétés par la configuration en base)"""
+        entry = self._cached_entry()
+
+        if entry is not None:
+            if time.time() >= entry['refresh_at']:
+                # Rafraîchissement anticipé par un seul worker
+                token = self._acquire_lock()
+                if token:
+                    try:
+                        entry = self.refresh()
+                    finally:
+                        self._release_lock(token)
+            return dict(entry['costs'])
+
+        token = self._acquire_lock()
+        if token:
+            try:
+                return dict(self.refresh()['costs'])
+            finally:
+                self._release_lock(token)
+
+        # Un autre worker recharge : attendre son résultat
+        for _ in range(self.WAIT_ATTEMPTS):
+            time.sleep(self.WAIT_INTERVAL)
+            entry = self._cached_entry()
+            if entry is not None:
+                return dict(entry['costs'])
+
+        logger.warning("Registre coûts: verrou non libéré, lecture directe en base")
+        return self._load_from_database()
+
+    def refresh(self) -> Dict:
+        """Recharge la table et remplace l'entrée du cache"""
+        entry = {
+            'costs': self._load_from_database(),
+            'refresh_at': time.time() + self.TTL * self.EARLY_REFRESH_RATIO,
+        }
+        cache.set(self.CACHE_KEY, entry, self.TTL)
+        return entry
+
+    @transaction.atomic
+    def set_cost(self, zone_key: str, cost_per_person: float, updated_by=None):
+        """Enregistre le coût d'une zone (le signal recharge le registre)"""
+        from ..models import GeographicInterventionCost
+
+        cost, _ = GeographicInterventionCost.objects.update_or_create(
+            zone_key=zone_key,
+            defaults={
+                'cost_per_person': cost_per_person,
+                'last_updated_by': updated_by,
+                'is_active': True,
+            }
+        )
+        return cost
+
+    def _load_from_database(self) -> Dict[str, float]:
+        from ..models import GeographicInterventionCost
+
+        costs = dict(self.defaults)
+        configured = GeographicInterventionCost.objects.filter(
+            is_active=True
+        ).values_list('zone_key', 'cost_per_person')
+        for zone_key, cost_per_person in configured:
+            costs[zone_key] = float(cost_per_person)
+        return costs
+
+    def _cached_entry(self) -> Optional[Dict]:
+        entry = cache.get(self.CACHE_KEY)
+        # Ancien format (dict de coûts sans métadonnées) : considéré absent
+        if isinstance(entry, dict) and 'costs' in entry and 'refresh_at' in entry:
+            return entry
+        return None
+
+    def _acquire_lock(self) -> Optional[str]:
+        token = uuid.uuid4().hex
+        if cache.add(self.LOCK_KEY, token, self.LOCK_TIMEOUT):
+            return token
+        return None
+
+    def _release_lock(self, token: str):
+        if cache.get(self.LOCK_KEY) == token:
+            cache.delete(self.LOCK_KEY)
+
+
+_registry = None
+
+
+def get_cost_registry() -> InterventionCostRegistry:
+    """Registre du processus, initialisé avec les coûts par défaut du géotargeting"""
+    global _registry
+    if _registry is None:
+        from .geotargeting_service import GeotargetingService
+        _registry = InterventionCostRegistry(GeotargetingService.DEFAULT_INTERVENTION_COSTS)
+    return _registry
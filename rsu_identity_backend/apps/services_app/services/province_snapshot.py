@@ -0,0 +1,129 @@
+# ===================================================================
+# RSU GABON - INSTANTANÉ PROVINCIAL DU GÉOTARGETING
+# Une série de requêtes groupées par requête HTTP
+# ===================================================================
+
+"""
+Couche d'accès aux données du géotargeting.
+
+Toutes les méthodes publiques de GeotargetingService lisent les mêmes
+agrégats par province : distribution des évaluations, éligibles par
+programme, accessibilité et coûts d'intervention. L'instantané les charge
+une seule fois (une requête groupée par section, à la première lecture)
+et les conserve pour la durée de vie du service, c'est-à-dire la requête.
+"""
+
+import logging
+from functools import cached_property
+from typing import Dict, Optional
+
+from django.db.models import Avg, Count, Q
+
+from apps.identity_app.services.accessibility_cache import get_accessibility_aggregates
+from ..models import VulnerabilityAssessment, SocialProgramEligibility
+from .budget_optimizer import ELIGIBLE_RECOMMENDATIONS
+
+logger = logging.getLogger(__name__)
+
+
+class ProvinceSnapshot:
+    """
+    Agrégats par province mémorisés
+
+    Usage:
+        snapshot = service.get_snapshot()
+        snapshot.assessment_stats('NYANGA')['vulnerability_rate']
+        snapshot.eligible_count('PROG-2025', 'NYANGA')
+    """
+
+    def __init__(self, geotargeting_service):
+        self.service = geotargeting_service
+
+    @cached_property
+    def assessments(self) -> Dict[str, Dict]:
+        """Distribution des évaluations actives par province (1 requête)"""
+        rows = (
+            VulnerabilityAssessment.objects
+            .filter(is_active=True, person__province__isnull=False)
+            .order_by()
+            .values('person__province')
+            .annotate(
+                total=Count('id'),
+                critical=Count('id', filter=Q(risk_level='CRITICAL')),
+                high=Count('id', filter=Q(risk_level='HIGH')),
+                avg_score=Avg('vulnerability_score')
+            )
+        )
+        stats = {}
+        for row in rows:
+            vulnerable = row['critical'] + row['high']
+            stats[row['person__province']] = {
+                'total': row['total'],
+                'critical': row['critical'],
+                'high': row['high'],
+                'vulnerable': vulnerable,
+                'vulnerability_rate': vulnerable / row['total'] * 100 if row['total'] else 0.0,
+                'avg_score': float(row['avg_score'] or 0),
+            }
+        return stats
+
+    @cached_property
+    def eligibility(self) -> Dict[str, Dict[str, int]]:
+        """Éligibles recommandés par province et programme (1 requête)"""
+        counts = {}
+        rows = (
+            SocialProgramEligibility.objects
+            .filter(
+                recommendation_level__in=ELIGIBLE_RECOMMENDATIONS,
+                person__province__isnull=False
+            )
+            .order_by()
+            .values('person__province', 'program_code')
+            .annotate(count=Count('id'))
+            .values_list('person__province', 'program_code', 'count')
+        )
+        for province, program_code, count in rows:
+            counts.setdefault(province, {})[program_code] = count
+        return counts
+
+    @cached_property
+    def accessibility(self) -> Dict[str, float]:
+        """Accessibilité moyenne par province (cache partagé)"""
+        return get_accessibility_aggregates()['provinces']
+
+    @cached_property
+    def costs(self) -> Dict[str, float]:
+        """Coût d'intervention par personne de chaque zone"""
+        return {
+            zone_key: self.service._get_intervention_cost(zone_key)
+            for zone_key in self.service.ZONE_PRIORITY_MAPPING
+        }
+
+    def assessment_stats(self, province: str) -> Optional[Dict]:
+        return self.assessments.get(province)
+
+    def vulnerability_rate(self, province: str) -> float:
+        stats = self.assessments.get(province)
+        return round(stats['vulnerability_rate'], 2) if stats else 0.0
+
+    def eligible_count(self, program_code: str, province: str) -> int:
+        return self.eligibility.get(province, {}).get(program_code, 0)
+
+    def eligible_by_province(self, program_code: str = None) -> Dict[str, int]:
+        """Éligibles par province, tous programmes confondus si program_code absent"""
+        return {
+            province: (
+                counts.get(program_code, 0) if program_code else sum(counts.values())
+            )
+            for province, counts in self.eligibility.items()
+        }
+
+    def province_accessibility(self, province: str) -> float:
+        """Score moyen, estimé selon la zone prioritaire sans données"""
+        score = self.accessibility.get(province)
+        if score is None:
+            return self.service._estimate_accessibility_from_zone(province)
+        return score
+
+    def cost_for_province(self, province: str) -> float:
+        return self.costs[self.service._get_zone_from_province(province)]
@@ -0,0 +1,248 @@
+# ===================================================================
+# RSU GABON - MODÈLES DE SCORING VERSIONNÉS
+# Pondérations et seuils en base, compilés une fois par version
+# ===================================================================
+
+"""
+Pondérations des dimensions et seuils de niveau de risque (ScoringModel).
+
+La version en vigueur est lue dans le cache Django partagé par les
+workers, puis compilée une seule fois par processus en tables de lecture :
+paires (dimension, poids) dans l'ordre DIMENSIONS et seuils triés pour une
+recherche dichotomique. Changer de politique revient à créer et activer
+une version, sans déploiement ; chaque évaluation enregistre la version
+utilisée.
+
+Les signaux post_save / post_delete rechargent le registre après commit
+(voir ..signals).
+"""
+
+import bisect
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Politique initiale (version 1, créée par la migration 0005)
+DEFAULT_DIMENSION_WEIGHTS = {
+    'economic': 0.30,
+    'social': 0.25,
+    'geographic': 0.20,
+    'health': 0.15,
+    'education': 0.10,
+    'household_composition': 0.0,   # calculée et enregistrée, hors score global
+}
+DEFAULT_RISK_THRESHOLDS = {
+    'CRITICAL': 80,
+    'HIGH': 60,
+    'MODERATE': 40,
+}
+
+DIMENSIONS = tuple(DEFAULT_DIMENSION_WEIGHTS)
+
+# Niveaux par ordre croissant ; l'indice est le nombre de seuils atteints
+RISK_LEVELS = ('LOW', 'MODERATE', 'HIGH', 'CRITICAL')
+
+
+class CompiledScoringModel:
+    """
+    Version compilée en tables de lecture
+
+    Attributes:
+        pk, version: Ligne ScoringModel (None si aucune version en base)
+        weights, thresholds: Configuration complète
+        weight_vector: Poids dans l'ordre DIMENSIONS (numpy)
+        threshold_vector: Seuils MODERATE, HIGH, CRITICAL (numpy, croissants)
+    """
+
+    def __init__(self, weights: Dict[str, float], thresholds: Dict[str, float],
+                 pk=None, version: Optional[int] = None):
+        unknown = set(weights) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Dimension(s) inconnue(s): {', '.join(sorted(unknown))}")
+        unknown = set(thresholds) - set(RISK_LEVELS[1:])
+        if unknown:
+            raise ValueError(f"Seuil(s) inconnu(s): {', '.join(sorted(unknown))}")
+        missing = set(RISK_LEVELS[1:]) - set(thresholds)
+        if missing:
+            raise ValueError(f"Seuil(s) manquant(s): {', '.join(sorted(missing))}")
+
+        self.pk = pk
+        self.version = version
+        self.weights = {dimension: float(weights.get(dimension, 0)) for dimension in DIMENSIONS}
+        self.thresholds = {level: float(thresholds[level]) for level in RISK_LEVELS[1:]}
+
+        self._weight_pairs = tuple(self.weights.items())
+        self._threshold_steps = tuple(self.thresholds[level] for level in RISK_LEVELS[1:])
+        if any(weight < 0 for _, weight in self._weight_pairs):
+            raise ValueError("Les pondérations doivent être positives")
+        if list(self._threshold_steps) != sorted(self._threshold_steps):
+            raise ValueError("Les seuils doivent croître de MODERATE à CRITICAL")
+
+        # Dimensions de poids nul : enregistrées mais hors somme pondérée
+        self._scored_pairs = tuple(pair for pair in self._weight_pairs if pair[1])
+        self.weight_vector = np.array([weight for _, weight in self._weight_pairs])
+        self.threshold_vector = np.array(self._threshold_steps)
+
+    def global_score(self, dimension_scores: Dict[str, float]) -> float:
+        """Somme pondérée des dimensions"""
+        return sum(dimension_scores[dimension] * weight for dimension, weight in self._scored_pairs)
+
+    def risk_level(self, score: float) -> str:
+        """Niveau de risque : nombre de seuils atteints (score ≥ seuil)"""
+        return RISK_LEVELS[bisect.bisect_right(self._threshold_steps, score)]
+
+    def with_overrides(self, weights=None, thresholds=None) -> 'CompiledScoringModel':
+        """Variante non enregistrée (dimensions ou seuils omis : valeurs courantes)"""
+        return CompiledScoringModel(
+            {**self.weights, **(weights or {})},
+            {**self.thresholds, **(thresholds or {})},
+        )
+
+
+def compile_scoring_model(scoring_model) -> CompiledScoringModel:
+    """Compile une ligne ScoringModel (ValueError si configuration invalide)"""
+    return CompiledScoringModel(
+        scoring_model.dimension_weights or {},
+        scoring_model.risk_thresholds or {},
+        pk=scoring_model.pk,
+        version=scoring_model.version,
+    )
+
+
+class ScoringModelRegistry:
+    """
+    Accès à la version en vigueur
+
+    Usage:
+        model = get_scoring_registry().get_current()
+        level = model.risk_level(model.global_score(dimension_scores))
+        get_scoring_registry().create_version('Priorité rurale', weights, thresholds, activate=True)
+    """
+
+    CACHE_KEY = 'scoring_model:current'
+    TTL = 3600
+    VERSION_ATTEMPTS = 5
+
+    def __init__(self):
+        self._compiled = {}
+
+    def get_current(self) -> CompiledScoringModel:
+        """Version en vigueur (compilée une fois par version et par processus)"""
+        entry = cache.get(self.CACHE_KEY)
+        if entry is None:
+            entry = self.refresh()
+
+        # Une version sans évaluation reste modifiable : la clé couvre sa configuration
+        key = (
+            entry['pk'], entry['version'],
+            tuple(sorted(entry['weights'].items())), tuple(sorted(entry['thresholds'].items())),
+        )
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = CompiledScoringModel(
+                entry['weights'], entry['thresholds'], pk=entry['pk'], version=entry['version']
+            )
+            self._compiled = {key: compiled}
+        return compiled
+
+    def refresh(self) -> Dict:
+        """Relit la version en vigueur et remplace l'entrée du cache"""
+        from ..models import ScoringModel
+
+        current = ScoringModel.objects.filter(is_current=True).values(
+            'pk', 'version', 'dimension_weights', 'risk_thresholds'
+        ).first()
+        if current is None:
+            logger.warning("Aucun modèle de scoring en vigueur, pondérations par défaut")
+            entry = {
+                'pk': None, 'version': None,
+                'weights': DEFAULT_DIMENSION_WEIGHTS, 'thresholds': DEFAULT_RISK_THRESHOLDS,
+            }
+        else:
+            entry = {
+                'pk': current['pk'], 'version': current['version'],
+                'weights': current['dimension_weights'],
+                'thresholds': current['risk_thresholds'],
+            }
+        cache.set(self.CACHE_KEY, entry, self.TTL)
+        return entry
+
+    @transaction.atomic
+    def create_version(
+        self,
+        name: str,
+        weights: Dict[str, float],
+        thresholds: Dict[str, float],
+        created_by=None,
+        activate: bool = False,
+        notes: str = ''
+    ):
+        """Enregistre une nouvelle version (validée avant écriture)"""
+        from ..models import ScoringModel
+
+        CompiledScoringModel(weights, thresholds)
+        scoring_model = self.save_new_version(ScoringModel(
+            name=name,
+            dimension_weights=weights,
+            risk_thresholds=thresholds,
+            notes=notes,
+            created_by=created_by,
+        ))
+        if activate:
+            self.activate(scoring_model.version, activated_by=created_by)
+            scoring_model.refresh_from_db()
+        return scoring_model
+
+    def save_new_version(self, scoring_model):
+        """
+        Numérote et insère une nouvelle version
+
+        Deux créations simultanées lisent le même dernier numéro : la
+        contrainte unique sur `version` départage, la perdante renumérote.
+        """
+        from ..models import ScoringModel
+
+        for attempt in range(self.VERSION_ATTEMPTS):
+            last = ScoringModel.objects.aggregate(last=Max('version'))['last']
+            scoring_model.version = (last or 0) + 1
+            try:
+                with transaction.atomic():
+                    scoring_model.save(force_insert=True)
+                return scoring_model
+            except IntegrityError:
+                if attempt == self.VERSION_ATTEMPTS - 1:
+                    raise
+
+    @transaction.atomic
+    def activate(self, version: int, activated_by=None):
+        """Met une version en vigueur (le signal recharge le registre)"""
+        from ..models import ScoringModel
+
+        scoring_model = ScoringModel.objects.select_for_update().get(version=version)
+        compile_scoring_model(scoring_model)
+        ScoringModel.objects.filter(is_current=True).exclude(pk=scoring_model.pk).update(
+            is_current=False, updated_at=timezone.now()
+        )
+        scoring_model.is_current = True
+        scoring_model.activated_at = timezone.now()
+        scoring_model.updated_by = activated_by
+        scoring_model.save(update_fields=['is_current', 'activated_at', 'updated_by', 'updated_at'])
+        return scoring_model
+
+
+_registry = None
+
+
+def get_scoring_registry() -> ScoringModelRegistry:
+    """Registre du processus"""
+    global _registry
+    if _registry is None:
+        _registry = ScoringModelRegistry()
+    return _registry
@@ -0,0 +1,345 @@
+# ===================================================================
+# RSU GABON - MOTEUR DE SCORING VULNÉRABILITÉ
+# Noyaux par dimension appliqués à des lots de lignes (numpy)
+# ===================================================================
+
+"""
+Moteur unique des scores de vulnérabilité par dimension.
+
+Les données nécessaires (personne et ménage dirigé) sont lues en colonnes :
+ScoringRows.from_queryset() les charge par values_list() (une requête lue par
+blocs), ScoringRows.from_persons() les lit sur des instances déjà chargées.
+Chaque dimension est un noyau qui reçoit le lot et rend un vecteur de
+scores 0-100 ; le même code sert l'appel API d'une personne (lot d'une
+ligne) et les calculs de masse (simulateur, rescoring).
+
+Les valeurs absentes sont traitées explicitement (masques has_household,
+NaN) : aucun chemin de repli par exception.
+"""
+
+import logging
+from datetime import date
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from django.utils import timezone
+
+from .scoring_models import DIMENSIONS
+
+logger = logging.getLogger(__name__)
+
+# (colonne, champ PersonIdentity, type)
+PERSON_COLUMNS = (
+    ('person_id', 'pk', 'key'),
+    ('province', 'province', 'str'),
+    ('gender', 'gender', 'str'),
+    ('marital_status', 'marital_status', 'str'),
+    ('education_level', 'education_level', 'str'),
+    ('commune', 'commune', 'str'),
+    ('has_disability', 'has_disability', 'bool'),
+    ('latitude', 'latitude', 'float'),
+    ('longitude', 'longitude', 'float'),
+    ('distance_to_health_center', 'distance_to_health_center', 'float'),
+    ('distance_to_road', 'distance_to_road', 'float'),
+    ('birth_date', 'birth_date', 'date'),
+)
+
+# (colonne, champ Household du ménage dirigé, type)
+HOUSEHOLD_COLUMNS = (
+    ('household_id', 'pk', 'key'),
+    ('household_size', 'household_size', 'float'),
+    ('monthly_income', 'total_monthly_income', 'float'),
+    ('has_bank_account', 'has_bank_account', 'bool'),
+    ('housing_type', 'housing_type', 'str'),
+    ('water_access', 'water_access', 'str'),
+    ('electricity_access', 'electricity_access', 'str'),
+    ('has_disabled_members', 'has_disabled_members', 'bool'),
+    ('has_elderly_members', 'has_elderly_members', 'bool'),
+    ('has_children_under_5', 'has_children_under_5', 'bool'),
+    ('has_pregnant_women', 'has_pregnant_women', 'bool'),
+    ('members_under_15', 'members_under_15', 'float'),
+    ('members_15_64', 'members_15_64', 'float'),
+    ('members_over_64', 'members_over_64', 'float'),
+)
+
+HOUSEHOLD_PREFIX = 'headed_household__'
+
+
+class ScoringRows:
+    """
+    Lot de personnes en colonnes numpy
+
+    Colonnes dérivées : has_household, age (années révolues, NaN si
+    inconnue), dependency_ratio (même règle que Household.calculate_dependency_ratio).
+    """
+
+    def __init__(self, records: List[Dict], today: Optional[date] = None):
+        """
+        Args:
+            records: Une entrée par personne, clés = noms de colonnes
+            today: Date de référence des âges (défaut: aujourd'hui)
+        """
+        self.size = len(records)
+        self.columns = {}
+        for name, _, kind in PERSON_COLUMNS + HOUSEHOLD_COLUMNS:
+            self.columns[name] = self._column([record[name] for record in records], kind)
+
+        self.columns['has_household'] = np.array(
+            [record['household_id'] is not None for record in records], dtype=bool
+        )
+        self.columns['age'] = self._ages(self.columns['birth_date'], today or timezone.now().date())
+
+        active = self.columns['members_15_64']
+        dependents = self.columns['members_under_15'] + self.columns['members_over_64']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.round(dependents / active * 100, 2)
+        self.columns['dependency_ratio'] = np.where(active > 0, ratio, 0.0)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def lookups(cls) -> List[str]:
+        """Champs values() d'un queryset PersonIdentity"""
+        return [field for _, field, _ in PERSON_COLUMNS] + [
+            HOUSEHOLD_PREFIX + field for _, field, _ in HOUSEHOLD_COLUMNS
+        ]
+
+    @classmethod
+    def from_queryset(cls, queryset, chunk_size: int = 2000) -> Iterator['ScoringRows']:
+        """Lots successifs d'au plus chunk_size personnes (un seul curseur)"""
+        names = [name for name, _, _ in PERSON_COLUMNS + HOUSEHOLD_COLUMNS]
+        lookups = cls.lookups()
+        chunk = []
+        for values in queryset.values_list(*lookups).iterator(chunk_size=chunk_size):
+            chunk.append(dict(zip(names, values)))
+            if len(chunk) == chunk_size:
+                yield cls(chunk)
+                chunk = []
+        if chunk:
+            yield cls(chunk)
+
+    @classmethod
+    def from_persons(cls, persons: Iterable) -> 'ScoringRows':
+        """Lot construit sur des instances (ménage dirigé lu s'il n'est pas chargé)"""
+        records = []
+        for person in persons:
+            household = getattr(person, 'headed_household', None)
+            record = {name: getattr(person, field) for name, field, _ in PERSON_COLUMNS}
+            record.update({
+                name: getattr(household, field) if household is not None else None
+                for name, field, _ in HOUSEHOLD_COLUMNS
+            })
+            records.append(record)
+        return cls(records)
+
+    @staticmethod
+    def _column(values: List, kind: str) -> np.ndarray:
+        if kind == 'float':
+            return np.array([np.nan if v is None else float(v) for v in values], dtype=float)
+        if kind == 'bool':
+            return np.array([bool(v) for v in values], dtype=bool)
+        if kind == 'str':
+            return np.array(['' if v is None else str(v) for v in values], dtype=object)
+        return np.array(values, dtype=object)
+
+    @staticmethod
+    def _ages(birth_dates: np.ndarray, today: date) -> np.ndarray:
+        ages = np.full(len(birth_dates), np.nan)
+        for index, birth_date in enumerate(birth_dates):
+            if birth_date is None:
+                continue
+            if isinstance(birth_date, str):
+                birth_date = date.fromisoformat(birth_date)
+            ages[index] = today.year - birth_date.year - (
+                (today.month, today.day) < (birth_date.month, birth_date.day)
+            )
+        return ages
+
+
+# ===================================================================
+# NOYAUX PAR DIMENSION
+# ===================================================================
+
+DIMENSION_KERNELS: Dict[str, Callable[[ScoringRows], np.ndarray]] = {}
+
+
+def dimension_kernel(dimension: str):
+    """Enregistre le noyau d'une dimension de DIMENSIONS"""
+    if dimension not in DIMENSIONS:
+        raise ValueError(f"Dimension inconnue: {dimension}")
+
+    def register(kernel):
+        DIMENSION_KERNELS[dimension] = kernel
+        return kernel
+    return register
+
+
+def _points(condition, points) -> np.ndarray:
+    return np.where(condition, float(points), 0.0)
+
+
+@dimension_kernel('economic')
+def economic_kernel(rows: ScoringRows) -> np.ndarray:
+    """Revenus, revenu par tête, inclusion financière, logement, services"""
+    income = np.nan_to_num(rows['monthly_income'])
+    size = np.nan_to_num(rows['household_size'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        per_capita = np.where(size > 0, income / size, np.inf)
+
+    score = np.select([income < 50000, income < 100000, income < 300000], [40.0, 30.0, 15.0], 0.0)
+    score += np.select([per_capita < 20000, per_capita < 50000], [20.0, 10.0], 0.0)
+    score += _points(~rows['has_bank_account'], 15)
+    score += _points(np.isin(rows['housing_type'], ['RENTED', 'INFORMAL', 'HOSTED']), 10)
+    score += _points(np.isin(rows['water_access'], ['VENDOR', 'NONE']), 10)
+    score += _points(rows['electricity_access'] == 'NONE', 5)
+
+    # Sans ménage renseigné : score moyen
+    return np.where(rows['has_household'], np.minimum(score, 100.0), 50.0)
+
+
+@dimension_kernel('social')
+def social_kernel(rows: ScoringRows) -> np.ndarray:
+    """Isolement, charge familiale, membres vulnérables, handicap"""
+    household = rows['has_household']
+    ratio = rows['dependency_ratio']
+
+    score = _points(np.isin(rows['marital_status'], ['SINGLE', 'DIVORCED', 'WIDOW']), 15)
+    score += _points(
+        household & (rows['gender'] == 'F') & (np.nan_to_num(rows['household_size']) > 3), 20
+    )
+    score += _points(household & rows['has_disabled_members'], 15)
+    score += _points(household & rows['has_elderly_members'], 10)
+    score += _points(household & rows['has_children_under_5'], 10)
+    score += np.where(household, np.select([ratio > 100, ratio > 50], [15.0, 10.0], 0.0), 0.0)
+    score += _points(rows['has_disability'], 20)
+    return np.minimum(score, 100.0)
+
+
+ISOLATED_PROVINCES = ['NYANGA', 'OGOOUE_LOLO', 'OGOOUE_IVINDO']
+MODERATE_PROVINCES = ['NGOUNIE', 'WOLEU_NTEM', 'HAUT_OGOOUE']
+
+
+@dimension_kernel('geographic')
+def geographic_kernel(rows: ScoringRows) -> np.ndarray:
+    """Province, milieu rural, géolocalisation, distances précalculées"""
+    commune = np.char.upper(rows['commune'].astype(str))
+    latitude, longitude = rows['latitude'], rows['longitude']
+    health_center, road = rows['distance_to_health_center'], rows['distance_to_road']
+
+    score = _points(np.isin(rows['province'], ISOLATED_PROVINCES), 40)
+    score += _points(np.isin(rows['province'], MODERATE_PROVINCES), 25)
+    score += _points(np.char.find(commune, 'RURAL') >= 0, 20)
+    # Coordonnées absentes ou nulles
+    score += _points(
+        np.isnan(latitude) | np.isnan(longitude) | (latitude == 0) | (longitude == 0), 15
+    )
+    score += np.select([health_center >= 20, health_center >= 10], [15.0, 8.0], 0.0)
+    score += _points(road >= 10, 10)
+    return np.minimum(score, 100.0)
+
+
+@dimension_kernel('health')
+def health_kernel(rows: ScoringRows) -> np.ndarray:
+    """Handicap, âge, membres du ménage à besoins de santé"""
+    age = rows['age']
+    household = rows['has_household']
+
+    score = _points(rows['has_disability'], 30)
+    score += _points((age < 5) | (age > 65), 20)
+    score += _points(household & rows['has_disabled_members'], 15)
+    score += _points(household & rows['has_elderly_members'], 10)
+    score += _points(household & rows['has_pregnant_women'], 15)
+    return np.minimum(score, 100.0)
+
+
+@dimension_kernel('education')
+def education_kernel(rows: ScoringRows) -> np.ndarray:
+    """Niveau d'éducation, rattrapage impossible après 25 ans"""
+    low_education = np.isin(rows['education_level'], ['NONE', 'INCOMPLETE_PRIMARY'])
+
+    score = np.select(
+        [low_education, rows['education_level'] == 'PRIMARY', rows['education_level'] == 'SECONDARY'],
+        [40.0, 30.0, 15.0],
+        0.0
+    )
+    score += _points(low_education & (rows['age'] > 25), 20)
+    return np.minimum(score, 100.0)
+
+
+@dimension_kernel('household_composition')
+def household_composition_kernel(rows: ScoringRows) -> np.ndarray:
+    """Taille du ménage, part de dépendants, profil du chef, handicap"""
+    size = np.nan_to_num(rows['household_size'])
+    dependents = rows['members_under_15'] + rows['members_over_64']
+    age = rows['age']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dependent_share = np.where(size > 0, dependents / size, 0.0)
+
+    score = np.select([size >= 8, size >= 6, size >= 4, size <= 1], [30.0, 25.0, 15.0, 20.0], 0.0)
+    score += np.select(
+        [dependent_share >= 0.7, dependent_share >= 0.5, dependent_share >= 0.3], [30.0, 20.0, 10.0], 0.0
+    )
+    # Chef de ménage : la personne évaluée
+    score += _points(rows['gender'] == 'F', 10)
+    score += _points(age >= 65, 15)
+    score += _points(age < 25, 10)
+    score += _points(rows['has_disabled_members'], 10)
+
+    # Sans ménage renseigné : score modéré
+    return np.where(rows['has_household'], np.minimum(score, 100.0), 40.0)
+
+
+# ===================================================================
+# MOTEUR
+# ===================================================================
+
+class VulnerabilityEngine:
+    """
+    Application des noyaux à un lot
+
+    Usage:
+        engine = VulnerabilityEngine()
+        scores = engine.score_person(person)                  # {'economic': 65.0, ...}
+        for rows, matrix in engine.score_queryset(PersonIdentity.objects.all()):
+            ...                                               # matrix : N×D (ordre DIMENSIONS)
+    """
+
+    def __init__(self, kernels: Optional[Dict[str, Callable]] = None):
+        """
+        Args:
+            kernels: Noyaux par dimension (défaut: DIMENSION_KERNELS)
+        """
+        self.kernels = dict(DIMENSION_KERNELS if kernels is None else kernels)
+        missing = [dimension for dimension in DIMENSIONS if dimension not in self.kernels]
+        if missing:
+            raise ValueError(f"Noyau(x) manquant(s): {', '.join(missing)}")
+
+    def score_rows(self, rows: ScoringRows, dimensions=DIMENSIONS) -> np.ndarray:
+        """Scores par dimension (N×len(dimensions))"""
+        if not len(rows):
+            return np.zeros((0, len(dimensions)))
+        return np.column_stack([self.kernels[dimension](rows) for dimension in dimensions])
+
+    def score_persons(self, persons: Iterable, dimensions=DIMENSIONS) -> List[Dict[str, float]]:
+        """Scores par dimension d'instances PersonIdentity"""
+        matrix = self.score_rows(ScoringRows.from_persons(persons), dimensions)
+        return [
+            {dimension: float(value) for dimension, value in zip(dimensions, row)}
+            for row in matrix
+        ]
+
+    def score_person(self, person, dimensions=DIMENSIONS) -> Dict[str, float]:
+        """Appel unitaire : lot d'une ligne"""
+        return self.score_persons([person], dimensions)[0]
+
+    def score_queryset(self, queryset, chunk_size: int = 2000):
+        """(lot, matrice N×D) par bloc de chunk_size personnes"""
+        for rows in ScoringRows.from_queryset(queryset, chunk_size):
+            yield rows, self.score_rows(rows)
@@ -6,22 +6,42 @@ Standards: Top 1% International
 """
 
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 from decimal import Decimal
 from django.db import transaction
 from django.utils import timezone
-from django.db.models import Count, Avg
+from django.db.models import Count, Avg, OuterRef, Subquery
 
 from apps.identity_app.models import PersonIdentity
 from ..models import VulnerabilityAssessment
 from .base_service import BaseService
+from .vulnerability_engine import VulnerabilityEngine
+from .scoring_models import (
+    DEFAULT_DIMENSION_WEIGHTS, DEFAULT_RISK_THRESHOLDS, DIMENSIONS, get_scoring_registry
+)
 
 logger = logging.getLogger(__name__)
 
+RESCORE_CHUNK_SIZE = 2000
+
+# Colonnes ScoringRows lues par les règles de facteurs (chemin par lots)
+RESCORE_FACT_COLUMNS = (
+    'has_household', 'monthly_income', 'has_disabled_members', 'has_children_under_5',
+    'has_bank_account', 'has_disability', 'education_level',
+)
+
 
 class VulnerabilityService(BaseService):
     """Service de calcul vulnérabilité contextualisé Gabon"""
     
+    # Politique initiale ; la version en vigueur est lue dans ScoringModel
+    DIMENSION_WEIGHTS = DEFAULT_DIMENSION_WEIGHTS
+    RISK_THRESHOLDS = DEFAULT_RISK_THRESHOLDS
+    
+    def __init__(self, engine: VulnerabilityEngine = None):
+        super().__init__()
+        self.engine = engine or VulnerabilityEngine()
+    
     def calculate_and_save_assessment(
         self, 
         person_id: int, 
@@ -40,7 +60,7 @@ class VulnerabilityService(BaseService):
             VulnerabilityAssessment créé
         """
         try:
-            person = PersonIdentity.objects.get(id=person_id)
+            person = PersonIdentity.objects.select_related('headed_household').get(id=person_id)
             
             # Vérifier évaluation existante récente
             if not force_recalculate:
@@ -70,7 +90,8 @@ class VulnerabilityService(BaseService):
                     protective_factors=assessment_data['protective_factors'],
                     recommendations=assessment_data['recommendations'],
                     priority_interventions=assessment_data['priority_interventions'],
-                    assessment_notes=assessment_data.get('assessment_notes', '')
+                    assessment_notes=assessment_data.get('assessment_notes', ''),
+                    scoring_model_id=assessment_data['scoring_model_id']
                 )
                 
                 # Log opération
@@ -99,31 +120,37 @@ class VulnerabilityService(BaseService):
         Returns:
             Dict avec champs alignés sur modèle VulnerabilityAssessment
         """
-        # Calcul scores par dimension
-        economic_score = self._calculate_economic_vulnerability(person)
-        social_score = self._calculate_social_vulnerability(person)
-        geographic_score = self._calculate_geographic_vulnerability(person)
-        health_score = self._calculate_health_vulnerability(person)
-        education_score = self._calculate_education_vulnerability(person)
-        
-        # Score global pondéré
-        vulnerability_score = (
-            economic_score * 0.30 +
-            social_score * 0.25 +
-            geographic_score * 0.20 +
-            health_score * 0.15 +
-            education_score * 0.10
+        household = getattr(person, 'headed_household', None)
+        facts = {
+            'has_household': household is not None,
+            'monthly_income': household.total_monthly_income if household else None,
+            'has_disabled_members': bool(household and household.has_disabled_members),
+            'has_children_under_5': bool(household and household.has_children_under_5),
+            'has_bank_account': bool(household and household.has_bank_account),
+            'has_disability': person.has_disability,
+            'education_level': person.education_level,
+        }
+        return self._assessment_fields(
+            self.calculate_dimension_scores(person), facts, get_scoring_registry().get_current()
         )
+
+    def _assessment_fields(self, dimension_scores: Dict[str, float], facts: Dict, scoring_model) -> Dict:
+        """
+        Champs d'une évaluation depuis les scores par dimension
+
+        Args:
+            facts: Attributs de la personne et de son ménage dirigé lus par
+                   les règles de facteurs (chemin unitaire ou colonnes d'un lot)
+        """
+        economic_score = dimension_scores['economic']
+        social_score = dimension_scores['social']
+        geographic_score = dimension_scores['geographic']
+        health_score = dimension_scores['health']
+        education_score = dimension_scores['education']
         
-        # Niveau de risque
-        if vulnerability_score >= 80:
-            risk_level = 'CRITICAL'
-        elif vulnerability_score >= 60:
-            risk_level = 'HIGH'
-        elif vulnerability_score >= 40:
-            risk_level = 'MODERATE'
-        else:
-            risk_level = 'LOW'
+        # Score global pondéré et niveau de risque (version en vigueur)
+        vulnerability_score = scoring_model.global_score(dimension_scores)
+        risk_level = scoring_model.risk_level(vulnerability_score)
         
         # Facteurs de vulnérabilité
         vulnerability_factors = []
@@ -136,23 +163,22 @@ class VulnerabilityService(BaseService):
         
         # Facteurs de risque
         risk_factors = []
-        household = getattr(person, 'headed_household', None)
-        if household:
-            if household.total_monthly_income and household.total_monthly_income < 50000:
+        if facts['has_household']:
+            if facts['monthly_income'] and facts['monthly_income'] < 50000:
                 risk_factors.append('EXTREME_POVERTY')
-            if household.has_disabled_members:
+            if facts['has_disabled_members']:
                 risk_factors.append('DISABLED_MEMBERS')
-            if household.has_children_under_5:
+            if facts['has_children_under_5']:
                 risk_factors.append('YOUNG_CHILDREN')
         
-        if person.has_disability:
+        if facts['has_disability']:
             risk_factors.append('PERSONAL_DISABILITY')
         
         # Facteurs protecteurs
         protective_factors = []
-        if person.education_level in ['UNIVERSITY', 'POSTGRADUATE']:
+        if facts['education_level'] in ['UNIVERSITY', 'POSTGRADUATE']:
             protective_factors.append('HIGH_EDUCATION')
-        if household and household.has_bank_account:
+        if facts['has_household'] and facts['has_bank_account']:
             protective_factors.append('FINANCIAL_INCLUSION')
         
         # Recommandations
@@ -176,7 +202,7 @@ class VulnerabilityService(BaseService):
         return {
             'vulnerability_score': Decimal(str(round(vulnerability_score, 2))),
             'risk_level': risk_level,
-            'household_composition_score': Decimal(str(round(social_score, 2))),
+            'household_composition_score': Decimal(str(round(dimension_scores['household_composition'], 2))),
             'economic_vulnerability_score': Decimal(str(round(economic_score, 2))),
             'social_vulnerability_score': Decimal(str(round(social_score, 2))),
             'vulnerability_factors': vulnerability_factors,
@@ -184,158 +210,47 @@ class VulnerabilityService(BaseService):
             'protective_factors': protective_factors,
             'recommendations': recommendations,
             'priority_interventions': priority_interventions,
-            'assessment_notes': f"Score: {vulnerability_score:.2f} - Niveau: {risk_level}"
+            'assessment_notes': f"Score: {vulnerability_score:.2f} - Niveau: {risk_level}",
+            'scoring_model_id': scoring_model.pk
         }
 
+    def calculate_dimension_scores(self, person: PersonIdentity) -> Dict[str, float]:
+        """Scores 0-100 par dimension (noyaux du moteur, lot d'une personne)"""
+        return self.engine.score_person(person)
+
+    def calculate_global_score(self, dimension_scores: Dict[str, float]) -> float:
+        """Somme pondérée des dimensions (modèle de scoring en vigueur)"""
+        return get_scoring_registry().get_current().global_score(dimension_scores)
+
+    def determine_risk_level(self, vulnerability_score: float) -> str:
+        """Niveau de risque (modèle de scoring en vigueur)"""
+        return get_scoring_registry().get_current().risk_level(vulnerability_score)
+
     def _calculate_economic_vulnerability(self, person: PersonIdentity) -> float:
-        """Calcul vulnérabilité économique (0-100)"""
-        score = 0.0
-        
-        household = getattr(person, 'headed_household', None)
-        if not household:
-            return 50.0  # Score moyen si pas de données ménage
-        
-        # Revenus mensuels
-        income = household.total_monthly_income or 0
-        if income < 50000:  # Extrême pauvreté
-            score += 40
-        elif income < 100000:  # Pauvreté
-            score += 30
-        elif income < 300000:  # Vulnérable
-            score += 15
-        
-        # Taille ménage vs revenus
-        if household.household_size > 0:
-            income_per_capita = income / household.household_size
-            if income_per_capita < 20000:
-                score += 20
-            elif income_per_capita < 50000:
-                score += 10
-        
-        # Accès services financiers
-        if not household.has_bank_account:
-            score += 15
-        
-        # Type logement
-        if household.housing_type in ['RENTED', 'INFORMAL', 'HOSTED']:
-            score += 10
-        
-        # Accès services de base
-        if household.water_access in ['VENDOR', 'NONE']:
-            score += 10
-        if household.electricity_access == 'NONE':
-            score += 5
-        
-        return min(100.0, score)
+        """Vulnérabilité économique (0-100)"""
+        return self.engine.score_person(person, ['economic'])['economic']
 
     def _calculate_social_vulnerability(self, person: PersonIdentity) -> float:
-        """Calcul vulnérabilité sociale (0-100)"""
-        score = 0.0
-        
-        household = getattr(person, 'headed_household', None)
-        
-        # Statut matrimonial
-        if person.marital_status in ['SINGLE', 'DIVORCED', 'WIDOW']:
-            score += 15
-        
-        # Chef de ménage vulnérable
-        if household:
-            if person.gender == 'F' and household.household_size > 3:
-                score += 20  # Femme chef de famille nombreuse
-            
-            # Présence membres vulnérables
-            if household.has_disabled_members:
-                score += 15
-            if household.has_elderly_members:
-                score += 10
-            if household.has_children_under_5:
-                score += 10
-            
-            # Ratio dépendance élevé
-            dependency_ratio = household.calculate_dependency_ratio()
-            if dependency_ratio > 100:
-                score += 15
-            elif dependency_ratio > 50:
-                score += 10
-        
-        # Handicap personnel
-        if person.has_disability:
-            score += 20
-        
-        return min(100.0, score)
+        """Vulnérabilité sociale (0-100)"""
+        return self.engine.score_person(person, ['social'])['social']
 
     def _calculate_geographic_vulnerability(self, person: PersonIdentity) -> float:
-        """Calcul vulnérabilité géographique (0-100)"""
-        score = 0.0
-        
-        # Provinces isolées
-        isolated_provinces = ['NYANGA', 'OGOOUE_LOLO', 'OGOOUE_IVINDO']
-        if person.province in isolated_provinces:
-            score += 40
-        
-        moderate_provinces = ['NGOUNIE', 'WOLEU_NTEM', 'HAUT_OGOOUE']
-        if person.province in moderate_provinces:
-            score += 25
-        
-        # Milieu rural (estimation par commune)
-        if person.commune and 'RURAL' in person.commune.upper():
-            score += 20
-        
-        # Absence coordonnées GPS
-        if not person.latitude or not person.longitude:
-            score += 15
-        
-        return min(100.0, score)
+        """Vulnérabilité géographique (0-100)"""
+        return self.engine.score_person(person, ['geographic'])['geographic']
 
     def _calculate_health_vulnerability(self, person: PersonIdentity) -> float:
-        """Calcul vulnérabilité santé (0-100)"""
-        score = 0.0
-        
-        # Handicap
-        if person.has_disability:
-            score += 30
-        
-        # Âge vulnérable
-        age = person.age
-        if age and (age < 5 or age > 65):
-            score += 20
-        
-        household = getattr(person, 'headed_household', None)
-        if household:
-            # Membres vulnérables santé
-            if household.has_disabled_members:
-                score += 15
-            if household.has_elderly_members:
-                score += 10
-            if household.has_pregnant_women:
-                score += 15
-        
-        return min(100.0, score)
+        """Vulnérabilité santé (0-100)"""
+        return self.engine.score_person(person, ['health'])['health']
 
     def _calculate_education_vulnerability(self, person: PersonIdentity) -> float:
-        """Calcul vulnérabilité éducation (0-100)"""
-        score = 0.0
-        
-        education = person.education_level
-        
-        if education in ['NONE', 'INCOMPLETE_PRIMARY']:
-            score += 40
-        elif education == 'PRIMARY':
-            score += 30
-        elif education == 'SECONDARY':
-            score += 15
-        
-        # Âge vs niveau éducation
-        age = person.age
-        if age and age > 25 and education in ['NONE', 'INCOMPLETE_PRIMARY']:
-            score += 20
-        
-        return min(100.0, score)
+        """Vulnérabilité éducation (0-100)"""
+        return self.engine.score_person(person, ['education'])['education']
 
     def bulk_calculate_assessments(
         self, 
         person_ids: List[int],
-        assessed_by=None
+        assessed_by=None,
+        force_recalculate: bool = False
     ) -> Dict:
         """
         Calcul en lot d'évaluations
@@ -351,7 +266,7 @@ class VulnerabilityService(BaseService):
                     assessment = self.calculate_and_save_assessment(
                         person_id=person_id,
                         assessed_by=assessed_by,
-                        force_recalculate=False
+                        force_recalculate=force_recalculate
                     )
                     
                     results['success'] += 1
@@ -375,6 +290,67 @@ class VulnerabilityService(BaseService):
             logger.error(f"Erreur bulk assessment: {str(e)}")
             raise
 
+    def rescore_version(
+        self,
+        version: Optional[int],
+        assessed_by=None,
+        chunk_size: int = RESCORE_CHUNK_SIZE
+    ) -> Dict:
+        """
+        Recalcule avec la version en vigueur les personnes dont la dernière
+        évaluation a été produite par une version donnée
+        
+        Chemin par lots : personnes lues par blocs (VulnerabilityEngine.score_queryset),
+        nouvelles évaluations insérées par bulk_create, une transaction par bloc.
+        Chaque nouvelle évaluation reprend le programme de celle qu'elle remplace.
+        
+        Args:
+            version: Version à remplacer (None : évaluations antérieures au versionnage)
+        
+        Returns:
+            Dict: {'rescored': int, 'from_version': ..., 'to_version': ...}
+        """
+        latest = VulnerabilityAssessment.objects.filter(
+            person=OuterRef('person')
+        ).order_by('-assessment_date').values('pk')[:1]
+        assessments = VulnerabilityAssessment.objects.filter(pk=Subquery(latest))
+        if version is None:
+            assessments = assessments.filter(scoring_model__isnull=True)
+        else:
+            assessments = assessments.filter(scoring_model__version=version)
+        programs = dict(assessments.values_list('person_id', 'program_id'))
+        
+        scoring_model = get_scoring_registry().get_current()
+        persons = PersonIdentity.objects.filter(pk__in=list(programs)).order_by('pk')
+        rescored = 0
+        for rows, matrix in self.engine.score_queryset(persons, chunk_size):
+            created = []
+            for index, scores in enumerate(matrix):
+                person_id = rows['person_id'][index]
+                facts = {name: rows[name][index] for name in RESCORE_FACT_COLUMNS}
+                if facts['monthly_income'] != facts['monthly_income']:  # NaN : revenu inconnu
+                    facts['monthly_income'] = None
+                created.append(VulnerabilityAssessment(
+                    person_id=person_id,
+                    program_id=programs[person_id],
+                    created_by=assessed_by,
+                    **self._assessment_fields(
+                        {dimension: float(score) for dimension, score in zip(DIMENSIONS, scores)},
+                        facts, scoring_model
+                    )
+                ))
+            with transaction.atomic():
+                VulnerabilityAssessment.objects.bulk_create(created)
+            rescored += len(created)
+        
+        results = {
+            'rescored': rescored,
+            'from_version': version,
+            'to_version': scoring_model.version,
+        }
+        self.log_operation('assessments_rescored', results)
+        return results
+
     def get_vulnerability_statistics(
         self,
         province: str = None
@@ -0,0 +1,184 @@
+# ===================================================================
+# RSU GABON - SIMULATEUR PONDÉRATIONS VULNÉRABILITÉ
+# Scénarios « what-if » sur pondérations et seuils, sans écriture
+# ===================================================================
+
+"""
+Simulation de politiques de scoring.
+
+Les scores par dimension de chaque personne sont calculés une seule fois
+par les noyaux du moteur (VulnerabilityEngine, lots values_list()) et rangés
+dans une matrice personnes × dimensions. Chaque scénario (pondérations, seuils)
+se réduit alors à un produit matrice-vecteur et à un searchsorted : des
+centaines de jeux de pondérations s'évaluent en quelques secondes, sans
+aucune requête ni évaluation enregistrée.
+
+Pour chaque scénario : répartition des niveaux de risque par province et
+nombre de personnes dont le niveau change par rapport au modèle de scoring
+en vigueur (ScoringModel).
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+from django.core.cache import cache
+
+from apps.identity_app.models import PersonIdentity
+from .scoring_models import DIMENSIONS, RISK_LEVELS, CompiledScoringModel, get_scoring_registry
+from .vulnerability_engine import VulnerabilityEngine
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_PROVINCE = 'NON_RENSEIGNEE'
+
+
+class DimensionScoreMatrix:
+    """
+    Scores par dimension partagés entre scénarios
+
+    Attributes:
+        person_ids: Lignes
+        provinces: Provinces distinctes
+        province_index: Province de chaque personne (indice dans provinces)
+        scores: Scores par dimension (N×D, 0-100, colonnes dans l'ordre DIMENSIONS)
+    """
+
+    CACHE_KEY = 'vulnerability_simulation_matrix:{province}'
+    CACHE_TIMEOUT = 600  # 10 minutes
+    CHUNK_SIZE = 2000
+
+    def __init__(self, person_ids, provinces, scores):
+        """
+        Args:
+            person_ids: Identifiants (N)
+            provinces: Province de chaque personne (N)
+            scores: Scores par dimension (N×D)
+        """
+        self.person_ids = np.asarray(person_ids)
+        labels = [province or UNKNOWN_PROVINCE for province in provinces]
+        self.provinces, self.province_index = np.unique(
+            np.asarray(labels, dtype=object).astype(str), return_inverse=True
+        )
+        self.provinces = list(self.provinces)
+        self.scores = np.asarray(scores, dtype=float).reshape(len(self.person_ids), len(DIMENSIONS))
+
+    def __len__(self):
+        return len(self.person_ids)
+
+    @classmethod
+    def load(cls, province: Optional[str] = None, engine: VulnerabilityEngine = None):
+        """
+        Calcule les scores par dimension de toutes les personnes (une requête, lue par blocs)
+
+        Args:
+            province: Restreindre à une province
+            engine: Moteur de scoring (défaut: noyaux enregistrés)
+        """
+        engine = engine or VulnerabilityEngine()
+        persons = PersonIdentity.objects.order_by('pk')
+        if province:
+            persons = persons.filter(province=province)
+
+        person_ids, provinces, blocks = [], [], [np.zeros((0, len(DIMENSIONS)))]
+        for rows, scores in engine.score_queryset(persons, cls.CHUNK_SIZE):
+            person_ids.extend(rows['person_id'])
+            provinces.extend(rows['province'])
+            blocks.append(scores)
+
+        return cls(person_ids, provinces, np.vstack(blocks))
+
+    @classmethod
+    def cached(cls, province: Optional[str] = None, refresh: bool = False) -> 'DimensionScoreMatrix':
+        """Matrice réutilisée entre requêtes pendant CACHE_TIMEOUT secondes"""
+        key = cls.CACHE_KEY.format(province=province or 'ALL')
+        matrix = None if refresh else cache.get(key)
+        if matrix is None:
+            matrix = cls.load(province)
+            cache.set(key, matrix, cls.CACHE_TIMEOUT)
+        return matrix
+
+
+class VulnerabilitySimulator:
+    """
+    Évaluation de scénarios de pondérations et seuils sur une matrice partagée
+
+    Usage:
+        simulator = VulnerabilitySimulator(DimensionScoreMatrix.cached())
+        results = simulator.simulate_scenarios([
+            {'name': 'Économie +', 'weights': {'economic': 0.40, 'education': 0.00}},
+            {'name': 'Seuils bas', 'thresholds': {'HIGH': 55}},
+        ])
+    """
+
+    def __init__(self, matrix: DimensionScoreMatrix, baseline: Optional[CompiledScoringModel] = None):
+        """
+        Args:
+            matrix: Scores par dimension
+            baseline: Modèle de référence (défaut: version en vigueur)
+        """
+        self.matrix = matrix
+        self.baseline = baseline or get_scoring_registry().get_current()
+        self.baseline_levels = self.levels(
+            self.matrix.scores @ self.baseline.weight_vector, self.baseline.threshold_vector
+        )
+
+    def simulate(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        thresholds: Optional[Dict[str, float]] = None
+    ) -> Dict:
+        """
+        Applique un scénario (dimensions ou seuils omis : valeurs de référence)
+
+        Returns:
+            Dict: Répartition des niveaux (globale et par province), changements
+        """
+        model = self.baseline.with_overrides(weights, thresholds)
+        global_scores = self.matrix.scores @ model.weight_vector
+        levels = self.levels(global_scores, model.threshold_vector)
+
+        by_province = np.bincount(
+            self.matrix.province_index * len(RISK_LEVELS) + levels,
+            minlength=len(self.matrix.provinces) * len(RISK_LEVELS)
+        ).reshape(len(self.matrix.provinces), len(RISK_LEVELS))
+        shift = levels - self.baseline_levels
+
+        return {
+            'baseline_version': self.baseline.version,
+            'weights': model.weights,
+            'thresholds': model.thresholds,
+            'total_persons': len(self.matrix),
+            'average_score': round(float(global_scores.mean()), 2) if len(self.matrix) else 0,
+            'level_distribution': self._level_counts(by_province.sum(axis=0)),
+            'by_province': {
+                province: self._level_counts(by_province[index])
+                for index, province in enumerate(self.matrix.provinces)
+            },
+            'changed_count': int(np.count_nonzero(shift)),
+            'escalated_count': int((shift > 0).sum()),
+            'deescalated_count': int((shift < 0).sum()),
+        }
+
+    def simulate_scenarios(self, scenarios: List[Dict]) -> List[Dict]:
+        """
+        Plusieurs scénarios sur la même matrice (aucune requête)
+
+        Args:
+            scenarios: [{'name'?, 'weights'?, 'thresholds'?}]
+        """
+        results = []
+        for scenario in scenarios:
+            result = self.simulate(scenario.get('weights'), scenario.get('thresholds'))
+            result['scenario_name'] = scenario.get('name')
+            results.append(result)
+        return results
+
+    @staticmethod
+    def levels(global_scores: np.ndarray, threshold_vector: np.ndarray) -> np.ndarray:
+        """Indice dans RISK_LEVELS : nombre de seuils atteints (score ≥ seuil)"""
+        return np.searchsorted(threshold_vector, global_scores, side='right')
+
+    @staticmethod
+    def _level_counts(counts) -> Dict[str, int]:
+        return {level: int(count) for level, count in zip(RISK_LEVELS, counts)}
@@ -0,0 +1,26 @@
+"""
+🇬🇦 RSU Gabon - Signaux Services App
+Fichier: apps/services_app/signals.py
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import GeographicInterventionCost, ScoringModel
+
+
+@receiver([post_save, post_delete], sender=GeographicInterventionCost)
+def refresh_intervention_costs(sender, **kwargs):
+    """Recharge le registre partagé une fois la modification validée"""
+    from .services.intervention_cost_registry import get_cost_registry
+
+    transaction.on_commit(lambda: get_cost_registry().refresh())
+
+
+@receiver([post_save, post_delete], sender=ScoringModel)
+def refresh_scoring_model(sender, **kwargs):
+    """Recharge la version en vigueur une fois la modification validée"""
+    from .services.scoring_models import get_scoring_registry
+
+    transaction.on_commit(lambda: get_scoring_registry().refresh())
@@ -0,0 +1,71 @@
+# apps/services_app/tests/test_benchmarks.py
+"""
+🧪 RSU GABON - Tests Suite de Benchmarks
+Génération synthétique, mesures et détection des régressions
+"""
+
+from django.test import TestCase
+from apps.core_app.models import RSUUser
+from apps.identity_app.models import PersonIdentity, Household
+from apps.services_app.benchmarks import (
+    generate_population, BenchmarkRunner, compare_results
+)
+
+
+class SyntheticPopulationTest(TestCase):
+    """Population synthétique reproductible"""
+
+    def test_generates_exact_size_with_households(self):
+        result = generate_population(60, seed=7)
+
+        self.assertEqual(result['persons'], 60)
+        self.assertEqual(PersonIdentity.objects.count(), 60)
+        self.assertEqual(Household.objects.count(), result['households'])
+        self.assertEqual(
+            PersonIdentity.objects.filter(is_household_head=True).count(),
+            result['households']
+        )
+
+    def test_same_seed_same_population(self):
+        generate_population(20, seed=3)
+        first = list(PersonIdentity.objects.order_by('rsu_id').values_list('first_name', 'province'))
+        Household.objects.all().delete()
+        PersonIdentity.objects.all().delete()
+
+        generate_population(20, seed=3)
+        second = list(PersonIdentity.objects.order_by('rsu_id').values_list('first_name', 'province'))
+        self.assertEqual(first, second)
+
+
+class BenchmarkRunnerTest(TestCase):
+    """Mesures et comparaison à la référence"""
+
+    def test_runner_reports_metrics(self):
+        user = RSUUser.objects.create_user(
+            username='bench_test', password='test123', user_type='ADMIN', employee_id='BENCH-T'
+        )
+        generate_population(30, seed=1, created_by=user)
+
+        report = BenchmarkRunner(user, iterations=2, scenarios=['person_list', 'person_detail']).run()
+
+        for name in ('person_list', 'person_detail'):
+            metrics = report['scenarios'][name]
+            self.assertNotIn('error', metrics)
+            self.assertGreater(metrics['queries'], 0)
+            self.assertGreaterEqual(metrics['p95_ms'], metrics['p50_ms'])
+            self.assertGreater(metrics['peak_memory_kb'], 0)
+
+    def test_compare_flags_latency_and_query_regressions(self):
+        baseline = {'scenarios': {
+            'person_list': {'queries': 4, 'p50_ms': 10.0, 'p95_ms': 12.0, 'peak_memory_kb': 500.0},
+            'dashboard': {'queries': 20, 'p50_ms': 30.0, 'p95_ms': 35.0, 'peak_memory_kb': 80.0},
+        }}
+        current = {'scenarios': {
+            'person_list': {'queries': 5, 'p50_ms': 10.5, 'p95_ms': 20.0, 'peak_memory_kb': 510.0},
+            'dashboard': {'error': 'FieldError: boom'},
+        }}
+
+        regressions = {(r['scenario'], r['metric']) for r in compare_results(baseline, current)}
+        self.assertEqual(regressions, {
+            ('person_list', 'queries'), ('person_list', 'p95_ms'), ('dashboard', 'error')
+        })
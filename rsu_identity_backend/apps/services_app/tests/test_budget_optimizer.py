@@ -0,0 +1,123 @@
+# apps/services_app/tests/test_budget_optimizer.py
+"""
+🧪 RSU GABON - Tests Optimiseur Allocation Budgétaire
+Sac à dos borné (MILP / glouton) et scénarios sur matrice partagée
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase, SimpleTestCase
+
+from apps.identity_app.models import PersonIdentity
+from apps.programs_app.models import ProgramCategory, SocialProgram
+from apps.services_app.models import SocialProgramEligibility
+from apps.services_app.services import GeotargetingService
+from apps.services_app.services.budget_optimizer import (
+    AllocationMatrix, BudgetOptimizer, program_benefit_cost
+)
+
+
+class BudgetOptimizerTest(SimpleTestCase):
+    """Résolution sur matrices construites en mémoire"""
+
+    def _matrix(self, capacity=None):
+        # A : ratio poids/coût 0.25 mais indivisible dans le budget restant
+        # B : ratio 0.24, deux bénéficiaires remplissent exactement le budget
+        return AllocationMatrix(
+            provinces=['NYANGA', 'ESTUAIRE'], program_codes=['P1'],
+            eligible=[1, 2], cost=[6, 5], weight=[1.5, 1.2], capacity=capacity,
+        )
+
+    def test_milp_beats_greedy_on_integer_knapsack(self):
+        greedy = BudgetOptimizer(self._matrix(), use_scipy=False).solve(10)
+        exact = BudgetOptimizer(self._matrix()).solve(10)
+
+        self.assertEqual(greedy['solver'], 'greedy')
+        self.assertEqual(greedy['weighted_impact'], 1.5)
+        self.assertEqual(exact['solver'], 'milp')
+        self.assertEqual(exact['weighted_impact'], 2.4)
+        self.assertEqual(exact['provinces']['ESTUAIRE']['beneficiaries_covered'], 2)
+        self.assertEqual(exact['budget_remaining'], 0)
+
+    def test_capacity_and_min_coverage(self):
+        for use_scipy in (True, False):
+            optimizer = BudgetOptimizer(self._matrix(capacity=[2]), use_scipy=use_scipy)
+            plan = optimizer.solve(100, min_coverage_rate=0.5)
+            self.assertEqual(plan['total_beneficiaries_covered'], 2)
+            self.assertEqual(set(plan['provinces']), {'NYANGA', 'ESTUAIRE'})
+
+        with self.assertRaises(ValueError):
+            BudgetOptimizer(self._matrix()).solve(5, min_coverage_rate=1.0)
+
+    def test_greedy_zero_cost_cells(self):
+        # Prestation nulle : cellule couverte entièrement, sans consommer le budget
+        matrix = AllocationMatrix(
+            provinces=['NYANGA', 'ESTUAIRE'], program_codes=['P1'],
+            eligible=[3, 2], cost=[0, 5], weight=[0, 1.0],
+        )
+        plan = BudgetOptimizer(matrix, use_scipy=False).solve(5)
+        self.assertEqual(plan['provinces']['NYANGA']['beneficiaries_covered'], 3)
+        self.assertEqual(plan['provinces']['ESTUAIRE']['beneficiaries_covered'], 1)
+        self.assertEqual(plan['budget_remaining'], 0)
+
+    def test_scenarios_share_matrix(self):
+        plans = BudgetOptimizer(self._matrix()).solve_scenarios([
+            {'name': 'Tout', 'budget': 100},
+            {'name': 'Estuaire', 'budget': 100, 'provinces': ['ESTUAIRE']},
+        ])
+        self.assertEqual([p['total_beneficiaries_covered'] for p in plans], [3, 2])
+        self.assertEqual(plans[1]['scenario_name'], 'Estuaire')
+
+
+class DeploymentScenarioTest(TestCase):
+    """Chargement de la matrice et comparaison de scénarios"""
+
+    def setUp(self):
+        category = ProgramCategory.objects.create(name='Transferts', description='Cash')
+        self.program = SocialProgram.objects.create(
+            code='OPT-2025', name='Transferts optimisés', category=category,
+            description='Test', start_date=date(2025, 1, 1), end_date=date(2025, 7, 1),
+            total_budget=Decimal('100000000'), benefit_amount=Decimal('20000')
+        )
+        for province, count in [('NYANGA', 3), ('ESTUAIRE', 2)]:
+            for index in range(count):
+                person = PersonIdentity.objects.create(
+                    first_name='Test', last_name=f'{province}{index}',
+                    birth_date='1980-01-01', gender='F', province=province
+                )
+                SocialProgramEligibility.objects.create(
+                    person=person, program_code='OPT-2025',
+                    eligibility_score=Decimal('80'), recommendation_level='RECOMMENDED'
+                )
+
+    def test_program_benefit_cost(self):
+        # 6 mois de versements mensuels
+        self.assertEqual(program_benefit_cost(self.program), 120000)
+
+    def test_matrix_loaded_once_for_all_scenarios(self):
+        service = GeotargetingService()
+        with self.assertNumQueries(2):
+            matrix = AllocationMatrix.load(service, ['OPT-2025'])
+        self.assertEqual(matrix.total_eligible(), 5)
+
+        optimizer = BudgetOptimizer(matrix)
+        with self.assertNumQueries(0):
+            plans = optimizer.solve_scenarios([
+                {'name': 'Large', 'budget': 10_000_000},
+                {'name': 'Serré', 'budget': 600_000},
+            ])
+        self.assertEqual(plans[0]['total_beneficiaries_covered'], 5)
+        # Budget serré : priorité à la zone critique (multiplicateur 1.5)
+        self.assertEqual(list(plans[1]['provinces']), ['NYANGA'])
+
+    def test_compare_deployment_scenarios(self):
+        result = GeotargetingService().compare_deployment_scenarios('OPT-2025', [
+            {'name': 'A', 'budget': 10_000_000},
+            {'name': 'B', 'budget': 10_000_000, 'provinces': ['ESTUAIRE']},
+        ])
+        self.assertEqual(result['scenarios'][0]['coverage_rate'], 100.0)
+        self.assertEqual(result['scenarios'][1]['beneficiaries_covered'], 2)
+
+        with self.assertRaises(ValueError):
+            GeotargetingService().optimize_program_deployment('INCONNU', Decimal('1000'))
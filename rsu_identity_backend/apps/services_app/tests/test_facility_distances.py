@@ -0,0 +1,115 @@
+# apps/services_app/tests/test_facility_distances.py
+"""
+🧪 RSU GABON - Tests Précalcul Distances aux Services
+Chargement infrastructures, BallTree haversine et stockage des distances
+"""
+
+import json
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+from django.test import TestCase
+from apps.identity_app.models import PersonIdentity, Household, GeographicData
+from apps.services_app.services import FacilityDistanceService, VulnerabilityService
+from utils.geo import haversine_km
+
+LIBREVILLE = (0.4162, 9.4673)
+OWENDO = (0.2917, 9.5047)
+NTOUM = (0.3906, 9.7611)
+LAMBARENE = (-0.7000, 10.2333)
+
+
+class FacilityDistanceServiceTest(TestCase):
+    """Distances au plus proche service"""
+
+    def setUp(self):
+        self.facilities = {
+            'HEALTH_CENTER': [OWENDO, LAMBARENE],
+            'SCHOOL': [LIBREVILLE],
+            'MARKET': [],
+            'ROAD': [NTOUM],
+        }
+        self.person = PersonIdentity.objects.create(
+            first_name='Jean', last_name='Mba', birth_date='1980-01-01', gender='M',
+            latitude=Decimal(str(LIBREVILLE[0])), longitude=Decimal(str(LIBREVILLE[1]))
+        )
+        self.household = Household.objects.create(
+            head_of_household=self.person, household_size=2, province='ESTUAIRE',
+            latitude=Decimal(str(LAMBARENE[0])), longitude=Decimal(str(LAMBARENE[1]))
+        )
+        self.without_gps = PersonIdentity.objects.create(
+            first_name='Paul', last_name='Obiang', birth_date='1985-01-01', gender='M'
+        )
+
+    def test_nearest_distances_match_haversine(self):
+        service = FacilityDistanceService(self.facilities)
+        distances = service.nearest_distances([LIBREVILLE, LAMBARENE])
+
+        self.assertNotIn('MARKET', distances)
+        self.assertAlmostEqual(
+            distances['HEALTH_CENTER'][0], haversine_km(*LIBREVILLE, *OWENDO), places=3
+        )
+        self.assertAlmostEqual(distances['HEALTH_CENTER'][1], 0.0, places=3)
+        self.assertAlmostEqual(distances['SCHOOL'][0], 0.0, places=3)
+
+    def test_update_all_stores_distances_in_chunks(self):
+        GeographicData.objects.create(
+            location_name='Ntoum', province='ESTUAIRE',
+            latitude=Decimal('0.3906'), longitude=Decimal('9.7611')
+        )
+        service = FacilityDistanceService(self.facilities, chunk_size=1)
+        stats = service.update_all()
+
+        self.assertEqual(stats, {'persons': 1, 'households': 1, 'geographic_data': 1})
+        self.person.refresh_from_db()
+        self.assertAlmostEqual(
+            self.person.distance_to_health_center, haversine_km(*LIBREVILLE, *OWENDO), places=2
+        )
+        self.assertIsNone(self.person.distance_to_market)
+        self.assertIsNotNone(self.person.facility_distances_computed_at)
+
+        self.household.refresh_from_db()
+        self.assertAlmostEqual(self.household.distance_to_health_center, 0.0, places=2)
+
+        self.without_gps.refresh_from_db()
+        self.assertIsNone(self.without_gps.distance_to_health_center)
+
+        locality = GeographicData.objects.get(location_name='Ntoum')
+        self.assertEqual(locality.distance_to_road, 0)
+        self.assertEqual(locality.distance_to_hospital, round(haversine_km(*NTOUM, *OWENDO)))
+
+    def test_load_csv_and_geojson(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / 'facilities.csv'
+            csv_path.write_text(
+                "type,name,latitude,longitude\n"
+                "hospital,CHU Libreville,0.4162,9.4673\n"
+                "SCHOOL,École Owendo,0.2917,9.5047\n"
+            )
+            geojson_path = Path(tmp) / 'facilities.geojson'
+            geojson_path.write_text(json.dumps({
+                'type': 'FeatureCollection',
+                'features': [{
+                    'type': 'Feature',
+                    'properties': {'type': 'MARKET'},
+                    'geometry': {'type': 'Point', 'coordinates': [9.7611, 0.3906]},
+                }],
+            }))
+
+            from_csv = FacilityDistanceService.load_facilities(csv_path)
+            from_geojson = FacilityDistanceService.load_facilities(geojson_path)
+
+        self.assertEqual(from_csv['HEALTH_CENTER'], [LIBREVILLE])
+        self.assertEqual(from_csv['SCHOOL'], [OWENDO])
+        self.assertEqual(from_geojson['MARKET'], [NTOUM])
+
+    def test_geographic_score_uses_stored_distances(self):
+        service = VulnerabilityService()
+        baseline = service._calculate_geographic_vulnerability(self.person)
+
+        self.person.distance_to_health_center = 35.0
+        self.person.distance_to_road = 12.0
+        self.assertEqual(
+            service._calculate_geographic_vulnerability(self.person), baseline + 25
+        )
@@ -0,0 +1,125 @@
+# apps/services_app/tests/test_heatmap_tiles.py
+"""
+🧪 RSU GABON - Tests Tuiles Carte de Chaleur
+Agrégation par cellule geohash, seuil de publication et ETag
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.core_app.models import RSUUser
+from apps.identity_app.models import PersonIdentity
+from apps.programs_app.models import ProgramCategory, SocialProgram
+from apps.services_app.models import VulnerabilityAssessment, VulnerabilityHeatmapTile
+from apps.services_app.services import HeatmapTileService
+from apps.services_app.views.analytics_views import AnalyticsViewSet
+from utils.geo import geohash_encode
+
+LIBREVILLE = (0.4162, 9.4673)
+FRANCEVILLE = (-1.6333, 13.5833)
+
+
+class HeatmapTileServiceTest(TestCase):
+    """Précalcul et service des tuiles"""
+
+    def setUp(self):
+        self.admin = RSUUser.objects.create_user(
+            username='heatmap_admin', email='heatmap@rsu.ga', password='test123',
+            user_type='ADMIN', employee_id='HEAT-001'
+        )
+        category = ProgramCategory.objects.create(name='Transferts', description='Cash')
+        self.program = SocialProgram.objects.create(
+            code='HEAT-2025', name='Programme test', category=category,
+            description='Test', start_date=date(2025, 1, 1),
+            total_budget=Decimal('1000000'), benefit_amount=Decimal('10000')
+        )
+        # 3 personnes à Libreville, 1 seule à Franceville (sous le seuil)
+        for index, score in enumerate([80, 60, 40]):
+            self._assess(self._person(f'Lbv{index}', LIBREVILLE), score)
+        self.isolated = self._person('Fcv', FRANCEVILLE)
+        self._assess(self.isolated, 90)
+
+    def _person(self, last_name, point):
+        return PersonIdentity.objects.create(
+            first_name='Test', last_name=last_name, birth_date='1980-01-01', gender='F',
+            latitude=Decimal(str(point[0])), longitude=Decimal(str(point[1]))
+        )
+
+    def _assess(self, person, score):
+        risk_level = 'CRITICAL' if score >= 75 else 'HIGH' if score >= 50 else 'MODERATE'
+        return VulnerabilityAssessment.objects.create(
+            program=self.program, person=person, vulnerability_score=Decimal(score),
+            risk_level=risk_level, household_composition_score=Decimal('0'),
+            economic_vulnerability_score=Decimal('0'), social_vulnerability_score=Decimal('0')
+        )
+
+    def test_build_tiles_aggregates_and_suppresses_small_cells(self):
+        tiles = HeatmapTileService().build_tiles()
+        geohash = geohash_encode(*LIBREVILLE)
+
+        national = tiles[(1, geohash[:1])]
+        self.assertEqual(national['rows'], [[geohash[:3], 3, 60.0, 80.0, 1, 1]])
+        expected_keys = {
+            (zoom, geohash[:tile_precision])
+            for zoom, (_, tile_precision) in HeatmapTileService.ZOOM_LEVELS.items()
+        }
+        self.assertEqual(set(tiles), expected_keys)
+
+    def test_latest_assessment_per_person_only(self):
+        self._assess(self.isolated, 10)
+        self._assess(self._person('Fcv2', FRANCEVILLE), 20)
+        self._assess(self._person('Fcv3', FRANCEVILLE), 30)
+
+        tiles = HeatmapTileService().build_tiles()
+        cell = geohash_encode(*FRANCEVILLE)[:3]
+        row = next(r for r in tiles[(1, cell[:1])]['rows'] if r[0] == cell)
+        self.assertEqual(row[1:3], [3, 20.0])
+
+    def test_refresh_keeps_etag_when_unchanged(self):
+        service = HeatmapTileService()
+        first = service.refresh_tiles()
+        self.assertEqual(first['created'], 4)
+        etags = dict(VulnerabilityHeatmapTile.objects.values_list('tile_key', 'etag'))
+
+        second = service.refresh_tiles()
+        self.assertEqual(second, {'created': 0, 'updated': 0, 'unchanged': 4, 'deleted': 0})
+        self.assertEqual(dict(VulnerabilityHeatmapTile.objects.values_list('tile_key', 'etag')), etags)
+
+        VulnerabilityAssessment.objects.update(is_active=False)
+        self.assertEqual(service.refresh_tiles()['deleted'], 4)
+
+    def test_tile_endpoint_honours_if_none_match(self):
+        HeatmapTileService().refresh_tiles()
+        tile_key = geohash_encode(*LIBREVILLE)[:2]
+        view = AnalyticsViewSet.as_view({'get': 'heatmap_tile'})
+
+        request = APIRequestFactory().get('/analytics/heatmap-tile/', {'zoom': 2, 'tile': tile_key})
+        force_authenticate(request, user=self.admin)
+        response = view(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['fields'], HeatmapTileService.CELL_FIELDS)
+
+        request = APIRequestFactory().get(
+            '/analytics/heatmap-tile/', {'zoom': 2, 'tile': tile_key},
+            HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        force_authenticate(request, user=self.admin)
+        self.assertEqual(view(request).status_code, 304)
+
+        request = APIRequestFactory().get('/analytics/heatmap-tile/', {'zoom': 9, 'tile': tile_key})
+        force_authenticate(request, user=self.admin)
+        self.assertEqual(view(request).status_code, 400)
+
+    def test_tile_index(self):
+        HeatmapTileService().refresh_tiles()
+        view = AnalyticsViewSet.as_view({'get': 'heatmap_tiles'})
+        request = APIRequestFactory().get('/analytics/heatmap-tiles/', {'zoom': 1})
+        force_authenticate(request, user=self.admin)
+        response = view(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['tiles']), 1)
+        self.assertEqual(response.data['tiles'][0]['person_count'], 3)
@@ -0,0 +1,68 @@
+# apps/services_app/tests/test_intervention_cost_registry.py
+"""
+🧪 RSU GABON - Tests Registre Coûts d'Intervention
+Rechargement unique, rafraîchissement anticipé et invalidation par signal
+"""
+
+import time
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.services_app.models import GeographicInterventionCost
+from apps.services_app.services import GeotargetingService
+from apps.services_app.services.intervention_cost_registry import InterventionCostRegistry
+
+
+class InterventionCostRegistryTest(TestCase):
+    """Lecture partagée des coûts configurés"""
+
+    def setUp(self):
+        cache.clear()
+        GeographicInterventionCost.objects.create(zone_key='ZONE_1', cost_per_person=175000)
+        self.registry = InterventionCostRegistry(GeotargetingService.DEFAULT_INTERVENTION_COSTS)
+
+    def test_single_load_then_cached(self):
+        with self.assertNumQueries(1):
+            costs = self.registry.get_costs()
+        self.assertEqual(costs['ZONE_1'], 175000)
+        self.assertEqual(costs['ZONE_4'], GeotargetingService.DEFAULT_INTERVENTION_COSTS['ZONE_4'])
+
+        with self.assertNumQueries(0):
+            self.registry.get_costs()
+
+    def test_early_refresh_by_lock_holder_only(self):
+        entry = self.registry.refresh()
+        entry['refresh_at'] = time.time() - 1
+        cache.set(InterventionCostRegistry.CACHE_KEY, entry)
+
+        # Un autre worker recharge déjà : valeur courante servie sans requête
+        cache.add(InterventionCostRegistry.LOCK_KEY, 'other-worker')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.registry.get_costs()['ZONE_1'], 175000)
+
+        cache.delete(InterventionCostRegistry.LOCK_KEY)
+        with self.assertNumQueries(1):
+            self.registry.get_costs()
+        self.assertGreater(
+            cache.get(InterventionCostRegistry.CACHE_KEY)['refresh_at'], time.time()
+        )
+
+    def test_cold_cache_waits_for_lock_holder(self):
+        cache.add(InterventionCostRegistry.LOCK_KEY, 'other-worker')
+        self.registry.WAIT_ATTEMPTS = 1
+        self.registry.WAIT_INTERVAL = 0
+        # Verrou jamais libéré : repli sur lecture directe, sans mise en cache
+        self.assertEqual(self.registry.get_costs()['ZONE_1'], 175000)
+        self.assertIsNone(cache.get(InterventionCostRegistry.CACHE_KEY))
+
+    def test_update_persists_and_signal_refreshes(self):
+        service = GeotargetingService()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(service.update_intervention_cost('ZONE_2', 120000))
+
+        self.assertEqual(
+            GeographicInterventionCost.objects.get(zone_key='ZONE_2').cost_per_person, 120000
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(GeotargetingService().intervention_costs['ZONE_2'], 120000)
@@ -0,0 +1,78 @@
+# apps/services_app/tests/test_province_snapshot.py
+"""
+🧪 RSU GABON - Tests Instantané Provincial
+Une série de requêtes groupées partagée par toutes les méthodes du géotargeting
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.identity_app.models import PersonIdentity
+from apps.programs_app.models import ProgramCategory, SocialProgram
+from apps.services_app.models import SocialProgramEligibility, VulnerabilityAssessment
+from apps.services_app.services import GeotargetingService
+
+
+class ProvinceSnapshotTest(TestCase):
+    """Méthodes publiques lues depuis un seul instantané"""
+
+    def setUp(self):
+        cache.clear()
+        category = ProgramCategory.objects.create(name='Transferts', description='Cash')
+        self.program = SocialProgram.objects.create(
+            code='SNAP-2025', name='Instantané', category=category,
+            description='Test', start_date=date(2025, 1, 1), end_date=date(2025, 7, 1),
+            total_budget=Decimal('100000000'), benefit_amount=Decimal('20000')
+        )
+        for province, risks in [('NYANGA', ['CRITICAL', 'HIGH']), ('ESTUAIRE', ['HIGH', 'LOW'])]:
+            for index, risk_level in enumerate(risks):
+                person = PersonIdentity.objects.create(
+                    first_name='Test', last_name=f'{province}{index}',
+                    birth_date='1980-01-01', gender='F', province=province
+                )
+                VulnerabilityAssessment.objects.create(
+                    program=self.program, person=person, risk_level=risk_level,
+                    vulnerability_score=Decimal('70'),
+                    household_composition_score=Decimal('0'),
+                    economic_vulnerability_score=Decimal('0'),
+                    social_vulnerability_score=Decimal('0')
+                )
+                SocialProgramEligibility.objects.create(
+                    person=person, program_code='SNAP-2025',
+                    eligibility_score=Decimal('80'), recommendation_level='RECOMMENDED'
+                )
+
+    def test_one_round_of_queries_per_service(self):
+        service = GeotargetingService()
+        # Évaluations + éligibilités + accessibilité (cache vide)
+        with self.assertNumQueries(3):
+            analysis = service.analyze_geographic_vulnerability()
+            zones = service.identify_priority_zones(
+                min_vulnerable_population=1, min_vulnerability_rate=0
+            )
+            statistics = service.get_deployment_statistics('SNAP-2025')
+
+        self.assertEqual(analysis['province_details']['NYANGA']['vulnerability_rate'], 100.0)
+        self.assertEqual(analysis['province_details']['ESTUAIRE']['vulnerability_rate'], 50.0)
+        self.assertEqual(zones[0]['province'], 'NYANGA')
+        self.assertEqual(statistics['total_eligible'], 4)
+
+        # Seul le programme reste à lire
+        with self.assertNumQueries(1):
+            result = service.generate_deployment_recommendations('SNAP-2025', 10_000_000)
+        self.assertEqual(result['summary']['total_beneficiaries'], 4)
+
+    def test_province_filter_and_invalidation(self):
+        service = GeotargetingService()
+        analysis = service.analyze_geographic_vulnerability(province='ESTUAIRE')
+        self.assertEqual(list(analysis['province_details']), ['ESTUAIRE'])
+
+        VulnerabilityAssessment.objects.filter(person__province='ESTUAIRE').update(
+            risk_level='CRITICAL'
+        )
+        self.assertEqual(service._get_province_vulnerability_rate('ESTUAIRE'), 50.0)
+        service.invalidate_snapshot()
+        self.assertEqual(service._get_province_vulnerability_rate('ESTUAIRE'), 100.0)
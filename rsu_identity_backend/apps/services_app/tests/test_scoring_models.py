@@ -0,0 +1,166 @@
+# apps/services_app/tests/test_scoring_models.py
+"""
+🧪 RSU GABON - Tests Modèles de Scoring Versionnés
+Version en vigueur compilée une fois, activation et traçabilité
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.core_app.models import RSUUser
+from apps.programs_app.models import ProgramCategory, SocialProgram
+from apps.services_app.models import ScoringModel, VulnerabilityAssessment
+from apps.services_app.services import VulnerabilityService
+from apps.services_app.services.scoring_models import ScoringModelRegistry, get_scoring_registry
+from apps.services_app.views.vulnerability_views import VulnerabilityAssessmentViewSet
+from .fixtures import TestDataFactory
+
+
+class ScoringModelRegistryTest(TestCase):
+    """Lecture, création et activation des versions"""
+
+    def setUp(self):
+        cache.clear()
+        self.registry = ScoringModelRegistry()
+
+    def tearDown(self):
+        # Versions créées annulées avec la transaction du test
+        cache.clear()
+
+    def test_initial_version_loaded_once(self):
+        with self.assertNumQueries(1):
+            model = self.registry.get_current()
+        self.assertEqual(model.version, 1)
+        self.assertEqual(model.weights, VulnerabilityService.DIMENSION_WEIGHTS)
+
+        with self.assertNumQueries(0):
+            self.assertIs(self.registry.get_current(), model)
+        self.assertEqual(model.risk_level(80), 'CRITICAL')
+        self.assertEqual(model.risk_level(79.99), 'HIGH')
+        self.assertEqual(model.risk_level(10), 'LOW')
+
+    def test_activation_switches_current_version(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            created = get_scoring_registry().create_version(
+                'Seuils abaissés',
+                weights={'economic': 0.5, 'social': 0.5},
+                thresholds={'CRITICAL': 70, 'HIGH': 50, 'MODERATE': 30},
+                activate=True,
+            )
+
+        self.assertEqual(created.version, 2)
+        self.assertEqual(list(ScoringModel.objects.filter(is_current=True)), [created])
+        service = VulnerabilityService()
+        self.assertEqual(service.determine_risk_level(55), 'HIGH')
+        self.assertEqual(service.calculate_global_score({
+            'economic': 100, 'social': 60, 'geographic': 100, 'health': 100, 'education': 100
+        }), 80)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            get_scoring_registry().activate(1)
+        self.assertEqual(service.determine_risk_level(55), 'MODERATE')
+
+    def test_edited_version_recompiled(self):
+        self.assertEqual(self.registry.get_current().risk_level(35), 'LOW')
+
+        # Version sans évaluation modifiée en place (admin)
+        current = ScoringModel.objects.get(is_current=True)
+        current.risk_thresholds = {'CRITICAL': 70, 'HIGH': 50, 'MODERATE': 30}
+        with self.captureOnCommitCallbacks(execute=True):
+            current.save()
+
+        model = self.registry.get_current()
+        self.assertEqual(model.version, 1)
+        self.assertEqual(model.thresholds, {'MODERATE': 30.0, 'HIGH': 50.0, 'CRITICAL': 70.0})
+        self.assertEqual(model.risk_level(35), 'MODERATE')
+
+    def test_invalid_versions_rejected(self):
+        with self.assertRaises(ValueError):
+            self.registry.create_version('Inconnue', {'income': 1}, {'CRITICAL': 80, 'HIGH': 60, 'MODERATE': 40})
+        with self.assertRaises(ValueError):
+            self.registry.create_version('Désordonnée', {'economic': 1}, {'CRITICAL': 50, 'HIGH': 60, 'MODERATE': 40})
+        self.assertEqual(ScoringModel.objects.count(), 1)
+
+    def test_assessment_records_version(self):
+        person = TestDataFactory.create_vulnerable_household()['person']
+        data = VulnerabilityService()._calculate_vulnerability_assessment(person)
+        self.assertEqual(data['scoring_model_id'], ScoringModel.objects.get(version=1).pk)
+
+
+class RescoreVersionTest(TestCase):
+    """Recalcul par lots des évaluations d'une version"""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = RSUUser.objects.create_user(
+            username='rescore_admin', email='rescore@rsu.ga', password='test123',
+            user_type='ADMIN', employee_id='SCORE-001'
+        )
+        self.surveyor = RSUUser.objects.create_user(
+            username='rescore_surveyor', email='surveyor@rsu.ga', password='test123',
+            user_type='SURVEYOR', employee_id='SCORE-002'
+        )
+        category = ProgramCategory.objects.create(name='Transferts', description='Cash')
+        self.program = SocialProgram.objects.create(
+            code='SCORE-2025', name='Programme test', category=category,
+            description='Test', start_date=date(2025, 1, 1),
+            total_budget=Decimal('1000000'), benefit_amount=Decimal('10000')
+        )
+        self.persons = [
+            TestDataFactory.create_vulnerable_household()['person'],
+            TestDataFactory.create_middle_class_household()['person'],
+        ]
+        version_1 = ScoringModel.objects.get(version=1)
+        for person in self.persons:
+            VulnerabilityAssessment.objects.create(
+                program=self.program, person=person, scoring_model=version_1,
+                vulnerability_score=Decimal('50'), risk_level='MODERATE',
+                household_composition_score=Decimal('0'),
+                economic_vulnerability_score=Decimal('0'), social_vulnerability_score=Decimal('0')
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            get_scoring_registry().create_version(
+                'Seuils abaissés', weights={'economic': 0.5, 'social': 0.5},
+                thresholds={'CRITICAL': 70, 'HIGH': 50, 'MODERATE': 30}, activate=True,
+            )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _rescore(self, user, body):
+        request = APIRequestFactory().post('/vulnerability-assessments/rescore/', body, format='json')
+        force_authenticate(request, user=user)
+        # Options de l'action (permission_classes) appliquées comme par le routeur
+        view = VulnerabilityAssessmentViewSet.as_view(
+            {'post': 'rescore'}, **VulnerabilityAssessmentViewSet.rescore.kwargs
+        )
+        return view(request)
+
+    def test_batch_matches_single_person_path(self):
+        service = VulnerabilityService()
+        results = service.rescore_version(1, assessed_by=self.admin, chunk_size=1)
+        self.assertEqual(results, {'rescored': 2, 'from_version': 1, 'to_version': 2})
+
+        for person in self.persons:
+            assessment = VulnerabilityAssessment.objects.get(person=person, scoring_model__version=2)
+            expected = service._calculate_vulnerability_assessment(person)
+            self.assertEqual(assessment.program, self.program)
+            for field in ('vulnerability_score', 'risk_level', 'risk_factors', 'protective_factors'):
+                self.assertEqual(getattr(assessment, field), expected[field], field)
+
+        # Dernières évaluations déjà en version 2 : rien à refaire
+        self.assertEqual(service.rescore_version(1)['rescored'], 0)
+
+    def test_endpoint_admin_only_and_validated(self):
+        self.assertEqual(self._rescore(self.surveyor, {'version': 1}).status_code, 403)
+        for body in [{}, {'version': 'v1'}, {'version': 0}]:
+            self.assertEqual(self._rescore(self.admin, body).status_code, 400, body)
+
+        response = self._rescore(self.admin, {'version': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['rescored'], 2)
+        self.assertNotIn('details', response.data)
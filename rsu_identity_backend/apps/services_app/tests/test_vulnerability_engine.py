@@ -0,0 +1,73 @@
+# apps/services_app/tests/test_vulnerability_engine.py
+"""
+🧪 RSU GABON - Tests Moteur de Scoring Vulnérabilité
+Noyaux par dimension, chemin unitaire et chemin par lots
+"""
+
+from django.test import TestCase
+
+from apps.identity_app.models import PersonIdentity
+from apps.services_app.services.scoring_models import DIMENSIONS
+from apps.services_app.services.vulnerability_engine import ScoringRows, VulnerabilityEngine
+from .fixtures import TestDataFactory
+
+
+class VulnerabilityEngineTest(TestCase):
+    """Mêmes scores pour une personne et pour un lot"""
+
+    def setUp(self):
+        self.engine = VulnerabilityEngine()
+        self.vulnerable = TestDataFactory.create_vulnerable_household()['person']
+        self.middle_class = TestDataFactory.create_middle_class_household()['person']
+        self.isolated = TestDataFactory.create_person(
+            first_name='Paul', province='NYANGA', marital_status='WIDOW', age_years=70
+        )
+
+    def test_batch_matches_single_person(self):
+        persons = PersonIdentity.objects.order_by('pk')
+        batches = list(self.engine.score_queryset(persons, chunk_size=2))
+        self.assertEqual([len(rows) for rows, _ in batches], [2, 1])
+
+        for rows, matrix in batches:
+            for person_id, scores in zip(rows['person_id'], matrix):
+                person = PersonIdentity.objects.get(pk=person_id)
+                self.assertEqual(
+                    self.engine.score_person(person),
+                    {dimension: float(score) for dimension, score in zip(DIMENSIONS, scores)}
+                )
+
+    def test_single_streamed_query(self):
+        # Curseur unique lu par blocs (SQLite : pas de requête supplémentaire par bloc)
+        with self.assertNumQueries(1):
+            list(self.engine.score_queryset(PersonIdentity.objects.order_by('pk'), chunk_size=2))
+
+    def test_person_without_household(self):
+        scores = self.engine.score_person(self.isolated)
+
+        self.assertEqual(scores['economic'], 50.0)
+        self.assertEqual(scores['household_composition'], 40.0)
+        # Province isolée (40) + coordonnées absentes (15)
+        self.assertEqual(scores['geographic'], 55.0)
+        # Veuf (15), sans points liés au ménage
+        self.assertEqual(scores['social'], 15.0)
+        self.assertEqual(scores['health'], 20.0)
+
+    def test_vulnerable_household_scores(self):
+        scores = self.engine.score_person(self.vulnerable)
+
+        # Revenu < 50 000 (40) + par tête < 20 000 (20) + banque (15)
+        # + location (10) + revendeur d'eau (10) + sans électricité (5)
+        self.assertEqual(scores['economic'], 100.0)
+        # Ratio de dépendance (4 + 1) / 2 = 250 %
+        self.assertEqual(ScoringRows.from_persons([self.vulnerable])['dependency_ratio'][0], 250.0)
+        # 7 membres (25) + 5/7 dépendants (30) + cheffe (10) + handicap (10)
+        self.assertEqual(scores['household_composition'], 75.0)
+        self.assertGreater(scores['economic'], self.engine.score_person(self.middle_class)['economic'])
+
+    def test_newborn_counts_as_young_child(self):
+        newborn = TestDataFactory.create_person(first_name='Bébé', age_years=0)
+        self.assertEqual(self.engine.score_person(newborn, ['health']), {'health': 20.0})
+
+    def test_missing_kernel(self):
+        with self.assertRaises(ValueError):
+            VulnerabilityEngine(kernels={'economic': lambda rows: rows['age']})
@@ -16,6 +16,7 @@ from decimal import Decimal
 from apps.identity_app.models import PersonIdentity, Household
 from apps.services_app.models import VulnerabilityAssessment, SocialProgramEligibility
 from apps.core_app.permissions import IsSurveyorOrHigher
+from apps.services_app.services import HeatmapTileService
 
 
 class AnalyticsViewSet(viewsets.ViewSet):
@@ -27,6 +28,8 @@ class AnalyticsViewSet(viewsets.ViewSet):
     - GET /api/v1/analytics/vulnerability-stats/ - Stats vulnérabilité
     - GET /api/v1/analytics/geographic-distribution/ - Répartition géographique
     - GET /api/v1/analytics/demographic-insights/ - Insights démographiques
+    - GET /api/v1/analytics/heatmap-tiles/?zoom= - Index tuiles carte de chaleur
+    - GET /api/v1/analytics/heatmap-tile/?zoom=&tile= - Tuile (ETag)
     """
     
     permission_classes = [IsAuthenticated, IsSurveyorOrHigher]
@@ -322,4 +325,56 @@ class AnalyticsViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def demographic_insights(self, request):
         """Insights démographiques"""
-        return Response(self._get_demographic_insights())
\ No newline at end of file
+        return Response(self._get_demographic_insights())
+    
+    @action(detail=False, methods=['get'], url_path='heatmap-tiles')
+    def heatmap_tiles(self, request):
+        """
+        Index des tuiles de carte de chaleur d'un niveau de zoom
+        ?zoom=1..4 (défaut 1 : vue nationale)
+        """
+        zoom = self._parse_zoom(request)
+        if zoom is None:
+            return Response(
+                {'error': f'zoom invalide ({", ".join(map(str, HeatmapTileService.ZOOM_LEVELS))})'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response({
+            'zoom': zoom,
+            'tiles': HeatmapTileService().list_tiles(zoom),
+        })
+    
+    @action(detail=False, methods=['get'], url_path='heatmap-tile')
+    def heatmap_tile(self, request):
+        """
+        Contenu compact d'une tuile (?zoom=&tile=), avec ETag :
+        If-None-Match identique → 304 sans corps
+        """
+        zoom = self._parse_zoom(request)
+        tile_key = request.query_params.get('tile', '')
+        if zoom is None or not tile_key:
+            return Response(
+                {'error': 'zoom et tile requis'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        tile = HeatmapTileService().get_tile(zoom, tile_key)
+        if tile is None:
+            return Response({'error': 'Tuile introuvable'}, status=status.HTTP_404_NOT_FOUND)
+        
+        etag = f'"{tile.etag}"'
+        if_none_match = request.headers.get('If-None-Match', '')
+        if etag in [value.strip() for value in if_none_match.split(',')]:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(tile.payload)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+    
+    def _parse_zoom(self, request):
+        try:
+            zoom = int(request.query_params.get('zoom', 1))
+        except ValueError:
+            return None
+        return zoom if zoom in HeatmapTileService.ZOOM_LEVELS else None
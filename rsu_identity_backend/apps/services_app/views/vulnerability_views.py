@@ -13,9 +13,15 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 
 from apps.services_app.models import VulnerabilityAssessment
-from apps.services_app.serializers import VulnerabilityAssessmentSerializer
+from apps.services_app.serializers import (
+    ScoringRescoreSerializer, VulnerabilityAssessmentSerializer
+)
 from apps.services_app.services.vulnerability_service import VulnerabilityService
+from apps.services_app.services.vulnerability_simulator import (
+    DimensionScoreMatrix, VulnerabilitySimulator
+)
 from apps.core_app.permissions import IsSurveyorOrHigher
+from apps.core_app.views.permissions import IsAdmin
 
 
 class VulnerabilityAssessmentViewSet(viewsets.ModelViewSet):
@@ -30,8 +36,12 @@ class VulnerabilityAssessmentViewSet(viewsets.ModelViewSet):
     - DELETE /vulnerability-assessments/{id}/ - Supprimer
     - POST /vulnerability-assessments/calculate/ - Calculer pour personne
     - GET /vulnerability-assessments/statistics/ - Statistiques globales
+    - POST /vulnerability-assessments/simulate/ - Simuler pondérations et seuils
+    - POST /vulnerability-assessments/rescore/ - Recalculer une version de scoring
     """
     
+    MAX_SIMULATION_SCENARIOS = 500
+    
     queryset = VulnerabilityAssessment.objects.all().select_related(
         'person', 'assessed_by'
     ).order_by('-assessment_date')
@@ -162,6 +172,75 @@ class VulnerabilityAssessmentViewSet(viewsets.ModelViewSet):
         
         return Response(results, status=status.HTTP_200_OK)
     
+    @action(detail=False, methods=['post'])
+    def simulate(self, request):
+        """
+        Simuler des pondérations et seuils sans enregistrer d'évaluation
+        
+        Body:
+        {
+            "scenarios": [
+                {"name": "Économie +", "weights": {"economic": 0.40, "education": 0.00}},
+                {"name": "Seuils bas", "thresholds": {"HIGH": 55, "CRITICAL": 75}}
+            ],
+            "province": "NYANGA",    (optionnel)
+            "refresh": false         (recalculer les scores par dimension)
+        }
+        
+        Returns:
+            Référence en vigueur et, par scénario, répartition des niveaux par
+            province et nombre de personnes changeant de niveau
+        """
+        scenarios = request.data.get('scenarios')
+        if not scenarios or not isinstance(scenarios, list) or \
+                not all(isinstance(scenario, dict) for scenario in scenarios):
+            return Response(
+                {'error': 'scenarios requis (liste)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(scenarios) > self.MAX_SIMULATION_SCENARIOS:
+            return Response(
+                {'error': f'{self.MAX_SIMULATION_SCENARIOS} scénarios maximum'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        matrix = DimensionScoreMatrix.cached(
+            province=request.data.get('province'),
+            refresh=bool(request.data.get('refresh', False))
+        )
+        simulator = VulnerabilitySimulator(matrix)
+        try:
+            results = simulator.simulate_scenarios(scenarios)
+        except (ValueError, TypeError) as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({
+            'baseline': simulator.simulate(),
+            'scenarios': results,
+        })
+    
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, IsAdmin])
+    def rescore(self, request):
+        """
+        Recalculer avec la version en vigueur les évaluations d'une version
+        (administrateurs, traitement par lots)
+        
+        Body:
+        {
+            "version": 1    (null : évaluations antérieures au versionnage)
+        }
+        
+        Returns:
+            {"rescored": 1250, "from_version": 1, "to_version": 2}
+        """
+        serializer = ScoringRescoreSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        results = VulnerabilityService().rescore_version(
+            serializer.validated_data['version'], assessed_by=request.user
+        )
+        return Response(results, status=status.HTTP_200_OK)
+    
     @action(detail=False, methods=['get'])
     def statistics(self, request):
         """
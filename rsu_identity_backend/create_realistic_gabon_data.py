@@ -22,163 +22,11 @@ except RuntimeError:
 
 from apps.identity_app.models import PersonIdentity, Household
 from apps.core_app.models import RSUUser
-
-# ============================================================================
-# DONNÉES GABONAISES RÉALISTES
-# ============================================================================
-
-NOMS = [
-    'NDONG', 'NGUEMA', 'OBIANG', 'MOUSSOUNDA', 'BIKORO', 'MINTSA', 'OVONO', 
-    'ELLA', 'MBA', 'ONDO', 'NZUE', 'MBOUMBA', 'MVIE', 'KOUMBA', 'BONGO',
-    'MIHINDOU', 'OGANDAGA', 'EYENE', 'ANGOUE', 'MAGANGA'
-]
-
-PRENOMS_HOMMES = [
-    'Jean', 'Pierre', 'Paul', 'François', 'André', 'Michel', 'Patrick', 
-    'Christian', 'Bruno', 'Daniel', 'Emmanuel', 'Georges', 'Henri', 'Joseph'
-]
-
-PRENOMS_FEMMES = [
-    'Marie', 'Jeanne', 'Antoinette', 'Catherine', 'Elisabeth', 'Anne', 
-    'Christine', 'Sylvie', 'Rosalie', 'Bernadette', 'Françoise', 'Thérèse'
-]
-
-# Provinces avec données géographiques réelles
-PROVINCES = {
-    'ESTUAIRE': {
-        'communes': ['Libreville', 'Akanda', 'Ntoum', 'Kango'],
-        'gps': (0.4162, 9.4673)
-    },
-    'HAUT_OGOOUE': {
-        'communes': ['Franceville', 'Moanda', 'Mounana', 'Okondja'],
-        'gps': (-1.6333, 13.5833)
-    },
-    'OGOOUE_MARITIME': {
-        'communes': ['Port-Gentil', 'Omboué', 'Gamba'],
-        'gps': (-0.7193, 8.7815)
-    },
-    'NGOUNIE': {
-        'communes': ['Mouila', 'Ndendé', 'Mbigou', 'Mandji'],
-        'gps': (-1.8667, 10.9667)
-    },
-    'WOLEU_NTEM': {
-        'communes': ['Oyem', 'Bitam', 'Mitzic', 'Minvoul'],
-        'gps': (1.6000, 11.5833)
-    },
-    'MOYEN_OGOOUE': {
-        'communes': ['Lambaréné', 'Ndjolé', 'Booué'],
-        'gps': (-0.7000, 10.2333)
-    },
-    'OGOOUE_IVINDO': {
-        'communes': ['Makokou', 'Ovan', 'Mékambo'],
-        'gps': (0.5738, 12.8643)
-    },
-    'OGOOUE_LOLO': {
-        'communes': ['Koulamoutou', 'Lastoursville', 'Pana'],
-        'gps': (-0.9833, 12.4833)
-    },
-    'NYANGA': {
-        'communes': ['Tchibanga', 'Mayumba', 'Moabi'],
-        'gps': (-2.9167, 11.0167)
-    }
-}
-
-# ============================================================================
-# FONCTIONS UTILITAIRES
-# ============================================================================
-
-def gen_rsu_id():
-    """Génère un RSU-ID unique"""
-    return f"RSU-GA-{random.randint(100000, 999999)}"
-
-def gen_nip():
-    """Génère un NIP au format gabonais"""
-    year = random.randint(1950, 2024)
-    month = random.randint(1, 12)
-    day = random.randint(1, 28)
-    seq = random.randint(10000, 99999)
-    return f"{year:04d}{month:02d}{day:02d}-{seq}"
-
-def gen_phone():
-    """Génère un numéro de téléphone gabonais valide"""
-    prefixes = ['07', '06', '05', '04', '01', '02']
-    return f"+241{random.choice(prefixes)}{random.randint(1000000, 9999999):07d}"
-
-def gen_birth_date(min_age, max_age):
-    """Génère une date de naissance réaliste"""
-    days_old = random.randint(min_age * 365, max_age * 365)
-    return date.today() - timedelta(days=days_old)
-
-def calculate_age(birth_date):
-    """Calcule l'âge à partir de la date de naissance"""
-    if not birth_date:
-        return None
-    today = date.today()
-    return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
-
-def gen_gps_coords(base_lat, base_lon, radius=0.5):
-    """Génère des coordonnées GPS autour d'un point de base"""
-    lat = base_lat + random.uniform(-radius, radius)
-    lon = base_lon + random.uniform(-radius, radius)
-    return round(lat, 6), round(lon, 6)
-
-def calculate_vulnerability_score(income, age, has_disability, is_household_head, gender):
-    """Calcule un score de vulnérabilité réaliste"""
-    score = 0
-    
-    # Critères économiques (40 points max)
-    if income == 0:
-        score += 40
-    elif income < 50000:
-        score += 35
-    elif income < 100000:
-        score += 25
-    elif income < 150000:
-        score += 15
-    
-    # Critères démographiques (30 points max)
-    if age:
-        if age < 5:
-            score += 25
-        elif age < 18:
-            score += 15
-        elif age > 65:
-            score += 30
-    
-    # Critères sociaux (30 points max)
-    if has_disability:
-        score += 20
-    if is_household_head and gender == 'F':
-        score += 10
-    
-    # Ajouter variabilité
-    score += random.randint(-5, 5)
-    
-    return min(max(score, 0), 100)
-
-def get_vulnerability_level(score):
-    """Détermine le niveau de vulnérabilité"""
-    if score >= 75:
-        return 'CRITICAL'
-    elif score >= 50:
-        return 'HIGH'
-    elif score >= 25:
-        return 'MODERATE'
-    else:
-        return 'LOW'
-
-def get_employment_status(age, occupation):
-    """Détermine le statut d'emploi basé sur l'âge et l'occupation"""
-    if age < 6:
-        return 'UNABLE_TO_WORK'
-    elif 6 <= age < 16:
-        return 'STUDENT'
-    elif occupation == 'Sans emploi':
-        return 'UNEMPLOYED'
-    elif occupation in ['Fonctionnaire', 'Enseignant', 'Cadre']:
-        return 'EMPLOYED_FORMAL'
-    else:
-        return 'EMPLOYED_INFORMAL'
+from utils.synthetic_population import (
+    NOMS, PRENOMS_HOMMES, PRENOMS_FEMMES, PROVINCES,
+    gen_rsu_id, gen_nip, gen_phone, gen_birth_date, calculate_age, gen_gps_coords,
+    calculate_vulnerability_score, get_vulnerability_level, get_employment_status,
+)
 
 # ============================================================================
 # FONCTION PRINCIPALE DE CRÉATION
@@ -140,6 +140,14 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
+# Format binaire MessagePack pour terminaux mobiles (dépendance optionnelle)
+try:
+    import msgpack  # noqa: F401
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append('apps.core_app.renderers.MessagePackRenderer')
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'].append('apps.core_app.renderers.MessagePackParser')
+except ImportError:
+    pass
+
 # JWT Configuration
 from datetime import timedelta
 SIMPLE_JWT = {
@@ -204,6 +212,10 @@ GABON_PROVINCES = [
 
 GABON_PHONE_REGEX = r'^\+241[0-9]{8}$'
 RSU_ID_PREFIX = 'RSU-GA-'
+
+# Fournisseur de paiement (chemin pointé, ex: 'apps.programs_app.services.payment_dispatch.FakeMobileMoneyProvider')
+# Vide = règlement manuel des paiements
+PAYMENT_PROVIDER = os.environ.get('PAYMENT_PROVIDER', '')
 # Modèle utilisateur personnalisé
 
 AUTH_USER_MODEL = 'core_app.RSUUser'
@@ -1,6 +1,7 @@
 import uuid
-import random
+import threading
 from django.conf import settings
+from django.db import transaction
 
 """
 🇬🇦 RSU Gabon - Données de Référence Gabonaises
@@ -99,36 +100,220 @@ def validate_gabon_phone(phone_number: str) -> bool:
     """Valide un numéro de téléphone gabonais"""
     return bool(GABON_PHONE_REGEX.match(phone_number))
 
-# ✅ CORRECTION CRITIQUE: Signature fonction sans paramètre 'self'
+# =============================================================================
+# IDENTIFIANTS RSU : SÉQUENCE BASE36 + CLÉ DE CONTRÔLE
+# =============================================================================
+
+# Alphabet base36 (ordre ASCII : l'ordre lexicographique suit l'ordre numérique)
+ID_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+ID_PAYLOAD_LENGTH = 7  # 36^7 ≈ 78 milliards d'identifiants
+ID_MAX_VALUE = len(ID_ALPHABET) ** ID_PAYLOAD_LENGTH - 1
+DEFAULT_ID_BLOCK_SIZE = 100
+
+
+def encode_base36(value: int, length: int = ID_PAYLOAD_LENGTH) -> str:
+    """Encode un entier positif en base36 sur `length` caractères"""
+    if value < 0 or value > len(ID_ALPHABET) ** length - 1:
+        raise ValueError(f"Valeur hors plage base36 ({length} car.): {value}")
+
+    chars = []
+    for _ in range(length):
+        value, remainder = divmod(value, len(ID_ALPHABET))
+        chars.append(ID_ALPHABET[remainder])
+    return ''.join(reversed(chars))
+
+
+def compute_check_char(payload: str) -> str:
+    """
+    Clé de contrôle Luhn mod 36 : détecte toute erreur de saisie
+    sur un caractère et la plupart des inversions adjacentes.
+    """
+    base = len(ID_ALPHABET)
+    factor = 2
+    total = 0
+    for char in reversed(payload):
+        addend = factor * ID_ALPHABET.index(char)
+        factor = 1 if factor == 2 else 2
+        total += addend // base + addend % base
+    return ID_ALPHABET[(base - total % base) % base]
+
+
+def format_rsu_id(value: int, prefix: str = None) -> str:
+    """
+    Formate une valeur de séquence en RSU-ID: RSU-GA-XXXXXXXC
+    (7 caractères base36 + 1 clé de contrôle, même longueur qu'avant)
+    """
+    if prefix is None:
+        prefix = getattr(settings, 'RSU_ID_PREFIX', 'RSU-GA-')
+    payload = encode_base36(value)
+    return f"{prefix}{payload}{compute_check_char(payload)}"
+
+
+def format_household_id(value: int) -> str:
+    """Formate une valeur de séquence en ID ménage: HH-GA-XXXXXXXC"""
+    payload = encode_base36(value)
+    return f"HH-GA-{payload}{compute_check_char(payload)}"
+
+
+def decode_identifier(identifier: str) -> int:
+    """Retourne la valeur de séquence d'un identifiant (clé de contrôle vérifiée)"""
+    if not has_valid_check_char(identifier):
+        raise ValueError(f"Identifiant invalide: {identifier}")
+    return int(identifier.rsplit('-', 1)[-1][:-1], 36)
+
+
+def has_valid_check_char(identifier: str) -> bool:
+    """Vérifie la clé de contrôle d'un identifiant issu de la séquence"""
+    code = identifier.rsplit('-', 1)[-1].upper()
+    if len(code) != ID_PAYLOAD_LENGTH + 1 or any(c not in ID_ALPHABET for c in code):
+        return False
+    return compute_check_char(code[:-1]) == code[-1]
+
+
+class IdentifierAllocator:
+    """
+    Distributeur d'identifiants par blocs.
+
+    Une seule requête verrouillée réserve `block_size` valeurs dans
+    IdentifierSequence; les identifiants sont ensuite produits en mémoire.
+    Les RSU-ID historiques (aléatoires) tombant dans la plage réservée sont
+    écartés par une unique requête de plage par bloc.
+
+    Le cache local n'est rempli que par une réservation validée. Dans un
+    bloc atomic, le bloc est réservé sur une connexion autonome validée
+    aussitôt (PostgreSQL) : la transaction appelante ne garde pas le verrou
+    de la séquence. Sans connexion autonome (SQLite), seule la valeur
+    demandée est réservée dans la transaction, dont l'annulation peut
+    réattribuer la valeur ; chaque identifiant coûte alors un aller-retour
+    et le verrou est tenu jusqu'au commit. Les créations en nombre passent
+    par allocate() (un bloc par appel).
+    """
+
+    def __init__(self, sequence_name='RSU_ID', formatter=format_rsu_id,
+                 model_label='identity_app.PersonIdentity', field_name='rsu_id',
+                 block_size=None):
+        self.sequence_name = sequence_name
+        self.formatter = formatter
+        self.model_label = model_label
+        self.field_name = field_name
+        self.block_size = block_size or getattr(
+            settings, 'RSU_ID_BLOCK_SIZE', DEFAULT_ID_BLOCK_SIZE
+        )
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def next_id(self) -> str:
+        """Retourne le prochain identifiant (réserve un bloc si épuisé)"""
+        from apps.identity_app.models import IdentifierSequence
+
+        with self._lock:
+            while not self._pending:
+                if transaction.get_connection().in_atomic_block:
+                    if IdentifierSequence.supports_committed_reserve():
+                        self._pending = self.reserve_block(self.block_size, committed=True)
+                        continue
+                    identifiers = self.reserve_block(1)
+                    if identifiers:
+                        return identifiers[0]
+                    continue
+                self._pending = self.reserve_block(self.block_size)
+            return self._pending.pop(0)
+
+    def allocate(self, count: int) -> list:
+        """
+        Retourne `count` identifiants neufs, prêts pour bulk_create.
+        Réserve un bloc dédié (hors cache local) pour garder la contiguïté.
+        """
+        identifiers = []
+        while len(identifiers) < count:
+            identifiers.extend(self.reserve_block(count - len(identifiers)))
+        return identifiers
+
+    def reserve_block(self, size: int, committed: bool = False) -> list:
+        """Réserve `size` valeurs et retourne les identifiants libres"""
+        _, identifiers = self.reserve_range(size, committed)
+        return identifiers
+
+    def reserve_range(self, size: int, committed: bool = False):
+        """
+        Réserve `size` valeurs consécutives.
+
+        Args:
+            committed: Réserver sur une connexion autonome validée aussitôt
+
+        Returns:
+            tuple: (range des valeurs réservées, identifiants libres)
+        """
+        from apps.identity_app.models import IdentifierSequence
+
+        reserve = IdentifierSequence.reserve_committed if committed else IdentifierSequence.reserve
+        values = reserve(self.sequence_name, size)
+        if values[-1] > ID_MAX_VALUE:
+            raise OverflowError(f"Séquence {self.sequence_name} épuisée")
+
+        return values, self._exclude_taken([self.formatter(value) for value in values])
+
+    def _exclude_taken(self, identifiers: list) -> list:
+        """Écarte les identifiants déjà en base (une requête de plage)"""
+        from django.apps import apps
+
+        # Exclusion des identifiants déjà présents (une requête par bloc)
+        model = apps.get_model(self.model_label)
+        taken = set(
+            model.objects.filter(**{
+                f'{self.field_name}__gte': identifiers[0],
+                f'{self.field_name}__lte': identifiers[-1],
+            }).values_list(self.field_name, flat=True)
+        )
+        return [identifier for identifier in identifiers if identifier not in taken]
+
+
+_rsu_id_allocator = IdentifierAllocator()
+_household_id_allocator = IdentifierAllocator(
+    sequence_name='HOUSEHOLD_ID',
+    formatter=format_household_id,
+    model_label='identity_app.Household',
+    field_name='household_id',
+)
+
+ID_ALLOCATORS = {
+    'RSU_ID': _rsu_id_allocator,
+    'HOUSEHOLD_ID': _household_id_allocator,
+}
+
+
+def allocate_rsu_ids(count: int) -> list:
+    """Alloue `count` RSU-ID en un seul aller-retour (imports massifs)"""
+    return _rsu_id_allocator.allocate(count)
+
+
 def generate_rsu_id():
     """
-    Génère un RSU-ID unique au format: RSU-GA-XXXXXXXX
+    Génère un RSU-ID unique au format: RSU-GA-XXXXXXXC
     RSU = Registre Social Unifié
     GA = Gabon
-    XXXXXXXX = 8 caractères alphanumériques
-    
+    XXXXXXX = valeur de séquence en base36, C = clé de contrôle
+
+    Les identifiants sont tirés d'un bloc réservé en mémoire :
+    aucune requête par identifiant.
+
     Returns:
-        str: RSU-ID unique (ex: RSU-GA-A1B2C3D4)
+        str: RSU-ID unique (ex: RSU-GA-00000K2Q)
     """
-    prefix = getattr(settings, 'RSU_ID_PREFIX', 'RSU-GA-')
-    
-    # Générer 8 caractères alphanumériques
-    chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
-    unique_part = ''.join(random.choices(chars, k=8))
-    
-    rsu_id = f"{prefix}{unique_part}"
-    
-    # ✅ AMÉLIORATION: Vérification unicité avec import conditionnel
-    try:
-        from apps.identity_app.models import PersonIdentity
-        while PersonIdentity.objects.filter(rsu_id=rsu_id).exists():
-            unique_part = ''.join(random.choices(chars, k=8))
-            rsu_id = f"{prefix}{unique_part}"
-    except ImportError:
-        # Pendant les migrations ou tests, PersonIdentity peut ne pas être disponible
-        pass
-    
-    return rsu_id
+    return _rsu_id_allocator.next_id()
+
+
+def allocate_household_ids(count: int) -> list:
+    """Alloue `count` ID ménage en un seul aller-retour"""
+    return _household_id_allocator.allocate(count)
+
+
+def generate_household_id():
+    """
+    Génère un ID ménage unique au format: HH-GA-XXXXXXXC
+    (même séquence base36 + clé que les RSU-ID, sans collision)
+    """
+    return _household_id_allocator.next_id()
 
 def get_province_info(province_code: str) -> dict:
     """Retourne les informations d'une province"""
@@ -0,0 +1,144 @@
+# =============================================================================
+# FICHIER: utils/geo.py
+# =============================================================================
+
+"""
+🇬🇦 RSU Gabon - Utilitaires géospatiaux sans PostGIS
+Geohash (grille hiérarchique base32) et distances haversine.
+
+Un geohash de précision p est le préfixe de tous les geohash plus fins
+de la même cellule : une cellule se requête par une simple plage
+[préfixe, préfixe suivant) sur un index B-tree standard.
+"""
+import math
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 9          # ≈ 4,8 m × 4,8 m : précision de stockage
+EARTH_RADIUS_KM = 6371.0088
+MAX_COVER_CELLS = 64           # nombre max de cellules par requête de zone
+
+
+def geohash_encode(latitude, longitude, precision=GEOHASH_PRECISION):
+    """Encode des coordonnées décimales en geohash"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    latitude, longitude = float(latitude), float(longitude)
+
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # bits pairs = longitude
+    while len(chars) < precision:
+        target, value = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (target[0] + target[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            target[0] = mid
+        else:
+            bits <<= 1
+            target[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def geohash_prefix_upper_bound(prefix):
+    """
+    Borne supérieure exclue de la plage d'une cellule : préfixe suivant dans
+    l'alphabet (avec retenue), None si la cellule est la dernière du globe.
+    Reste alphanumérique, donc valable quelle que soit la collation SQL.
+    """
+    chars = list(prefix)
+    while chars:
+        index = GEOHASH_ALPHABET.index(chars[-1])
+        if index < len(GEOHASH_ALPHABET) - 1:
+            chars[-1] = GEOHASH_ALPHABET[index + 1]
+            return ''.join(chars)
+        chars.pop()
+    return None
+
+
+def geohash_bounds(geohash):
+    """Boîte (min_lat, min_lon, max_lat, max_lon) d'une cellule geohash"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        bits = GEOHASH_ALPHABET.index(char)
+        for shift in range(4, -1, -1):
+            target = lon_range if even else lat_range
+            mid = (target[0] + target[1]) / 2
+            if (bits >> shift) & 1:
+                target[0] = mid
+            else:
+                target[1] = mid
+            even = not even
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
+
+
+def geohash_cell_size(precision):
+    """Dimensions (hauteur lat°, largeur lon°) d'une cellule"""
+    total_bits = 5 * precision
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+
+def geohash_for_instance(instance, precision=GEOHASH_PRECISION):
+    """Geohash d'un objet possédant latitude/longitude (None si incomplet)"""
+    if instance.latitude is None or instance.longitude is None:
+        return None
+    return geohash_encode(instance.latitude, instance.longitude, precision)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Distance orthodromique en kilomètres"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (float(lat1), float(lon1), float(lat2), float(lon2)))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def bbox_around(latitude, longitude, radius_km):
+    """Boîte englobante (min_lat, min_lon, max_lat, max_lon) d'un cercle"""
+    latitude, longitude = float(latitude), float(longitude)
+    delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+    delta_lon = math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat))
+    return (
+        max(latitude - delta_lat, -90.0), max(longitude - delta_lon, -180.0),
+        min(latitude + delta_lat, 90.0), min(longitude + delta_lon, 180.0),
+    )
+
+
+def geohash_cover(min_lat, min_lon, max_lat, max_lon, max_cells=MAX_COVER_CELLS):
+    """
+    Cellules geohash couvrant une boîte, à la précision la plus fine
+    possible sans dépasser `max_cells` cellules.
+    """
+    min_lat, min_lon, max_lat, max_lon = map(float, (min_lat, min_lon, max_lat, max_lon))
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = geohash_cell_size(precision)
+        rows = math.floor(max_lat / height) - math.floor(min_lat / height) + 1
+        cols = math.floor(max_lon / width) - math.floor(min_lon / width) + 1
+        if rows * cols <= max_cells:
+            break
+
+    first_lat = math.floor(min_lat / height) * height + height / 2
+    first_lon = math.floor(min_lon / width) * width + width / 2
+    cells = {
+        geohash_encode(
+            min(first_lat + row * height, 89.999999),
+            min(first_lon + col * width, 179.999999),
+            precision
+        )
+        for row in range(rows)
+        for col in range(cols)
+    }
+    return sorted(cells)